@@ -1,10 +1,9 @@
 """
 Core modules for aworld-cli.
 """
-from .agent_registry import LocalAgent, LocalAgentRegistry, agent
-from .installed_skill_manager import InstalledSkillManager
-from .loader import init_agents
-from .skill_registry import get_skill_registry, register_skill_source, reset_skill_registry
+from __future__ import annotations
+
+from aworld.utils.lazy_import import lazy_attrs
 
 __all__ = [
     "InstalledSkillManager",
@@ -16,3 +15,18 @@ __all__ = [
     "register_skill_source",
     "reset_skill_registry",
 ]
+
+# Resolved on first access so that importing a light submodule (e.g. the
+# top-level command system) does not pull in the agent runtime.
+_LAZY_IMPORTS = {
+    "LocalAgent": (".agent_registry", "LocalAgent"),
+    "LocalAgentRegistry": (".agent_registry", "LocalAgentRegistry"),
+    "agent": (".agent_registry", "agent"),
+    "InstalledSkillManager": (".installed_skill_manager", "InstalledSkillManager"),
+    "init_agents": (".loader", "init_agents"),
+    "get_skill_registry": (".skill_registry", "get_skill_registry"),
+    "register_skill_source": (".skill_registry", "register_skill_source"),
+    "reset_skill_registry": (".skill_registry", "reset_skill_registry"),
+}
+
+__getattr__ = lazy_attrs(__name__, _LAZY_IMPORTS)[0]
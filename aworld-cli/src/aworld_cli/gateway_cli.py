@@ -307,7 +307,13 @@ async def serve_gateway(
         router = GatewayRouter(
             session_binding=SessionBinding(),
             agent_resolver=AgentResolver(default_agent_id=config.default_agent_id),
-            agent_backend=LocalCliAgentBackend(),
+            agent_backend=LocalCliAgentBackend(
+                pool_size=config.gateway.agent_pool_size,
+                pool_idle_seconds=config.gateway.agent_pool_idle_seconds,
+                session_cache_size=config.gateway.session_cache_size,
+                session_idle_seconds=config.gateway.session_idle_seconds,
+                session_lock_stripes=config.gateway.session_lock_stripes,
+            ),
         )
         runtime = GatewayRuntime(
             config=config,
@@ -341,6 +347,7 @@ async def serve_gateway(
         finally:
             gateway_logger.info("Gateway runtime stopping")
             await runtime.stop()
+            await router.close()
             gateway_logger.info("Gateway runtime stopped")
     finally:
         _restore_env_var("AWORLD_DISABLE_CONSOLE_LOG", previous_disable_console_log)
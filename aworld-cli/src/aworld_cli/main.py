@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Optional
 
 from aworld.plugins.discovery import discover_plugins
+from aworld.utils.lazy_import import lazy_attrs
 
 
 def _trajectory_from_direct_run_summary(
@@ -116,14 +117,14 @@ for logger_name in third_party_loggers:
 for aworld_logger in ['aworld', 'AWorld']:
     logging.getLogger(aworld_logger).setLevel(logging.INFO)
 
-# Try to import init_middlewares, fallback to no-op if not available
-try:
-    from aworld.core.context.amni.config import init_middlewares
-except ImportError:
-    # Fallback: init_middlewares might not be available in all environments
-    def init_middlewares():
-        """No-op fallback for init_middlewares if not available."""
-        pass
+def init_middlewares(**kwargs):
+    """Initialize Amni middlewares; the context package is only imported when the runtime starts."""
+    try:
+        from aworld.core.context.amni.config import init_middlewares as _init_middlewares
+    except ImportError:
+        # Fallback: init_middlewares might not be available in all environments
+        return None
+    return _init_middlewares(**kwargs)
 
 
 def _show_banner(console=None):
@@ -191,7 +192,7 @@ def _show_banner(console=None):
         # Print features
         console.print("[bold bright_cyan]🚀 Core Features:[/bold bright_cyan]")
         console.print(features_table)
-        cli = AWorldCLI()
+        cli = _lazy_attr("AWorldCLI")()
         cli._display_conf_info()
         
     except ImportError:
@@ -217,12 +218,6 @@ sys.excepthook = _suppress_keyboard_interrupt_traceback
 # Gateway mode may explicitly override this before importing this module.
 os.environ.setdefault('AWORLD_DISABLE_CONSOLE_LOG', 'true')
 
-# Import aworld modules (they will respect the environment variable)
-from .runtime.cli import CliRuntime
-from .console import AWorldCLI
-from .models import AgentInfo
-from .executors.continuous import ContinuousExecutor
-from .runtime_bootstrap import RuntimeBootstrapError, bootstrap_runtime
 from .core.top_level_command_system import (
     TopLevelCommandContext,
     TopLevelCommandRegistry,
@@ -230,8 +225,19 @@ from .core.top_level_command_system import (
 from .plugin_capabilities.cli_commands import sync_plugin_cli_commands
 from .top_level_commands import register_builtin_top_level_commands
 
-# Import commands to trigger registration
-from . import commands
+# The agent runtime, console and executors pull in model SDKs, tracing and rich;
+# they are imported on first use so that `--help`, `list` and gateway start-up stay fast.
+__getattr__, _lazy_attr = lazy_attrs(__name__, {
+    "CliRuntime": (".runtime.cli", "CliRuntime"),
+    "AWorldCLI": (".console", "AWorldCLI"),
+    "AgentInfo": (".models", "AgentInfo"),
+    "ContinuousExecutor": (".executors.continuous", "ContinuousExecutor"),
+})
+
+
+def _register_slash_commands() -> None:
+    # Import commands to trigger registration
+    from . import commands  # noqa: F401
 
 
 def _judge_config_from_cli_selectors(
@@ -341,7 +347,7 @@ async def load_all_agents(
                 print(f"⚠️ Failed to load agent file {agent_file}: {e}")
     
     # Use a short-lived CliRuntime to load agents from all supported sources.
-    runtime = CliRuntime(remote_backends=remote_backends, local_dirs=local_dirs)
+    runtime = _lazy_attr("CliRuntime")(remote_backends=remote_backends, local_dirs=local_dirs)
     return await runtime._load_agents()
 
 
@@ -835,6 +841,7 @@ def _maybe_dispatch_top_level_command(argv: list[str]) -> bool:
 
 
 def _run_top_level_command(command, args, argv: list[str]) -> bool:
+    _register_slash_commands()
     exit_code = command.run(
         args,
         TopLevelCommandContext(cwd=str(Path.cwd()), argv=tuple(argv)),
@@ -891,6 +898,9 @@ def main():
         if _dispatch_named_top_level_command("run", args, sys.argv):
             return
     
+    from .runtime_bootstrap import RuntimeBootstrapError, bootstrap_runtime
+
+    _register_slash_commands()
     try:
         bootstrap_runtime(
             env_file=args.env_file,
@@ -955,7 +965,7 @@ async def _run_interactive_mode(
             except Exception as e:
                 print(f"⚠️ Failed to load agent file {agent_file}: {e}")
     
-    runtime = CliRuntime(
+    runtime = _lazy_attr("CliRuntime")(
         agent_name=agent_name,
         remote_backends=remote_backends,
         local_dirs=local_dirs,
@@ -1137,7 +1147,7 @@ async def _run_direct_mode(
                 print(f"⚠️ Failed to load agent file {agent_file}: {e}")
     
     # Use CliRuntime to load agents and create executor
-    runtime = CliRuntime(
+    runtime = _lazy_attr("CliRuntime")(
         remote_backends=remote_backends, 
         local_dirs=local_dirs,
         session_id=session_id,
@@ -1214,7 +1224,7 @@ async def _run_direct_mode(
     if hasattr(agent_executor, 'console'):
         agent_executor.console = console
 
-    continuous_executor = ContinuousExecutor(agent_executor, console=console)
+    continuous_executor = _lazy_attr("ContinuousExecutor")(agent_executor, console=console)
     
     # Run task execution
     summary = await continuous_executor.run_continuous(
@@ -1,11 +1,14 @@
-from .bootstrap import (
-    build_cli_memory_config,
-    register_cli_memory_provider,
-    resolve_cli_memory_mode,
-)
+from __future__ import annotations
+
+from aworld.utils.lazy_import import lazy_attrs
 
 __all__ = [
     "build_cli_memory_config",
     "register_cli_memory_provider",
     "resolve_cli_memory_mode",
 ]
+
+# bootstrap imports the context package; discovery helpers must stay importable without it.
+_LAZY_IMPORTS = {name: (".bootstrap", name) for name in __all__}
+
+__getattr__ = lazy_attrs(__name__, _LAZY_IMPORTS)[0]
@@ -52,6 +52,10 @@ class HybridMemoryProvider(MemoryBase):
             limit=limit,
         )
 
+    def memory_revision(self, workspace_path: str | Path | None = None):
+        memory_revision = getattr(self.durable_provider, "memory_revision", None)
+        return memory_revision(workspace_path) if callable(memory_revision) else None
+
     def list_governed_decisions(self, workspace_path: str | Path):
         return self.durable_provider.list_governed_decisions(workspace_path)
 
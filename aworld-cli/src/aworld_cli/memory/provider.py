@@ -22,7 +22,7 @@ from aworld_cli.memory.governance import (
     append_governed_review,
     list_governed_decisions as load_governed_decisions,
 )
-from aworld_cli.memory.relevance import recall_relevant_memory_texts
+from aworld_cli.memory.relevance import recall_relevant_memory_texts, relevant_memory_revision
 
 
 @dataclass(frozen=True)
@@ -80,6 +80,9 @@ class CliDurableMemoryProvider:
         )
         return RelevantMemoryContext(texts=texts, source_files=source_files)
 
+    def memory_revision(self, workspace_path: str | Path | None = None):
+        return relevant_memory_revision(workspace_path)
+
     def get_durable_memory_records(
         self,
         workspace_path: str | Path,
@@ -77,6 +77,22 @@ def recall_relevant_memory_texts(
     return _hits_to_context(selected)
 
 
+def relevant_memory_revision(workspace_path: str | os.PathLike[str] | None) -> tuple[tuple[str, int, int], ...]:
+    """Stat stamp of the files recall reads; it changes whenever a recall result could."""
+    memory_dir = Path(workspace_path or os.getcwd()).expanduser().resolve() / ".aworld" / "memory"
+    if not memory_dir.exists():
+        return ()
+    stamp = []
+    for path in memory_dir.rglob("*"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        if path.is_file():
+            stamp.append((str(path.relative_to(memory_dir)), stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(stamp))
+
+
 def recall_relevant_durable_memory_texts(
     workspace_path: str | os.PathLike[str] | None,
     query: str,
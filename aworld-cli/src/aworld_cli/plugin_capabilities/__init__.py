@@ -1,22 +1,8 @@
 """Host-owned plugin capability helpers and adapters."""
 
-from .commands import PluginPromptCommand, register_plugin_commands, sync_plugin_commands
-from .context import CONTEXT_PHASES, PluginContextAdapter, load_plugin_contexts, run_context_phase
-from .hooks import (
-    HookEventPayload,
-    PluginHookResult,
-    StopHookEvent,
-    TaskCompletedHookEvent,
-    TaskErrorHookEvent,
-    TaskInterruptedHookEvent,
-    TaskProgressHookEvent,
-    TaskStartedHookEvent,
-    load_plugin_hooks,
-)
-from .hud import HudLine, collect_hud_lines
-from .hud_helpers import format_hud_context_bar, format_hud_elapsed, format_hud_tokens
-from .skill_commands import load_plugin_skill_commands
-from .state import PluginStateHandle, PluginStateStore
+from __future__ import annotations
+
+from aworld.utils.lazy_import import lazy_attrs
 
 __all__ = [
     "CONTEXT_PHASES",
@@ -44,3 +30,33 @@ __all__ = [
     "run_context_phase",
     "sync_plugin_commands",
 ]
+
+# Submodules are imported on first attribute access; most of them pull in the agent runtime.
+_LAZY_IMPORTS = {
+    "PluginPromptCommand": (".commands", "PluginPromptCommand"),
+    "register_plugin_commands": (".commands", "register_plugin_commands"),
+    "sync_plugin_commands": (".commands", "sync_plugin_commands"),
+    "CONTEXT_PHASES": (".context", "CONTEXT_PHASES"),
+    "PluginContextAdapter": (".context", "PluginContextAdapter"),
+    "load_plugin_contexts": (".context", "load_plugin_contexts"),
+    "run_context_phase": (".context", "run_context_phase"),
+    "HookEventPayload": (".hooks", "HookEventPayload"),
+    "PluginHookResult": (".hooks", "PluginHookResult"),
+    "StopHookEvent": (".hooks", "StopHookEvent"),
+    "TaskCompletedHookEvent": (".hooks", "TaskCompletedHookEvent"),
+    "TaskErrorHookEvent": (".hooks", "TaskErrorHookEvent"),
+    "TaskInterruptedHookEvent": (".hooks", "TaskInterruptedHookEvent"),
+    "TaskProgressHookEvent": (".hooks", "TaskProgressHookEvent"),
+    "TaskStartedHookEvent": (".hooks", "TaskStartedHookEvent"),
+    "load_plugin_hooks": (".hooks", "load_plugin_hooks"),
+    "HudLine": (".hud", "HudLine"),
+    "collect_hud_lines": (".hud", "collect_hud_lines"),
+    "format_hud_context_bar": (".hud_helpers", "format_hud_context_bar"),
+    "format_hud_elapsed": (".hud_helpers", "format_hud_elapsed"),
+    "format_hud_tokens": (".hud_helpers", "format_hud_tokens"),
+    "load_plugin_skill_commands": (".skill_commands", "load_plugin_skill_commands"),
+    "PluginStateHandle": (".state", "PluginStateHandle"),
+    "PluginStateStore": (".state", "PluginStateStore"),
+}
+
+__getattr__ = lazy_attrs(__name__, _LAZY_IMPORTS)[0]
@@ -5,8 +5,6 @@ import inspect
 from typing import Any, Callable
 
 from aworld.logs.util import logger
-from aworld.memory.main import _default_file_memory_store
-from aworld_cli.memory import bootstrap as memory_bootstrap
 
 
 class RuntimeBootstrapError(RuntimeError):
@@ -38,11 +36,14 @@ def bootstrap_runtime(
     show_banner_fn: Callable[[], None],
     console: Any | None = None,
 ) -> RuntimeBootstrapResult:
+    # Memory and model modules are heavy; top-level commands import this module just to register.
+    from aworld.memory.main import _default_file_memory_store
     from aworld_cli._globals import console as global_console
     from aworld_cli.core.config import has_model_config, load_config_with_env
     from aworld_cli.core.runtime_skill_registry import (
         build_runtime_skill_registry_view,
     )
+    from aworld_cli.memory import bootstrap as memory_bootstrap
 
     resolved_console = console or global_console
     config_dict, _, _ = load_config_with_env(env_file)
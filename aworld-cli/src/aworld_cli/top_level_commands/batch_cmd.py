@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from aworld_cli.plugins.batch.cli import run_batch_command
-
 
 class BatchTopLevelCommand:
     @property
@@ -35,6 +33,8 @@ class BatchTopLevelCommand:
         )
 
     def run(self, args, context) -> int | None:
+        from aworld_cli.plugins.batch.cli import run_batch_command
+
         argv = [str(args.config_path)]
         if getattr(args, "remote_backend", None):
             argv.extend(["--remote-backend", str(args.remote_backend)])
@@ -3,16 +3,19 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from aworld_cli.evaluator_runtime import (
-    available_evaluator_suites,
-    evaluator_exit_code,
-    get_evaluator_suite_selection,
-    get_evaluator_report_schema,
-    render_evaluator_summary,
-    run_evaluator_cli,
-    run_evaluator_source_cli,
-    validate_evaluator_report,
-)
+from aworld.utils.lazy_import import lazy_attrs
+
+# evaluator_runtime imports the evaluation stack and the runner; resolve it only when the command runs.
+__getattr__, _lazy_attr = lazy_attrs(__name__, {
+    "available_evaluator_suites": ("aworld_cli.evaluator_runtime", "available_evaluator_suites"),
+    "evaluator_exit_code": ("aworld_cli.evaluator_runtime", "evaluator_exit_code"),
+    "get_evaluator_suite_selection": ("aworld_cli.evaluator_runtime", "get_evaluator_suite_selection"),
+    "get_evaluator_report_schema": ("aworld_cli.evaluator_runtime", "get_evaluator_report_schema"),
+    "render_evaluator_summary": ("aworld_cli.evaluator_runtime", "render_evaluator_summary"),
+    "run_evaluator_cli": ("aworld_cli.evaluator_runtime", "run_evaluator_cli"),
+    "run_evaluator_source_cli": ("aworld_cli.evaluator_runtime", "run_evaluator_source_cli"),
+    "validate_evaluator_report": ("aworld_cli.evaluator_runtime", "validate_evaluator_report"),
+})
 
 
 class EvaluatorTopLevelCommand:
@@ -81,7 +84,7 @@ class EvaluatorTopLevelCommand:
                 print("Evaluator error: exactly one of --judge-agent, --judge-agent-name, or --judge-backend-ref is required with --input")
                 return 1
             try:
-                report = run_evaluator_source_cli(
+                report = _lazy_attr("run_evaluator_source_cli")(
                     input=args.input,
                     kind=args.kind,
                     judge_agent=args.judge_agent,
@@ -101,8 +104,8 @@ class EvaluatorTopLevelCommand:
             except (FileNotFoundError, ValueError, KeyError) as exc:
                 print(f"Evaluator error: {exc}")
                 return 1
-            print(render_evaluator_summary(report))
-            return evaluator_exit_code(report)
+            print(_lazy_attr("render_evaluator_summary")(report))
+            return _lazy_attr("evaluator_exit_code")(report)
 
         source_only_args = (
             ("kind", "--kind"),
@@ -119,14 +122,14 @@ class EvaluatorTopLevelCommand:
                 return 1
 
         if getattr(args, "print_report_schema", False):
-            print(json.dumps(get_evaluator_report_schema(), ensure_ascii=False, indent=2))
+            print(json.dumps(_lazy_attr("get_evaluator_report_schema")(), ensure_ascii=False, indent=2))
             return 0
 
         if getattr(args, "validate_report", None):
             report_path = Path(args.validate_report).expanduser().resolve()
             report = json.loads(report_path.read_text(encoding="utf-8"))
             try:
-                validate_evaluator_report(report)
+                _lazy_attr("validate_evaluator_report")(report)
             except ValueError as exc:
                 print(f"Report is invalid: {exc}")
                 return 4
@@ -137,14 +140,14 @@ class EvaluatorTopLevelCommand:
             try:
                 if getattr(args, "target", None):
                     print("Available evaluator suites for target:")
-                    suite_names = available_evaluator_suites(target=args.target)
+                    suite_names = _lazy_attr("available_evaluator_suites")(target=args.target)
                 else:
                     print("Available evaluator suites:")
-                    suite_names = available_evaluator_suites()
+                    suite_names = _lazy_attr("available_evaluator_suites")()
                 for suite_name in suite_names:
                     print(f"  - {suite_name}")
                 if getattr(args, "target", None) and suite_names:
-                    selection = get_evaluator_suite_selection(target=args.target, suite=args.suite)
+                    selection = _lazy_attr("get_evaluator_suite_selection")(target=args.target, suite=args.suite)
                     print(f"Default suite: {selection['resolved']}")
             except (FileNotFoundError, ValueError, KeyError) as exc:
                 print(f"Evaluator error: {exc}")
@@ -156,7 +159,7 @@ class EvaluatorTopLevelCommand:
             return 1
 
         try:
-            report = run_evaluator_cli(
+            report = _lazy_attr("run_evaluator_cli")(
                 target=args.target,
                 suite=args.suite,
                 output=args.output,
@@ -165,5 +168,5 @@ class EvaluatorTopLevelCommand:
         except (FileNotFoundError, ValueError, KeyError) as exc:
             print(f"Evaluator error: {exc}")
             return 1
-        print(render_evaluator_summary(report))
-        return evaluator_exit_code(report)
+        print(_lazy_attr("render_evaluator_summary")(report))
+        return _lazy_attr("evaluator_exit_code")(report)
@@ -4,7 +4,6 @@ import asyncio
 from pathlib import Path
 
 from aworld_gateway import GATEWAY_DISPLAY_NAME
-from aworld_cli import gateway_cli
 from aworld_cli.runtime_bootstrap import RuntimeBootstrapError, bootstrap_runtime
 
 
@@ -28,9 +27,14 @@ class GatewayTopLevelCommand:
             description=self.description,
             prog="aworld-cli gateway",
         )
+        # gateway_cli imports uvicorn and the channel stack; only load it once the command is used.
+        from aworld_cli import gateway_cli
+
         gateway_cli.register_gateway_subcommands(parser)
 
     def run(self, args, context) -> int | None:
+        from aworld_cli import gateway_cli
+
         if args.gateway_action == "status":
             print(gateway_cli.handle_gateway_status())
             return 0
@@ -48,6 +52,7 @@ class GatewayTopLevelCommand:
         raise ValueError(f"Unsupported gateway action: {args.gateway_action}")
 
     def _run_server(self, context) -> int:
+        from aworld_cli import gateway_cli
         from aworld_cli.main import _resolve_agent_dirs, _show_banner, init_middlewares
 
         global_args = gateway_cli.parse_gateway_global_args(context.argv)
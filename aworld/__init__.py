@@ -50,6 +50,9 @@ def configure(logger_level: str = "INFO", use_trace: bool = None, debug: bool =
 
 
 def cleanup():
+    # Local tool files are only registered by `aworld.tools`; skip importing it at exit otherwise.
+    if not os.environ.get("LOCAL_TOOLS_ENV_VAR"):
+        return
     try:
         from aworld.tools import LOCAL_TOOLS_ENV_VAR, parse_local_tool_entries
 
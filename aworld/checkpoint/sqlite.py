@@ -0,0 +1,312 @@
+import asyncio
+import json
+import pickle
+import sqlite3
+import threading
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import Checkpoint, CheckpointMetadata, BaseCheckpointRepository, VersionUtils
+
+
+class SqliteCheckpointRepository(BaseCheckpointRepository):
+    """
+    Durable SQLite implementation of BaseCheckpointRepository.
+
+    Checkpoints of a session form a chain ordered by a per-session sequence
+    number. The first checkpoint and every `keyframe_interval`-th one store
+    their values in full (a keyframe); the others store only the top-level
+    keys that changed or were removed since the previous checkpoint. Restoring
+    a checkpoint reads its keyframe and at most `keyframe_interval - 1` deltas.
+
+    Rows are indexed by (session_id, seq), (session_id, ts) and task_id, so
+    the latest checkpoint of a session and point-in-time lookups are B-tree
+    seeks rather than scans. Values are pickled per key, so anything the
+    in-memory repository can hold can be stored. Safe to share across threads.
+    """
+
+    _COLUMNS = "id, session_id, seq, ts, version, keyframe_seq, header, payload"
+
+    def __init__(self, db_path: str = "./data/aworld_checkpoints.db", keyframe_interval: int = 16,
+                 cache_size: int = 128) -> None:
+        """
+        Initialize the SQLite checkpoint repository.
+        Args:
+            db_path (str): Path to the SQLite database file.
+            keyframe_interval (int): Store a full snapshot every N checkpoints of a session.
+            cache_size (int): Number of sessions whose latest values are kept in memory to encode deltas.
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.cache_size = cache_size
+        self._lock = threading.RLock()
+        # session_id -> (checkpoint id, {key: pickled value}) of the session's latest checkpoint
+        self._latest_values: "OrderedDict[str, Tuple[str, Dict[str, bytes]]]" = OrderedDict()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._init_database()
+
+    def _init_database(self) -> None:
+        """Initialize database tables and indexes."""
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS aworld_checkpoints (
+                    id TEXT PRIMARY KEY,
+                    session_id TEXT NOT NULL,
+                    task_id TEXT,
+                    seq INTEGER NOT NULL,
+                    ts TEXT NOT NULL,
+                    version INTEGER NOT NULL,
+                    keyframe_seq INTEGER NOT NULL,
+                    header TEXT NOT NULL,
+                    payload BLOB NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_checkpoints_session_seq "
+                               "ON aworld_checkpoints (session_id, seq)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_checkpoints_session_ts "
+                               "ON aworld_checkpoints (session_id, ts)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_checkpoints_task "
+                               "ON aworld_checkpoints (task_id)")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def get(self, checkpoint_id: str) -> Optional[Checkpoint]:
+        """
+        Retrieve a checkpoint by its unique identifier.
+        Args:
+            checkpoint_id (str): The unique identifier of the checkpoint.
+        Returns:
+            Optional[Checkpoint]: The checkpoint if found, otherwise None.
+        """
+        with self._lock:
+            row = self._conn.execute(f"SELECT {self._COLUMNS} FROM aworld_checkpoints WHERE id = ?",
+                                     (checkpoint_id,)).fetchone()
+            return self._restore(row) if row else None
+
+    def list(self, params: Dict[str, Any]) -> List[Checkpoint]:
+        """
+        List checkpoints matching the given parameters.
+        Args:
+            params (dict): Parameters to filter checkpoints. `session_id` and `task_id`
+                are answered from indexes; other keys are compared on the restored checkpoints.
+        Returns:
+            List[Checkpoint]: List of matching checkpoints, in session order.
+        """
+        clauses, args = [], []
+        for key in ('session_id', 'task_id'):
+            if key in params:
+                clauses.append(f"{key} = ?")
+                args.append(params[key])
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {self._COLUMNS} FROM aworld_checkpoints {where} "
+                                      f"ORDER BY session_id, seq", args).fetchall()
+            checkpoints = self._restore_rows(rows)
+
+        result = []
+        for cp in checkpoints:
+            if all(self._field(cp, k) == v for k, v in params.items() if k not in ('session_id', 'task_id')):
+                result.append(cp)
+        return result
+
+    def put(self, checkpoint: Checkpoint) -> None:
+        """
+        Store a checkpoint.
+        Args:
+            checkpoint (Checkpoint): The checkpoint to store.
+        """
+        session_id = checkpoint.metadata.session_id
+        encoded = {key: pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+                   for key, value in checkpoint.values.items()}
+        header = json.dumps({
+            "metadata": checkpoint.metadata.model_dump(),
+            "parent_id": checkpoint.parent_id,
+            "namespace": checkpoint.namespace,
+        }, ensure_ascii=False, default=str)
+
+        with self._lock:
+            existing = self._conn.execute(
+                "SELECT session_id, seq, keyframe_seq FROM aworld_checkpoints WHERE id = ?",
+                (checkpoint.id,)).fetchone()
+            last = self._conn.execute(
+                "SELECT id, seq, version, keyframe_seq FROM aworld_checkpoints "
+                "WHERE session_id = ? ORDER BY seq DESC LIMIT 1", (session_id,)).fetchone()
+
+            if existing:
+                # Later checkpoints are stored as deltas on top of this one, so only
+                # the latest checkpoint of a session can be replaced
+                if existing[0] != session_id or existing[1] != last[1]:
+                    raise ValueError(f"Checkpoint {checkpoint.id} already exists and is not the latest "
+                                     f"checkpoint of session {session_id}")
+                seq, keyframe_seq = existing[1], existing[2]
+                # Re-encoded against its predecessor, keeping its place in the chain
+                last = self._conn.execute(
+                    f"SELECT {self._COLUMNS} FROM aworld_checkpoints WHERE session_id = ? AND seq = ?",
+                    (session_id, seq - 1)).fetchone() if seq != keyframe_seq else None
+                if last and VersionUtils.is_version_less(checkpoint, last[4]):
+                    raise ValueError(f"New checkpoint version {checkpoint.version} must be greater than last version {last[4]}")
+                previous = self._replay(last) if last else None
+            elif last:
+                last_id, last_seq, last_version, last_keyframe_seq = last
+                # Compare versions to ensure optimistic locking
+                if VersionUtils.is_version_less(checkpoint, last_version):
+                    raise ValueError(f"New checkpoint version {checkpoint.version} must be greater than last version {last_version}")
+                seq = last_seq + 1
+                previous = self._latest_encoded(session_id, last_id)
+                keyframe_seq = last_keyframe_seq
+                if previous is None or seq - last_keyframe_seq >= self.keyframe_interval:
+                    keyframe_seq, previous = seq, None
+            else:
+                seq, keyframe_seq, previous = 0, 0, None
+
+            if previous is None:
+                payload = {"full": encoded}
+            else:
+                payload = {
+                    "set": {key: value for key, value in encoded.items() if previous.get(key) != value},
+                    "unset": [key for key in previous if key not in encoded],
+                }
+
+            row = (session_id, checkpoint.metadata.task_id, seq, checkpoint.ts, checkpoint.version, keyframe_seq,
+                   header, zlib.compress(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)))
+            with self._conn:
+                if existing:
+                    self._conn.execute(
+                        "UPDATE aworld_checkpoints SET session_id = ?, task_id = ?, seq = ?, ts = ?, version = ?, "
+                        "keyframe_seq = ?, header = ?, payload = ? WHERE id = ?", (*row, checkpoint.id))
+                else:
+                    self._conn.execute(
+                        "INSERT INTO aworld_checkpoints "
+                        "(id, session_id, task_id, seq, ts, version, keyframe_seq, header, payload) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", (checkpoint.id, *row))
+            self._remember(session_id, checkpoint.id, encoded)
+
+    def get_by_session(self, session_id: str) -> Optional[Checkpoint]:
+        """
+        Get the latest checkpoint for a session.
+        Args:
+            session_id (str): The session identifier.
+        Returns:
+            Optional[Checkpoint]: The latest checkpoint if found, otherwise None.
+        """
+        with self._lock:
+            row = self._conn.execute(f"SELECT {self._COLUMNS} FROM aworld_checkpoints "
+                                     f"WHERE session_id = ? ORDER BY seq DESC LIMIT 1", (session_id,)).fetchone()
+            return self._restore(row) if row else None
+
+    def get_at(self, session_id: str, ts: str) -> Optional[Checkpoint]:
+        """
+        Get the session's checkpoint that was current at a point in time.
+        Args:
+            session_id (str): The session identifier.
+            ts (str): ISO-8601 timestamp, in the same format as `Checkpoint.ts`.
+        Returns:
+            Optional[Checkpoint]: The latest checkpoint with `ts` not after the given time, otherwise None.
+        """
+        with self._lock:
+            row = self._conn.execute(f"SELECT {self._COLUMNS} FROM aworld_checkpoints "
+                                     f"WHERE session_id = ? AND ts <= ? ORDER BY ts DESC, seq DESC LIMIT 1",
+                                     (session_id, ts)).fetchone()
+            return self._restore(row) if row else None
+
+    def delete_by_session(self, session_id: str) -> None:
+        """
+        Delete all checkpoints related to a session.
+        Args:
+            session_id (str): The session identifier.
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM aworld_checkpoints WHERE session_id = ?", (session_id,))
+            self._latest_values.pop(session_id, None)
+
+    async def aget_at(self, session_id: str, ts: str) -> Optional[Checkpoint]:
+        """
+        Asynchronously get the session's checkpoint that was current at a point in time.
+        """
+        return await asyncio.to_thread(self.get_at, session_id, ts)
+
+    @staticmethod
+    def _field(checkpoint: Checkpoint, key: str) -> Any:
+        if hasattr(checkpoint, key):
+            return getattr(checkpoint, key)
+        return getattr(checkpoint.metadata, key, None)
+
+    def _remember(self, session_id: str, checkpoint_id: str, encoded: Dict[str, bytes]) -> None:
+        self._latest_values[session_id] = (checkpoint_id, encoded)
+        self._latest_values.move_to_end(session_id)
+        while len(self._latest_values) > self.cache_size:
+            self._latest_values.popitem(last=False)
+
+    def _latest_encoded(self, session_id: str, checkpoint_id: str) -> Optional[Dict[str, bytes]]:
+        """Encoded values of the session's latest checkpoint, from cache or replayed from storage."""
+        cached = self._latest_values.get(session_id)
+        if cached and cached[0] == checkpoint_id:
+            return cached[1]
+        row = self._conn.execute(f"SELECT {self._COLUMNS} FROM aworld_checkpoints WHERE id = ?",
+                                 (checkpoint_id,)).fetchone()
+        encoded = self._replay(row) if row else None
+        if encoded is not None:
+            self._remember(session_id, checkpoint_id, encoded)
+        return encoded
+
+    def _replay(self, row: tuple) -> Dict[str, bytes]:
+        """Encoded values of `row`: its keyframe plus the deltas after it."""
+        _, session_id, seq, _, _, keyframe_seq, _, _ = row
+        payloads = self._conn.execute(
+            "SELECT payload FROM aworld_checkpoints WHERE session_id = ? AND seq BETWEEN ? AND ? ORDER BY seq",
+            (session_id, keyframe_seq, seq)).fetchall()
+        encoded: Dict[str, bytes] = {}
+        for (blob,) in payloads:
+            payload = pickle.loads(zlib.decompress(blob))
+            if "full" in payload:
+                encoded = dict(payload["full"])
+                continue
+            encoded.update(payload["set"])
+            for key in payload["unset"]:
+                encoded.pop(key, None)
+        return encoded
+
+    def _restore(self, row: tuple) -> Checkpoint:
+        return self._build(row, self._replay(row))
+
+    def _restore_rows(self, rows: List[tuple]) -> List[Checkpoint]:
+        """Restore rows sharing keyframes without replaying each chain from scratch."""
+        checkpoints = []
+        encoded: Dict[str, bytes] = {}
+        previous: Optional[Tuple[str, int]] = None
+        for row in rows:
+            _, session_id, seq, _, _, keyframe_seq, _, blob = row
+            payload = pickle.loads(zlib.decompress(blob))
+            if "full" in payload:
+                encoded = dict(payload["full"])
+            elif previous == (session_id, seq - 1):
+                encoded = dict(encoded)
+                encoded.update(payload["set"])
+                for key in payload["unset"]:
+                    encoded.pop(key, None)
+            else:
+                encoded = self._replay(row)
+            previous = (session_id, seq)
+            checkpoints.append(self._build(row, encoded))
+        return checkpoints
+
+    @staticmethod
+    def _build(row: tuple, encoded: Dict[str, bytes]) -> Checkpoint:
+        checkpoint_id, _, _, ts, version, _, header, _ = row
+        header = json.loads(header)
+        return Checkpoint(
+            id=checkpoint_id,
+            ts=ts,
+            metadata=CheckpointMetadata(**header["metadata"]),
+            values={key: pickle.loads(value) for key, value in encoded.items()},
+            version=version,
+            parent_id=header.get("parent_id"),
+            namespace=header.get("namespace", "aworld"),
+        )
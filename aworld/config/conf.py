@@ -409,6 +409,8 @@ class TaskConfig(BaseConfig):
     max_steps: int = 100
     trajectory_strategy: Optional[Type['TrajectoryStrategy']] = None
     trajectory_storage: Optional[Type['TrajectoryStorage']] = None
+    # TrajectorySink instance or segment directory; buffers trajectory steps instead of writing each to storage
+    trajectory_sink: Optional[Any] = None
     stream: bool = False
     resp_carry_context: bool = True
     resp_carry_raw_llm_resp: bool = False
@@ -466,6 +468,7 @@ class DataLoaderConfig(BaseConfig):
     seed: Optional[int] = None
     batch_sampler: Optional[Iterable[List[int]]] = None
     collate_fn: Optional[Callable[..., Any]] = None
+    shuffle_buffer_size: Optional[int] = None
 
 
 class DatasetConfig(BaseConfig):
@@ -483,6 +486,7 @@ class DatasetConfig(BaseConfig):
     encoding: str = "utf-8"
     limit: Optional[int] = None
     preload_transform: Optional[Callable[..., Any]] = None
+    lazy: bool = False
 
     # Config for dataloader
     dataloader_config: DataLoaderConfig = DataLoaderConfig()
@@ -511,3 +515,15 @@ class EvaluationConfig(BaseConfig):
     parallel_num: int = 1
     skip_passed_cases: bool = False
     skip_passed_on_metrics: List[str] = []
+    # directory of the per-run JSONL case ledger; when set, a run with the same eval_run_id resumes
+    # from the cases already recorded there
+    eval_run_store_path: Optional[str] = None
+    # stable ledger key of the run, e.g. "nightly-2025-06-01"; defaults to the eval task id, which is
+    # new on every run, so set it to resume an interrupted run
+    eval_run_id: Optional[str] = None
+    # resume from the ledgered cases of eval_run_id, False starts the run over
+    eval_resume: bool = True
+    # run the scorers of one case concurrently
+    parallel_scorers: bool = False
+    # max concurrent calls per scorer name, e.g. {"SummarizeQualityScorer": 2}
+    scorer_concurrency: Dict[str, int] = {}
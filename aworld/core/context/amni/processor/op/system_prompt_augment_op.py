@@ -3,7 +3,7 @@ import json
 import os
 import time
 import traceback
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
 from aworld.core.agent.base import AgentFactory
 from aworld.core.context.amni.prompt.assembly import DefaultPromptAssemblyProvider
@@ -15,6 +15,7 @@ from aworld.logs.util import logger
 from .base import BaseOp, MemoryCommand
 from .op_factory import memory_op
 from ...prompt.neurons import neuron_factory, Neuron
+from ...prompt.neurons.render_cache import neuron_render_cache
 from ...prompt.prompt_ext import ContextPromptTemplate
 from ...retrieval.reranker import RerankResult
 from ...retrieval.reranker.factory import RerankerFactory
@@ -31,6 +32,7 @@ class SystemPromptAugmentOp(BaseOp):
     def __init__(self, name: str = "system_prompt_augment", **kwargs):
         super().__init__(name, **kwargs)
         self._memory = MemoryFactory.instance()
+        self._render_cache = neuron_render_cache
 
     async def execute(self, context: ApplicationContext, info: Dict[str, Any] = None, event: SystemPromptMessagePayload = None,
                       **kwargs) -> Dict[str, Any]:
@@ -151,9 +153,9 @@ class SystemPromptAugmentOp(BaseOp):
                 component_name = neuron.__class__.__name__
 
                 try:
-                    # Context augment
+                    # Context augment, served from the render cache while the neuron's state is unchanged
                     st = time.time()
-                    rerank_result = await self.rerank_items(neuron=neuron, context=context, namespace=namespace)
+                    rerank_result = await self._render_neuron(neuron=neuron, context=context, namespace=namespace)
                     # Read current value first, then update atomically
                     current_prompt = augment_prompts[neuron.name]
                     augment_prompts[neuron.name] = current_prompt + '\n\n' + rerank_result
@@ -208,8 +210,45 @@ class SystemPromptAugmentOp(BaseOp):
 
         return augment_prompts
 
+    async def _render_neuron(self, neuron: Neuron, context: ApplicationContext, namespace: str) -> str:
+        version = await self._neuron_state_version(neuron, context, namespace)
+        query = str(getattr(context, "task_input", "") or "")
+        if version is not None:
+            cached = self._render_cache.get(neuron.name, namespace, version, query)
+            if cached is not None:
+                logger.debug(f"Neuron {neuron.name} rendered from cache, version={version!r}")
+                return cached
+
+        rendered, reranked, cacheable = await self._rerank_items(neuron=neuron, context=context, namespace=namespace)
+        if version is not None and cacheable:
+            self._render_cache.put(neuron.name, namespace, version, rendered, query=query if reranked else None)
+        return rendered
+
+    @staticmethod
+    async def _neuron_state_version(neuron: Neuron, context: ApplicationContext,
+                                    namespace: str) -> Optional[Hashable]:
+        state_version = getattr(neuron, "state_version", None)
+        if state_version is None:
+            return None
+        try:
+            return await state_version(context=context, namespace=namespace)
+        except Exception as e:
+            logger.warning(f"Neuron {neuron.name} state version failed, rendering uncached: {e}")
+            return None
+
     async def rerank_items(self, neuron: Neuron, context: ApplicationContext,
                            namespace: str) -> str:
+        rendered, _, _ = await self._rerank_items(neuron=neuron, context=context, namespace=namespace)
+        return rendered
+
+    async def _rerank_items(self, neuron: Neuron, context: ApplicationContext,
+                            namespace: str) -> Tuple[str, bool, bool]:
+        """Render `neuron`.
+
+        Returns the prompt, whether it was reranked against the user query, and
+        whether it may be cached; a reranker that returned nothing (e.g. timed
+        out) is retried on the next render instead of caching the empty prompt.
+        """
         user_query = context.task_input
 
         st = time.time()
@@ -219,12 +258,12 @@ class SystemPromptAugmentOp(BaseOp):
         t1 = time.time() - st
         # Only perform rerank when items is not empty
         if not items:
-            return ""
+            return "", False, True
 
         # If length is not enough, no need to rerank, directly append
         total_length = sum(len(item) for item in items)
         if total_length <= 40000:
-            return await neuron.format(context=context, items=items, namespace=namespace)
+            return await neuron.format(context=context, items=items, namespace=namespace), False, True
 
         # Only judge the first part of text
         tmp_items = [item[:1000] for item in items]
@@ -241,11 +280,11 @@ class SystemPromptAugmentOp(BaseOp):
                 logger.debug(f"Component {neuron}: "
                              f"filtered {len(filtered_results)}/{len(rerank_results)} docs "
                              f"with threshold {score_threshold}")
-                return component_prompt
+                return component_prompt, True, True
         t3 = time.time() - st - t1 - t2
         logger.info(
             f"🔄 _process_prompt_components: {neuron.__class__.__name__} rerank time: start_time={st}s format_time={t1:.3f}s, rerank_time={t2:.3f}s, filter_time={t3:.3f}s lens={[len(item) for item in items]}")
-        return ""
+        return "", True, bool(rerank_results)
 
     def _filter_items_by_rerank_result(self, items: List[str], rerank_results: RerankResult) -> List[str]:
         filtered = []
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Hashable, List, Optional
 
 from ... import ApplicationContext
 
@@ -37,6 +37,16 @@ class Neuron(ABC):
                      **kwargs) -> str:
         pass
 
+    async def state_version(self, context: ApplicationContext, namespace: str = None,
+                            **kwargs) -> Optional[Hashable]:
+        """
+        Version of the context state `format_items`/`format` depend on.
+
+        The rendered prompt is reused while this value is unchanged; None (the default)
+        means the neuron is re-rendered every time.
+        """
+        return None
+
 
 # Import registry and factory
 from .neuron_factory import NeuronFactory, neuron_factory
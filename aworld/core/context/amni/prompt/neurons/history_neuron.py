@@ -1,4 +1,4 @@
-from typing import List
+from typing import Hashable, List, Optional
 
 from ... import ApplicationContext
 from . import Neuron
@@ -9,6 +9,24 @@ from .neuron_factory import neuron_factory
 class HistoryNeuron(Neuron):
     """Neuron for handling historical messages and previous round results related properties"""
     
+    async def state_version(self, context: ApplicationContext, namespace: str = None,
+                            **kwargs) -> Optional[Hashable]:
+        """Ids of the history messages and previous round results; None if any message has no id."""
+        messages = list(context.history or [])
+        if hasattr(context, 'root') and hasattr(context.root, 'task_state') and hasattr(context.root.task_state, 'previous_round_results'):
+            messages.append(None)
+            messages.extend(context.root.task_state.previous_round_results or [])
+        ids = []
+        for message in messages:
+            if message is None:
+                ids.append(None)
+                continue
+            message_id = getattr(message, 'id', None)
+            if not message_id:
+                return None
+            ids.append(message_id)
+        return tuple(ids)
+
     async def format_items(self, context: ApplicationContext, namespace: str = None, **kwargs) -> List[str]:
         """Format historical messages and previous round results information"""
         items = []
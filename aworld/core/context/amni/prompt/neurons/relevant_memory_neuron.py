@@ -1,5 +1,5 @@
 import os
-from typing import List
+from typing import Hashable, List, Optional
 
 from ... import ApplicationContext
 from . import Neuron
@@ -26,6 +26,22 @@ class RelevantMemoryNeuron(Neuron):
     def _query_text(self, context: ApplicationContext) -> str:
         return str(getattr(context, "task_input", "") or getattr(context, "origin_user_input", "") or "")
 
+    async def state_version(
+        self,
+        context: ApplicationContext,
+        namespace: str = None,
+        **kwargs,
+    ) -> Optional[Hashable]:
+        memory = MemoryFactory.instance()
+        memory_revision = getattr(memory, "memory_revision", None)
+        if not callable(memory_revision):
+            return None
+        workspace_path = self._workspace_path(context)
+        revision = memory_revision(workspace_path)
+        if revision is None:
+            return None
+        return (str(workspace_path), self._query_text(context), revision)
+
     async def format_items(
         self,
         context: ApplicationContext,
@@ -0,0 +1,54 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable, Optional, Tuple
+
+
+@dataclass
+class _RenderEntry:
+    rendered: str
+    # Set when the rendering was reranked against the user query and is only valid for it.
+    query: Optional[str] = None
+
+
+class NeuronRenderCache:
+    """
+    LRU cache of rendered neuron prompts, keyed by neuron name, namespace and the
+    neuron's `state_version`. Renderings that went through the reranker are also
+    bound to the query they were reranked for.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Optional[str], Hashable], _RenderEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, neuron_name: str, namespace: Optional[str], version: Hashable, query: str) -> Optional[str]:
+        key = (neuron_name, namespace, version)
+        try:
+            entry = self._entries.get(key)
+        except TypeError:
+            return None
+        if entry is None or (entry.query is not None and entry.query != query):
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.rendered
+
+    def put(self, neuron_name: str, namespace: Optional[str], version: Hashable, rendered: str,
+            query: Optional[str] = None) -> None:
+        key = (neuron_name, namespace, version)
+        try:
+            self._entries[key] = _RenderEntry(rendered=rendered, query=query)
+        except TypeError:
+            return
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+neuron_render_cache = NeuronRenderCache()
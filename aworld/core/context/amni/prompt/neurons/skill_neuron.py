@@ -1,4 +1,4 @@
-from typing import List
+from typing import Hashable, List, Optional
 
 from . import Neuron
 from .neuron_factory import neuron_factory
@@ -64,6 +64,24 @@ class SkillsNeuron(Neuron):
             "  </forced_skill_contract>\n"
         )
 
+    async def state_version(self, context: ApplicationContext, namespace: str = None,
+                            **kwargs) -> Optional[Hashable]:
+        total_skills = await context.get_skill_list(namespace) or {}
+        active_skills = set(await context.get_active_skills(namespace) or [])
+        return (
+            tuple(
+                (
+                    skill_id,
+                    skill.get("name"),
+                    skill.get("description", skill.get("desc")),
+                    skill.get("type"),
+                    skill.get("usage", "") if skill_id in active_skills else None,
+                )
+                for skill_id, skill in total_skills.items()
+            ),
+            tuple(self._requested_skill_names(context)),
+        )
+
     async def format_items(self, context: ApplicationContext, namespace: str = None, **kwargs) -> List[str]:
         total_skills = await context.get_skill_list(namespace)
         if not total_skills:
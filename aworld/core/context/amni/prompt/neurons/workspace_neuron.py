@@ -1,4 +1,4 @@
-from typing import List
+from typing import Hashable, List, Optional
 
 from ... import ApplicationContext
 from . import Neuron
@@ -9,6 +9,13 @@ from .neuron_factory import neuron_factory
 class WorkspaceNeuron(Neuron):
     """Neuron for handling workspace related properties"""
 
+    async def state_version(self, context: ApplicationContext, namespace: str = None,
+                            **kwargs) -> Optional[Hashable]:
+        workspace = context.workspace
+        if not workspace:
+            return ()
+        return (getattr(workspace, 'workspace_id', 'unknown'), getattr(workspace, 'workspace_type', 'unknown'))
+
     async def format_items(self, context: ApplicationContext, namespace: str = None, **kwargs) -> List[str]:
         """Format workspace information"""
         items = []
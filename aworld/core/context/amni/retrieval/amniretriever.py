@@ -2,7 +2,7 @@ import asyncio
 import time
 import traceback
 from itertools import chain
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, Tuple, Iterable, AsyncIterable, Union
 
 from .chunker import ChunkerFactory, Chunk, ChunkIndex, Chunker, ArtifactStats,ChunkStoreFactory, ChunkStore
 from aworld.logs.util import logger
@@ -12,6 +12,8 @@ from .reranker.factory import RerankerFactory
 from .base import BaseRetriever, RetrieverConfig
 from .index import RetrievalIndexPluginFactory
 from .index.base import RetrievalIndexPlugin
+from .pipeline import IngestionPipeline, IngestionStats, DEFAULT_BATCH_SIZE, DEFAULT_QUEUE_SIZE, \
+    DEFAULT_INDEX_CONCURRENCY
 from aworld.output import Artifact
 
 
@@ -181,6 +183,41 @@ class AmniRetriever(BaseRetriever):
             )
             raise
 
+    async def async_insert_many(self, workspace_id: str,
+                                artifacts: Union[Iterable[Artifact], AsyncIterable[Artifact]],
+                                index: bool = True) -> IngestionStats:
+        """
+        Insert a stream of artifacts through the streaming ingestion pipeline.
+
+        Chunking, chunk storage and indexing run as concurrent stages connected by
+        bounded queues, so artifacts are consumed lazily and large corpora are not
+        materialized as chunks all at once. Pipeline options are read from
+        `RetrieverConfig.config` (`ingest_chunk_workers`, `ingest_batch_size`,
+        `ingest_queue_size`, `ingest_index_concurrency`).
+
+        Args:
+            workspace_id (str): Workspace the artifacts belong to.
+            artifacts: Artifacts to insert, as an iterable or async iterable.
+            index (bool): Whether to build the chunk indexes.
+
+        Returns:
+            IngestionStats: Counts and per-stage throughput of the run.
+        """
+        options = self.config.config or {}
+        pipeline = IngestionPipeline(
+            chunker=self.chunker,
+            chunk_store=self.chunk_store,
+            index_plugins=self.index_plugins,
+            chunk_config=self.config.chunk_config,
+            chunk_workers=options.get("ingest_chunk_workers"),
+            batch_size=int(options.get("ingest_batch_size", DEFAULT_BATCH_SIZE)),
+            queue_size=int(options.get("ingest_queue_size", DEFAULT_QUEUE_SIZE)),
+            index_concurrency=int(options.get("ingest_index_concurrency", DEFAULT_INDEX_CONCURRENCY)),
+        )
+        stats = await pipeline.run(workspace_id, artifacts, index=index)
+        self.clear_cache()
+        return stats
+
     async def _add_chunks_to_store(self, workspace_id: str, chunks: list[Chunk]) -> None:
         """
         Add chunks to the chunk store with workspace ID.
@@ -1,6 +1,6 @@
 import os
 from abc import ABC
-from typing import Optional
+from typing import Iterable, Optional
 
 from pydantic import BaseModel
 
@@ -34,6 +34,11 @@ class BaseRetriever(ABC):
         """Async insert document into RAG"""
         pass
 
+    async def async_insert_many(self, workspace_id: str, artifacts: Iterable[Artifact], index=True):
+        """Async insert a stream of documents into RAG"""
+        for artifact in artifacts:
+            await self.async_insert(workspace_id, artifact, index=index)
+
     async def async_search(self, workspace_id: str, user_query: str, search_filter: dict = None, top_k: int = None,
                            **kwargs) -> Optional[SearchResults]:
         """Async query RAG"""
@@ -6,7 +6,8 @@ This module provides a fast, in-memory storage solution for chunks.
 
 import asyncio
 import logging
-from typing import Optional, List, Dict, Any
+from collections import Counter
+from typing import Optional, List, Dict, Any, Hashable, Iterable, Tuple
 from ..base import Chunk
 from .chunk_store import ChunkStore
 
@@ -17,17 +18,112 @@ class InMemoryChunkStore(ChunkStore):
     """
     In-memory implementation of ChunkStore.
     
-    This implementation stores chunks in memory using a Python list and dictionary
-    for fast access. It's suitable for testing and small-scale applications.
+    Chunks are kept in an insertion-ordered dict keyed by chunk_id, next to hash
+    indexes on (artifact_id, chunk_index) and on every hashable metadata field.
+    Lookups by chunk id or position are O(1), and filtered searches only visit
+    the chunks of the most selective indexed condition. Chunk metadata must not
+    be mutated in place once stored; upsert a new chunk instead.
     """
     
     def __init__(self, **kwargs) -> None:
         """Initialize the in-memory chunk store."""
-        self._chunks: List[Chunk] = []
-        self._chunk_index: Dict[str, int] = {}  # chunk_id -> index mapping
+        self._chunks: Dict[str, Chunk] = {}
+        # chunk_id -> insertion sequence, so indexed results keep storage order
+        self._seq: Dict[str, int] = {}
+        self._next_seq = 0
+        # (artifact_id, chunk_index) -> chunk_ids
+        self._positions: Dict[Tuple[Any, Any], Dict[str, None]] = {}
+        # metadata field -> value -> chunk_ids
+        self._fields: Dict[str, Dict[Hashable, Dict[str, None]]] = {}
         self._lock = asyncio.Lock()
         logger.debug("🚀 InMemoryChunkStore initialized")
-    
+
+    @staticmethod
+    def _indexable_fields(chunk: Chunk) -> Iterable[Tuple[str, Hashable]]:
+        metadata = chunk.chunk_metadata
+        for fields in (metadata.__dict__, metadata.__pydantic_extra__ or {}):
+            for key, value in fields.items():
+                try:
+                    hash(value)
+                except TypeError:
+                    continue
+                yield key, value
+
+    def _index(self, chunk: Chunk) -> None:
+        chunk_id = chunk.chunk_id
+        metadata = chunk.chunk_metadata
+        self._positions.setdefault((metadata.artifact_id, metadata.chunk_index), {})[chunk_id] = None
+        for key, value in self._indexable_fields(chunk):
+            self._fields.setdefault(key, {}).setdefault(value, {})[chunk_id] = None
+
+    def _unindex(self, chunk: Chunk) -> None:
+        chunk_id = chunk.chunk_id
+        metadata = chunk.chunk_metadata
+        position = (metadata.artifact_id, metadata.chunk_index)
+        ids = self._positions.get(position)
+        if ids is not None:
+            ids.pop(chunk_id, None)
+            if not ids:
+                del self._positions[position]
+        for key, value in self._indexable_fields(chunk):
+            values = self._fields.get(key)
+            ids = values.get(value) if values is not None else None
+            if ids is not None:
+                ids.pop(chunk_id, None)
+                if not ids:
+                    del values[value]
+
+    def _put(self, chunk: Chunk) -> bool:
+        """Store `chunk` and update the indexes; returns True if it replaced an existing chunk."""
+        previous = self._chunks.get(chunk.chunk_id)
+        if previous is not None:
+            self._unindex(previous)
+        else:
+            self._seq[chunk.chunk_id] = self._next_seq
+            self._next_seq += 1
+        self._chunks[chunk.chunk_id] = chunk
+        self._index(chunk)
+        return previous is not None
+
+    def _candidates(self, search_filter: Dict[str, Any],
+                    ordered: bool = True) -> Tuple[Optional[Iterable[str]], Dict[str, Any]]:
+        """
+        Chunk ids of the most selective indexed condition of `search_filter`, in storage
+        order, together with the conditions those ids still have to be checked against.
+
+        The ids are None when no condition can use an index and the caller has to scan.
+        """
+        best: Optional[Dict[str, None]] = None
+        used: Tuple[str, ...] = ()
+        try:
+            if "artifact_id" in search_filter and "chunk_index" in search_filter:
+                best = self._positions.get((search_filter["artifact_id"], search_filter["chunk_index"]), {})
+                used = ("artifact_id", "chunk_index")
+            for key, value in search_filter.items():
+                if best is not None and len(best) <= 1:
+                    break
+                values = self._fields.get(key)
+                if values is None:
+                    # Unknown field: nothing has it, so nothing matches
+                    return [], {}
+                ids = values.get(value, {})
+                if best is None or len(ids) < len(best):
+                    best, used = ids, (key,)
+        except TypeError:
+            # Unhashable filter value; fall back to scanning
+            return None, search_filter
+        if best is None:
+            return None, search_filter
+        remaining = {key: value for key, value in search_filter.items() if key not in used}
+        return (sorted(best, key=self._seq.__getitem__) if ordered else best), remaining
+
+    def _matching_chunks(self, search_filter: Dict[str, Any], ordered: bool = True) -> List[Chunk]:
+        candidates, remaining = self._candidates(search_filter, ordered)
+        chunks = self._chunks.values() if candidates is None else [self._chunks[i] for i in candidates]
+        if not remaining:
+            return list(chunks)
+        return [chunk for chunk in chunks if self._chunk_matches_filter(chunk, remaining)]
+
     async def upsert_chunk(self, chunk: Chunk) -> None:
         """
         Upsert a chunk to storage. If chunk with same chunk_id exists, update it; otherwise insert new one.
@@ -36,15 +132,9 @@ class InMemoryChunkStore(ChunkStore):
             chunk: Chunk object to be upserted
         """
         async with self._lock:
-            if chunk.chunk_id in self._chunk_index:
-                # Update existing chunk
-                index = self._chunk_index[chunk.chunk_id]
-                self._chunks[index] = chunk
+            if self._put(chunk):
                 logger.debug(f"🔄 Updated existing chunk: {chunk.chunk_id}")
             else:
-                # Insert new chunk
-                self._chunks.append(chunk)
-                self._chunk_index[chunk.chunk_id] = len(self._chunks) - 1
                 logger.debug(f"➕ Inserted new chunk: {chunk.chunk_id}")
     
     async def upsert_chunks_batch(self, chunks: List[Chunk]) -> None:
@@ -62,15 +152,9 @@ class InMemoryChunkStore(ChunkStore):
             inserted_count = 0
             
             for chunk in chunks:
-                if chunk.chunk_id in self._chunk_index:
-                    # Update existing chunk
-                    index = self._chunk_index[chunk.chunk_id]
-                    self._chunks[index] = chunk
+                if self._put(chunk):
                     updated_count += 1
                 else:
-                    # Insert new chunk
-                    self._chunks.append(chunk)
-                    self._chunk_index[chunk.chunk_id] = len(self._chunks) - 1
                     inserted_count += 1
             
             logger.debug(f"🔄 Batch upsert completed: {updated_count} updated, {inserted_count} inserted")
@@ -86,10 +170,7 @@ class InMemoryChunkStore(ChunkStore):
             Optional[Chunk]: The chunk if found, None otherwise
         """
         async with self._lock:
-            if chunk_id in self._chunk_index:
-                index = self._chunk_index[chunk_id]
-                return self._chunks[index]
-            return None
+            return self._chunks.get(chunk_id)
     
     async def check_chunk_exists(self, chunk_id: str) -> bool:
         """
@@ -102,7 +183,7 @@ class InMemoryChunkStore(ChunkStore):
             bool: True if chunk exists, False otherwise
         """
         async with self._lock:
-            return chunk_id in self._chunk_index
+            return chunk_id in self._chunks
     
     async def search_chunks(self, search_filter: Dict[str, Any]) -> List[Chunk]:
         """
@@ -115,11 +196,7 @@ class InMemoryChunkStore(ChunkStore):
             List[Chunk]: List of matching chunks
         """
         async with self._lock:
-            matching_chunks = []
-            for chunk in self._chunks:
-                if self._chunk_matches_filter(chunk, search_filter):
-                    matching_chunks.append(chunk)
-            return matching_chunks
+            return self._matching_chunks(search_filter)
     
     async def delete_chunk(self, chunk_id: str) -> bool:
         """
@@ -132,17 +209,11 @@ class InMemoryChunkStore(ChunkStore):
             bool: True if chunk was deleted, False if not found
         """
         async with self._lock:
-            if chunk_id not in self._chunk_index:
+            chunk = self._chunks.pop(chunk_id, None)
+            if chunk is None:
                 return False
-            
-            index = self._chunk_index[chunk_id]
-            del self._chunks[index]
-            del self._chunk_index[chunk_id]
-            
-            # Rebuild index for chunks after the deleted one
-            for i in range(index, len(self._chunks)):
-                self._chunk_index[self._chunks[i].chunk_id] = i
-            
+            self._unindex(chunk)
+            del self._seq[chunk_id]
             logger.debug(f"🗑️ Deleted chunk: {chunk_id}")
             return True
     
@@ -154,13 +225,15 @@ class InMemoryChunkStore(ChunkStore):
             List[Chunk]: List of all chunks
         """
         async with self._lock:
-            return self._chunks.copy()
+            return list(self._chunks.values())
     
     async def clear(self) -> None:
         """Clear all chunks from storage."""
         async with self._lock:
             self._chunks.clear()
-            self._chunk_index.clear()
+            self._seq.clear()
+            self._positions.clear()
+            self._fields.clear()
             logger.debug("🧹 Cleared all chunks from storage")
     
     async def get_chunk_count(self) -> int:
@@ -177,9 +250,8 @@ class InMemoryChunkStore(ChunkStore):
         """
         Get chunk counts grouped by artifact_id from in-memory storage.
         
-        This method filters chunks in memory and groups them by artifact_id.
-        For in-memory storage, this is still efficient as we avoid loading
-        chunk content, only processing metadata.
+        This method filters chunks through the metadata indexes and groups
+        them by artifact_id.
         
         Args:
             search_filter: Dictionary containing filter conditions to match against chunk_metadata
@@ -189,13 +261,8 @@ class InMemoryChunkStore(ChunkStore):
         """
         async with self._lock:
             try:
-                from collections import Counter
-                
                 # Filter chunks that match the search criteria
-                matching_chunks = [
-                    chunk for chunk in self._chunks 
-                    if self._chunk_matches_filter(chunk, search_filter)
-                ]
+                matching_chunks = self._matching_chunks(search_filter, ordered=False)
                 
                 # Count chunks per artifact_id using Counter
                 artifact_counts = Counter(chunk.chunk_metadata.artifact_id for chunk in matching_chunks)
@@ -211,8 +278,8 @@ class InMemoryChunkStore(ChunkStore):
         """
         Get chunks for a specific artifact within a range of chunk indices.
         
-        This method efficiently retrieves only the chunks within the specified range
-        from in-memory storage, avoiding loading all chunks for the artifact.
+        This method walks whichever is smaller: the positions of the range, or
+        the chunks of the artifact.
         
         Args:
             artifact_id: ID of the artifact
@@ -223,12 +290,18 @@ class InMemoryChunkStore(ChunkStore):
             List[Chunk]: List of chunks within the specified range, sorted by chunk_index
         """
         try:
-            # 🚀 Filter chunks by artifact_id and range in memory
-            matching_chunks = []
-            for chunk in self._chunks:
-                if (chunk.chunk_metadata.artifact_id == artifact_id and 
-                    start_index <= chunk.chunk_metadata.chunk_index < end_index):
-                    matching_chunks.append(chunk)
+            artifact_chunk_ids = self._fields.get("artifact_id", {}).get(artifact_id, {})
+            if end_index - start_index <= len(artifact_chunk_ids):
+                matching_chunks = [
+                    self._chunks[chunk_id]
+                    for index in range(start_index, end_index)
+                    for chunk_id in self._positions.get((artifact_id, index), ())
+                ]
+            else:
+                matching_chunks = [
+                    chunk for chunk in (self._chunks[chunk_id] for chunk_id in artifact_chunk_ids)
+                    if start_index <= chunk.chunk_metadata.chunk_index < end_index
+                ]
             
             # Sort by chunk_index to maintain order
             matching_chunks.sort(key=lambda x: x.chunk_metadata.chunk_index)
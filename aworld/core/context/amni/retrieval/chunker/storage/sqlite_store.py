@@ -38,13 +38,15 @@ class SQLiteChunkStore(ChunkStore):
             os.makedirs("./data")
         self.table_name = config.get("table_name", "chunks")
         self._lock = asyncio.Lock()
+        # One long-lived connection: its statement cache keeps the store's queries prepared
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
         self._init_database()
         logger.debug(f"🚀 SQLiteChunkStore initialized with database: {self.db_path}")
     
     def _init_database(self) -> None:
         """Initialize the database and create tables if they don't exist."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._conn as conn:
                 cursor = conn.cursor()
                 
                 # 🚀 Enable WAL mode to improve write performance
@@ -64,17 +66,26 @@ class SQLiteChunkStore(ChunkStore):
                     )
                 """)
                 
-                # Create index on chunk_id for faster lookups
+                # The primary key already indexes chunk_id; the old duplicate index only slowed writes
+                cursor.execute(f"DROP INDEX IF EXISTS idx_{self.table_name}_chunk_id")
+                
+                # Create JSON expression indexes for common metadata fields.
+                # (artifact_id, chunk_index) serves position lookups and range scans in index order
                 cursor.execute(f"""
-                    CREATE INDEX IF NOT EXISTS idx_{self.table_name}_chunk_id 
-                    ON {self.table_name}(chunk_id)
+                    CREATE INDEX IF NOT EXISTS idx_{self.table_name}_artifact_chunk
+                    ON {self.table_name}(
+                    JSON_EXTRACT(chunk_metadata, '$.artifact_id'),
+                    JSON_EXTRACT(chunk_metadata, '$.chunk_index'))
                 """)
+                # Superseded by the composite index above
+                cursor.execute(f"DROP INDEX IF EXISTS idx_{self.table_name}_artifact_id")
                 
-                # Create JSON expression indexes for common metadata fields
-                # Index for artifact_id queries (most common)
+                # Covering index for per-workspace artifact statistics: the GROUP BY reads no table rows
                 cursor.execute(f"""
-                    CREATE INDEX IF NOT EXISTS idx_{self.table_name}_artifact_id 
-                    ON {self.table_name}(JSON_EXTRACT(chunk_metadata, '$.artifact_id'))
+                    CREATE INDEX IF NOT EXISTS idx_{self.table_name}_workspace_artifact
+                    ON {self.table_name}(
+                    JSON_EXTRACT(chunk_metadata, '$.workspace_id'),
+                    JSON_EXTRACT(chunk_metadata, '$.artifact_id'))
                 """)
                 
                 # Index for workspace_id queries
@@ -103,12 +114,50 @@ class SQLiteChunkStore(ChunkStore):
                     ON {self.table_name}(created_at)
                 """)
                 
-                conn.commit()
                 logger.debug(f"✅ Database initialized successfully")
                 
         except Exception as e:
             logger.error(f"❌ Failed to initialize database: {e}")
             raise
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    @property
+    def _upsert_sql(self) -> str:
+        return f"""
+            INSERT INTO {self.table_name} (chunk_id, content, chunk_metadata)
+            VALUES (?, ?, ?)
+            ON CONFLICT(chunk_id) DO UPDATE SET
+                content = excluded.content,
+                chunk_metadata = excluded.chunk_metadata,
+                updated_at = CURRENT_TIMESTAMP
+        """
+
+    @staticmethod
+    def _row_to_chunk(row) -> Chunk:
+        chunk_id, content, metadata_json = row
+        metadata = ChunkMetadata.model_validate(json.loads(metadata_json))
+        return Chunk(chunk_id=chunk_id, content=content, chunk_metadata=metadata)
+
+    @staticmethod
+    def _build_where(search_filter: Dict[str, Any]):
+        """WHERE clause and parameters matching `search_filter` against chunk_metadata fields."""
+        where_conditions = []
+        query_params = []
+        for key, value in search_filter.items():
+            # Handle different data types properly for JSON extraction
+            where_conditions.append(f"JSON_EXTRACT(chunk_metadata, '$.{key}') = ?")
+            if isinstance(value, bool):
+                query_params.append(1 if value else 0)
+            elif isinstance(value, (int, float, str)):
+                query_params.append(value)
+            else:
+                # Fallback to string conversion
+                query_params.append(str(value))
+        where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
+        return where_clause, query_params
     
     async def upsert_chunk(self, chunk: Chunk) -> None:
         """
@@ -119,59 +168,34 @@ class SQLiteChunkStore(ChunkStore):
         """
         async with self._lock:
             try:
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    
-                    # Check if chunk exists
-                    cursor.execute(f"SELECT chunk_id FROM {self.table_name} WHERE chunk_id = ?", (chunk.chunk_id,))
-                    exists = cursor.fetchone() is not None
-                    
-                    if exists:
-                        # Update existing chunk
-                        cursor.execute(f"""
-                            UPDATE {self.table_name} 
-                            SET content = ?, chunk_metadata = ?, updated_at = CURRENT_TIMESTAMP
-                            WHERE chunk_id = ?
-                        """, (chunk.content, json.dumps(chunk.chunk_metadata.model_dump()), chunk.chunk_id))
-                        logger.debug(f"🔄 Updated existing chunk: {chunk.chunk_id}")
-                    else:
-                        # Insert new chunk
-                        cursor.execute(f"""
-                            INSERT INTO {self.table_name} (chunk_id, content, chunk_metadata)
-                            VALUES (?, ?, ?)
-                        """, (chunk.chunk_id, chunk.content, json.dumps(chunk.chunk_metadata.model_dump())))
-                        logger.debug(f"➕ Inserted new chunk: {chunk.chunk_id}")
-                    
-                    conn.commit()
+                with self._conn as conn:
+                    conn.execute(self._upsert_sql,
+                                 (chunk.chunk_id, chunk.content, json.dumps(chunk.chunk_metadata.model_dump())))
+                logger.debug(f"🔄 Upserted chunk: {chunk.chunk_id}")
                     
             except Exception as e:
                 logger.error(f"❌ Failed to upsert chunk {chunk.chunk_id}: {e}")
                 raise
     
-    async def upsert_chunks_batch(self, chunks: List[Chunk], batch_size: int = 200) -> None:
+    async def upsert_chunks_batch(self, chunks: List[Chunk], batch_size: int = 5000) -> None:
         """
         Upsert multiple chunks to storage in a batch operation.
         
+        Chunks are written with one executemany per batch; each batch is its own
+        transaction, so the lock is released between batches of a very large list.
+        
         Args:
             chunks: List of Chunk objects to be upserted
-            batch_size: Number of chunks to process in each batch (default: 200)
+            batch_size: Number of chunks to process in each batch (default: 5000)
         """
         if not chunks:
             return
             
-        start_time = time.time()
         total_chunks = len(chunks)
-        
-        # 🚀 If chunks count exceeds batch_size, process in batches
         if total_chunks > batch_size:
             logger.info(f"📦 Batch processing: {total_chunks} chunks, batch size: {batch_size}")
-            for i in range(0, total_chunks, batch_size):
-                batch_chunks = chunks[i:i + batch_size]
-                await self._process_batch(batch_chunks, i // batch_size + 1)
-            return
-        
-        # Single batch processing
-        await self._process_batch(chunks, 1)
+        for i in range(0, total_chunks, batch_size):
+            await self._process_batch(chunks[i:i + batch_size], i // batch_size + 1)
     
     async def _process_batch(self, chunks: List[Chunk], batch_num: int) -> None:
         """
@@ -185,74 +209,19 @@ class SQLiteChunkStore(ChunkStore):
         
         async with self._lock:
             try:
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    
-                    # 🚀 Batch query all chunk_ids to check existence
-                    query_start = time.time()
-                    chunk_ids = [chunk.chunk_id for chunk in chunks]
-                    placeholders = ','.join(['?' for _ in chunk_ids])
-                    cursor.execute(f"SELECT chunk_id FROM {self.table_name} WHERE chunk_id IN ({placeholders})", chunk_ids)
-                    existing_ids = {row[0] for row in cursor.fetchall()}
-                    query_time = time.time() - query_start
-                    
-                    # Separate chunks that need updating and inserting
-                    chunks_to_update = []
-                    chunks_to_insert = []
-                    
-                    for chunk in chunks:
-                        if chunk.chunk_id in existing_ids:
-                            chunks_to_update.append(chunk)
-                        else:
-                            chunks_to_insert.append(chunk)
-                    
-                    # 🚀 Batch update
-                    update_time = 0
-                    if chunks_to_update:
-                        update_start = time.time()
-                        update_data = [
-                            (chunk.content, json.dumps(chunk.chunk_metadata.model_dump()), chunk.chunk_id)
-                            for chunk in chunks_to_update
-                        ]
-                        cursor.executemany(f"""
-                            UPDATE {self.table_name} 
-                            SET content = ?, chunk_metadata = ?, updated_at = CURRENT_TIMESTAMP
-                            WHERE chunk_id = ?
-                        """, update_data)
-                        update_time = time.time() - update_start
-                    
-                    # 🚀 Batch insert
-                    insert_time = 0
-                    if chunks_to_insert:
-                        insert_start = time.time()
-                        
-                        # 🚀 Pre-serialize all metadata to reduce repeated calculations
-                        serialization_start = time.time()
-                        insert_data = []
-                        for chunk in chunks_to_insert:
-                            metadata_json = json.dumps(chunk.chunk_metadata.model_dump())
-                            insert_data.append((chunk.chunk_id, chunk.content, metadata_json))
-                        serialization_time = time.time() - serialization_start
-                        
-                        # 🚀 Use executemany for batch insert
-                        db_insert_start = time.time()
-                        cursor.executemany(f"""
-                            INSERT INTO {self.table_name} (chunk_id, content, chunk_metadata)
-                            VALUES (?, ?, ?)
-                        """, insert_data)
-                        db_insert_time = time.time() - db_insert_start
-                        
-                        insert_time = time.time() - insert_start
-                        
-                        logger.debug(f"🔧 Batch {batch_num} insert details - serialization time: {serialization_time:.3f}s, database insert time: {db_insert_time:.3f}s")
-                    
-                    conn.commit()
-                    batch_time = time.time() - batch_start_time
-                    
-                    logger.debug(f"🔄 Batch {batch_num} completed: {len(chunks_to_update)} updates, {len(chunks_to_insert)} inserts")
-                    logger.debug(f"⏱️ Batch {batch_num} performance - total chunks: {len(chunks)}, total time: {batch_time:.3f}s, "
-                              f"query time: {query_time:.3f}s, update time: {update_time:.3f}s, "
-                              f"insert time: {insert_time:.3f}s, average: {batch_time/len(chunks)*1000:.2f}ms/chunk")
+                # 🚀 Pre-serialize all metadata outside of the transaction
+                rows = [
+                    (chunk.chunk_id, chunk.content, json.dumps(chunk.chunk_metadata.model_dump()))
+                    for chunk in chunks
+                ]
+                serialization_time = time.time() - batch_start_time
+                
+                with self._conn as conn:
+                    conn.executemany(self._upsert_sql, rows)
+                
+                batch_time = time.time() - batch_start_time
+                logger.debug(f"⏱️ Batch {batch_num} performance - total chunks: {len(chunks)}, total time: {batch_time:.3f}s, "
+                             f"serialization time: {serialization_time:.3f}s, average: {batch_time/len(chunks)*1000:.3f}ms/chunk")
                     
             except Exception as e:
                 logger.error(f"❌ Batch {batch_num} processing failed: {e}")
@@ -270,7 +239,7 @@ class SQLiteChunkStore(ChunkStore):
         """
         async with self._lock:
             try:
-                with sqlite3.connect(self.db_path) as conn:
+                with self._conn as conn:
                     cursor = conn.cursor()
                     cursor.execute(f"""
                         SELECT chunk_id, content, chunk_metadata 
@@ -279,11 +248,7 @@ class SQLiteChunkStore(ChunkStore):
                     """, (chunk_id,))
                     
                     row = cursor.fetchone()
-                    if row:
-                        chunk_id, content, metadata_json = row
-                        metadata = ChunkMetadata.model_validate(json.loads(metadata_json))
-                        return Chunk(chunk_id=chunk_id, content=content, chunk_metadata=metadata)
-                    return None
+                    return self._row_to_chunk(row) if row else None
                     
             except Exception as e:
                 logger.error(f"❌ Failed to get chunk {chunk_id}: {e}")
@@ -301,7 +266,7 @@ class SQLiteChunkStore(ChunkStore):
         """
         async with self._lock:
             try:
-                with sqlite3.connect(self.db_path) as conn:
+                with self._conn as conn:
                     cursor = conn.cursor()
                     cursor.execute(f"SELECT 1 FROM {self.table_name} WHERE chunk_id = ?", (chunk_id,))
                     return cursor.fetchone() is not None
@@ -326,30 +291,10 @@ class SQLiteChunkStore(ChunkStore):
         """
         async with self._lock:
             try:
-                with sqlite3.connect(self.db_path) as conn:
+                with self._conn as conn:
                     cursor = conn.cursor()
                     
-                    # Build optimized SQL query using JSON_EXTRACT with proper type handling
-                    where_conditions = []
-                    query_params = []
-                    
-                    for key, value in search_filter.items():
-                        # Handle different data types properly for JSON extraction
-                        if isinstance(value, (int, float)):
-                            where_conditions.append(f"JSON_EXTRACT(chunk_metadata, '$.{key}') = ?")
-                            query_params.append(value)
-                        elif isinstance(value, str):
-                            where_conditions.append(f"JSON_EXTRACT(chunk_metadata, '$.{key}') = ?")
-                            query_params.append(value)
-                        elif isinstance(value, bool):
-                            where_conditions.append(f"JSON_EXTRACT(chunk_metadata, '$.{key}') = ?")
-                            query_params.append(1 if value else 0)
-                        else:
-                            # Fallback to string conversion
-                            where_conditions.append(f"JSON_EXTRACT(chunk_metadata, '$.{key}') = ?")
-                            query_params.append(str(value))
-                    
-                    where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
+                    where_clause, query_params = self._build_where(search_filter)
                     
                     # Add ORDER BY for consistent results and better performance
                     query = f"""
@@ -362,12 +307,7 @@ class SQLiteChunkStore(ChunkStore):
                     cursor.execute(query, query_params)
                     rows = cursor.fetchall()
                     
-                    matching_chunks = []
-                    for row in rows:
-                        chunk_id, content, metadata_json = row
-                        metadata = ChunkMetadata.model_validate(json.loads(metadata_json))
-                        chunk = Chunk(chunk_id=chunk_id, content=content, chunk_metadata=metadata)
-                        matching_chunks.append(chunk)
+                    matching_chunks = [self._row_to_chunk(row) for row in rows]
                     
                     logger.debug(f"🔍 Found {len(matching_chunks)} chunks matching filter: {search_filter}")
                     return matching_chunks
@@ -388,10 +328,9 @@ class SQLiteChunkStore(ChunkStore):
         """
         async with self._lock:
             try:
-                with sqlite3.connect(self.db_path) as conn:
+                with self._conn as conn:
                     cursor = conn.cursor()
                     cursor.execute(f"DELETE FROM {self.table_name} WHERE chunk_id = ?", (chunk_id,))
-                    conn.commit()
                     
                     deleted = cursor.rowcount > 0
                     if deleted:
@@ -411,18 +350,11 @@ class SQLiteChunkStore(ChunkStore):
         """
         async with self._lock:
             try:
-                with sqlite3.connect(self.db_path) as conn:
+                with self._conn as conn:
                     cursor = conn.cursor()
                     cursor.execute(f"SELECT chunk_id, content, chunk_metadata FROM {self.table_name}")
                     
-                    chunks = []
-                    for row in cursor.fetchall():
-                        chunk_id, content, metadata_json = row
-                        metadata = ChunkMetadata.model_validate(json.loads(metadata_json))
-                        chunk = Chunk(chunk_id=chunk_id, content=content, chunk_metadata=metadata)
-                        chunks.append(chunk)
-                    
-                    return chunks
+                    return [self._row_to_chunk(row) for row in cursor.fetchall()]
                     
             except Exception as e:
                 logger.error(f"❌ Failed to get all chunks: {e}")
@@ -432,10 +364,9 @@ class SQLiteChunkStore(ChunkStore):
         """Clear all chunks from storage."""
         async with self._lock:
             try:
-                with sqlite3.connect(self.db_path) as conn:
+                with self._conn as conn:
                     cursor = conn.cursor()
                     cursor.execute(f"DELETE FROM {self.table_name}")
-                    conn.commit()
                     logger.debug("🧹 Cleared all chunks from storage")
                     
             except Exception as e:
@@ -451,7 +382,7 @@ class SQLiteChunkStore(ChunkStore):
         """
         async with self._lock:
             try:
-                with sqlite3.connect(self.db_path) as conn:
+                with self._conn as conn:
                     cursor = conn.cursor()
                     cursor.execute(f"SELECT COUNT(*) FROM {self.table_name}")
                     return cursor.fetchone()[0]
@@ -502,20 +433,10 @@ class SQLiteChunkStore(ChunkStore):
         """
         async with self._lock:
             try:
-                with sqlite3.connect(self.db_path) as conn:
+                with self._conn as conn:
                     cursor = conn.cursor()
                     
-                    # Build WHERE conditions for JSON_EXTRACT queries
-                    where_conditions = []
-                    query_params = []
-                    param_count = 1
-                    
-                    for key, value in search_filter.items():
-                        where_conditions.append(f"JSON_EXTRACT(chunk_metadata, '$.{key}') = ?")
-                        query_params.append(str(value))
-                        param_count += 1
-                    
-                    where_clause = " AND ".join(where_conditions) if where_conditions else "TRUE"
+                    where_clause, query_params = self._build_where(search_filter)
                     
                     # Use GROUP BY to count chunks per artifact_id
                     query = f"""
@@ -561,7 +482,7 @@ class SQLiteChunkStore(ChunkStore):
         """
         async with self._lock:
             try:
-                with sqlite3.connect(self.db_path) as conn:
+                with self._conn as conn:
                     cursor = conn.cursor()
                     
                     # 🚀 Efficient range query using SQL
@@ -577,12 +498,7 @@ class SQLiteChunkStore(ChunkStore):
                     cursor.execute(query, (artifact_id, start_index, end_index))
                     rows = cursor.fetchall()
                     
-                    chunks = []
-                    for row in rows:
-                        chunk_id, content, metadata_json = row
-                        metadata = ChunkMetadata.model_validate(json.loads(metadata_json))
-                        chunk = Chunk(chunk_id=chunk_id, content=content, chunk_metadata=metadata)
-                        chunks.append(chunk)
+                    chunks = [self._row_to_chunk(row) for row in rows]
                     
                     logger.debug(f"🔍 Found {len(chunks)} chunks for artifact {artifact_id} in range [{start_index}, {end_index})")
                     return chunks
@@ -0,0 +1,306 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import AsyncIterable, Dict, Iterable, List, Optional, Union
+
+from aworld.logs.util import logger
+from aworld.output import Artifact
+from .chunker import Chunk, ChunkConfig, Chunker, ChunkerFactory, ChunkStore
+from .index.base import RetrievalIndexPlugin
+
+# Chunker providers that are pure CPU and can be rebuilt from their config in a worker process
+PROCESS_POOL_PROVIDERS = {"smart"}
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_QUEUE_SIZE = 16
+DEFAULT_INDEX_CONCURRENCY = 2
+# Same per-artifact cap as `AmniRetriever.async_insert`
+DEFAULT_MAX_CHUNKS_PER_ARTIFACT = 200
+
+_STOP = object()
+
+# One pool per worker count: a pool may still be in use by another pipeline, so it is never
+# replaced, only shut down by `shutdown_chunk_pool`.
+_pools: Dict[int, ProcessPoolExecutor] = {}
+_pool_lock = threading.Lock()
+
+
+def _get_process_pool(workers: int) -> ProcessPoolExecutor:
+    with _pool_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            pool = _pools[workers] = ProcessPoolExecutor(max_workers=workers,
+                                                         mp_context=multiprocessing.get_context("spawn"))
+        return pool
+
+
+def shutdown_chunk_pool() -> None:
+    """Stop the chunking worker processes; the next pipeline run starts new ones."""
+    with _pool_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=True)
+
+
+@lru_cache(maxsize=8)
+def _worker_chunker(config_json: str) -> Chunker:
+    return ChunkerFactory.get_chunker(ChunkConfig.model_validate_json(config_json))
+
+
+def _chunk_in_worker(config_json: str, artifact: Artifact) -> Optional[List[Chunk]]:
+    """Runs in a worker process: chunk one artifact with a per-process chunker."""
+    return asyncio.run(_worker_chunker(config_json).chunk(artifact))
+
+
+@dataclass
+class StageStats:
+    """Work done by one pipeline stage."""
+    name: str
+    items: int = 0
+    # Time spent doing the stage's own work, summed over its workers
+    busy_seconds: float = 0.0
+    # Time spent waiting for room in the downstream queue, i.e. backpressure
+    blocked_seconds: float = 0.0
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.busy_seconds if self.busy_seconds else 0.0
+
+
+@dataclass
+class IngestionStats:
+    """Result of an `IngestionPipeline.run`."""
+    artifacts: int = 0
+    chunks: int = 0
+    failed_artifacts: int = 0
+    elapsed_seconds: float = 0.0
+    stages: Dict[str, StageStats] = field(default_factory=lambda: {
+        name: StageStats(name) for name in ("chunk", "store", "index")
+    })
+
+    def summary(self) -> str:
+        parts = [f"{self.artifacts} artifacts, {self.chunks} chunks, {self.failed_artifacts} failed "
+                 f"in {self.elapsed_seconds:.3f}s"]
+        for stage in self.stages.values():
+            parts.append(f"{stage.name}: {stage.items} items, {stage.items_per_second:.1f}/s busy, "
+                         f"{stage.blocked_seconds:.3f}s blocked")
+        return "; ".join(parts)
+
+
+class IngestionPipeline:
+    """
+    Streaming ingestion of many artifacts into a chunk store and index plugins.
+
+    Three stages run concurrently and are connected by bounded queues, so a slow
+    stage throttles the ones before it and memory stays proportional to the queue
+    sizes rather than to the corpus:
+
+        artifacts --> [chunk] --> [store] --> [index]
+
+    - chunk: artifacts are chunked in a pool of worker processes when the chunker
+      can be rebuilt from `chunk_config` there, in-process otherwise.
+    - store: chunks are grouped into batches of `batch_size` and upserted to the chunk store.
+    - index: each batch is handed to every index plugin, where embedding happens
+      batch by batch; up to `index_concurrency` batches are in flight.
+
+    Args:
+        chunker: Chunker used in-process.
+        chunk_store: Store the chunks are written to.
+        index_plugins: Index plugins fed with every stored batch.
+        chunk_config: Config of `chunker`; enables process-pool chunking for supported providers.
+        chunk_workers: Worker processes for chunking, 0 chunks in-process. Defaults to min(4, cpu count).
+        batch_size: Chunks per store/index batch.
+        queue_size: Capacity of the queues between stages.
+        index_concurrency: Batches indexed concurrently.
+        max_chunks_per_artifact: Chunks kept per artifact.
+    """
+
+    def __init__(self,
+                 chunker: Chunker,
+                 chunk_store: ChunkStore,
+                 index_plugins: Optional[List[RetrievalIndexPlugin]] = None,
+                 chunk_config: Optional[ChunkConfig] = None,
+                 chunk_workers: Optional[int] = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 queue_size: int = DEFAULT_QUEUE_SIZE,
+                 index_concurrency: int = DEFAULT_INDEX_CONCURRENCY,
+                 max_chunks_per_artifact: int = DEFAULT_MAX_CHUNKS_PER_ARTIFACT) -> None:
+        self.chunker = chunker
+        self.chunk_store = chunk_store
+        self.index_plugins = index_plugins or []
+        if chunk_workers is None:
+            chunk_workers = min(4, os.cpu_count() or 1)
+        self.chunk_workers = chunk_workers
+        self.batch_size = max(1, batch_size)
+        self.queue_size = max(1, queue_size)
+        self.index_concurrency = max(1, index_concurrency)
+        self.max_chunks_per_artifact = max_chunks_per_artifact
+
+        self._config_json: Optional[str] = None
+        if chunk_workers > 0 and chunk_config is not None and chunk_config.provider in PROCESS_POOL_PROVIDERS:
+            self._config_json = chunk_config.model_dump_json()
+
+    @property
+    def uses_process_pool(self) -> bool:
+        return self._config_json is not None
+
+    async def run(self,
+                  workspace_id: str,
+                  artifacts: Union[Iterable[Artifact], AsyncIterable[Artifact]],
+                  index: bool = True) -> IngestionStats:
+        """
+        Chunk, store and (optionally) index `artifacts`, consuming them lazily.
+
+        Args:
+            workspace_id (str): Workspace the chunks belong to.
+            artifacts: Artifacts to ingest, as an iterable or async iterable.
+            index (bool): Whether to feed the index plugins.
+
+        Returns:
+            IngestionStats: Counts and per-stage metrics.
+        """
+        stats = IngestionStats()
+        start = time.perf_counter()
+        chunk_concurrency = self.chunk_workers * 2 if self.uses_process_pool else 1
+        artifact_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        chunk_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        index_queue: asyncio.Queue = asyncio.Queue(maxsize=self.index_concurrency)
+
+        async def chunk() -> None:
+            await asyncio.gather(*(self._chunk_stage(artifact_queue, chunk_queue, stats)
+                                   for _ in range(chunk_concurrency)))
+            await chunk_queue.put(_STOP)
+
+        async def store() -> None:
+            await self._store_stage(workspace_id, chunk_queue, index_queue if index else None, stats)
+            for _ in range(index_workers):
+                await index_queue.put(_STOP)
+
+        index_workers = self.index_concurrency if index else 0
+        tasks = [asyncio.create_task(self._feed(artifacts, artifact_queue, chunk_concurrency, stats)),
+                 asyncio.create_task(chunk()),
+                 asyncio.create_task(store())]
+        tasks += [asyncio.create_task(self._index_stage(workspace_id, index_queue, stats))
+                  for _ in range(index_workers)]
+        try:
+            # The first failure aborts the run, the other stages are cancelled below
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        stats.elapsed_seconds = time.perf_counter() - start
+        logger.info(f"📥 Ingested into workspace {workspace_id}: {stats.summary()}")
+        return stats
+
+    @staticmethod
+    async def _feed(artifacts, artifact_queue: asyncio.Queue, consumers: int, stats: IngestionStats) -> None:
+        async def put(artifact: Artifact) -> None:
+            if not isinstance(artifact.content, str):
+                return  # Skip non-string artifacts
+            stats.artifacts += 1
+            await artifact_queue.put(artifact)
+
+        if hasattr(artifacts, "__aiter__"):
+            async for artifact in artifacts:
+                await put(artifact)
+        else:
+            for artifact in artifacts:
+                await put(artifact)
+        for _ in range(consumers):
+            await artifact_queue.put(_STOP)
+
+    async def _chunk(self, artifact: Artifact) -> Optional[List[Chunk]]:
+        if self.uses_process_pool:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_get_process_pool(self.chunk_workers), _chunk_in_worker,
+                                              self._config_json, artifact)
+        return await self.chunker.chunk(artifact)
+
+    async def _chunk_stage(self, artifact_queue: asyncio.Queue, chunk_queue: asyncio.Queue,
+                           stats: IngestionStats) -> None:
+        stage = stats.stages["chunk"]
+        while True:
+            artifact = await artifact_queue.get()
+            if artifact is _STOP:
+                return
+            started = time.perf_counter()
+            try:
+                chunks = await self._chunk(artifact)
+            except Exception as e:
+                logger.error(f"❌ Failed to chunk artifact {artifact.artifact_id}: {e}, "
+                             f"traceback is {traceback.format_exc()}")
+                chunks = None
+            stage.busy_seconds += time.perf_counter() - started
+            stage.items += 1
+            if chunks is None:
+                stats.failed_artifacts += 1
+                continue
+            artifact.metadata["chunked"] = True
+            artifact.metadata["chunks"] = len(chunks)
+            if not chunks:
+                continue
+
+            blocked = time.perf_counter()
+            await chunk_queue.put(chunks[:self.max_chunks_per_artifact])
+            stage.blocked_seconds += time.perf_counter() - blocked
+
+    async def _store_stage(self, workspace_id: str, chunk_queue: asyncio.Queue,
+                           index_queue: Optional[asyncio.Queue], stats: IngestionStats) -> None:
+        stage = stats.stages["store"]
+        pending: List[Chunk] = []
+
+        async def flush() -> None:
+            batch = pending[:self.batch_size]
+            del pending[:self.batch_size]
+            started = time.perf_counter()
+            for chunk in batch:
+                chunk.chunk_metadata.workspace_id = workspace_id
+            await self.chunk_store.upsert_chunks_batch(batch)
+            stage.busy_seconds += time.perf_counter() - started
+            stage.items += len(batch)
+            stats.chunks += len(batch)
+            if index_queue is not None:
+                blocked = time.perf_counter()
+                await index_queue.put(batch)
+                stage.blocked_seconds += time.perf_counter() - blocked
+
+        while True:
+            chunks = await chunk_queue.get()
+            if chunks is _STOP:
+                break
+            pending.extend(chunks)
+            while len(pending) >= self.batch_size:
+                await flush()
+        while pending:
+            await flush()
+
+    async def _index_stage(self, workspace_id: str, index_queue: asyncio.Queue, stats: IngestionStats) -> None:
+        stage = stats.stages["index"]
+        while True:
+            batch = await index_queue.get()
+            if batch is _STOP:
+                return
+            started = time.perf_counter()
+            documents = [{
+                "doc_id": chunk.chunk_id,
+                "content": chunk.content,
+                "meta": chunk.chunk_metadata.model_dump()
+            } for chunk in batch]
+            # Every plugin is awaited, even ones with `wait_insert` off: the index
+            # stage is what throttles the stages before it.
+            results = await asyncio.gather(
+                *(plugin.build_index_batch(workspace_id, documents) for plugin in self.index_plugins),
+                return_exceptions=True)
+            for plugin, result in zip(self.index_plugins, results):
+                if isinstance(result, Exception):
+                    logger.error(f"❌ Failed to index {len(batch)} chunks with {type(plugin).__name__}: {result}")
+            stage.busy_seconds += time.perf_counter() - started
+            stage.items += len(batch)
@@ -11,7 +11,7 @@ class RerankConfig(BaseModel):
     Configuration for reranker providers.
     
     Attributes:
-        provider (str): Reranker provider type (e.g., "http").
+        provider (str): Reranker provider type ("http" or "local").
         config (Optional[dict[str, Any]]): Provider-specific configuration.
     """
     provider: str = Field(default="http", description="Provider")
@@ -78,6 +78,9 @@ class RerankerFactory:
         if reranker_config.provider == "http":
             from .http import HttpReranker
             return HttpReranker(reranker_config)
+        elif reranker_config.provider == "local":
+            from .local import LocalReranker
+            return LocalReranker(reranker_config)
         else:
             raise ValueError(f"Invalid reranker provider: {reranker_config.provider}")
 
@@ -90,9 +93,12 @@ class RerankerFactory:
             Reranker: Default reranker instance.
             
         Environment Variables:
+            RERANKER_PROVIDER: "http" or "local". Defaults to "http", or to "local"
+                when RERANKER_BASE_URL is unset.
             RERANKER_BASE_URL: Base URL for reranker API.
             RERANKER_API_KEY: API key for authentication.
             RERANKER_MODEL_NAME: Model name to use.
+            RERANKER_MODEL_PATH: ONNX cross-encoder for the local provider (optional).
             
         Example:
             ```python
@@ -103,7 +109,12 @@ class RerankerFactory:
             reranker = RerankerFactory.get_default_reranker()
             ```
         """
-        return RerankerFactory.get_reranker(RerankConfig(provider="http", config={
+        provider = os.getenv("RERANKER_PROVIDER") or ("http" if os.getenv("RERANKER_BASE_URL") else "local")
+        if provider == "local":
+            return RerankerFactory.get_reranker(RerankConfig(provider="local", config={
+                "model_path": os.getenv("RERANKER_MODEL_PATH"),
+            }))
+        return RerankerFactory.get_reranker(RerankConfig(provider=provider, config={
             "base_url": os.getenv("RERANKER_BASE_URL"),
             "api_key": os.getenv("RERANKER_API_KEY"),
             "model_name": os.getenv("RERANKER_MODEL_NAME"),
@@ -0,0 +1,265 @@
+import asyncio
+import hashlib
+import math
+import re
+import threading
+import traceback
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from aworld.logs.util import logger
+from .base import Reranker, RerankResult
+from .factory import RerankConfig
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Documents are scored on their head, like the HTTP reranker does
+MAX_DOC_LENGTH = 1000
+DEFAULT_BATCH_SIZE = 32
+DEFAULT_MAX_LENGTH = 512
+DEFAULT_MODEL_WEIGHT = 0.8
+
+# Latin words and digits as tokens, CJK ideographs one character at a time
+_TOKEN_RE = re.compile(r"[0-9a-z_]+|[\u3400-\u4dbf\u4e00-\u9fff]")
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8", errors="ignore"), digest_size=16).hexdigest()
+
+
+class RerankScoreCache:
+    """
+    Thread-safe LRU of per-document work, keyed by content hash.
+
+    Holds the term frequencies of each document (reused across queries) and the
+    cross-encoder score of each (model, query hash, doc hash) pair, so only
+    unseen pairs reach the model.
+    """
+
+    def __init__(self, max_entries: int = 50000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Tuple, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+local_rerank_cache = RerankScoreCache()
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="local-reranker")
+        return _executor
+
+
+class _CrossEncoder:
+    """Small ONNX cross-encoder (e.g. an exported ms-marco MiniLM) scored with onnxruntime on CPU."""
+
+    def __init__(self, model_path: str, tokenizer_path: Optional[str], max_length: int, num_threads: int):
+        import onnxruntime
+        from tokenizers import Tokenizer
+
+        model_file = Path(model_path)
+        if model_file.is_dir():
+            model_file = model_file / "model.onnx"
+        tokenizer_file = Path(tokenizer_path) if tokenizer_path else model_file.parent / "tokenizer.json"
+
+        options = onnxruntime.SessionOptions()
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        self.session = onnxruntime.InferenceSession(str(model_file), options, providers=["CPUExecutionProvider"])
+        self.input_names = {item.name for item in self.session.get_inputs()}
+        self.tokenizer = Tokenizer.from_file(str(tokenizer_file))
+        self.tokenizer.enable_truncation(max_length=max_length)
+        self.tokenizer.enable_padding()
+        # InferenceSession.run is thread-safe, the tokenizer's padding state is not
+        self._lock = threading.Lock()
+
+    def score(self, query: str, documents: List[str]) -> List[float]:
+        import numpy as np
+
+        with self._lock:
+            encodings = self.tokenizer.encode_batch([(query, doc) for doc in documents])
+        features = {
+            "input_ids": np.asarray([e.ids for e in encodings], dtype=np.int64),
+            "attention_mask": np.asarray([e.attention_mask for e in encodings], dtype=np.int64),
+            "token_type_ids": np.asarray([e.type_ids for e in encodings], dtype=np.int64),
+        }
+        logits = self.session.run(None, {k: v for k, v in features.items() if k in self.input_names})[0]
+        logits = np.asarray(logits, dtype=np.float32)
+        if logits.ndim > 1:
+            logits = logits[:, -1]
+        return (1.0 / (1.0 + np.exp(-logits))).tolist()
+
+
+@lru_cache(maxsize=4)
+def _load_cross_encoder(model_path: str, tokenizer_path: Optional[str], max_length: int,
+                        num_threads: int) -> Optional[_CrossEncoder]:
+    try:
+        return _CrossEncoder(model_path, tokenizer_path, max_length, num_threads)
+    except ImportError as e:
+        logger.warning(f"⚠️ Local reranker model {model_path} needs onnxruntime and tokenizers ({e}), "
+                       f"falling back to lexical scoring")
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to load local reranker model {model_path}: {e}, falling back to lexical scoring")
+    return None
+
+
+class LocalReranker(Reranker):
+    """
+    In-process CPU reranker, no service required.
+
+    Scores documents with BM25 over the candidate list, normalized to [0, 1), and,
+    when `model_path` points at an ONNX cross-encoder, blends in the model's
+    relevance probability. Documents are scored in batches on a worker thread so
+    the event loop is never blocked, and both the per-document term statistics
+    and the model scores are cached by content hash.
+
+    Config keys (all optional):
+        model_path: ONNX model file, or a directory holding `model.onnx` and `tokenizer.json`.
+        tokenizer_path: `tokenizer.json` of the model, if not next to it.
+        model_weight: Weight of the cross-encoder score in the blend. Defaults to 0.8.
+        batch_size: Documents per model call. Defaults to 32.
+        max_length: Max tokens per (query, document) pair. Defaults to 512.
+        num_threads: onnxruntime intra-op threads; 0 lets onnxruntime decide.
+    """
+
+    def __init__(self, config: Optional[RerankConfig] = None, cache: Optional[RerankScoreCache] = None) -> None:
+        self.config = config or RerankConfig(provider="local")
+        self.cache = cache if cache is not None else local_rerank_cache
+        self.model_path: Optional[str] = self.config.get_value("model_path")
+        model_weight = self.config.get_value("model_weight")
+        self.model_weight = DEFAULT_MODEL_WEIGHT if model_weight is None else float(model_weight)
+        self.batch_size = int(self.config.get_value("batch_size") or DEFAULT_BATCH_SIZE)
+
+    async def run(
+            self,
+            query: str,
+            documents: List[str],
+            top_k: Optional[int] = 10,
+            **kwargs
+    ) -> Optional[List[RerankResult]]:
+        """
+        Rerank documents in a worker thread.
+
+        Args:
+            query (str): Search query.
+            documents (List[str]): List of documents to rerank.
+            top_k (Optional[int]): Number of top results to return.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            List[RerankResult]: List of rerank results sorted by score.
+        """
+        if not documents:
+            return None
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_get_executor(), self.rerank, query, documents, top_k)
+        except Exception as e:
+            logger.error(f"❌ Local rerank failed: {str(e)}, traceback is {traceback.format_exc()}")
+            return None
+
+    def rerank(self, query: str, documents: List[str], top_k: Optional[int] = 10) -> List[RerankResult]:
+        """Synchronous scoring; `run` calls this off the event loop."""
+        scores = self._lexical_scores(query, documents)
+        encoder = self._cross_encoder()
+        if encoder is not None:
+            model_scores = self._model_scores(encoder, query, documents)
+            scores = [self.model_weight * m + (1 - self.model_weight) * s for m, s in zip(model_scores, scores)]
+
+        results = [RerankResult(idx=i, doc=doc, score=score) for i, (doc, score) in enumerate(zip(documents, scores))]
+        results.sort(key=lambda x: x.score, reverse=True)
+        return results[:top_k] if top_k is not None else results
+
+    def _term_frequencies(self, doc: str) -> Tuple[Counter, int]:
+        key = ("tf", _digest(doc))
+        cached = self.cache.get(key)
+        if cached is None:
+            tokens = tokenize(doc[:MAX_DOC_LENGTH])
+            cached = (Counter(tokens), len(tokens))
+            self.cache.put(key, cached)
+        return cached
+
+    def _lexical_scores(self, query: str, documents: List[str]) -> List[float]:
+        query_terms = set(tokenize(query))
+        stats = [self._term_frequencies(doc) for doc in documents]
+        if not query_terms:
+            return [0.0] * len(documents)
+
+        n_docs = len(stats)
+        avg_len = (sum(length for _, length in stats) / n_docs) or 1.0
+        doc_freq: Dict[str, int] = {term: sum(1 for tf, _ in stats if term in tf) for term in query_terms}
+        idf = {term: math.log(1 + (n_docs - df + 0.5) / (df + 0.5)) for term, df in doc_freq.items()}
+
+        scores = []
+        for tf, length in stats:
+            raw = 0.0
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * length / avg_len)
+            for term in query_terms:
+                freq = tf.get(term)
+                if freq:
+                    raw += idf[term] * freq * (BM25_K1 + 1) / (freq + norm)
+            # Squash into [0, 1) so the score composes with thresholds and model probabilities
+            scores.append(raw / (raw + len(query_terms)))
+        return scores
+
+    def _cross_encoder(self) -> Optional[_CrossEncoder]:
+        if not self.model_path:
+            return None
+        return _load_cross_encoder(
+            str(self.model_path),
+            self.config.get_value("tokenizer_path"),
+            int(self.config.get_value("max_length") or DEFAULT_MAX_LENGTH),
+            int(self.config.get_value("num_threads") or 0),
+        )
+
+    def _model_scores(self, encoder: _CrossEncoder, query: str, documents: List[str]) -> List[float]:
+        query_digest = _digest(query)
+        keys = [("ce", self.model_path, query_digest, _digest(doc)) for doc in documents]
+        scores: List[Optional[float]] = [self.cache.get(key) for key in keys]
+
+        pending = [i for i, score in enumerate(scores) if score is None]
+        for start in range(0, len(pending), self.batch_size):
+            batch = pending[start:start + self.batch_size]
+            batch_scores = encoder.score(query, [documents[i][:MAX_DOC_LENGTH] for i in batch])
+            for i, score in zip(batch, batch_scores):
+                scores[i] = float(score)
+                self.cache.put(keys[i], scores[i])
+        return scores
@@ -15,6 +15,9 @@ class VectorDBFactory:
         if vector_db_config.provider == "elasticsearch":
             from .elasticsearch import ElasticsearchVectorDB
             return ElasticsearchVectorDB(vector_db_config.config)
+        if vector_db_config.provider == "local":
+            from .local import LocalVectorDB
+            return LocalVectorDB(vector_db_config.config)
         if vector_db_config.provider == "qdrant":
             from .qdrant import QdrantVectorDB
             return QdrantVectorDB(vector_db_config.config)
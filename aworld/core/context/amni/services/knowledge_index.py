@@ -0,0 +1,109 @@
+# coding: utf-8
+# Copyright (c) 2025 inclusionAI.
+"""
+Line-offset indexes for knowledge artifacts.
+
+`KnowledgeService` pages through large artifacts by line range and greps them
+line by line. A `LineIndex` records where every line starts, so a range is a
+single slice of the text instead of a split of the whole document, and
+`KnowledgeIndexCache` keeps one index per artifact head version so it is built
+once per version rather than once per call.
+"""
+import re
+import threading
+from array import array
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Hashable, Iterator, Optional, Tuple
+
+
+class LineIndex:
+    """Start offsets of the lines of `text` (split on '\\n', like `str.split('\\n')`)."""
+
+    __slots__ = ("text", "_starts")
+
+    def __init__(self, text: str):
+        self.text = text
+        starts = array('q', [0])
+        find = text.find
+        pos = find('\n')
+        while pos != -1:
+            starts.append(pos + 1)
+            pos = find('\n', pos + 1)
+        self._starts = starts
+
+    @property
+    def line_count(self) -> int:
+        return len(self._starts)
+
+    def _end(self, line_num: int) -> int:
+        """Offset just past the content of 1-based `line_num` (excluding its newline)."""
+        if line_num < len(self._starts):
+            return self._starts[line_num] - 1
+        return len(self.text)
+
+    def line(self, line_num: int) -> str:
+        """Content of the 1-based line `line_num`."""
+        return self.text[self._starts[line_num - 1]:self._end(line_num)]
+
+    def lines(self, start_line: int, end_line: int) -> str:
+        """Lines `start_line`..`end_line` (1-based, inclusive, end clamped) joined by '\\n'."""
+        end_line = min(end_line, self.line_count)
+        return self.text[self._starts[start_line - 1]:self._end(end_line)]
+
+    def iter_lines(self, start_line: int = 1) -> Iterator[Tuple[int, str]]:
+        """Yield `(line_num, line)` pairs lazily, so callers can stop early."""
+        for line_num in range(start_line, self.line_count + 1):
+            yield line_num, self.line(line_num)
+
+
+@lru_cache(maxsize=256)
+def compile_pattern(pattern: str, flags: int = 0) -> "re.Pattern[str]":
+    """`re.compile` with an LRU of its own, so hot grep patterns stay compiled."""
+    return re.compile(pattern, flags)
+
+
+class KnowledgeIndexCache:
+    """
+    LRU of line indexes keyed by (workspace id, artifact id) and validated by the
+    artifact's head version. Bounded by the total characters of indexed text.
+    """
+
+    def __init__(self, max_chars: int = 64 * 1024 * 1024):
+        self.max_chars = max_chars
+        self._entries: "OrderedDict[Tuple[Any, str], Tuple[Hashable, LineIndex]]" = OrderedDict()
+        self._chars = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple[Any, str], version: Hashable) -> Optional[LineIndex]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Tuple[Any, str], version: Hashable, index: LineIndex) -> None:
+        if len(index.text) > self.max_chars:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._chars -= len(previous[1].text)
+            self._entries[key] = (version, index)
+            self._chars += len(index.text)
+            while self._chars > self.max_chars and self._entries:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._chars -= len(evicted.text)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._chars = 0
+
+
+knowledge_line_indexes = KnowledgeIndexCache()
@@ -7,9 +7,14 @@ This service abstracts knowledge management operations from ApplicationContext,
 providing a clean interface for adding, updating, retrieving, and searching knowledge.
 """
 import abc
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Hashable
 
 from aworld.core.context.amni.retrieval.embeddings import SearchResults
+from aworld.core.context.amni.services.knowledge_index import (
+    LineIndex,
+    compile_pattern,
+    knowledge_line_indexes,
+)
 from aworld.core.context.amni.state.common import WorkingState
 from aworld.logs.util import logger
 from aworld.memory.tool_result_compaction import (
@@ -406,17 +411,13 @@ class KnowledgeService(IKnowledgeService):
         
         
         try:
-            workspace = await self._context._ensure_workspace()
-            artifact = workspace.get_latest_artifact(knowledge_id)
+            line_index = await self._get_line_index(knowledge_id)
             
-            if not artifact:
+            if not line_index:
                 logger.warning(f"⚠️ Knowledge artifact not found: knowledge_id={knowledge_id}")
                 return None
             
-            # Split content into lines
-            content_str = artifact.content if isinstance(artifact.content, str) else str(artifact.content)
-            lines = content_str.split('\n')
-            total_lines = len(lines)
+            total_lines = line_index.line_count
             
             # Validate line numbers (1-based indexing)
             if start_line < 1 or end_line < 1:
@@ -434,9 +435,8 @@ class KnowledgeService(IKnowledgeService):
             # Adjust end_line if it exceeds total lines
             actual_end_line = min(end_line, total_lines)
             
-            # Extract lines (convert to 0-based indexing)
-            selected_lines = lines[start_line - 1:actual_end_line]
-            content = '\n'.join(selected_lines)
+            # Slice the range straight out of the indexed content
+            content = line_index.lines(start_line, actual_end_line)
             
             logger.info(f"✅ Knowledge lines retrieved: knowledge_id={knowledge_id}, lines={start_line}-{actual_end_line}")
             return f"Lines {start_line}-{actual_end_line} of {total_lines} (knowledge_id: {knowledge_id}):\n\n{content}"
@@ -445,6 +445,41 @@ class KnowledgeService(IKnowledgeService):
             logger.error(f"❌ Error retrieving knowledge by lines: knowledge_id={knowledge_id}, error={str(e)}")
             return None
     
+    async def _get_line_index(self, knowledge_id: str) -> Optional[LineIndex]:
+        """Line index of the artifact's head version, built once per version and cached."""
+        workspace = await self._context._ensure_workspace()
+        cache_key = (getattr(workspace, "workspace_id", None), knowledge_id)
+        version = self._head_version(workspace, knowledge_id)
+        if version is not None:
+            line_index = knowledge_line_indexes.get(cache_key, version)
+            if line_index is not None:
+                return line_index
+
+        artifact = workspace.get_latest_artifact(knowledge_id)
+        if not artifact:
+            return None
+        content_str = artifact.content if isinstance(artifact.content, str) else str(artifact.content)
+        line_index = LineIndex(content_str)
+        if version is not None:
+            knowledge_line_indexes.put(cache_key, version, line_index)
+        return line_index
+
+    @staticmethod
+    def _head_version(workspace, knowledge_id: str) -> Optional[Hashable]:
+        """Head version id from the repository's version list, without loading the content."""
+        repository = getattr(workspace, "repository", None)
+        if repository is None:
+            return None
+        try:
+            versions = repository.get_artifact_versions(knowledge_id)
+        except Exception as e:
+            logger.debug(f"Failed to read versions of knowledge#{knowledge_id}: {e}")
+            return None
+        if not versions:
+            return None
+        head = versions[-1]
+        return head.get("id") or head.get("timestamp")
+
     async def grep_knowledge(self, knowledge_id: str, pattern: str, ignore_case: bool = False, 
                             context_before: int = 0, context_after: int = 0, max_results: int = 100,
                             namespace: str = "default") -> Optional[str]:
@@ -467,31 +502,27 @@ class KnowledgeService(IKnowledgeService):
         
         
         try:
-            workspace = await self._context._ensure_workspace()
-            artifact = workspace.get_latest_artifact(knowledge_id)
+            line_index = await self._get_line_index(knowledge_id)
             
-            if not artifact:
+            if not line_index:
                 logger.warning(f"⚠️ Knowledge artifact not found: knowledge_id={knowledge_id}")
                 return None
             
-            # Split content into lines
-            content_str = artifact.content if isinstance(artifact.content, str) else str(artifact.content)
-            lines = content_str.split('\n')
-            total_lines = len(lines)
+            total_lines = line_index.line_count
             
             # Compile regex pattern
             try:
                 flags = re.IGNORECASE if ignore_case else 0
-                regex = re.compile(pattern, flags)
+                regex = compile_pattern(pattern, flags)
             except re.error as e:
                 logger.warning(f"⚠️ Invalid regex pattern: {str(e)}")
                 return None
             
-            # Find matching lines
+            # Find matching lines, streaming over the index and stopping at max_results
             matches = []
             matched_line_numbers = set()
             
-            for line_num, line in enumerate(lines, start=1):
+            for line_num, line in line_index.iter_lines():
                 if regex.search(line):
                     matches.append(line_num)
                     matched_line_numbers.add(line_num)
@@ -529,7 +560,7 @@ class KnowledgeService(IKnowledgeService):
                 if prev_line > 0 and line_num > prev_line + 1:
                     result_lines.append("--")
                 
-                line_content = lines[line_num - 1]
+                line_content = line_index.line(line_num)
                 
                 # Mark matching lines with different prefix
                 if line_num in matched_line_numbers:
@@ -21,6 +21,10 @@ class DataLoader(Generic[_T_co]):
         batch_sampler: Iterable yielding lists of indices per batch. Mutually exclusive with
             ``batch_size``, ``shuffle``, ``sampler``, and ``drop_last``.
         collate_fn: Optional function to merge a list of samples into a batch object.
+        shuffle_buffer_size: When ``shuffle`` is set and no ``sampler`` is given, read the
+            dataset sequentially and shuffle through a buffer of this many samples instead
+            of drawing a full permutation. Keeps reads local for lazily loaded datasets
+            and lets the first batch arrive after ``shuffle_buffer_size`` reads.
     """
 
     def __init__(
@@ -34,6 +38,7 @@ class DataLoader(Generic[_T_co]):
         seed: Optional[int] = None,
         batch_sampler: Optional[Iterable[List[int]]] = None,
         collate_fn: Optional[Callable[[List[_T_co]], _Batch]] = None,
+        shuffle_buffer_size: Optional[int] = None,
     ) -> None:
         # Validate exclusivity
         if batch_sampler is not None:
@@ -44,6 +49,8 @@ class DataLoader(Generic[_T_co]):
         else:
             if batch_size is None or batch_size <= 0:
                 raise ValueError("batch_size must be a positive integer")
+        if shuffle_buffer_size is not None and shuffle_buffer_size <= 0:
+            raise ValueError("shuffle_buffer_size must be a positive integer")
 
         self.dataset = dataset
         self.batch_size = batch_size
@@ -53,6 +60,7 @@ class DataLoader(Generic[_T_co]):
         self.seed = seed
         self.batch_sampler = batch_sampler
         self.collate_fn = collate_fn
+        self.shuffle_buffer_size = shuffle_buffer_size
 
     def __iter__(self) -> Iterator[Union[List[_T_co], _Batch]]:
         # If batch_sampler is provided, try to inject dataset length then iterate directly on its batches
@@ -68,42 +76,22 @@ class DataLoader(Generic[_T_co]):
             except Exception:
                 pass
             for batch_indices in self.batch_sampler:
-                batch: List[_T_co] = []
-                for idx in batch_indices:
-                    try:
-                        item = self.dataset.__getitem__(idx)  # type: ignore[attr-defined]
-                    except NotImplementedError:
-                        item = self.dataset.data[idx]  # type: ignore[attr-defined]
-                    batch.append(item)
+                batch: List[_T_co] = [self._get_item(idx) for idx in batch_indices]
                 yield self._maybe_collate(batch)
             return
 
         # Resolve indices from sampler / shuffle
         num_items = len(self.dataset)
-        if self.sampler is not None:
-            # Inject dataset length for samplers that support it
-            try:
-                if hasattr(self.sampler, "set_dataset"):
-                    self.sampler.set_dataset(self.dataset)  # type: ignore[call-arg]
-                elif hasattr(self.sampler, "set_length") and self.sampler.length is None:
-                    self.sampler.set_length(num_items)  # type: ignore[call-arg]
-            except Exception:
-                pass
-            indices = list(iter(self.sampler))
+        items: Iterable[_T_co]
+        if self.sampler is None and self.shuffle and self.shuffle_buffer_size is not None:
+            items = self._buffered_shuffle(num_items)
         else:
-            indices = list(range(num_items))
-            if self.shuffle and num_items > 1:
-                rng = random.Random(self.seed)
-                rng.shuffle(indices)
+            items = (self._get_item(idx) for idx in self._resolve_indices(num_items))
 
         # Batch iteration
         assert self.batch_size is not None
         batch: List[_T_co] = []
-        for idx in indices:
-            try:
-                item = self.dataset.__getitem__(idx)  # type: ignore[attr-defined]
-            except NotImplementedError:
-                item = self.dataset.data[idx]  # type: ignore[attr-defined]
+        for item in items:
             batch.append(item)
             if len(batch) == self.batch_size:
                 yield self._maybe_collate(batch)
@@ -112,6 +100,45 @@ class DataLoader(Generic[_T_co]):
         if batch and not self.drop_last:
             yield self._maybe_collate(batch)
 
+    def _get_item(self, idx: int) -> _T_co:
+        try:
+            return self.dataset.__getitem__(idx)  # type: ignore[attr-defined]
+        except NotImplementedError:
+            return self.dataset.data[idx]  # type: ignore[attr-defined]
+
+    def _resolve_indices(self, num_items: int) -> List[int]:
+        if self.sampler is not None:
+            # Inject dataset length for samplers that support it
+            try:
+                if hasattr(self.sampler, "set_dataset"):
+                    self.sampler.set_dataset(self.dataset)  # type: ignore[call-arg]
+                elif hasattr(self.sampler, "set_length") and self.sampler.length is None:
+                    self.sampler.set_length(num_items)  # type: ignore[call-arg]
+            except Exception:
+                pass
+            return list(iter(self.sampler))
+        indices = list(range(num_items))
+        if self.shuffle and num_items > 1:
+            rng = random.Random(self.seed)
+            rng.shuffle(indices)
+        return indices
+
+    def _buffered_shuffle(self, num_items: int) -> Iterator[_T_co]:
+        """Yield samples in approximately random order reading the dataset sequentially."""
+        assert self.shuffle_buffer_size is not None
+        rng = random.Random(self.seed)
+        buffer: List[_T_co] = []
+        for idx in range(num_items):
+            item = self._get_item(idx)
+            if len(buffer) < self.shuffle_buffer_size:
+                buffer.append(item)
+                continue
+            pick = rng.randrange(len(buffer))
+            buffer[pick], item = item, buffer[pick]
+            yield item
+        rng.shuffle(buffer)
+        yield from buffer
+
     def __len__(self) -> int:
         if self.batch_sampler is not None:
             # Try best-effort length when batch_sampler has __len__
@@ -11,6 +11,7 @@ from pydantic import BaseModel, Field
 from aworld.utils import import_package
 from aworld.dataset.sampler import Sampler
 from aworld.dataset.dataloader import DataLoader
+from aworld.dataset.lazy_records import LAZY_FORMATS, ConcatRecords, open_lazy_records
 from aworld.logs.util import logger
 from aworld.config.conf import ConfigDict
 from aworld.config.conf import DatasetConfig
@@ -57,6 +58,7 @@ class Dataset(BaseModel, Generic[_T_co]):
         encoding: str = "utf-8",
         limit: Optional[int] = None,
         preload_transform: Optional[Callable[[_T_co], _T_co]] = None,
+        lazy: bool = False,
     ):
         """Load data into `data` from a local path(s) or Hugging Face Hub.
 
@@ -76,6 +78,13 @@ class Dataset(BaseModel, Generic[_T_co]):
             preload_transform: Optional callable to transform each data item while
                 loading. This materializes transformed data into
                 `self.data`. 
+            lazy: Keep local jsonl/csv/txt/parquet files on disk and index them
+                instead of reading every record into memory. `data` becomes a
+                read-only sequence that decodes one record per access (jsonl/csv/txt
+                through a memory-mapped line-offset index, parquet one row group at
+                a time), and `preload_transform` is applied on access. Hugging Face
+                datasets keep their memory-mapped arrow table instead of being
+                converted to a list.
 
         Returns:
             self (with `data` replaced by the loaded records/items).
@@ -113,6 +122,31 @@ class Dataset(BaseModel, Generic[_T_co]):
             formats_seen: List[str] = []
             remaining = limit
 
+            if lazy:
+                parts = []
+                for p in paths:
+                    fmt_this = (format or p.suffix.lstrip(".")).lower()
+                    if fmt_this not in LAZY_FORMATS:
+                        raise ValueError(
+                            f"Lazy loading does not support format {fmt_this!r}; supported: {sorted(LAZY_FORMATS)}"
+                        )
+                    formats_seen.append(fmt_this)
+                    parts.append(open_lazy_records(
+                        p,
+                        fmt_this,
+                        encoding=encoding,
+                        parquet_columns=parquet_columns,
+                        item_transform=preload_transform,
+                    ))
+                self.data = parts[0] if len(parts) == 1 and limit is None else ConcatRecords(parts, limit=limit)  # type: ignore[assignment]
+                meta = {"format": "multiple" if len(set(formats_seen)) > 1 else formats_seen[0], "lazy": True}
+                if len(paths) == 1:
+                    meta.update({"source": str(paths[0])})
+                else:
+                    meta.update({"sources": [str(p) for p in paths]})
+                self.metadata.update(meta)
+                return
+
             def _read_single_file(file_path: Path, fmt_override: Optional[str], max_items: Optional[int]) -> List[Any]:
                 fmt_local = (fmt_override or file_path.suffix.lstrip(".")).lower()
                 if fmt_local not in {"csv", "json", "jsonl", "txt", "parquet"}:
@@ -230,6 +264,15 @@ class Dataset(BaseModel, Generic[_T_co]):
 
         try:
             ds = load_dataset(source, subset, split=split, streaming=False)  # type: ignore[call-arg]
+            if lazy and preload_transform is None:
+                # Arrow-backed datasets are memory-mapped and support random access directly.
+                if limit is not None:
+                    ds = ds.select(range(min(limit, len(ds))))
+                self.data = ds  # type: ignore[assignment]
+                self.metadata.update(
+                    {"source": source, "format": "huggingface", "split": split, "subset": subset, "lazy": True}
+                )
+                return
             # Convert to list of dicts/records
             iterator: Iterable[Any]
             try:
@@ -252,6 +295,7 @@ class Dataset(BaseModel, Generic[_T_co]):
         seed: Optional[int] = None,
         batch_sampler: Optional[Iterable[List[int]]] = None,
         collate_fn: Optional[Callable[[List[_T_co]], Any]] = None,
+        shuffle_buffer_size: Optional[int] = None,
     ) -> Iterator[List[_T_co]]:
         """A lightweight DataLoader-like iterator.
 
@@ -266,6 +310,9 @@ class Dataset(BaseModel, Generic[_T_co]):
             seed: Optional seed for deterministic shuffling.
             batch_sampler: Iterable yielding lists of indices per batch. Mutually exclusive
                 with `batch_size`, `shuffle`, `sampler`, and `drop_last`.
+            shuffle_buffer_size: When shuffling, read the dataset sequentially through
+                a buffer of this many samples instead of drawing a full random
+                permutation. Suited to lazily loaded datasets.
 
         Yields:
             List of samples of length `batch_size` (except possibly the last one
@@ -280,6 +327,7 @@ class Dataset(BaseModel, Generic[_T_co]):
             seed=seed,
             batch_sampler=batch_sampler,
             collate_fn=collate_fn,
+            shuffle_buffer_size=shuffle_buffer_size,
         )
         return iter(loader)
 
@@ -341,6 +389,7 @@ def create_dataset(config: Union[DatasetConfig, ConfigDict, Dict[str, Any]]) ->
         "encoding",
         "limit",
         "preload_transform",
+        "lazy",
     ]
     for k in possible_keys:
         if k in conf_dict and conf_dict[k] is not None:
@@ -369,7 +418,8 @@ def create_dataset(config: Union[DatasetConfig, ConfigDict, Dict[str, Any]]) ->
         drop_last=bool(dl_conf.get("drop_last", False)),
         seed=dl_conf.get("seed"),
         batch_sampler=dl_conf.get("batch_sampler"),
-        collate_fn=dl_conf.get("collate_fn")
+        collate_fn=dl_conf.get("collate_fn"),
+        shuffle_buffer_size=dl_conf.get("shuffle_buffer_size"),
     )
     return ds, dl_iter
 
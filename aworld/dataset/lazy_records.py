@@ -0,0 +1,338 @@
+import bisect
+import csv
+import io
+import json
+import mmap
+import os
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from aworld.utils import import_package
+
+LAZY_FORMATS = {"jsonl", "csv", "txt", "parquet"}
+
+
+class LazyRecords(Sequence):
+    """Read-only, random-access view over records that live on disk.
+
+    Subclasses build a compact index on first access and decode a single
+    record per ``__getitem__`` call, so memory use stays O(1) per row
+    regardless of the file size.
+
+    Args:
+        path: Local file path.
+        limit: Optional cap on the number of records exposed.
+        item_transform: Optional callable applied to each record on access.
+    """
+
+    format: str = ""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        limit: Optional[int] = None,
+        item_transform: Optional[Callable[[Any], Any]] = None,
+    ) -> None:
+        self.path = Path(path)
+        self.limit = limit
+        self.item_transform = item_transform
+        self._length: Optional[int] = None
+
+    def _build_index(self) -> int:
+        """Build the record index and return the number of records."""
+        raise NotImplementedError
+
+    def _read(self, index: int) -> Any:
+        """Decode record `index` (already bounds-checked and non-negative)."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release file handles; the index is rebuilt lazily on next access."""
+        self._length = None
+
+    def __len__(self) -> int:
+        if self._length is None:
+            total = self._build_index()
+            self._length = total if self.limit is None else min(total, max(0, self.limit))
+        return self._length
+
+    def __getitem__(self, index):
+        length = len(self)
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(length))]
+        if index < 0:
+            index += length
+        if index < 0 or index >= length:
+            raise IndexError(f"{type(self).__name__} index out of range: {index}")
+        item = self._read(index)
+        if self.item_transform is not None:
+            item = self.item_transform(item)
+        return item
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # File handles and indexes are process-local; rebuild them after unpickling.
+        state = self.__dict__.copy()
+        for key in list(state):
+            if key.startswith("_"):
+                state[key] = None
+        return state
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(path={str(self.path)!r})"
+
+
+class _MmapLineRecords(LazyRecords):
+    """Base for line-oriented text files indexed by byte offsets over an mmap."""
+
+    def __init__(self, path: Path, *, encoding: str = "utf-8", **kwargs) -> None:
+        super().__init__(path, **kwargs)
+        self.encoding = encoding
+        self._file = None
+        self._mm: Optional[mmap.mmap] = None
+        # Start/end byte offsets of every record; 8 bytes per row each.
+        self._starts: Optional[array] = None
+        self._ends: Optional[array] = None
+
+    def _open(self) -> Optional[mmap.mmap]:
+        if self._mm is None and os.path.getsize(self.path) > 0:
+            self._file = open(self.path, "rb")
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mm
+
+    def _iter_lines(self, mm: mmap.mmap, pos: int = 0) -> Iterator[tuple]:
+        size = len(mm)
+        while pos < size:
+            end = mm.find(b"\n", pos)
+            if end < 0:
+                end = size
+            yield pos, end
+            pos = end + 1
+
+    def _keep_line(self, line: bytes) -> bool:
+        return True
+
+    def _build_index(self) -> int:
+        starts, ends = array("Q"), array("Q")
+        mm = self._open()
+        if mm is not None:
+            for start, end in self._iter_lines(mm, self._data_offset(mm)):
+                if self._keep_line(mm[start:end]):
+                    starts.append(start)
+                    ends.append(end)
+        self._starts, self._ends = starts, ends
+        return len(starts)
+
+    def _data_offset(self, mm: mmap.mmap) -> int:
+        return 0
+
+    def _raw(self, index: int) -> str:
+        mm = self._open()
+        if self._starts is None:
+            self._build_index()
+        return mm[self._starts[index]:self._ends[index]].decode(self.encoding).rstrip("\r")
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._starts = self._ends = None
+        super().close()
+
+
+class JsonlRecords(_MmapLineRecords):
+    """JSON Lines file indexed by line offsets; blank lines are skipped."""
+
+    format = "jsonl"
+
+    def _keep_line(self, line: bytes) -> bool:
+        return bool(line.strip())
+
+    def _read(self, index: int) -> Any:
+        try:
+            return json.loads(self._raw(index))
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSONL parse error at record {index} in {self.path}: {e}") from e
+
+
+class TextRecords(_MmapLineRecords):
+    """Plain text file where every line is one record."""
+
+    format = "txt"
+
+    def _read(self, index: int) -> Any:
+        return self._raw(index)
+
+
+class CsvRecords(_MmapLineRecords):
+    """CSV file with a header row, indexed by record offsets.
+
+    Quoted fields may span several physical lines; a record ends at the first
+    newline seen with an even number of quote characters since its start.
+    """
+
+    format = "csv"
+
+    def __init__(self, path: Path, **kwargs) -> None:
+        super().__init__(path, **kwargs)
+        self._fieldnames: Optional[List[str]] = None
+
+    def _iter_lines(self, mm: mmap.mmap, pos: int = 0) -> Iterator[tuple]:
+        record_start = None
+        quotes = 0
+        for start, end in super()._iter_lines(mm, pos):
+            if record_start is None:
+                record_start = start
+                quotes = 0
+            quotes += mm[start:end].count(b'"')
+            if quotes % 2 == 0:
+                yield record_start, end
+                record_start = None
+        if record_start is not None:
+            yield record_start, len(mm)
+
+    def _keep_line(self, line: bytes) -> bool:
+        # csv.DictReader skips rows without any field.
+        return bool(line.strip(b"\r"))
+
+    def _data_offset(self, mm: mmap.mmap) -> int:
+        for start, end in self._iter_lines(mm):
+            self._fieldnames = next(csv.reader(io.StringIO(mm[start:end].decode(self.encoding))), [])
+            return end + 1
+        self._fieldnames = []
+        return len(mm)
+
+    def _read(self, index: int) -> Any:
+        raw = self._raw(index)
+        reader = csv.DictReader(io.StringIO(raw, newline=""), fieldnames=self._fieldnames)
+        return next(reader)
+
+    @property
+    def fieldnames(self) -> List[str]:
+        len(self)
+        return list(self._fieldnames or [])
+
+
+class ParquetRecords(LazyRecords):
+    """Parquet file read one row group at a time through pyarrow.
+
+    Only the row-group metadata is loaded up front; the row group holding the
+    requested row is decoded on demand and the most recent one is kept, so
+    sequential scans decode every row group exactly once.
+    """
+
+    format = "parquet"
+
+    def __init__(self, path: Path, *, columns: Optional[List[str]] = None, **kwargs) -> None:
+        super().__init__(path, **kwargs)
+        self.columns = columns
+        self._parquet_file = None
+        self._group_offsets: Optional[List[int]] = None
+        self._cached_group: Optional[int] = None
+        self._cached_rows: Optional[List[Dict[str, Any]]] = None
+
+    def _open(self):
+        if self._parquet_file is None:
+            import_package("pyarrow")
+            import pyarrow.parquet as pq  # type: ignore
+
+            self._parquet_file = pq.ParquetFile(str(self.path))
+        return self._parquet_file
+
+    def _build_index(self) -> int:
+        metadata = self._open().metadata
+        offsets = [0]
+        for i in range(metadata.num_row_groups):
+            offsets.append(offsets[-1] + metadata.row_group(i).num_rows)
+        self._group_offsets = offsets
+        return offsets[-1]
+
+    def _read(self, index: int) -> Any:
+        if self._group_offsets is None:
+            self._build_index()
+        group = bisect.bisect_right(self._group_offsets, index) - 1
+        if group != self._cached_group:
+            table = self._open().read_row_group(group, columns=self.columns)
+            self._cached_rows = table.to_pylist()
+            self._cached_group = group
+        return self._cached_rows[index - self._group_offsets[group]]
+
+    def close(self) -> None:
+        if self._parquet_file is not None:
+            self._parquet_file.close()
+            self._parquet_file = None
+        self._group_offsets = None
+        self._cached_group = None
+        self._cached_rows = None
+        super().close()
+
+
+class ConcatRecords(Sequence):
+    """Concatenation of several record sequences, addressed by global index."""
+
+    def __init__(self, parts: List[Sequence], limit: Optional[int] = None) -> None:
+        self.parts = parts
+        self.limit = limit
+        self._offsets: Optional[List[int]] = None
+
+    def _ensure_offsets(self) -> List[int]:
+        if self._offsets is None:
+            offsets = [0]
+            for part in self.parts:
+                offsets.append(offsets[-1] + len(part))
+            self._offsets = offsets
+        return self._offsets
+
+    def __len__(self) -> int:
+        total = self._ensure_offsets()[-1]
+        return total if self.limit is None else min(total, max(0, self.limit))
+
+    def __getitem__(self, index):
+        length = len(self)
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(length))]
+        if index < 0:
+            index += length
+        if index < 0 or index >= length:
+            raise IndexError(f"ConcatRecords index out of range: {index}")
+        offsets = self._ensure_offsets()
+        part = bisect.bisect_right(offsets, index) - 1
+        return self.parts[part][index - offsets[part]]
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def close(self) -> None:
+        for part in self.parts:
+            if hasattr(part, "close"):
+                part.close()
+
+
+def open_lazy_records(
+    path: Path,
+    fmt: str,
+    *,
+    encoding: str = "utf-8",
+    parquet_columns: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+    item_transform: Optional[Callable[[Any], Any]] = None,
+) -> LazyRecords:
+    """Create the lazy record view for a local file of format `fmt`."""
+    if fmt == "jsonl":
+        return JsonlRecords(path, encoding=encoding, limit=limit, item_transform=item_transform)
+    if fmt == "csv":
+        return CsvRecords(path, encoding=encoding, limit=limit, item_transform=item_transform)
+    if fmt == "txt":
+        return TextRecords(path, encoding=encoding, limit=limit, item_transform=item_transform)
+    if fmt == "parquet":
+        return ParquetRecords(path, columns=parquet_columns, limit=limit, item_transform=item_transform)
+    raise ValueError(f"Lazy loading does not support format {fmt!r}; supported: {sorted(LAZY_FORMATS)}")
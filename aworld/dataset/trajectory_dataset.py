@@ -16,6 +16,7 @@ from aworld.core.storage.condition import Condition
 from aworld.core.storage.data import Data
 from aworld.core.storage.inmemory_store import InmemoryStorage, InmemoryConfig
 from aworld.dataset.dataset import Dataset
+from aworld.dataset.trajectory_sink import TrajectorySink
 from aworld.dataset.types import TrajectoryItem
 from aworld.logs.util import logger
 from aworld.runners.state_manager import RuntimeStateManager, EventRuntimeStateManager
@@ -40,6 +41,8 @@ class TrajectoryDataset(Dataset[TrajectoryItem]):
     storage: Optional[Storage[Any]] = Field(default=None, description="Storage for trajectory data")
     enable_storage: bool = Field(default=False, description="Whether to enable storage")
     strategy: Optional[Any] = Field(default=None, description="Trajectory generation strategy")
+    sink: Optional[TrajectorySink] = Field(default=None, exclude=True,
+                                           description="Buffered trajectory sink, replaces per-step storage writes")
 
     def __init__(self, strategy: Optional[Any] = None, **data):
         super().__init__(**data)
@@ -248,13 +251,16 @@ class TrajectoryDataset(Dataset[TrajectoryItem]):
         return messages
 
     async def save_task_trajectory(self, task_id: str, trajectory_steps: Union[List[TrajectoryItem], List[Dict[str, Any]]]):
-        """Save task trajectory data (list of steps) to storage.
+        """Save task trajectory data (list of steps) to storage, or buffer it in the sink if configured.
 
         Args:
             task_id: The task id.
             trajectory_steps: The list of trajectory steps, which can be `TrajectoryItem` objects
                 or dicts (e.g., from `.to_dict()` results).
         """
+        if self.sink is not None:
+            await self.sink.append(task_id, list(trajectory_steps))
+            return
         if not self.storage:
             return
 
@@ -303,6 +309,13 @@ class TrajectoryDataset(Dataset[TrajectoryItem]):
         Returns:
             List[Dict[str, Any]]: The list of trajectory steps.
         """
+        if self.sink is not None:
+            try:
+                steps = await self.sink.read_task(task_id)
+                return [step for step in steps if isinstance(step, TrajectoryItem)]
+            except Exception as e:
+                logger.error(f"Failed to get task trajectory from sink: {str(e)}")
+                return []
         if not self.storage:
             return []
 
@@ -327,6 +340,19 @@ class TrajectoryDataset(Dataset[TrajectoryItem]):
             logger.error(f"Failed to get task trajectory: {str(e)}")
             return []
 
+    async def flush_task_trajectory(self, task_id: str) -> None:
+        """Write the buffered steps of a finished task to the sink, if one is configured.
+
+        Args:
+            task_id: The task id.
+        """
+        if self.sink is None:
+            return
+        try:
+            await self.sink.flush(task_id)
+        except Exception as e:
+            logger.error(f"Failed to flush task trajectory: {str(e)}")
+
     def to_json(self) -> List[Dict[str, Any]]:
         return [to_serializable(item) for item in self.data]
 
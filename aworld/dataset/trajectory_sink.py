@@ -0,0 +1,366 @@
+# coding: utf-8
+# Copyright (c) 2025 inclusionAI.
+import asyncio
+import gzip
+import io
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from aworld.dataset.types import TrajectoryItem
+from aworld.logs.util import logger
+from aworld.utils import import_package
+from aworld.utils.serialized_util import to_serializable
+
+SINK_FORMATS = {"jsonl", "parquet"}
+INDEX_FILE = "index.jsonl"
+
+_META_COLUMNS = ("session_id", "task_name", "agent_id", "step", "execute_time", "pre_agent")
+_SAR_COLUMNS = ("state", "action", "reward")
+
+
+def _to_record(step: Union[TrajectoryItem, Dict[str, Any]]) -> Dict[str, Any]:
+    return step.to_dict() if isinstance(step, TrajectoryItem) else step
+
+
+def _dumps(value: Any) -> str:
+    # Only values json can't encode go through to_serializable, which also stringifies None
+    return json.dumps(value, ensure_ascii=False, default=to_serializable)
+
+
+def _to_item(record: Dict[str, Any]) -> Union[TrajectoryItem, Dict[str, Any]]:
+    try:
+        return TrajectoryItem.model_validate(record)
+    except Exception:
+        return record
+
+
+def _step_id(step: Union[TrajectoryItem, Dict[str, Any]]) -> Optional[str]:
+    if isinstance(step, TrajectoryItem):
+        return step.id
+    return step.get("id") if isinstance(step, dict) else None
+
+
+class TrajectorySink:
+    """
+    Buffered, append-only trajectory writer.
+
+    Steps are buffered per task in memory and written to immutable segment files
+    under `path` when the buffer holds `max_buffer_items` steps,
+    `flush_interval` seconds after a step was buffered, or when a task is
+    flushed explicitly on completion. Serialization and file I/O happen on a
+    worker thread at flush time, so appending a step is a list append.
+
+    Each task's steps form one unit inside a segment: a gzip member in
+    `jsonl` segments, a row group in `parquet` segments (one row per step, meta
+    fields as columns, state/action/reward as JSON columns). `index.jsonl` maps
+    every task id to its units, so reading a task touches only its own data and
+    exports can read the segment files directly. The index is read on first
+    use, and `get_sink_instance` shares one sink per directory, so starting a
+    task does not re-read it.
+
+    Args:
+        path: Directory holding the segments and the index.
+        format: "jsonl" (gzip-compressed) or "parquet" (needs pyarrow).
+        max_buffer_items: Buffered steps, across tasks, that trigger a flush.
+        flush_interval: Seconds a buffered step waits at most before it is flushed.
+        compression: Parquet compression codec.
+    """
+
+    def __init__(self,
+                 path: Union[str, Path],
+                 format: str = "jsonl",
+                 max_buffer_items: int = 1024,
+                 flush_interval: float = 5.0,
+                 compression: str = "zstd"):
+        if format not in SINK_FORMATS:
+            raise ValueError(f"Unsupported trajectory sink format: {format}, expected one of {sorted(SINK_FORMATS)}")
+        if format == "parquet":
+            import_package("pyarrow")
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.format = format
+        self.max_buffer_items = max_buffer_items
+        self.flush_interval = flush_interval
+        self.compression = compression
+
+        # A shared sink is written from the event loop (and thread) of every task using it, so the
+        # buffers, the steps being written and the counters are only touched under this lock.
+        self._buffer_lock = threading.Lock()
+        self._buffers: Dict[str, List[Union[TrajectoryItem, Dict[str, Any]]]] = {}
+        # task id -> batches taken out of the buffers by flushes still writing them
+        self._in_flight: Dict[str, List[List[Union[TrajectoryItem, Dict[str, Any]]]]] = {}
+        self._buffered = 0
+        self._flushing = 0
+        self._last_flush = time.monotonic()
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+        self._flush_timer_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending_flushes: set = set()
+        self._io_lock = threading.RLock()
+        self._segment_seq = 0
+        # task id -> index entries of its written units, loaded on first use
+        self._index_entries: Optional[Dict[str, List[Dict[str, Any]]]] = None
+
+    @property
+    def _index(self) -> Dict[str, List[Dict[str, Any]]]:
+        if self._index_entries is None:
+            with self._io_lock:
+                if self._index_entries is None:
+                    self._index_entries = self._load_index()
+        return self._index_entries
+
+    def _load_index(self) -> Dict[str, List[Dict[str, Any]]]:
+        index: Dict[str, List[Dict[str, Any]]] = {}
+        index_file = self.path / INDEX_FILE
+        if not index_file.exists():
+            return index
+        with open(index_file, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn last line of an interrupted writer
+                    continue
+                index.setdefault(entry["task_id"], []).append(entry)
+        return index
+
+    @property
+    def buffered(self) -> int:
+        return self._buffered
+
+    def task_ids(self) -> List[str]:
+        with self._buffer_lock:
+            pending = [*self._in_flight.keys(), *self._buffers.keys()]
+        return list(dict.fromkeys([*self._index.keys(), *pending]))
+
+    def segment_paths(self) -> List[Path]:
+        """Written segment files, oldest first."""
+        return sorted(self.path.glob(f"seg-*.{self._suffix}"))
+
+    @property
+    def _suffix(self) -> str:
+        return "jsonl.gz" if self.format == "jsonl" else "parquet"
+
+    async def append(self, task_id: str, steps: List[Union[TrajectoryItem, Dict[str, Any]]]) -> None:
+        """Buffer trajectory steps of a task, flushing when the size or time threshold is crossed."""
+        if not steps:
+            return
+        with self._buffer_lock:
+            self._buffers.setdefault(task_id, []).extend(steps)
+            self._buffered += len(steps)
+            due = self._buffered >= self.max_buffer_items or \
+                time.monotonic() - self._last_flush >= self.flush_interval
+            # Steps appended while a flush is writing go out with the next one
+            flush_now = due and not self._flushing
+        if flush_now:
+            await self.flush()
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Flush in `flush_interval` seconds, even if no other step is appended by then."""
+        with self._buffer_lock:
+            if not self._buffered:
+                return
+            loop = self._flush_timer_loop
+            if self._flush_timer is not None and loop is not None and not loop.is_closed():
+                return
+            self._flush_timer_loop = asyncio.get_running_loop()
+            self._flush_timer = self._flush_timer_loop.call_later(self.flush_interval, self._on_flush_timer)
+
+    def _on_flush_timer(self) -> None:
+        with self._buffer_lock:
+            self._flush_timer = None
+            buffered = self._buffered
+        if buffered:
+            task = asyncio.ensure_future(self.flush())
+            self._pending_flushes.add(task)
+            task.add_done_callback(self._pending_flushes.discard)
+
+    async def flush(self, task_id: Optional[str] = None) -> None:
+        """Write the buffered steps of `task_id`, or of every task, to a new segment."""
+        with self._buffer_lock:
+            task_ids = [task_id] if task_id is not None else list(self._buffers.keys())
+            # The batch is taken out of the buffers, so concurrent flushes never write the same steps
+            snapshot = {tid: self._buffers.pop(tid) for tid in task_ids if self._buffers.get(tid)}
+            for tid, steps in snapshot.items():
+                self._in_flight.setdefault(tid, []).append(steps)
+            self._last_flush = time.monotonic()
+            if not snapshot:
+                return
+            self._flushing += 1
+        written = False
+        try:
+            await asyncio.to_thread(self._write_segment, snapshot)
+            written = True
+        except Exception as e:
+            logger.error(f"Failed to flush trajectories of {len(snapshot)} tasks to {self.path}: {e}")
+        finally:
+            with self._buffer_lock:
+                self._flushing -= 1
+                for tid, steps in snapshot.items():
+                    batches = [batch for batch in self._in_flight[tid] if batch is not steps]
+                    if batches:
+                        self._in_flight[tid] = batches
+                    else:
+                        del self._in_flight[tid]
+                    if written:
+                        self._buffered -= len(steps)
+                    else:
+                        # Put the batch back in front of the steps appended meanwhile
+                        self._buffers[tid] = steps + self._buffers.get(tid, [])
+
+    def _new_segment_path(self) -> Path:
+        self._segment_seq += 1
+        return self.path / f"seg-{time.time_ns()}-{os.getpid()}-{self._segment_seq:06d}.{self._suffix}"
+
+    def _write_segment(self, snapshot: Dict[str, List[Union[TrajectoryItem, Dict[str, Any]]]]) -> None:
+        with self._io_lock:
+            segment = self._new_segment_path()
+            tmp = segment.with_name(segment.name + ".tmp")
+            records = {tid: [_to_record(step) for step in steps] for tid, steps in snapshot.items()}
+            if self.format == "jsonl":
+                entries = self._write_jsonl(tmp, records)
+            else:
+                entries = self._write_parquet(tmp, records)
+            os.replace(tmp, segment)
+
+            lines = []
+            for entry in entries:
+                entry["segment"] = segment.name
+                self._index.setdefault(entry["task_id"], []).append(entry)
+                lines.append(json.dumps(entry, ensure_ascii=False) + "\n")
+            with open(self.path / INDEX_FILE, "a", encoding="utf-8") as f:
+                f.write("".join(lines))
+
+    @staticmethod
+    def _write_jsonl(path: Path, records: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        entries = []
+        with open(path, "wb") as f:
+            for task_id, rows in records.items():
+                payload = "".join(_dumps({"task_id": task_id, **row}) + "\n" for row in rows)
+                member = gzip.compress(payload.encode("utf-8"))
+                entries.append({"task_id": task_id, "offset": f.tell(), "length": len(member), "rows": len(rows)})
+                f.write(member)
+        return entries
+
+    def _write_parquet(self, path: Path, records: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = pa.schema(
+            [("task_id", pa.string()), ("id", pa.string())]
+            + [(name, pa.int64() if name == "step" else pa.float64() if name == "execute_time" else pa.string())
+               for name in _META_COLUMNS]
+            + [(name, pa.string()) for name in (*_SAR_COLUMNS, "extra")]
+        )
+        entries = []
+        with pq.ParquetWriter(str(path), schema, compression=self.compression) as writer:
+            for row_group, (task_id, rows) in enumerate(records.items()):
+                columns: Dict[str, List[Any]] = {name: [] for name in schema.names}
+                for row in rows:
+                    meta = row.get("meta") or {}
+                    columns["task_id"].append(task_id)
+                    columns["id"].append(row.get("id"))
+                    for name in _META_COLUMNS:
+                        columns[name].append(meta.get(name))
+                    for name in _SAR_COLUMNS:
+                        columns[name].append(_dumps(row.get(name)))
+                    extra = {k: v for k, v in row.items() if k not in ("id", "meta", *_SAR_COLUMNS)}
+                    # Meta fields without a column of their own, e.g. the task id of a sub-task step
+                    meta_rest = {k: v for k, v in meta.items()
+                                 if k not in _META_COLUMNS and not (k == "task_id" and v == task_id)}
+                    if meta_rest:
+                        extra["meta"] = meta_rest
+                    columns["extra"].append(_dumps(extra) if extra else None)
+                writer.write_table(pa.table(columns, schema=schema))
+                entries.append({"task_id": task_id, "row_group": row_group, "rows": len(rows)})
+        return entries
+
+    def _read_unit(self, entry: Dict[str, Any]) -> List[Dict[str, Any]]:
+        segment = self.path / entry["segment"]
+        if "offset" in entry:
+            with open(segment, "rb") as f:
+                f.seek(entry["offset"])
+                payload = gzip.decompress(f.read(entry["length"]))
+            rows = []
+            for line in io.StringIO(payload.decode("utf-8")):
+                row = json.loads(line)
+                row.pop("task_id", None)
+                rows.append(row)
+            return rows
+
+        import pyarrow.parquet as pq
+        table = pq.ParquetFile(str(segment)).read_row_group(entry["row_group"])
+        rows = []
+        for row in table.to_pylist():
+            record = {"id": row["id"], "meta": {"task_id": row["task_id"], **{n: row[n] for n in _META_COLUMNS}}}
+            for name in _SAR_COLUMNS:
+                record[name] = json.loads(row[name])
+            if row.get("extra"):
+                extra = json.loads(row["extra"])
+                record["meta"].update(extra.pop("meta", {}))
+                record.update(extra)
+            rows.append(record)
+        return rows
+
+    def _read_written(self, task_id: str) -> List[Dict[str, Any]]:
+        with self._io_lock:
+            entries = list(self._index.get(task_id, ()))
+        rows = []
+        for entry in entries:
+            rows.extend(self._read_unit(entry))
+        return rows
+
+    async def read_task(self, task_id: str) -> List[Union[TrajectoryItem, Dict[str, Any]]]:
+        """All steps of a task, written and buffered, deduplicated by step id (last write wins)."""
+        # Pending steps are taken first: a batch finishing its write meanwhile is then read twice, never missed
+        with self._buffer_lock:
+            pending = [step for batch in self._in_flight.get(task_id, ()) for step in batch]
+            pending.extend(self._buffers.get(task_id, ()))
+        written = await asyncio.to_thread(self._read_written, task_id) if task_id in self._index else []
+        buffered = [step if isinstance(step, TrajectoryItem) else _to_item(step) for step in pending]
+        steps: Dict[Any, Union[TrajectoryItem, Dict[str, Any]]] = {}
+        for i, step in enumerate([*(_to_item(row) for row in written), *buffered]):
+            step_id = _step_id(step)
+            steps[step_id if step_id is not None else ("#", i)] = step
+        return list(steps.values())
+
+    def iter_records(self, task_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Written steps as plain dicts, for one task or for all of them, without touching the buffers."""
+        task_ids = [task_id] if task_id is not None else list(self._index.keys())
+        for tid in task_ids:
+            yield from self._read_written(tid)
+
+    async def close(self) -> None:
+        await self.flush()
+
+
+_shared_sinks: Dict[str, TrajectorySink] = {}
+_shared_sinks_lock = threading.Lock()
+
+
+def get_sink_instance(sink: Optional[Union[TrajectorySink, str, Path]]) -> Optional[TrajectorySink]:
+    """
+    Get a TrajectorySink from a sink instance or a directory path.
+
+    Args:
+        sink: Sink instance, a directory (jsonl segments), or None
+
+    Returns:
+        TrajectorySink instance, shared by every caller passing the same directory,
+        or None when no sink is configured
+    """
+    if sink is None or isinstance(sink, TrajectorySink):
+        return sink
+    if isinstance(sink, (str, Path)):
+        key = str(Path(sink).expanduser().resolve())
+        with _shared_sinks_lock:
+            instance = _shared_sinks.get(key)
+            if instance is None:
+                instance = _shared_sinks[key] = TrajectorySink(key)
+            return instance
+    logger.warning(f"Trajectory sink has unexpected type {type(sink)}, ignored")
+    return None
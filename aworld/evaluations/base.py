@@ -12,6 +12,7 @@ from dataclasses import dataclass, field
 from itertools import chain, repeat
 from aworld.logs.util import logger
 from aworld.config.conf import EvaluationConfig
+from aworld.evaluations.run_store import EvalRunStore
 
 # Try to import tqdm
 try:
@@ -120,6 +121,47 @@ class EvalCaseResult:
     score_rows: dict[str, ScorerResult] = field(default_factory=dict)
     create_time: float = field(default_factory=lambda: time.time())
 
+    def to_dict(self) -> dict:
+        """Serialize for the eval run ledger; the input is restored from the dataset on load."""
+        score_rows = {}
+        for scorer_name, scorer_result in self.score_rows.items():
+            metric_results = {}
+            for metric_name, metric_result in scorer_result.metric_results.items():
+                if isinstance(metric_result, dict):
+                    metric_result = dict(metric_result)
+                    if isinstance(metric_result.get('eval_status'), EvalStatus):
+                        metric_result['eval_status'] = metric_result['eval_status'].name
+                metric_results[metric_name] = metric_result
+            score_rows[scorer_name] = {'scorer_name': scorer_result.scorer_name, 'metric_results': metric_results}
+        return {
+            'index': self.index,
+            'eval_case_id': self.eval_case_id,
+            'eval_dataset_id': self.eval_dataset_id,
+            'output': self.output,
+            'score_rows': score_rows,
+            'create_time': self.create_time,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, input: Any = None) -> 'EvalCaseResult':
+        score_rows = {}
+        for scorer_name, scorer_data in (data.get('score_rows') or {}).items():
+            metric_results = {}
+            for metric_name, metric_result in (scorer_data.get('metric_results') or {}).items():
+                if isinstance(metric_result, dict) and isinstance(metric_result.get('eval_status'), str):
+                    metric_result = dict(metric_result)
+                    metric_result['eval_status'] = EvalStatus[metric_result['eval_status']]
+                metric_results[metric_name] = metric_result
+            score_rows[scorer_name] = ScorerResult(scorer_name=scorer_data.get('scorer_name', scorer_name),
+                                                   metric_results=metric_results)
+        return cls(index=data.get('index', 0),
+                   eval_case_id=data.get('eval_case_id', ''),
+                   eval_dataset_id=data.get('eval_dataset_id', ''),
+                   input=input if input is not None else {},
+                   output=data.get('output') or {},
+                   score_rows=score_rows,
+                   create_time=data.get('create_time', time.time()))
+
 
 @dataclass
 class EvalResult:
@@ -291,7 +333,12 @@ class Evaluator(Generic[EvalCaseDataType]):
                  repeat_times: int = 1,
                  parallel_num: int = 1,
                  skip_passed_cases: bool = False,
-                 skip_passed_on_metrics: list[str] = None):
+                 skip_passed_on_metrics: list[str] = None,
+                 run_store: Optional[EvalRunStore] = None,
+                 run_id: Optional[str] = None,
+                 resume: bool = True,
+                 parallel_scorers: bool = False,
+                 scorer_concurrency: Optional[dict[str, int]] = None):
         self.scorers = scorers or []
         # preprocess the dataset
         self.prepare_dataset = prepare_dataset or self._default_prepare_dataset
@@ -307,6 +354,16 @@ class Evaluator(Generic[EvalCaseDataType]):
         self._passed_cases = dict[str, set[str]]()
         # lock to protect access to _passed_cases in async environment
         self._passed_cases_lock = asyncio.Lock()
+        # ledger of finished cases; with `resume`, cases already recorded for the run id are not run again
+        self.run_store = run_store
+        # ledger key of the run, defaults to the dataset run_id
+        self.run_id = run_id
+        self.resume = resume
+        # run the scorers of one case concurrently, so a case costs its slowest scorer instead of their sum
+        self.parallel_scorers = parallel_scorers
+        # max concurrent calls per scorer name across all running cases, e.g. to throttle LLM judges
+        self.scorer_concurrency = scorer_concurrency or {}
+        self._scorer_semaphores: dict[str, asyncio.Semaphore] = {}
 
     def _default_prepare_dataset(self, dataset: EvalDataset) -> List[EvalDataCase[EvalCaseDataType]]:
         return dataset.eval_cases
@@ -314,10 +371,12 @@ class Evaluator(Generic[EvalCaseDataType]):
     async def _evaluate_in_task(self,
                                 eval_target: EvalTarget[EvalCaseDataType],
                                 dataset: Iterable[EvalDataCase[EvalCaseDataType]],
-                                evaluate_fun: Callable[[int, EvalTarget[EvalCaseDataType], EvalDataCase[EvalCaseDataType]], Awaitable[dict]]):
+                                evaluate_fun: Callable[[int, EvalTarget[EvalCaseDataType], EvalDataCase[EvalCaseDataType]], Awaitable[dict]],
+                                skip_indices: Optional[set[int]] = None):
         # create a semaphore to limit the parallelism
         semaphore: asyncio.Semaphore = asyncio.Semaphore(self.parallel_num)
         dataset_iter = iter(dataset)
+        skip_indices = skip_indices or set()
         running_tasks: Set[asyncio.Task] = set()
         index = 0
 
@@ -332,6 +391,9 @@ class Evaluator(Generic[EvalCaseDataType]):
             nonlocal running_tasks
             try:
                 input = next(dataset_iter)
+                while index in skip_indices:
+                    index += 1
+                    input = next(dataset_iter)
                 running_tasks.add(asyncio.create_task(__evaluate_fun(index, eval_target, input)))
                 index += 1
             except StopIteration:
@@ -425,17 +487,18 @@ class Evaluator(Generic[EvalCaseDataType]):
         output['_time_cost_ms'] = time_cost_ms
         score_rows = {}
 
-        for scorer in self.scorers:
-            scorer_result = await scorer.scorer_and_judge(index, input, output)
+        if self.parallel_scorers:
+            scorer_results = await asyncio.gather(
+                *(self._run_scorer(scorer, index, input, output) for scorer in self.scorers))
+        else:
+            scorer_results = [await self._run_scorer(scorer, index, input, output) for scorer in self.scorers]
+
+        for scorer, scorer_result in zip(self.scorers, scorer_results):
             score_rows[scorer.name] = scorer_result
 
             # Record passed metrics if skip_passed_on_metrics is specified
             if self.skip_passed_cases:
-                for metric_name, metric_result in scorer_result.metric_results.items():
-                    if metric_result.get('eval_status') == EvalStatus.PASSED:
-                        # Add to passed cases if it passed on this metric
-                        async with self._passed_cases_lock:
-                            self._passed_cases.setdefault(metric_name, set()).add(eval_case_id)
+                await self._record_passed_metrics(eval_case_id, scorer_result)
 
         return EvalCaseResult(index=index,
                               input=input,
@@ -444,6 +507,74 @@ class Evaluator(Generic[EvalCaseDataType]):
                               output=output,
                               score_rows=score_rows)
 
+    async def _run_scorer(self, scorer: Scorer, index: int, input: EvalDataCase[EvalCaseDataType],
+                          output: dict) -> ScorerResult:
+        limit = self.scorer_concurrency.get(scorer.name)
+        if not limit:
+            return await scorer.scorer_and_judge(index, input, output)
+        semaphore = self._scorer_semaphores.get(scorer.name)
+        if semaphore is None:
+            semaphore = self._scorer_semaphores[scorer.name] = asyncio.Semaphore(limit)
+        async with semaphore:
+            return await scorer.scorer_and_judge(index, input, output)
+
+    async def _record_passed_metrics(self, eval_case_id: str, scorer_result: ScorerResult) -> None:
+        for metric_name, metric_result in scorer_result.metric_results.items():
+            if isinstance(metric_result, dict) and metric_result.get('eval_status') == EvalStatus.PASSED:
+                # Add to passed cases if it passed on this metric
+                async with self._passed_cases_lock:
+                    self._passed_cases.setdefault(metric_name, set()).add(eval_case_id)
+
+    async def _load_completed(self, run_id: str, inputs: list) -> dict[int, EvalCaseResult]:
+        """Load the ledgered results of `run_id` that still match the dataset."""
+        if not self.resume:
+            self.run_store.clear(run_id)
+            return {}
+        completed = {}
+        for index, record in self.run_store.load(run_id).items():
+            if index >= len(inputs):
+                continue
+            input = inputs[index]
+            expected_id = input.get('eval_case_id', str(index)) if isinstance(input, dict) else getattr(
+                input, 'eval_case_id', str(index))
+            if record.get('eval_case_id') != expected_id:
+                continue
+            result = EvalCaseResult.from_dict(record, input=input)
+            completed[index] = result
+            if self.skip_passed_cases:
+                for scorer_result in result.score_rows.values():
+                    await self._record_passed_metrics(result.eval_case_id, scorer_result)
+        if completed:
+            logger.info(f"eval run {run_id} resumed, {len(completed)}/{len(inputs)} cases already completed")
+        return completed
+
+    async def evaluate_stream(self,
+                              dataset: EvalDataset,
+                              eval_target: EvalTarget[EvalCaseDataType] = NoActionEvalTarget()):
+        """Evaluate the dataset and yield every EvalCaseResult as soon as it finishes.
+
+        Results are yielded in completion order; cases restored from the run store are
+        yielded first. Each new result is written to the run store before it is yielded.
+        """
+        async for result_row in self._stream_cases(dataset, self.prepare_dataset(dataset), eval_target):
+            yield result_row
+
+    async def _stream_cases(self, dataset: EvalDataset, input_dataset: List[EvalDataCase[EvalCaseDataType]],
+                            eval_target: EvalTarget[EvalCaseDataType]):
+        inputs = list(chain.from_iterable(repeat(input_dataset, self.repeat_times)))
+        run_id = self.run_id or dataset.run_id or dataset.eval_dataset_id
+        completed = await self._load_completed(run_id, inputs) if self.run_store else {}
+
+        for index in sorted(completed):
+            yield completed[index]
+        if len(completed) >= len(inputs):
+            return
+        async for result_row in self._evaluate_in_task(eval_target, inputs, self.run_single_case,
+                                                       skip_indices=set(completed)):
+            if self.run_store:
+                self.run_store.append(run_id, {'run_id': run_id, **result_row.to_dict()})
+            yield result_row
+
     async def evaluate(self,
                        dataset: EvalDataset,
                        eval_target: EvalTarget[EvalCaseDataType] = NoActionEvalTarget()) -> EvalResult:
@@ -453,8 +584,6 @@ class Evaluator(Generic[EvalCaseDataType]):
             EvaluationResult
         """
         input_dataset = self.prepare_dataset(dataset)
-
-        input_dataset_chain = chain.from_iterable(repeat(input_dataset, self.repeat_times))
         details = []
 
         # Calculate total number of cases for progress bar
@@ -463,13 +592,13 @@ class Evaluator(Generic[EvalCaseDataType]):
         # Use tqdm if available
         if HAS_TQDM:
             progress_bar = tqdm(total=total_cases, desc="Evaluating", unit="case")
-            async for result_row in self._evaluate_in_task(eval_target, input_dataset_chain, self.run_single_case):
+            async for result_row in self._stream_cases(dataset, input_dataset, eval_target):
                 details.append(result_row)
                 progress_bar.update(1)
             progress_bar.close()
         else:
             # Fallback without progress bar
-            async for result_row in self._evaluate_in_task(eval_target, input_dataset_chain, self.run_single_case):
+            async for result_row in self._stream_cases(dataset, input_dataset, eval_target):
                 details.append(result_row)
 
         details.sort(key=lambda x: x.index)
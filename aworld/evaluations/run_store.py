@@ -0,0 +1,109 @@
+# coding: utf-8
+# Copyright (c) inclusionAI.
+import abc
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from aworld.logs.util import logger
+
+
+class EvalRunStore(abc.ABC):
+    """Ledger of finished eval case results, keyed by run id and case index.
+
+    `Evaluator` appends one record per finished case and, when a run is
+    resumed with the same run id, loads the ledger to skip completed cases.
+    """
+
+    @abc.abstractmethod
+    def load(self, run_id: str) -> Dict[int, dict]:
+        """Return the recorded case results of `run_id`, keyed by case index."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def append(self, run_id: str, record: dict) -> None:
+        """Durably record one finished case result of `run_id`."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def clear(self, run_id: str) -> None:
+        """Drop every record of `run_id`."""
+        raise NotImplementedError
+
+
+class InMemoryEvalRunStore(EvalRunStore):
+    """Process-local ledger, mainly for tests and in-process retries."""
+
+    def __init__(self):
+        self._runs: Dict[str, Dict[int, dict]] = {}
+
+    def load(self, run_id: str) -> Dict[int, dict]:
+        return dict(self._runs.get(run_id, {}))
+
+    def append(self, run_id: str, record: dict) -> None:
+        self._runs.setdefault(run_id, {})[int(record["index"])] = json.loads(json.dumps(record, default=str))
+
+    def clear(self, run_id: str) -> None:
+        self._runs.pop(run_id, None)
+
+
+class JsonlEvalRunStore(EvalRunStore):
+    """Append-only JSONL ledger, one file per run under `root`.
+
+    Every record is written as a single line and flushed before the case is
+    reported, so a crash loses at most the cases that were still running. A
+    torn trailing line from a crash is ignored on load; when a case index was
+    recorded more than once the last record wins.
+    """
+
+    def __init__(self, root: str, fsync: bool = False):
+        self.root = Path(root)
+        self.fsync = fsync
+        self._lock = threading.Lock()
+
+    def path(self, run_id: str) -> Path:
+        if not run_id:
+            raise ValueError("eval run store requires a non-empty run_id")
+        return self.root / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', run_id)}.jsonl"
+
+    def load(self, run_id: str) -> Dict[int, dict]:
+        path = self.path(run_id)
+        records: Dict[int, dict] = {}
+        if not path.exists():
+            return records
+        with open(path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                    records[int(record["index"])] = record
+                except (ValueError, KeyError, TypeError):
+                    logger.warning(f"skip unreadable eval ledger line {line_no} in {path}")
+        return records
+
+    def append(self, run_id: str, record: dict) -> None:
+        path = self.path(run_id)
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+
+    def clear(self, run_id: str) -> None:
+        with self._lock:
+            self.path(run_id).unlink(missing_ok=True)
+
+
+def create_eval_run_store(path: Optional[str]) -> Optional[EvalRunStore]:
+    """Build the ledger configured by `EvaluationConfig.eval_run_store_path`."""
+    if not path:
+        return None
+    return JsonlEvalRunStore(path)
@@ -18,6 +18,7 @@ from a2a.client.middleware import ClientCallContext
 from urllib.parse import urlparse
 from aworld.experimental.a2a.config import ClientConfig
 from aworld.experimental.a2a.client_manager import A2AClientManager
+from aworld.experimental.a2a.http_pool import agent_card_cache
 from aworld.logs.util import logger
 from aworld.core.task import Task, TaskResponse
 from aworld.config import RunConfig
@@ -57,7 +58,7 @@ class A2AClientProxy:
                 base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
                 relative_card_path = parsed_url.path
                 resolver = A2ACardResolver(
-                    httpx_client=self._client_manager.get_client().https_client,
+                    httpx_client=self._client_manager.pool.get_client(base_url),
                     base_url=base_url,
                 )
                 return await resolver.get_agent_card(
@@ -85,8 +86,11 @@ class A2AClientProxy:
                 raise e
 
     async def get_or_init_agent_card(self) -> AgentCard:
-        if self._agent_card is None:
-            self._agent_card = await self._resolve_agent_card()
+        if self._agent_card_source is None:
+            return self._agent_card
+        # Cards resolved from a URL or file are shared by all proxies and refreshed after the TTL
+        self._agent_card = await agent_card_cache.get_or_fetch(
+            self._agent_card_source, self._resolve_agent_card, ttl=self._config.agent_card_ttl)
         return self._agent_card
 
     def _build_a2a_message(self, message: A2AMessage | dict[str, Any] | str) -> A2AMessage:
@@ -146,9 +150,11 @@ class A2AClientProxy:
         else:
             call_context = None
         try:
-            client = self._client_manager.get_client().create(await self.get_or_init_agent_card())
-            async for event in client.send_message(a2a_message, context=call_context):
-                yield event
+            agent_card = await self.get_or_init_agent_card()
+            client = self._client_manager.get_client(agent_card.url).create(agent_card)
+            async with self._client_manager.pool.limit(agent_card.url):
+                async for event in client.send_message(a2a_message, context=call_context):
+                    yield event
         except Exception as e:
             logger.error(f"Failed to send message: {e}")
             raise e
@@ -51,4 +51,11 @@ class ClientConfig(BaseConfig):
     accepted_output_modes: list[str] = []
     push_notification_configs: list[PushNotificationConfig] = []
     consumers: list[Consumer] = []
-    client_monitor_interval: int = 5
+    # Connection pool shared by all clients, see `A2AConnectionPool`
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = True
+    max_concurrency_per_remote: int = 16
+    # Seconds a resolved agent card is reused across proxies
+    agent_card_ttl: float = 300.0
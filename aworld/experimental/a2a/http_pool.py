@@ -0,0 +1,184 @@
+# coding: utf-8
+# Copyright (c) 2025 inclusionAI.
+import asyncio
+import importlib.util
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+from urllib.parse import urlparse
+
+import httpx
+
+from aworld.logs.util import logger
+
+
+def base_url_of(url: str) -> str:
+    """`scheme://host[:port]` of a URL, the key connections are pooled by."""
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class A2AConnectionPool:
+    """
+    Shared `httpx.AsyncClient`s, one per remote base URL and event loop.
+
+    httpx clients hold connections bound to the loop that opened them, so clients
+    are kept per loop (in a weak map, dropped with the loop) and shared by every
+    proxy talking to the same remote from that loop. Connections are kept alive
+    between calls, over HTTP/2 when `h2` is installed, and each remote gets a
+    semaphore capping the calls in flight to it.
+
+    Args:
+        timeout: Request timeout in seconds.
+        max_connections: Connection cap per remote.
+        max_keepalive_connections: Idle connections kept per remote.
+        keepalive_expiry: Seconds an idle connection is kept.
+        http2: Negotiate HTTP/2 when available.
+        max_concurrency_per_remote: Calls in flight per remote, 0 for no limit.
+        client_kwargs: Extra `httpx.AsyncClient` arguments, e.g. a transport.
+    """
+
+    def __init__(self,
+                 timeout: float = 600.0,
+                 max_connections: int = 100,
+                 max_keepalive_connections: int = 20,
+                 keepalive_expiry: float = 30.0,
+                 http2: bool = True,
+                 max_concurrency_per_remote: int = 16,
+                 **client_kwargs: Any):
+        self.timeout = timeout
+        self.limits = httpx.Limits(max_connections=max_connections,
+                                   max_keepalive_connections=max_keepalive_connections,
+                                   keepalive_expiry=keepalive_expiry)
+        self.http2 = http2 and _http2_available()
+        if http2 and not self.http2:
+            logger.debug("h2 is not installed, A2A connections use HTTP/1.1 keep-alive")
+        self.max_concurrency_per_remote = max_concurrency_per_remote
+        self.client_kwargs = client_kwargs
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]]" = \
+            weakref.WeakKeyDictionary()
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = \
+            weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get_client(self, url: str) -> httpx.AsyncClient:
+        """Pooled client for the remote of `url`, for the running event loop."""
+        loop = asyncio.get_running_loop()
+        base_url = base_url_of(url)
+        with self._lock:
+            clients = self._clients.setdefault(loop, {})
+            client = clients.get(base_url)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(timeout=self.timeout, limits=self.limits, http2=self.http2,
+                                           **self.client_kwargs)
+                clients[base_url] = client
+            return client
+
+    @asynccontextmanager
+    async def limit(self, url: str):
+        """Hold one of the concurrency slots of the remote of `url`."""
+        if self.max_concurrency_per_remote <= 0:
+            yield
+            return
+        loop = asyncio.get_running_loop()
+        base_url = base_url_of(url)
+        with self._lock:
+            semaphores = self._semaphores.setdefault(loop, {})
+            semaphore = semaphores.get(base_url)
+            if semaphore is None:
+                semaphore = semaphores[base_url] = asyncio.Semaphore(self.max_concurrency_per_remote)
+        async with semaphore:
+            yield
+
+    async def aclose(self) -> None:
+        """Close the clients of the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = self._clients.pop(loop, {})
+            self._semaphores.pop(loop, None)
+        for base_url, client in clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing A2A client for {base_url}: {e}")
+
+
+class AgentCardCache:
+    """
+    TTL cache of resolved agent cards, shared by all proxies.
+
+    Concurrent lookups of the same card within a loop share one fetch.
+    """
+
+    def __init__(self, ttl: float = 300.0):
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, asyncio.Future]]" = \
+            weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                return None
+            return entry[1]
+
+    def put(self, key: Hashable, card: Any, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), card)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]],
+                           ttl: Optional[float] = None) -> Any:
+        """Cached card for `key`, calling `fetch` on a miss or after expiry."""
+        card = self.get(key)
+        if card is not None:
+            self.hits += 1
+            return card
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            inflight = self._inflight.setdefault(loop, {})
+            future = inflight.get(key)
+            owner = future is None
+            if owner:
+                future = inflight[key] = loop.create_future()
+        if not owner:
+            self.hits += 1
+            return await asyncio.shield(future)
+
+        self.misses += 1
+        try:
+            card = await fetch()
+            self.put(key, card, ttl)
+            future.set_result(card)
+            return card
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark it retrieved, so a future nobody waited on doesn't log it
+            future.exception()
+            raise
+        finally:
+            with self._lock:
+                inflight.pop(key, None)
+
+
+agent_card_cache = AgentCardCache()
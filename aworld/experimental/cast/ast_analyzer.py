@@ -5,15 +5,19 @@ AWorld AST Framework - Default Implementation
 Provides default implementation of CodeAnalyzer and related components.
 """
 
+import multiprocessing
+import os
 import time
 from abc import abstractmethod, ABC
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from typing import Set, Any
 
-import networkx as nx
+import numpy as np
 
+from .incremental import FileParseCache, IgnoreMatcher, _init_parse_worker, _parse_in_worker
 from .models import (
     CodeNode, LogicLayer, SkeletonLayer, ImplementationLayer,
     SymbolType, ReferenceType, Symbol
@@ -21,6 +25,30 @@ from .models import (
 from .models import RepositoryMap
 from .utils import logger
 
+DEFAULT_IGNORE_PATTERNS = ['.git', '__pycache__', 'node_modules', '.pytest_cache']
+
+
+def _sparse_pagerank(n: int, sources: np.ndarray, targets: np.ndarray,
+                     alpha: float = 0.85, max_iter: int = 100, tol: float = 1.0e-6) -> Optional[np.ndarray]:
+    """PageRank by power iteration over an edge list.
+
+    Mirrors `networkx.pagerank` with uniform personalization: rank of dangling
+    nodes is spread uniformly and convergence is reached when the L1 change is
+    below `n * tol`. Each iteration is O(V + E). Returns None if it does not
+    converge within `max_iter` iterations.
+    """
+    out_degree = np.bincount(sources, minlength=n).astype(np.float64)
+    dangling = out_degree == 0
+    edge_weight = 1.0 / out_degree[sources] if len(sources) else np.empty(0)
+    x = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        previous = x
+        x = alpha * np.bincount(targets, weights=previous[sources] * edge_weight, minlength=n)
+        x += (alpha * previous[dangling].sum() + (1.0 - alpha)) / n
+        if np.abs(x - previous).sum() < n * tol:
+            return x
+    return None
+
 
 class ASTAnalyzer(ABC):
     """Code analyzer abstract base class"""
@@ -100,10 +128,26 @@ class ASTAnalyzer(ABC):
 
 
 class DefaultASTAnalyzer(ASTAnalyzer):
-    """Default code analyzer implementation"""
-
-    def __init__(self, parsers: Dict[str, Any]):
+    """Default code analyzer implementation
+
+    Args:
+        parsers: Parsers by language name
+        cache_dir: Directory of the persistent per-file parse cache; None disables it
+        max_workers: Worker processes for the parse stage; None uses the CPU count, 1 parses in-process
+        parallel_threshold: Minimum number of files to parse before a process pool is used
+        use_gitignore: Also honour the rules of `<root>/.gitignore` when scanning
+    """
+
+    def __init__(self, parsers: Dict[str, Any],
+                 cache_dir: Optional[Path] = None,
+                 max_workers: Optional[int] = None,
+                 parallel_threshold: int = 64,
+                 use_gitignore: bool = False):
         super().__init__(parsers)
+        self.parse_cache = FileParseCache(cache_dir) if cache_dir is not None else None
+        self.max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        self.parallel_threshold = parallel_threshold
+        self.use_gitignore = use_gitignore
 
     def analyze_repository(self, root_path: Path,
                            file_patterns: Optional[List[str]] = None,
@@ -125,10 +169,10 @@ class DefaultASTAnalyzer(ASTAnalyzer):
         t_parse = time.perf_counter() - t0
         logger.info(f"[analyze_repository] analyze_files: {len(code_nodes)} nodes, {t_parse:.3f}s")
 
-        # Build dependency graph (skip when disabled - saves ~96s for 1k+ files)
+        # Build dependency graph (optional; callers that only need skeletons skip it)
         if enable_dependency_graph:
             t0 = time.perf_counter()
-            dependency_graph = self.build_dependency_graph(code_nodes)
+            dependency_graph = self.build_dependency_graph(code_nodes, root_path)
             t_dep = time.perf_counter() - t0
             n_edges = sum(len(t) for t in dependency_graph.values())
             logger.info(f"[analyze_repository] build_dependency_graph: {len(dependency_graph)} nodes, {n_edges} edges, {t_dep:.3f}s")
@@ -179,42 +223,122 @@ class DefaultASTAnalyzer(ASTAnalyzer):
         )
 
     def analyze_files(self, file_paths: List[Path]) -> Dict[Path, CodeNode]:
-        """Analyze specified file list"""
+        """Analyze specified file list
+
+        Unchanged files are served from the parse cache; the rest are parsed in a
+        process pool when there are at least `parallel_threshold` of them.
+        """
         code_nodes = {}
+        pending: List[Tuple[Path, str, Any]] = []
 
         for file_path in file_paths:
+            parser_name, parser = self._get_named_parser(file_path)
+            if not parser:
+                logger.warning(f"No suitable parser found: {file_path}")
+                continue
+            cached = self.parse_cache.get(file_path, parser) if self.parse_cache else None
+            if cached is not None:
+                code_nodes[file_path] = cached
+            else:
+                pending.append((file_path, parser_name, parser))
+
+        if self.parse_cache:
+            logger.info(f"[analyze_files] parse cache: {len(code_nodes)} reused, {len(pending)} to parse")
+
+        parsed = None
+        if self.max_workers > 1 and len(pending) >= self.parallel_threshold:
             try:
-                parser = self.get_parser(file_path)
-                if parser:
-                    code_node = parser.parse_file(file_path)
-                    code_nodes[file_path] = code_node
-                    logger.debug(f"Parsed file: {file_path}")
-                else:
-                    logger.warning(f"No suitable parser found: {file_path}")
+                parsed = self._parse_in_processes(pending)
+            except Exception as e:
+                logger.warning(f"Parallel parsing failed, falling back to in-process parsing: {e}")
+        if parsed is None:
+            parsed = self._parse_serially(pending)
+
+        for file_path, _, parser in pending:
+            code_node, stat, content_hash = parsed.get(file_path, (None, None, None))
+            if code_node is None:
+                continue
+            code_nodes[file_path] = code_node
+            if self.parse_cache:
+                self.parse_cache.put(file_path, parser, code_node, stat=stat, content_hash=content_hash)
+
+        # Keep the caller's file order regardless of which stage produced a node.
+        return {file_path: code_nodes[file_path] for file_path in file_paths if file_path in code_nodes}
+
+    def _get_named_parser(self, file_path: Path) -> Tuple[Optional[str], Optional[Any]]:
+        for name, parser in self.parsers.items():
+            if hasattr(parser, 'can_parse') and parser.can_parse(file_path):
+                return name, parser
+        return None, None
+
+    def _snapshot(self, file_path: Path) -> Tuple[Optional[os.stat_result], Optional[str]]:
+        """Stat and hash a file before parsing, so the cache never pairs a new stat with an old parse."""
+        if not self.parse_cache:
+            return None, None
+        try:
+            return os.stat(file_path), FileParseCache.content_hash(file_path.read_bytes())
+        except OSError:
+            return None, None
+
+    def _parse_serially(self, pending: List[Tuple[Path, str, Any]]) -> Dict[Path, tuple]:
+        parsed = {}
+        for file_path, _, parser in pending:
+            try:
+                stat, content_hash = self._snapshot(file_path)
+                parsed[file_path] = (parser.parse_file(file_path), stat, content_hash)
+                logger.debug(f"Parsed file: {file_path}")
             except Exception as e:
                 logger.error(f"Failed to parse file {file_path}: {e}")
+        return parsed
+
+    def _parse_in_processes(self, pending: List[Tuple[Path, str, Any]]) -> Dict[Path, tuple]:
+        """Parse files in worker processes, each holding its own freshly built parsers."""
+        snapshots = {file_path: self._snapshot(file_path) for file_path, _, _ in pending}
+        workers = min(self.max_workers, len(pending))
+        # A few chunks per worker balances load without paying per-file IPC.
+        chunk_size = max(1, len(pending) // (workers * 4))
+        items = [(parser_name, file_path) for file_path, parser_name, _ in pending]
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+        parser_classes = {name: type(parser) for name, parser in self.parsers.items()}
+
+        parsed = {}
+        # spawn: the parent may run logging/event-loop threads that are unsafe to fork.
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_parse_worker,
+                                 initargs=(parser_classes,)) as executor:
+            for results in executor.map(_parse_in_worker, chunks):
+                for file_path, code_node, error in results:
+                    if error is not None:
+                        logger.error(f"Failed to parse file {file_path}: {error}")
+                        continue
+                    parsed[file_path] = (code_node, *snapshots[file_path])
+        logger.info(f"[analyze_files] parsed {len(parsed)} files in {workers} worker processes")
+        return parsed
 
-        return code_nodes
+    def build_dependency_graph(self, code_nodes: Dict[Path, CodeNode],
+                               root_path: Optional[Path] = None) -> Dict[Path, Set[Path]]:
+        """Build file dependency graph
 
-    def build_dependency_graph(self, code_nodes: Dict[Path, CodeNode]) -> Dict[Path, Set[Path]]:
-        """Build file dependency graph"""
+        The symbol table and module index are built in one pass over the nodes,
+        so resolving each import and reference is a dict lookup. Module names are
+        relative to `root_path`, the common parent of the files by default.
+        """
         dependency_graph = defaultdict(set)
+        module_index = self._build_module_index(code_nodes, root_path)
+        symbol_table = self._build_symbol_table(code_nodes)
 
         for file_path, node in code_nodes.items():
             # Build dependency relationships based on import statements
             for import_name in node.imports:
-                # Try to resolve import to file paths
-                target_files = self._resolve_import(import_name, code_nodes.keys())
-                for target_file in target_files:
+                for target_file in self._resolve_import(import_name, module_index):
                     if target_file != file_path:
                         dependency_graph[file_path].add(target_file)
                         code_nodes[target_file].dependents.add(file_path)
 
             # Build dependency relationships based on symbol references
             for reference in node.references:
-                # Find files that define this symbol
-                target_files = self._find_symbol_definition(reference.symbol_name, code_nodes)
-                for target_file in target_files:
+                for target_file in symbol_table.get(reference.symbol_name, ()):
                     if target_file != file_path:
                         dependency_graph[file_path].add(target_file)
                         code_nodes[target_file].dependents.add(file_path)
@@ -228,29 +352,28 @@ class DefaultASTAnalyzer(ASTAnalyzer):
         if not code_nodes:
             return {}
 
-        # Create NetworkX graph
-        G = nx.DiGraph()
-
-        # Add nodes
-        for file_path in code_nodes.keys():
-            G.add_node(str(file_path))
-
-        # Add edges (dependency relationships)
-        for source, targets in dependency_graph.items():
-            for target in targets:
-                G.add_edge(str(source), str(target))
+        paths = list(code_nodes.keys())
+        index = {path: i for i, path in enumerate(paths)}
+        sources, targets = [], []
+        for source, source_targets in dependency_graph.items():
+            if source not in index:
+                continue
+            for target in source_targets:
+                if target in index:
+                    sources.append(index[source])
+                    targets.append(index[target])
 
         # Calculate basic PageRank scores
-        try:
-            pagerank = nx.pagerank(G, alpha=0.85, max_iter=100)
-        except nx.PowerIterationFailedConvergence:
+        scores = _sparse_pagerank(len(paths), np.asarray(sources, dtype=np.int64),
+                                  np.asarray(targets, dtype=np.int64), alpha=0.85, max_iter=100)
+        if scores is None:
             logger.warning("PageRank calculation did not converge, using uniform distribution")
-            pagerank = {str(path): 1.0 / len(code_nodes) for path in code_nodes.keys()}
+            scores = np.full(len(paths), 1.0 / len(paths))
 
         # Apply weight adjustments
         weighted_scores = {}
         for file_path, node in code_nodes.items():
-            base_score = pagerank.get(str(file_path), 0.0)
+            base_score = float(scores[index[file_path]])
 
             # User mention weight
             mention_weight = 1.0
@@ -267,52 +390,105 @@ class DefaultASTAnalyzer(ASTAnalyzer):
     def _scan_files(self, root_path: Path,
                     file_patterns: Optional[List[str]] = None,
                     ignore_patterns: Optional[List[str]] = None) -> List[Path]:
-        """Scan directory to get files that need to be analyzed"""
-        files = []
-        ignore_patterns = ignore_patterns or ['.git', '__pycache__', 'node_modules', '.pytest_cache']
-
-        def should_ignore(path: Path) -> bool:
-            path_str = str(path)
-            return any(pattern in path_str for pattern in ignore_patterns)
+        """Scan directory to get files that need to be analyzed
 
-        def collect_files(directory: Path):
-            if should_ignore(directory):
-                return
+        Ignore patterns use gitignore semantics (see `IgnoreMatcher`) and are
+        matched against paths relative to `root_path`; ignored directories are
+        pruned without being listed.
+        """
+        files = []
+        ignore_patterns = ignore_patterns or DEFAULT_IGNORE_PATTERNS
+        if self.use_gitignore:
+            matcher = IgnoreMatcher.from_gitignore(root_path, ignore_patterns)
+        else:
+            matcher = IgnoreMatcher(ignore_patterns)
 
-            for item in directory.iterdir():
-                if item.is_file():
-                    if self.get_parser(item) and not should_ignore(item):
+        stack = [(root_path, '')]
+        while stack:
+            directory, rel_dir = stack.pop()
+            try:
+                entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+            except OSError as e:
+                logger.warning(f"Failed to list directory {directory}: {e}")
+                continue
+            subdirs = []
+            for entry in entries:
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                if entry.is_dir():
+                    if not matcher.match(rel_path, is_dir=True):
+                        subdirs.append((Path(entry.path), rel_path))
+                elif entry.is_file():
+                    item = Path(entry.path)
+                    if self.get_parser(item) and not matcher.match(rel_path):
                         files.append(item)
-                elif item.is_dir():
-                    collect_files(item)
-
-        collect_files(root_path)
+            # Depth-first in name order, like the recursive walk this replaces.
+            stack.extend(reversed(subdirs))
         return files
 
-    def _resolve_import(self, import_name: str, available_files: List[Path]) -> List[Path]:
-        """Resolve import statement to actual file paths"""
-        # Simplified implementation: based on name matching
-        result = []
-        import_parts = import_name.replace('.', '/').split('/')
+    def _build_module_index(self, code_nodes: Dict[Path, CodeNode],
+                            root_path: Optional[Path] = None) -> Dict[str, List[Path]]:
+        """Map dotted module names to the files defining them.
+
+        A file is indexed by its dotted path relative to `root_path` and, inside
+        a package, relative to the parent of its top-level package, so
+        `src/pkg/core/agent.py` is `src.pkg.core.agent` and `pkg.core.agent`;
+        a package is its `__init__` file.
+        """
+        paths = list(code_nodes.keys())
+        if not paths:
+            return {}
+        if root_path is None:
+            root_path = Path(os.path.commonpath(paths))
+            if root_path in code_nodes:
+                root_path = root_path.parent
+        package_dirs = {path.parent for path in paths if path.name == '__init__.py'}
+
+        module_index = defaultdict(list)
+        for file_path in paths:
+            bases = {root_path}
+            if file_path.parent in package_dirs:
+                import_root = file_path.parent
+                while import_root in package_dirs and import_root != root_path:
+                    import_root = import_root.parent
+                bases.add(import_root)
+            for base in bases:
+                try:
+                    parts = list(file_path.relative_to(base).with_suffix('').parts)
+                except ValueError:
+                    continue
+                if parts and parts[-1] == '__init__':
+                    parts.pop()
+                if parts:
+                    module_index['.'.join(parts).lower()].append(file_path)
+        return dict(module_index)
+
+    def _build_symbol_table(self, code_nodes: Dict[Path, CodeNode]) -> Dict[str, Set[Path]]:
+        """Map symbol names and qualified names to the files defining them"""
+        symbol_table = defaultdict(set)
+        for file_path, node in code_nodes.items():
+            for symbol in node.symbols:
+                symbol_table[symbol.name].add(file_path)
+                symbol_table[symbol.full_name].add(file_path)
+        return dict(symbol_table)
 
-        for file_path in available_files:
-            file_str = str(file_path).lower()
-            if any(part.lower() in file_str for part in import_parts if part):
-                result.append(file_path)
+    def _resolve_import(self, import_name: str, module_index: Dict[str, List[Path]]) -> List[Path]:
+        """Resolve import statement to actual file paths
 
-        return result
+        Falls back to the longest importable prefix, so `pkg.mod.Class`
+        resolves to the file of `pkg.mod`.
+        """
+        parts = [part for part in import_name.lower().split('.') if part]
+        while parts:
+            files = module_index.get('.'.join(parts))
+            if files:
+                return files
+            parts.pop()
+        return []
 
     def _find_symbol_definition(self, symbol_name: str,
                                 code_nodes: Dict[Path, CodeNode]) -> List[Path]:
         """Find files where symbol is defined"""
-        result = []
-
-        for file_path, node in code_nodes.items():
-            for symbol in node.symbols:
-                if symbol.name == symbol_name or symbol.full_name == symbol_name:
-                    result.append(file_path)
-
-        return result
+        return sorted(self._build_symbol_table(code_nodes).get(symbol_name, ()))
 
     def _build_logic_layer(self, root_path: Path, code_nodes: Dict[Path, CodeNode],
                            dependency_graph: Dict[Path, Set[Path]]) -> LogicLayer:
@@ -571,21 +571,21 @@ class PythonParser(BaseParser):
             # import statements
             import_names = captures.get('import_name', [])
             for node in import_names:
-                module_name = node.text.decode('utf-8').split('.')[0]
+                module_name = node.text.decode('utf-8')
                 if module_name:
                     imports.append(module_name)
 
             # from import statements
             from_modules = captures.get('from_module', [])
             for node in from_modules:
-                module_name = node.text.decode('utf-8').split('.')[0]
+                module_name = node.text.decode('utf-8')
                 if module_name and not module_name.startswith('.'):
                     imports.append(module_name)
 
             # from import list statements
             from_module_lists = captures.get('from_module_list', [])
             for node in from_module_lists:
-                module_name = node.text.decode('utf-8').split('.')[0]
+                module_name = node.text.decode('utf-8')
                 if module_name and not module_name.startswith('.'):
                     imports.append(module_name)
 
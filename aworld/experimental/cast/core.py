@@ -329,7 +329,10 @@ class ACast:
         if code_analyzer_class is None:
             code_analyzer_class = DefaultASTAnalyzer
 
-        code_analyzer = code_analyzer_class(self.parsers)
+        if issubclass(code_analyzer_class, DefaultASTAnalyzer):
+            code_analyzer = code_analyzer_class(self.parsers, cache_dir=self.tmp_path / "parse_cache")
+        else:
+            code_analyzer = code_analyzer_class(self.parsers)
         self.analyzer = ASTContextBuilder(code_analyzer)
         return self.analyzer
 
@@ -0,0 +1,235 @@
+"""
+AWorld AST Framework - Incremental Analysis Support
+===================================================
+
+Building blocks that let `DefaultASTAnalyzer` re-analyse a repository while
+only touching the files that changed:
+
+- `IgnoreMatcher`: gitignore-style ignore patterns compiled once into regexes
+- `FileParseCache`: persistent per-file CodeNode cache keyed by path, mtime and content hash
+- process-pool helpers used for the parallel parse stage
+"""
+
+import hashlib
+import os
+import pickle
+import re
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from .models import CodeNode
+from .utils import logger
+
+PARSE_CACHE_VERSION = 2
+
+
+@dataclass(frozen=True)
+class _IgnoreRule:
+    regex: "re.Pattern[str]"
+    negated: bool
+    dir_only: bool
+
+
+def _translate_glob(pattern: str) -> str:
+    """Translate one gitignore glob (without anchoring) into a regex fragment."""
+    i, n = 0, len(pattern)
+    out = []
+    while i < n:
+        c = pattern[i]
+        if c == '*':
+            if pattern[i:i + 3] == '**/':
+                out.append('(?:.*/)?')
+                i += 3
+                continue
+            if pattern[i:i + 2] == '**':
+                out.append('.*')
+                i += 2
+                continue
+            out.append('[^/]*')
+        elif c == '?':
+            out.append('[^/]')
+        elif c == '[':
+            j = pattern.find(']', i + 1)
+            if j == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:j].replace('\\', '\\\\')
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                out.append(f'[{body}]')
+                i = j
+        elif c == '\\' and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return ''.join(out)
+
+
+class IgnoreMatcher:
+    """Gitignore-style path matcher compiled once per scan.
+
+    Patterns follow `.gitignore` semantics: a pattern without a slash matches
+    a file or directory name at any depth (`__pycache__`, `*.pyc`), a leading
+    or inner slash anchors it to the root (`/build`, `docs/_build`), a
+    trailing slash matches directories only, `**` spans directories and `!`
+    re-includes a previously ignored path. Paths are matched relative to the
+    scan root with `/` separators.
+    """
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        self.rules: List[_IgnoreRule] = []
+        for raw in patterns:
+            self.add(raw)
+
+    @classmethod
+    def from_gitignore(cls, root_path: Path, patterns: Iterable[str] = ()) -> "IgnoreMatcher":
+        """Compile `patterns` followed by the rules of `root_path/.gitignore`, if present."""
+        matcher = cls(patterns)
+        gitignore = Path(root_path) / '.gitignore'
+        if gitignore.is_file():
+            for line in gitignore.read_text(encoding='utf-8', errors='replace').splitlines():
+                matcher.add(line)
+        return matcher
+
+    def add(self, raw: str) -> None:
+        pattern = raw.rstrip()
+        if not pattern or pattern.startswith('#'):
+            return
+        negated = pattern.startswith('!')
+        if negated:
+            pattern = pattern[1:]
+        dir_only = pattern.endswith('/')
+        pattern = pattern.rstrip('/')
+        anchored = '/' in pattern
+        pattern = pattern.lstrip('/')
+        if not pattern:
+            return
+        prefix = '' if anchored else '(?:.*/)?'
+        regex = re.compile(f'^{prefix}{_translate_glob(pattern)}$')
+        self.rules.append(_IgnoreRule(regex=regex, negated=negated, dir_only=dir_only))
+
+    def match(self, rel_path: str, is_dir: bool = False) -> bool:
+        """Return True when `rel_path` (relative, `/`-separated) is ignored.
+
+        A path is also ignored when one of its parent directories matches.
+        """
+        parts = rel_path.strip('/').split('/')
+        # (candidate, is_dir): the path itself, then every parent directory.
+        candidates = [(rel_path.strip('/'), is_dir)] + [('/'.join(parts[:i]), True) for i in range(1, len(parts))]
+        ignored = False
+        for rule in self.rules:
+            # Only rules that could flip the current state matter; the last match wins.
+            if rule.negated != ignored:
+                continue
+            if any(rule.regex.match(candidate) for candidate, candidate_is_dir in candidates
+                   if candidate_is_dir or not rule.dir_only):
+                ignored = not rule.negated
+        return ignored
+
+
+class FileParseCache:
+    """Persistent per-file CodeNode cache.
+
+    One pickle per source file lives under `cache_dir`, named by a hash of the
+    absolute path. An entry is reused when the file's mtime and size are
+    unchanged, or, failing that, when the content hash still matches (e.g.
+    after a checkout that only touched timestamps). Entries also record the
+    parser class, so switching parser implementations invalidates them.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, file_path: Path) -> Path:
+        digest = hashlib.sha256(str(Path(file_path).resolve()).encode('utf-8')).hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest}.pkl"
+
+    @staticmethod
+    def parser_key(parser: Any) -> str:
+        cls = type(parser)
+        return f"{cls.__module__}.{cls.__qualname__}:{PARSE_CACHE_VERSION}"
+
+    @staticmethod
+    def content_hash(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def get(self, file_path: Path, parser: Any) -> Optional[CodeNode]:
+        entry_path = self._entry_path(file_path)
+        try:
+            stat = os.stat(file_path)
+            with open(entry_path, 'rb') as f:
+                entry = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError):
+            self.misses += 1
+            return None
+        if not isinstance(entry, dict) or entry.get('parser') != self.parser_key(parser) \
+                or entry.get('path') != str(file_path):
+            self.misses += 1
+            return None
+        if entry.get('mtime_ns') != stat.st_mtime_ns or entry.get('size') != stat.st_size:
+            try:
+                content_hash = self.content_hash(Path(file_path).read_bytes())
+            except OSError:
+                self.misses += 1
+                return None
+            if content_hash != entry.get('content_hash'):
+                self.misses += 1
+                return None
+            entry['mtime_ns'], entry['size'] = stat.st_mtime_ns, stat.st_size
+            self._write(entry_path, entry)
+        self.hits += 1
+        return entry['node']
+
+    def put(self, file_path: Path, parser: Any, node: CodeNode,
+            stat: Optional[os.stat_result] = None, content_hash: Optional[str] = None) -> None:
+        try:
+            stat = stat or os.stat(file_path)
+            content_hash = content_hash or self.content_hash(Path(file_path).read_bytes())
+        except OSError:
+            return
+        self._write(self._entry_path(file_path), {
+            'path': str(file_path),
+            'parser': self.parser_key(parser),
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'content_hash': content_hash,
+            'node': node,
+        })
+
+    def _write(self, entry_path: Path, entry: Dict[str, Any]) -> None:
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=entry_path.parent, prefix='.tmp-')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, entry_path)
+        except Exception as e:
+            logger.debug(f"Failed to write parse cache entry {entry_path}: {e}")
+
+
+# Parsers of the current worker process, built once by `_init_parse_worker`.
+_WORKER_PARSERS: Dict[str, Any] = {}
+
+
+def _init_parse_worker(parser_classes: Dict[str, Type[Any]]) -> None:
+    """Process-pool initializer: build fresh parsers (tree-sitter state is not picklable)."""
+    _WORKER_PARSERS.clear()
+    for name, parser_class in parser_classes.items():
+        _WORKER_PARSERS[name] = parser_class()
+
+
+def _parse_in_worker(items: List[Tuple[str, Path]]) -> List[Tuple[Path, Optional[CodeNode], Optional[str]]]:
+    """Parse `(parser_name, file_path)` items; returns `(path, node, error)` per item."""
+    results = []
+    for parser_name, file_path in items:
+        try:
+            results.append((file_path, _WORKER_PARSERS[parser_name].parse_file(file_path), None))
+        except Exception as e:
+            results.append((file_path, None, str(e)))
+    return results
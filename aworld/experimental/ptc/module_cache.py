@@ -0,0 +1,98 @@
+# coding: utf-8
+# Copyright (c) 2025 inclusionAI.
+"""Compiled PTC tool modules, cached by tool schema.
+
+Generating a tool module's source and compiling it only depends on the tool
+schemas of its server, so both are done once per schema and the code object is
+reused by every PTC step. Executing the cached code object still gives each step
+a fresh module namespace, into which the step's sandbox and context are bound.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from types import CodeType
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from aworld.experimental.ptc.mcp_client_code_generator import generate_ptc_tool_module_from_openai_tools
+from aworld.logs.util import logger
+
+
+def schema_digest(openai_tools: List[Dict[str, Any]]) -> str:
+    """Stable hash of a server's tool schemas."""
+    payload = json.dumps(openai_tools, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PtcModule(NamedTuple):
+    server_name: str
+    digest: str
+    source: str
+    code: CodeType
+
+
+class PtcModuleCache:
+    """LRU of compiled tool modules keyed by (server name, schema digest)."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], PtcModule]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_module(self, server_name: str, openai_tools: List[Dict[str, Any]]) -> PtcModule:
+        """Module for `openai_tools` of `server_name`, generated on a schema change only."""
+        key = (server_name, schema_digest(openai_tools))
+        with self._lock:
+            module = self._entries.get(key)
+            if module is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return module
+            self.misses += 1
+
+        source = generate_ptc_tool_module_from_openai_tools(openai_tools=openai_tools, server_name=server_name)
+        module = PtcModule(server_name, key[1], source, compile(source, f"<ptc_tools:{server_name}>", "exec"))
+        with self._lock:
+            self._entries[key] = module
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        logger.debug(f"Compiled PTC tool module for server: {server_name}")
+        return module
+
+    def get_code(self, server_name: str, openai_tools: List[Dict[str, Any]]) -> CodeType:
+        """Compiled module for `openai_tools` of `server_name`."""
+        return self.get_module(server_name, openai_tools).code
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def instantiate_tool_module(code: CodeType, sandbox: Any, context: Optional[Any] = None) -> Dict[str, Any]:
+    """
+    Run a compiled tool module in a fresh namespace bound to `sandbox` and `context`.
+
+    Args:
+        code: Compiled tool module.
+        sandbox: Sandbox the tool functions call MCP tools through.
+        context: Context passed along with every tool call.
+
+    Returns:
+        Dict[str, Any]: The module namespace.
+    """
+    module_globals = {
+        '__builtins__': __builtins__,
+        'sandbox': sandbox,
+    }
+    exec(code, module_globals)
+    if 'set_sandbox' in module_globals:
+        module_globals['set_sandbox'](sandbox)
+    if 'set_context' in module_globals:
+        module_globals['set_context'](context)
+    return module_globals
+
+
+ptc_module_cache = PtcModuleCache()
@@ -7,7 +7,7 @@ programmatically, keeping intermediate results out of the context window.
 """
 import traceback
 import asyncio
-from typing import Any, Dict, Tuple, List
+from typing import Any, Dict, Optional, Tuple, List
 import sys
 from io import StringIO
 
@@ -22,7 +22,9 @@ from aworld.core.tool.action import ToolAction
 from aworld.core.tool.base import ToolFactory, AsyncTool
 from aworld.logs.util import logger
 from aworld.tools.utils import build_observation
-from aworld.experimental.ptc.mcp_client_code_generator import generate_ptc_tool_module_from_openai_tools
+from aworld.experimental.ptc.module_cache import PtcModule, ptc_module_cache, instantiate_tool_module
+from aworld.experimental.ptc.ptc_worker import wrap_ptc_code
+from aworld.experimental.ptc.worker_pool import PtcWorkerPool, get_ptc_worker_pool
 
 PTC_TOOL = "PTC"
 
@@ -57,6 +59,11 @@ class PtcTool(AsyncTool):
     that are marked with [allow_code_execution]. The code can orchestrate multiple tool calls
     programmatically, keeping intermediate results out of the context window.
     
+    Scripts run in the agent process by default. With `ptc_worker_pool` set in the
+    tool config's `ext` (True, or a dict of `PtcWorkerPool` arguments: size, timeout,
+    cpu_seconds, memory_mb), they run in a pool of warm worker processes instead,
+    with their tool calls made back through the agent's sandbox.
+
     Example:
         # Agent can call this tool with Python code
         action = ActionModel(
@@ -136,15 +143,25 @@ class PtcTool(AsyncTool):
                 return agent.sandbox
         return None
 
-    async def _generate_tool_modules(self, sandbox, context: Context, agent: Agent) -> Dict[str, str]:
-        """Generate Python tool modules for PTC-compatible tools.
-        
+    def _worker_pool(self) -> Optional[PtcWorkerPool]:
+        """Worker pool scripts run in, None to run them in process."""
+        options = (self.conf.get('ext') or {}).get('ptc_worker_pool')
+        if not options:
+            return None
+        return get_ptc_worker_pool(**(options if isinstance(options, dict) else {}))
+
+    async def _generate_tool_modules(self, sandbox, context: Context, agent: Agent) -> Dict[str, PtcModule]:
+        """Get compiled Python tool modules for PTC-compatible tools.
+
+        Modules are generated and compiled once per tool schema and reused from
+        `ptc_module_cache` until a server's tools change.
+
         Args:
             sandbox: Sandbox instance with MCP servers
             context: Context for tool discovery
             
         Returns:
-            Dictionary mapping server names to generated module code
+            Dictionary mapping server names to compiled modules
         """
         if not sandbox or not hasattr(sandbox, 'mcp_servers') or not sandbox.mcp_servers:
             return {}
@@ -182,12 +199,7 @@ class PtcTool(AsyncTool):
             # Generate modules for each server
             for server_name, tools in server_tools.items():
                 try:
-                    module_code = generate_ptc_tool_module_from_openai_tools(
-                        openai_tools=tools,
-                        server_name=server_name
-                    )
-                    tool_modules[server_name] = module_code
-                    logger.debug(f"Generated PTC tool module for server: {server_name}")
+                    tool_modules[server_name] = ptc_module_cache.get_module(server_name, tools)
                 except Exception as e:
                     logger.warning(f"Failed to generate tool module for {server_name}: {e}")
         
@@ -201,7 +213,7 @@ class PtcTool(AsyncTool):
         code: str,
         sandbox,
         context: AmniContext,
-        tool_modules: Dict[str, str]
+        tool_modules: Dict[str, PtcModule]
     ) -> Tuple[Any, str]:
         """Execute Python code in a sandboxed environment.
         
@@ -209,11 +221,15 @@ class PtcTool(AsyncTool):
             code: Python code to execute
             sandbox: Sandbox instance for MCP tool calls
             context: Context for tool calls
-            tool_modules: Dictionary of generated tool modules
+            tool_modules: Dictionary of compiled tool modules
             
         Returns:
             Tuple of (result, error_message)
         """
+        pool = self._worker_pool()
+        if pool:
+            return await pool.execute(code, sandbox, context, tool_modules)
+
         # Create execution namespace
         exec_globals = {
             '__builtins__': __builtins__,
@@ -223,21 +239,11 @@ class PtcTool(AsyncTool):
         exec_locals = {}
         
         # Inject tool modules into execution environment
-        for server_name, module_code in tool_modules.items():
+        for server_name, module in tool_modules.items():
             try:
-                # Execute module code to create tool functions
-                module_globals = {
-                    '__builtins__': __builtins__,
-                    'sandbox': sandbox,
-                }
-                exec(module_code, module_globals)
-                
-                # Set sandbox and context in the generated module, same pattern for both
-                if 'set_sandbox' in module_globals:
-                    module_globals['set_sandbox'](sandbox)
-                if 'set_context' in module_globals:
-                    module_globals['set_context'](context)
-                
+                # Fresh module namespace per execution, bound to this step's sandbox and context
+                module_globals = instantiate_tool_module(module.code, sandbox, context)
+
                 # Import all tool functions into exec_globals
                 for name, value in module_globals.items():
                     if not name.startswith('_') and callable(value):
@@ -259,19 +265,7 @@ class PtcTool(AsyncTool):
             
             # Execute the code
             # Wrap code in an async function to support both sync and async operations
-            # Indent user code properly
-            import textwrap
-            indented_code = textwrap.indent(code, '    ')
-            wrapped_code = f"""async def _ptc_main():
-{indented_code}
-    # Try to return result if it exists, otherwise return None
-    if 'result' in locals():
-        return result
-    return None
-"""
-            
-            # Compile and execute wrapped code
-            compiled_code = compile(wrapped_code, '<ptc_code>', 'exec')
+            compiled_code = compile(wrap_ptc_code(code), '<ptc_code>', 'exec')
             exec(compiled_code, exec_globals, exec_locals)
             
             # Execute the async function
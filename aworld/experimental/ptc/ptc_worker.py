@@ -0,0 +1,215 @@
+# coding: utf-8
+# Copyright (c) 2025 inclusionAI.
+"""PTC worker process.
+
+Runs PTC scripts outside the agent process. The worker is started by
+`PtcWorkerPool` as `python -I ptc_worker.py`, so it only depends on the
+standard library and never imports aworld. It talks to the parent over
+stdin/stdout with length-prefixed JSON frames:
+
+    parent -> worker  {"op": "run", "job", "code", "modules": {server: {"digest", "source"}}, "cpu_seconds"}
+    worker -> parent  {"op": "call", "call", "actions"}           one MCP tool call of the script
+    parent -> worker  {"op": "result", "call", "results"|"error"} its results
+    worker -> parent  {"op": "done", "job", "result", "result_type", "output", "error"}
+
+Tool modules are compiled once per schema digest and kept for later jobs, and
+tool calls of a script are sent as soon as they are made, so calls gathered by
+the script run concurrently in the parent.
+"""
+import asyncio
+import io
+import json
+import os
+import struct
+import sys
+import textwrap
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Any, Dict
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+_HEADER = struct.Struct(">I")
+
+
+def encode_frame(message: Dict[str, Any]) -> bytes:
+    """Length-prefixed JSON frame of `message`."""
+    payload = json.dumps(message, ensure_ascii=False, default=str).encode("utf-8")
+    return _HEADER.pack(len(payload)) + payload
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Dict[str, Any]:
+    """Next frame from `reader`, raises `asyncio.IncompleteReadError` at EOF."""
+    header = await reader.readexactly(_HEADER.size)
+    return json.loads(await reader.readexactly(_HEADER.unpack(header)[0]))
+
+
+def wrap_ptc_code(code: str) -> str:
+    """Wrap a PTC script in an async function returning its `result` variable."""
+    return f"""async def _ptc_main():
+{textwrap.indent(code, '    ')}
+    # Try to return result if it exists, otherwise return None
+    if 'result' in locals():
+        return result
+    return None
+"""
+
+
+def set_memory_limit(memory_mb: int) -> None:
+    """Cap the address space of this process."""
+    if resource is None or not memory_mb:
+        return
+    limit = int(memory_mb) * 1024 * 1024
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def set_cpu_limit(cpu_seconds: float) -> None:
+    """Allow `cpu_seconds` more CPU time from now, SIGXCPU kills the process after it."""
+    if resource is None:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if not cpu_seconds:
+        resource.setrlimit(resource.RLIMIT_CPU, (hard, hard))
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    limit = int(usage.ru_utime + usage.ru_stime + cpu_seconds) + 1
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (limit, hard))
+
+
+class _McpServers:
+    """`sandbox.mcpservers` of the tool modules, forwarding calls to the parent."""
+
+    def __init__(self, worker: "PtcWorker"):
+        self._worker = worker
+
+    async def call_tool(self, actions, context=None):
+        # The context stays in the parent, which passes its own with the call
+        return await self._worker.call_parent(actions)
+
+
+class _Sandbox:
+    def __init__(self, worker: "PtcWorker"):
+        self.mcpservers = _McpServers(worker)
+
+
+class PtcWorker:
+    def __init__(self, reader: asyncio.StreamReader, out):
+        self.reader = reader
+        self.out = out
+        self.sandbox = _Sandbox(self)
+        self.code_cache: Dict[str, Any] = {}
+        self.pending: Dict[int, asyncio.Future] = {}
+        self.next_call = 0
+        self.job_task = None
+
+    def send(self, message: Dict[str, Any]) -> None:
+        self.out.write(encode_frame(message))
+        self.out.flush()
+
+    async def call_parent(self, actions):
+        self.next_call += 1
+        call_id = self.next_call
+        future = self.pending[call_id] = asyncio.get_running_loop().create_future()
+        try:
+            self.send({"op": "call", "call": call_id, "actions": actions})
+            return await future
+        finally:
+            self.pending.pop(call_id, None)
+
+    def _module_code(self, server_name: str, module: Dict[str, Any]):
+        digest = module["digest"]
+        code = self.code_cache.get(digest)
+        if code is None:
+            code = self.code_cache[digest] = compile(module["source"], f"<ptc_tools:{server_name}>", "exec")
+        return code
+
+    async def run_job(self, message: Dict[str, Any]) -> None:
+        set_cpu_limit(message.get("cpu_seconds"))
+        exec_globals = {'__builtins__': __builtins__, 'sandbox': self.sandbox, 'context': None}
+        stdout_capture, stderr_capture = io.StringIO(), io.StringIO()
+        done = {"op": "done", "job": message["job"], "result": None, "result_type": "none", "output": "",
+                "error": None}
+        try:
+            with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
+                for server_name, module in (message.get("modules") or {}).items():
+                    module_globals = {'__builtins__': __builtins__, 'sandbox': self.sandbox}
+                    exec(self._module_code(server_name, module), module_globals)
+                    if 'set_sandbox' in module_globals:
+                        module_globals['set_sandbox'](self.sandbox)
+                    for name, value in module_globals.items():
+                        if not name.startswith('_') and callable(value):
+                            exec_globals[name] = value
+
+                exec_locals = {}
+                exec(compile(wrap_ptc_code(message["code"]), '<ptc_code>', 'exec'), exec_globals, exec_locals)
+                result = await exec_locals['_ptc_main']()
+
+            if result is not None:
+                try:
+                    json.dumps(result)
+                    done.update(result=result, result_type="json")
+                except (TypeError, ValueError):
+                    done.update(result=str(result), result_type="str")
+            output = ""
+            if stdout_capture.getvalue():
+                output += f"STDOUT:\n{stdout_capture.getvalue()}\n"
+            if stderr_capture.getvalue():
+                output += f"STDERR:\n{stderr_capture.getvalue()}\n"
+            done["output"] = output
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            done["error"] = f"Execution error: {str(e)}\n{traceback.format_exc()}"
+        finally:
+            set_cpu_limit(None)
+        self.send(done)
+
+    def _on_result(self, message: Dict[str, Any]) -> None:
+        future = self.pending.get(message["call"])
+        if future is None or future.done():
+            return
+        if message.get("error") is not None:
+            future.set_exception(RuntimeError(message["error"]))
+        else:
+            future.set_result(message.get("results") or [])
+
+    async def serve(self) -> None:
+        while True:
+            try:
+                message = await read_frame(self.reader)
+            except asyncio.IncompleteReadError:
+                # Parent closed the channel
+                return
+            op = message.get("op")
+            if op == "run":
+                self.job_task = asyncio.ensure_future(self.run_job(message))
+            elif op == "result":
+                self._on_result(message)
+
+
+async def _main() -> None:
+    # Frames go to the original stdout, anything else printed lands on stderr
+    out = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=2 ** 26)
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    worker = PtcWorker(reader, out)
+    worker.send({"op": "ready", "pid": os.getpid()})
+    await worker.serve()
+
+
+if __name__ == "__main__":
+    for arg in sys.argv[1:]:
+        if arg.startswith("--memory-mb="):
+            set_memory_limit(int(arg.split("=", 1)[1]))
+    asyncio.run(_main())
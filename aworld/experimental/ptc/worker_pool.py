@@ -0,0 +1,236 @@
+# coding: utf-8
+# Copyright (c) 2025 inclusionAI.
+"""Pool of warm worker processes running PTC scripts out of the agent process.
+
+A script runs in a worker started from `ptc_worker.py`, away from the agent's
+interpreter and event loop. Its MCP tool calls come back to the parent over the
+worker's stdin/stdout and are made through the step's sandbox and context, so
+tool clients and credentials stay in the agent process. Workers are reused
+between scripts and keep the tool modules they compiled, only modules they have
+not seen yet are sent along with a script.
+
+Each script gets a wall-clock timeout, and optionally a CPU time and memory
+limit enforced by the worker's rlimits. A worker that exceeds a limit is killed
+and replaced by a fresh one.
+"""
+import asyncio
+import os
+import signal
+import sys
+import threading
+import weakref
+from typing import Any, Dict, Optional, Set, Tuple
+
+from aworld.experimental.ptc.module_cache import PtcModule
+from aworld.experimental.ptc.ptc_worker import encode_frame, read_frame
+from aworld.logs.util import logger
+
+WORKER_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ptc_worker.py")
+
+
+class PtcWorkerError(RuntimeError):
+    """The worker running a script was lost."""
+
+
+def _content_of(result: Any) -> Any:
+    return result.get("content") if isinstance(result, dict) else getattr(result, "content", None)
+
+
+class _PtcWorkerProcess:
+    """One worker process and its channel."""
+
+    def __init__(self, memory_mb: Optional[int] = None):
+        self.memory_mb = memory_mb
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.digests: Set[str] = set()
+        self.jobs = 0
+        self._write_lock = asyncio.Lock()
+
+    async def start(self) -> "_PtcWorkerProcess":
+        args = [sys.executable, "-I", WORKER_FILE]
+        if self.memory_mb:
+            args.append(f"--memory-mb={int(self.memory_mb)}")
+        self.process = await asyncio.create_subprocess_exec(
+            *args, stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE, limit=2 ** 26)
+        await read_frame(self.process.stdout)
+        logger.debug(f"PTC worker {self.process.pid} started")
+        return self
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+
+    async def send(self, message: Dict[str, Any]) -> None:
+        async with self._write_lock:
+            self.process.stdin.write(encode_frame(message))
+            await self.process.stdin.drain()
+
+    async def run(self, job: Dict[str, Any], sandbox: Any, context: Any) -> Dict[str, Any]:
+        """Send `job` and serve its tool calls until the worker reports it done."""
+        calls: Set[asyncio.Task] = set()
+
+        async def answer(call: Dict[str, Any]) -> None:
+            try:
+                results = await sandbox.mcpservers.call_tool(call["actions"], context=context)
+                reply = {"op": "result", "call": call["call"],
+                         "results": [{"content": _content_of(result)} for result in results or []]}
+            except Exception as e:
+                reply = {"op": "result", "call": call["call"], "error": str(e)}
+            await self.send(reply)
+
+        await self.send(job)
+        try:
+            while True:
+                try:
+                    message = await read_frame(self.process.stdout)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    raise PtcWorkerError(self._exit_reason(await self.process.wait()))
+                if message.get("op") == "call":
+                    task = asyncio.create_task(answer(message))
+                    calls.add(task)
+                    task.add_done_callback(calls.discard)
+                elif message.get("op") == "done" and message.get("job") == job["job"]:
+                    return message
+        finally:
+            for task in list(calls):
+                task.cancel()
+
+    @staticmethod
+    def _exit_reason(returncode: int) -> str:
+        if returncode == -signal.SIGXCPU:
+            return "PTC worker exceeded its CPU time limit"
+        if returncode == -signal.SIGKILL:
+            return "PTC worker was killed"
+        return f"PTC worker exited with code {returncode}"
+
+    async def close(self, timeout: float = 2.0) -> None:
+        if not self.alive:
+            return
+        try:
+            self.process.stdin.close()
+            await asyncio.wait_for(self.process.wait(), timeout)
+        except (asyncio.TimeoutError, ConnectionError):
+            self.kill()
+            await self.process.wait()
+
+    def kill(self) -> None:
+        if self.alive:
+            try:
+                self.process.kill()
+            except ProcessLookupError:
+                pass
+
+
+class PtcWorkerPool:
+    """
+    Warm PTC worker processes of one event loop.
+
+    Args:
+        size: Maximum number of workers, and so of scripts running at once.
+        timeout: Wall-clock seconds a script may run.
+        cpu_seconds: CPU seconds a script may use, None for no limit.
+        memory_mb: Address space of a worker in MB, None for no limit.
+    """
+
+    def __init__(self,
+                 size: int = 4,
+                 timeout: float = 300.0,
+                 cpu_seconds: Optional[float] = None,
+                 memory_mb: Optional[int] = None):
+        self.size = max(1, size)
+        self.timeout = timeout
+        self.cpu_seconds = cpu_seconds
+        self.memory_mb = memory_mb
+        self._idle: list = []
+        self._slots = asyncio.Semaphore(self.size)
+        self._next_job = 0
+        self.started = 0
+
+    async def _acquire(self) -> _PtcWorkerProcess:
+        while self._idle:
+            worker = self._idle.pop()
+            if worker.alive:
+                return worker
+        self.started += 1
+        return await _PtcWorkerProcess(self.memory_mb).start()
+
+    async def execute(self,
+                      code: str,
+                      sandbox: Any,
+                      context: Any,
+                      modules: Dict[str, PtcModule]) -> Tuple[Any, str]:
+        """
+        Run a PTC script in a worker.
+
+        Args:
+            code: Python code to execute.
+            sandbox: Sandbox the script's MCP tool calls are made through.
+            context: Context passed along with every tool call.
+            modules: Tool modules of the script, by server name.
+
+        Returns:
+            Tuple of (result, output), output holds the error message if the script failed.
+        """
+        async with self._slots:
+            worker = await self._acquire()
+            self._next_job += 1
+            job = {
+                "op": "run",
+                "job": self._next_job,
+                "code": code,
+                "cpu_seconds": self.cpu_seconds,
+                "modules": {
+                    server_name: {"digest": module.digest,
+                                  "source": None if module.digest in worker.digests else module.source}
+                    for server_name, module in modules.items()
+                },
+            }
+            healthy = False
+            try:
+                done = await asyncio.wait_for(worker.run(job, sandbox, context), self.timeout)
+                worker.digests.update(module.digest for module in modules.values())
+                worker.jobs += 1
+                healthy = True
+            except asyncio.TimeoutError:
+                error = f"Execution error: PTC script timed out after {self.timeout}s"
+                logger.warning(f"PTC worker {worker.process.pid} killed: {error}")
+                return None, error
+            except PtcWorkerError as e:
+                logger.warning(f"PTC worker {worker.process.pid} lost: {e}")
+                return None, f"Execution error: {e}"
+            finally:
+                if healthy and worker.alive:
+                    self._idle.append(worker)
+                else:
+                    worker.kill()
+
+        if done.get("error"):
+            logger.error(f"PTC code execution failed: {done['error']}")
+            return None, done["error"]
+        return done.get("result"), done.get("output") or ""
+
+    async def aclose(self) -> None:
+        """Stop the idle workers."""
+        idle, self._idle = self._idle, []
+        await asyncio.gather(*(worker.close() for worker in idle), return_exceptions=True)
+
+
+_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple, PtcWorkerPool]]" = \
+    weakref.WeakKeyDictionary()
+_pools_lock = threading.Lock()
+
+
+def get_ptc_worker_pool(size: int = 4,
+                        timeout: float = 300.0,
+                        cpu_seconds: Optional[float] = None,
+                        memory_mb: Optional[int] = None) -> PtcWorkerPool:
+    """Shared pool with these limits for the running event loop."""
+    loop = asyncio.get_running_loop()
+    key = (size, timeout, cpu_seconds, memory_mb)
+    with _pools_lock:
+        pools = _pools.setdefault(loop, {})
+        pool = pools.get(key)
+        if pool is None:
+            pool = pools[key] = PtcWorkerPool(size=size, timeout=timeout, cpu_seconds=cpu_seconds,
+                                              memory_mb=memory_mb)
+        return pool
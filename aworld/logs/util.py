@@ -1,11 +1,16 @@
 # coding: utf-8
 # Copyright (c) 2025 inclusionAI.
 import asyncio
+import atexit
 import inspect
 import json
 import os
+import queue
+import random
 import sys
+import threading
 import traceback
+import zlib
 from enum import Enum
 from typing import Union, Callable, Dict, Any, Optional
 
@@ -17,6 +22,116 @@ CONSOLE_LEVEL = 'INFO'
 STORAGE_LEVEL = 'INFO'
 SUPPORTED_FUNC = ['info', 'debug', 'warning', 'error', 'critical', 'exception', 'trace', 'success', 'log', 'catch',
                   'opt', 'bind', 'unbind', 'contextualize', 'patch']
+# Emitting calls that may be handed to the background writer; `exception` needs the caller's exc_info.
+ASYNC_FUNC = {'info', 'debug', 'warning', 'error', 'critical', 'trace', 'success', 'log'}
+
+try:
+    from loguru._datetime import aware_now as _log_now
+except ImportError:  # pragma: no cover - private loguru helper
+    _log_now = None
+
+
+class LazyMessage:
+    """Log message built only when it is written.
+
+    Wrap a callable (`logger.info(LazyMessage(lambda: f"... {message}"))`) to
+    defer building the string; with async logging enabled it is built on the
+    writer thread, off the caller's event loop. Only capture values that are
+    immutable or already snapshotted, anything the caller keeps mutating may be
+    rendered in a later state.
+    """
+
+    def __init__(self, build: Callable[[], Any]):
+        self.build = build
+
+    def __str__(self):
+        return str(self.build())
+
+
+def _resolve(value):
+    return str(value) if isinstance(value, LazyMessage) else value
+
+
+class AsyncLogWriter:
+    """Queue-backed background writer shared by all AWorld loggers.
+
+    Log calls are queued with their caller metadata already captured and the
+    loguru pipeline (message building, formatting, sinks, rotation) runs on a
+    daemon thread. When the queue is full the call is written synchronously,
+    so records are delayed but never dropped. Pending records are flushed at
+    interpreter exit.
+    """
+
+    def __init__(self, maxsize: int = 10000):
+        self.maxsize = maxsize
+        self._queue = None
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def submit(self, fn: Callable, *args, **kwargs) -> None:
+        if self._pid != os.getpid():
+            self._start()
+        try:
+            self._queue.put_nowait((fn, args, kwargs))
+        except queue.Full:
+            self._call(fn, args, kwargs)
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Block until every queued record has been written."""
+        if self._queue is None or self._pid != os.getpid():
+            return
+        done = threading.Event()
+        try:
+            self._queue.put((done.set, (), {}), timeout=timeout)
+        except queue.Full:
+            return
+        done.wait(timeout)
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            # Also taken after fork: the parent's writer thread does not exist in the child.
+            self._queue = queue.Queue(maxsize=self.maxsize)
+            self._thread = threading.Thread(target=self._run, name="aworld-log-writer", daemon=True)
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def _run(self) -> None:
+        while True:
+            fn, args, kwargs = self._queue.get()
+            self._call(fn, args, kwargs)
+
+    @staticmethod
+    def _call(fn: Callable, args: tuple, kwargs: dict) -> None:
+        try:
+            fn(*[_resolve(arg) for arg in args], **kwargs)
+        except Exception:
+            traceback.print_exc()
+
+
+_async_writer: Optional[AsyncLogWriter] = None
+
+
+def enable_async_logging(enabled: bool = True, maxsize: int = 10000) -> None:
+    """Write logs through a background thread instead of on the caller's thread.
+
+    Also enabled at import time by the environment variable AWORLD_LOG_ASYNC=true.
+    """
+    global _async_writer
+    if enabled and _async_writer is None:
+        _async_writer = AsyncLogWriter(maxsize=maxsize)
+    elif not enabled and _async_writer is not None:
+        _async_writer.flush()
+        _async_writer = None
+
+
+def flush_logs(timeout: float = 5.0) -> None:
+    """Wait for queued log records to be written; a no-op without async logging."""
+    if _async_writer is not None:
+        _async_writer.flush(timeout)
 
 
 class Color:
@@ -58,7 +173,13 @@ def aworld_log(logger, color: str = Color.black, level: str = "INFO"):
         if not color:
             color = def_color
 
-        if highlight_key is None:
+        if isinstance(value, LazyMessage):
+            build = value.build
+            if highlight_key is None:
+                logger.log(level, LazyMessage(lambda: f"{color}  {build()} {Color.reset}"))
+            else:
+                logger.log(level, LazyMessage(lambda: f"{color} {highlight_key}: {Color.reset} {build()}"))
+        elif highlight_key is None:
             logger.log(level, f"{color}  {value} {Color.reset}")
         else:
             logger.log(level, f"{color} {highlight_key}: {Color.reset} {value}")
@@ -254,14 +375,28 @@ class AWorldLogger:
             trace_id = get_trace_id()
             update = {"function": func_name, "line": line, "name": module,
                       "extra": {"trace_id": trace_id, "logger_name": "Aworld"}}
+            writer = _async_writer
+            caller_thread = None
+            if writer is not None and name in ASYNC_FUNC:
+                # Keep the time and thread of the call, not of the write.
+                caller_thread = threading.current_thread()
+                if _log_now is not None:
+                    update["time"] = _log_now()
 
             def patch(record):
                 extra = update.pop("extra")
                 record.update(update)
                 record['extra'].update(extra)
+                if caller_thread is not None:
+                    record['thread'] = type(record['thread'])(caller_thread.ident, caller_thread.name)
                 return record
 
-            return getattr(self._logger.patch(patch), name)
+            method = getattr(self._logger.patch(patch), name)
+            if writer is not None and name in ASYNC_FUNC:
+                return lambda *args, **kwargs: writer.submit(method, *args, **kwargs)
+            if name in ASYNC_FUNC:
+                return lambda *args, **kwargs: method(*[_resolve(arg) for arg in args], **kwargs)
+            return method
         raise AttributeError(f"'AWorldLogger' object has no attribute '{name}'")
 
 
@@ -292,6 +427,9 @@ _LLM_LOG_FORMATTER = (
 )
 llm_logger = AWorldLogger(tag='llm', name='AWorld', formatter=_LLM_LOG_FORMATTER)
 
+if os.getenv('AWORLD_LOG_ASYNC', 'false').lower() in ('true', '1', 'yes'):
+    enable_async_logging()
+
 if os.getenv('AWORLD_LOG_ENDABLE_MONKEY', 'true') == 'true':
     monkey_logger(logger)
     monkey_logger(trace_logger)
@@ -302,6 +440,95 @@ if os.getenv('AWORLD_LOG_ENDABLE_MONKEY', 'true') == 'true':
     # monkey_logger(llm_logger)
 
 
+class LLMLogSettings:
+    """Sampling, size and sink settings of `log_llm_record`.
+
+    Defaults come from the environment:
+    AWORLD_LLM_LOG_SAMPLE_RATES ("CHUNK=0.05,INPUT=1"; directions not listed use 1.0),
+    AWORLD_LLM_LOG_MAX_CHARS (payload cap, 0 for none) and
+    AWORLD_LLM_LOG_JSONL (true, or a file path, to also write one JSON object per record).
+    """
+
+    def __init__(self):
+        self.sample_rates: Dict[str, float] = {}
+        for item in os.getenv('AWORLD_LLM_LOG_SAMPLE_RATES', '').split(','):
+            if '=' in item:
+                direction, rate = item.split('=', 1)
+                self.sample_rates[direction.strip().upper()] = float(rate)
+        self.max_payload_chars = int(os.getenv('AWORLD_LLM_LOG_MAX_CHARS', '0'))
+        self.jsonl_sink_id = None
+
+    def sampled(self, direction: str, key: Optional[str]) -> bool:
+        """Decide whether to log; records sharing a request id are kept or dropped together.
+
+        Only the key is hashed, so with differing rates the records kept for a
+        lower-rate direction are a subset of those kept for a higher one.
+        """
+        rate = self.sample_rates.get(direction.upper(), 1.0)
+        if rate >= 1.0:
+            return True
+        if rate <= 0.0:
+            return False
+        if key:
+            return zlib.crc32(key.encode('utf-8')) / 0xFFFFFFFF < rate
+        return random.random() < rate
+
+
+llm_log_settings = LLMLogSettings()
+
+
+def _llm_jsonl_sink(path: str):
+    lock = threading.Lock()
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    def sink(message):
+        record = message.record
+        extra = record['extra']
+        payload = record['message'] if not extra.get('truncated') else json.dumps(record['message'], ensure_ascii=False)
+        # The payload is already JSON; embed it without decoding and re-encoding.
+        line = (f'{{"time":{json.dumps(record["time"].isoformat())},'
+                f'"direction":{json.dumps(extra.get("direction"))},'
+                f'"trace_id":{json.dumps(extra.get("trace_id"))},'
+                f'"model":{json.dumps(extra.get("model_name"))},'
+                f'"meta":{json.dumps(extra.get("meta"), ensure_ascii=False)},'
+                f'"payload":{payload}}}\n')
+        with lock, open(path, 'a', encoding='utf-8') as f:
+            f.write(line)
+
+    return sink
+
+
+def configure_llm_logging(sample_rates: Optional[Dict[str, float]] = None,
+                          max_payload_chars: Optional[int] = None,
+                          jsonl_path: Optional[str] = None) -> None:
+    """Configure `log_llm_record`.
+
+    Args:
+        sample_rates: Fraction of records to keep per direction (e.g. {"CHUNK": 0.05}).
+        max_payload_chars: Truncate serialized payloads beyond this many characters; 0 disables the cap.
+        jsonl_path: Also write every logged record as one JSON object per line to this file.
+    """
+    if sample_rates is not None:
+        llm_log_settings.sample_rates = {k.upper(): float(v) for k, v in sample_rates.items()}
+    if max_payload_chars is not None:
+        llm_log_settings.max_payload_chars = max_payload_chars
+    if jsonl_path is not None:
+        if llm_log_settings.jsonl_sink_id is not None:
+            base_logger.remove(llm_log_settings.jsonl_sink_id)
+        llm_log_settings.jsonl_sink_id = base_logger.add(
+            _llm_jsonl_sink(jsonl_path),
+            filter=lambda record: record['extra'].get('name') == 'llm',
+            format="{message}",
+            level=STORAGE_LEVEL)
+
+
+_llm_jsonl_env = os.getenv('AWORLD_LLM_LOG_JSONL', '')
+if _llm_jsonl_env.lower() in ('true', '1', 'yes'):
+    configure_llm_logging(jsonl_path=f"{os.environ.get('AWORLD_LOG_PATH', f'{os.getcwd()}/logs')}/llm.jsonl")
+elif _llm_jsonl_env and _llm_jsonl_env.lower() not in ('false', '0', 'no'):
+    configure_llm_logging(jsonl_path=_llm_jsonl_env)
+
+
 def log_llm_record(
         direction: str,
         model_name: str,
@@ -317,12 +544,18 @@ def log_llm_record(
         data: The data to be logged (e.g., messages list for input, ModelResponse for output).
         params: Optional dict of extra call parameters (temperature, max_tokens, etc.).
         trace_id: Optional trace ID; auto-resolved from context when omitted.
+
+    Records are sampled per direction and payloads capped in size according to
+    `llm_log_settings` (see `configure_llm_logging`); sampling happens before
+    any serialization, so dropped records cost almost nothing.
     """
     from aworld.models.usage import normalize_usage
     from aworld.trace.base import get_trace_id
     from aworld.utils.serialized_util import to_serializable
 
     resolved_trace_id = trace_id or get_trace_id()
+    if not llm_log_settings.sampled(direction, (params or {}).get("request_id") or resolved_trace_id):
+        return
     enriched_params = dict(params or {})
 
     provider_request_id = None
@@ -383,12 +616,24 @@ def log_llm_record(
 
     meta_str = ", ".join(meta_parts) if meta_parts else ""
 
-    llm_logger._logger.bind(
+    # Serialized here: the caller may keep mutating `data` (e.g. the messages list) after this returns.
+    message = json.dumps(body, ensure_ascii=False)
+    truncated = 0 < llm_log_settings.max_payload_chars < len(message)
+    if truncated:
+        dropped = len(message) - llm_log_settings.max_payload_chars
+        message = f"{message[:llm_log_settings.max_payload_chars]}...[truncated {dropped} chars]"
+
+    bound = llm_logger._logger.bind(
         trace_id=resolved_trace_id,
         direction=direction,
         model_name=model_name,
         meta=meta_str,
-    ).info(json.dumps(body, ensure_ascii=False))
+        truncated=truncated,
+    )
+    if _async_writer is not None:
+        _async_writer.submit(bound.info, message)
+    else:
+        bound.info(message)
 
 
 # log examples:
@@ -0,0 +1,122 @@
+"""
+Embedded vector database for aworld memory, backed by `LocalVectorStore`.
+
+Runs in-process on numpy with memory-mapped segment files, so no vector
+service or client library is needed.
+"""
+import time
+from typing import Optional, Dict, Any
+
+from aworld.logs.util import logger
+from aworld.memory.embeddings.base import EmbeddingsResults, EmbeddingsMetadata, EmbeddingsResult
+from aworld.memory.vector.dbs.base import VectorDB
+from aworld.memory.vector.local_store import LocalVectorStore, metadata_filter
+
+
+class LocalVectorDB(VectorDB):
+    """Embedded implementation of the VectorDB interface.
+
+    Config keys:
+        local_data_path: Directory of the collections; in-memory when unset.
+        local_dtype: "float32" (default) or "float16".
+        local_segment_size: Rows per memory-mapped segment file.
+        local_index: "flat" (exact, default) or "ivf".
+        local_nlist / local_nprobe: IVF lists and lists scanned per query.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        options = {
+            "dtype": config.get("local_dtype"),
+            "segment_size": config.get("local_segment_size"),
+            "index": config.get("local_index"),
+            "nlist": config.get("local_nlist"),
+            "nprobe": config.get("local_nprobe"),
+        }
+        self.store = LocalVectorStore(
+            config.get("local_data_path"),
+            **{key: value for key, value in options.items() if value is not None},
+        )
+
+    def has_collection(self, collection_name: str) -> bool:
+        return self.store.has_collection(collection_name)
+
+    def delete_collection(self, collection_name: str):
+        return self.store.delete_collection(collection_name)
+
+    @staticmethod
+    def _to_result(record, score=None) -> EmbeddingsResult:
+        item_id, content, metadata, _ = record
+        return EmbeddingsResult(
+            id=item_id,
+            embedding=None,
+            content=content,
+            metadata=EmbeddingsMetadata.model_validate(metadata),
+            score=score,
+        )
+
+    def search(
+            self, collection_name: str, vectors: list[list[float | int]], filter: dict, threshold: float, limit: int
+    ) -> Optional[EmbeddingsResults]:
+        """Search for nearest neighbors based on vector similarity.
+
+        Scores are cosine similarity mapped to [0, 1], as the chroma backend reports them.
+        """
+        try:
+            collection = self.store.collection(collection_name, create=False)
+            if collection is None:
+                return None
+            records = collection.search(vectors, limit, filter=metadata_filter(filter))[0]
+            docs = []
+            for record in records:
+                score = (1 + record[3]) / 2
+                if threshold and score < threshold:
+                    continue
+                docs.append(self._to_result(record, score))
+            return EmbeddingsResults(docs=docs, retrieved_at=int(time.time()))
+        except Exception as e:
+            logger.error(f"Error in search: {e}")
+            return None
+
+    def query(
+            self, collection_name: str, filter: dict, limit: Optional[int] = None
+    ) -> Optional[EmbeddingsResults]:
+        collection = self.store.collection(collection_name, create=False)
+        if collection is None:
+            return None
+        docs = [self._to_result(record) for record in collection.query(metadata_filter(filter), limit)]
+        return EmbeddingsResults(docs=docs, retrieved_at=int(time.time()))
+
+    def get(self, collection_name: str) -> Optional[EmbeddingsResults]:
+        return self.query(collection_name, filter={})
+
+    def insert(self, collection_name: str, items: list[EmbeddingsResult]):
+        self.upsert(collection_name, items)
+
+    def upsert(self, collection_name: str, items: list[EmbeddingsResult]):
+        self.store.collection(collection_name).upsert(
+            ids=[item.id for item in items],
+            vectors=[item.embedding for item in items],
+            contents=[item.content for item in items],
+            metadatas=[item.metadata.model_dump() for item in items],
+        )
+
+    def delete(
+            self,
+            collection_name: str,
+            ids: Optional[list[str]] = None,
+            filter: Optional[dict] = None,
+    ):
+        collection = self.store.collection(collection_name, create=False)
+        if collection is None:
+            return
+        if ids:
+            collection.delete(ids=ids)
+        elif filter:
+            where = metadata_filter(filter)
+            if where:
+                collection.delete(filter=where)
+        else:
+            self.store.delete_collection(collection_name)
+
+    def reset(self):
+        self.store.reset()
@@ -18,6 +18,9 @@ class VectorDBFactory:
         if vector_db_config.provider == "chroma":
             from aworld.memory.vector.dbs.chroma import ChromaVectorDB
             return ChromaVectorDB(vector_db_config.config)
+        if vector_db_config.provider == "local":
+            from aworld.memory.vector.dbs.local import LocalVectorDB
+            return LocalVectorDB(vector_db_config.config)
         if vector_db_config.provider == "qdrant":
             from aworld.memory.vector.dbs.qdrant import QdrantVectorDB
             return QdrantVectorDB(vector_db_config.config)
@@ -0,0 +1,538 @@
+"""
+Embedded single-process vector store.
+
+Vectors live in fixed-capacity segment files (`seg-000000.npy`, ...) that are
+memory-mapped, so a collection larger than RAM is paged in on demand and a
+restart does not re-read it. Rows are addressed by their insertion number: row
+`r` is row `r % segment_size` of segment `r // segment_size`. Contents and
+metadata are kept in an append-only JSONL log next to the segments, which is
+also the source of truth for how many rows are valid. Deletes are tombstones,
+reclaimed by `compact()` once they dominate a collection.
+
+Search is exact cosine top-k, computed segment by segment with one matrix
+multiply per block. Collections configured with `index="ivf"` additionally keep
+an inverted-file index (spherical k-means lists) and only score the rows of the
+`nprobe` nearest lists. Metadata equality filters are answered from per
+(key, value) lists of rows.
+"""
+import json
+import math
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from aworld.logs.util import logger
+
+MANIFEST_VERSION = 1
+DEFAULT_SEGMENT_SIZE = 8192
+# Row blocks scored per matrix multiply; bounds the float32 scratch of float16 collections
+SEARCH_BLOCK_ROWS = 4096
+COMPACT_DEAD_RATIO = 0.5
+IVF_MIN_ROWS = 10000
+IVF_TRAIN_SAMPLE_PER_LIST = 64
+IVF_ITERATIONS = 10
+
+# (id, content, metadata, score)
+VectorRecord = Tuple[str, str, Dict[str, Any], Optional[float]]
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def _index_value(value: Any) -> Optional[str]:
+    if value is None or isinstance(value, (dict, list, tuple, set)):
+        return None
+    return str(value)
+
+
+def metadata_filter(filter: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Equality conditions of `filter`; None and "" do not constrain, while 0 and False still do."""
+    return {key: value for key, value in (filter or {}).items() if value is not None and value != ""}
+
+
+class _RowList:
+    """Growable array of the rows holding one metadata value, in insertion order."""
+
+    __slots__ = ("rows", "count")
+
+    def __init__(self):
+        self.rows = np.zeros(8, dtype=np.int64)
+        self.count = 0
+
+    def append(self, row: int) -> None:
+        if self.count == len(self.rows):
+            grown = np.zeros(2 * len(self.rows), dtype=np.int64)
+            grown[:self.count] = self.rows
+            self.rows = grown
+        self.rows[self.count] = row
+        self.count += 1
+
+
+class _IVFIndex:
+    """Inverted lists over normalized vectors, trained with spherical k-means."""
+
+    def __init__(self, nlist: int, nprobe: int):
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.centroids: Optional[np.ndarray] = None
+        self.assignments = np.zeros(0, dtype=np.int32)
+        self.trained_rows = 0
+
+    def train(self, sample: np.ndarray, total_rows: int) -> None:
+        nlist = self.nlist or max(1, int(math.sqrt(total_rows)))
+        nlist = min(nlist, len(sample))
+        rng = np.random.default_rng(0)
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+        for _ in range(IVF_ITERATIONS):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            for i in range(nlist):
+                members = sample[labels == i]
+                if len(members):
+                    centroids[i] = members.sum(axis=0)
+            centroids = _normalize(centroids)
+        self.centroids = centroids.astype(np.float32)
+        self.trained_rows = total_rows
+
+    def assign(self, block: np.ndarray) -> np.ndarray:
+        return np.argmax(block @ self.centroids.T, axis=1).astype(np.int32)
+
+    def set_assignments(self, start: int, labels: np.ndarray) -> None:
+        end = start + len(labels)
+        if len(self.assignments) < end:
+            grown = np.zeros(max(end, 2 * len(self.assignments)), dtype=np.int32)
+            grown[:len(self.assignments)] = self.assignments
+            self.assignments = grown
+        self.assignments[start:end] = labels
+
+    def probe_mask(self, query: np.ndarray, size: int) -> np.ndarray:
+        nprobe = min(self.nprobe, len(self.centroids))
+        lists = np.argpartition(-(self.centroids @ query), nprobe - 1)[:nprobe]
+        return np.isin(self.assignments[:size], lists)
+
+
+class LocalVectorCollection:
+    """
+    One collection of the embedded store. Thread-safe; not safe to share a
+    directory between processes that write.
+
+    Args:
+        path: Directory of the collection, or None to keep it in memory only.
+        dtype: "float32" or "float16" storage of the vectors.
+        segment_size: Rows per segment file.
+        index: "flat" for exact search only, "ivf" to add an inverted-file index.
+        nlist: IVF lists; 0 picks sqrt(rows).
+        nprobe: IVF lists scanned per query.
+        ivf_min_rows: Below this many live rows IVF collections still search exactly.
+    """
+
+    def __init__(self, path: Optional[Path], dtype: str = "float32", segment_size: int = DEFAULT_SEGMENT_SIZE,
+                 index: str = "flat", nlist: int = 0, nprobe: int = 8, ivf_min_rows: int = IVF_MIN_ROWS):
+        self.path = Path(path) if path is not None else None
+        self.dtype = np.dtype(dtype)
+        self.segment_size = segment_size
+        self.index = index
+        self.ivf_min_rows = ivf_min_rows
+        self.dim: Optional[int] = None
+        self._segments: List[np.ndarray] = []
+        self._ids: List[Optional[str]] = []
+        self._contents: List[str] = []
+        self._metadata: List[Dict[str, Any]] = []
+        self._alive = np.zeros(0, dtype=bool)
+        self._row_of: Dict[str, int] = {}
+        self._value_rows: Dict[str, Dict[str, _RowList]] = {}
+        self._ivf = _IVFIndex(nlist, nprobe) if index == "ivf" else None
+        self._lock = threading.RLock()
+        if self.path is not None:
+            _recover_compaction(self.path)
+            self._load()
+
+    # ---- persistence -------------------------------------------------------------------------
+
+    @property
+    def _manifest_path(self) -> Path:
+        return self.path / "manifest.json"
+
+    @property
+    def _log_path(self) -> Path:
+        return self.path / "rows.jsonl"
+
+    def _segment_path(self, number: int) -> Path:
+        return self.path / f"seg-{number:06d}.npy"
+
+    def _load(self) -> None:
+        if not self._manifest_path.exists():
+            return
+        manifest = json.loads(self._manifest_path.read_text(encoding="utf-8"))
+        self.dim = manifest["dim"]
+        self.dtype = np.dtype(manifest["dtype"])
+        self.segment_size = manifest["segment_size"]
+        number = 0
+        while self._segment_path(number).exists():
+            self._segments.append(np.load(self._segment_path(number), mmap_mode="r+"))
+            number += 1
+
+        if self._log_path.exists():
+            good_offset = 0
+            with open(self._log_path, "rb") as handle:
+                for line in handle:
+                    try:
+                        record = json.loads(line) if line.endswith(b"\n") else None
+                    except ValueError:
+                        record = None
+                    if record is None:
+                        break
+                    good_offset += len(line)
+                    if record["op"] == "add":
+                        self._append_row(record.get("id"), record.get("content", ""), record.get("metadata") or {})
+                    elif record["op"] == "del":
+                        self._tombstone(record["ids"])
+            if good_offset != self._log_path.stat().st_size:
+                # Torn trailing write: its rows were never acknowledged, drop it before appending again
+                logger.warning(f"Truncating torn tail of vector log {self._log_path}")
+                with open(self._log_path, "r+b") as handle:
+                    handle.truncate(good_offset)
+
+        capacity = len(self._segments) * self.segment_size
+        if len(self._ids) > capacity:
+            logger.warning(f"Vector log of {self.path} is ahead of its segments, dropping "
+                           f"{len(self._ids) - capacity} rows")
+            for row in range(capacity, len(self._ids)):
+                self._kill_row(row)
+
+    def _write_manifest(self) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        payload = {"version": MANIFEST_VERSION, "dim": self.dim, "dtype": self.dtype.name,
+                   "segment_size": self.segment_size}
+        tmp = self._manifest_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp, self._manifest_path)
+
+    def _append_log(self, records: Iterable[Dict[str, Any]]) -> None:
+        if self.path is None:
+            return
+        with open(self._log_path, "a", encoding="utf-8") as handle:
+            handle.write("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records))
+            handle.flush()
+
+    def _new_segment(self) -> np.ndarray:
+        shape = (self.segment_size, self.dim)
+        if self.path is None:
+            return np.zeros(shape, dtype=self.dtype)
+        return np.lib.format.open_memmap(self._segment_path(len(self._segments)), mode="w+",
+                                         dtype=self.dtype, shape=shape)
+
+    # ---- row bookkeeping ---------------------------------------------------------------------
+
+    def _append_row(self, item_id: Optional[str], content: str, metadata: Dict[str, Any]) -> int:
+        row = len(self._ids)
+        if row >= len(self._alive):
+            grown = np.zeros(max(1024, 2 * len(self._alive)), dtype=bool)
+            grown[:len(self._alive)] = self._alive
+            self._alive = grown
+        self._ids.append(item_id)
+        self._contents.append(content)
+        self._metadata.append(metadata)
+        if item_id is None:
+            return row
+        previous = self._row_of.get(item_id)
+        if previous is not None:
+            self._alive[previous] = False
+        self._row_of[item_id] = row
+        self._alive[row] = True
+        for key, value in metadata.items():
+            value = _index_value(value)
+            if value is not None:
+                values = self._value_rows.setdefault(key, {})
+                rows = values.get(value)
+                if rows is None:
+                    rows = values[value] = _RowList()
+                rows.append(row)
+        return row
+
+    def _kill_row(self, row: int) -> None:
+        self._alive[row] = False
+        item_id = self._ids[row]
+        if item_id is not None and self._row_of.get(item_id) == row:
+            del self._row_of[item_id]
+
+    def _tombstone(self, ids: Iterable[str]) -> List[str]:
+        removed = []
+        for item_id in ids:
+            row = self._row_of.get(item_id)
+            if row is not None:
+                self._kill_row(row)
+                removed.append(item_id)
+        return removed
+
+    @property
+    def size(self) -> int:
+        """Number of live rows."""
+        return len(self._row_of)
+
+    def _filter_mask(self, filter: Optional[Dict[str, Any]]) -> np.ndarray:
+        size = len(self._ids)
+        mask = self._alive[:size].copy()
+        for key, value in (filter or {}).items():
+            rows = self._value_rows.get(key, {}).get(_index_value(value))
+            if rows is None:
+                return np.zeros(size, dtype=bool)
+            matched = np.zeros(size, dtype=bool)
+            matched[rows.rows[:rows.count]] = True
+            mask &= matched
+        return mask
+
+    def _record(self, row: int, score: Optional[float] = None) -> VectorRecord:
+        return self._ids[row], self._contents[row], dict(self._metadata[row]), score
+
+    # ---- public API --------------------------------------------------------------------------
+
+    def upsert(self, ids: Sequence[str], vectors: Sequence[Sequence[float]], contents: Sequence[str],
+               metadatas: Sequence[Dict[str, Any]]) -> None:
+        """Add rows, replacing (tombstoning) any live row with the same id."""
+        if not ids:
+            return
+        matrix = _normalize(np.asarray(vectors, dtype=np.float32))
+        with self._lock:
+            if self.dim is None:
+                self.dim = matrix.shape[1]
+                if self.path is not None:
+                    self._write_manifest()
+            if matrix.shape[1] != self.dim:
+                raise ValueError(f"Vector dimension {matrix.shape[1]} does not match collection dimension {self.dim}")
+
+            start = len(self._ids)
+            # Vectors first: a crash before the log append leaves unreferenced rows that the next write reuses
+            written = 0
+            while written < len(matrix):
+                row = start + written
+                number, offset = divmod(row, self.segment_size)
+                while number >= len(self._segments):
+                    self._segments.append(self._new_segment())
+                take = min(self.segment_size - offset, len(matrix) - written)
+                self._segments[number][offset:offset + take] = matrix[written:written + take]
+                written += take
+            for number in range(start // self.segment_size, (start + len(matrix) - 1) // self.segment_size + 1):
+                if isinstance(self._segments[number], np.memmap):
+                    self._segments[number].flush()
+
+            self._append_log({"op": "add", "id": item_id, "content": content, "metadata": metadata}
+                             for item_id, content, metadata in zip(ids, contents, metadatas))
+            for item_id, content, metadata in zip(ids, contents, metadatas):
+                self._append_row(item_id, content, metadata)
+
+            if self._ivf is not None and self._ivf.centroids is not None:
+                self._ivf.set_assignments(start, self._ivf.assign(matrix))
+                if self.size > 2 * self._ivf.trained_rows:
+                    self._ivf.centroids = None
+
+    def delete(self, ids: Optional[Sequence[str]] = None, filter: Optional[Dict[str, Any]] = None) -> int:
+        """Tombstone rows by id, or every row matching `filter`. Returns the number removed."""
+        with self._lock:
+            if ids is None:
+                mask = self._filter_mask(filter)
+                ids = [self._ids[row] for row in np.flatnonzero(mask)]
+            removed = self._tombstone(ids)
+            if removed:
+                self._append_log([{"op": "del", "ids": removed}])
+            dead = len(self._ids) - self.size
+            if dead >= self.segment_size // 4 and dead > COMPACT_DEAD_RATIO * len(self._ids):
+                self.compact()
+            return len(removed)
+
+    def query(self, filter: Optional[Dict[str, Any]] = None, limit: Optional[int] = None) -> List[VectorRecord]:
+        """Live rows matching `filter`, in insertion order."""
+        with self._lock:
+            rows = np.flatnonzero(self._filter_mask(filter))
+            if limit is not None:
+                rows = rows[:limit]
+            return [self._record(int(row)) for row in rows]
+
+    def search(self, vectors: Sequence[Sequence[float]], limit: int,
+               filter: Optional[Dict[str, Any]] = None) -> List[List[VectorRecord]]:
+        """Top-`limit` rows by cosine similarity for each query vector, best first."""
+        queries = _normalize(np.asarray(vectors, dtype=np.float32))
+        with self._lock:
+            size = len(self._ids)
+            if not size or limit <= 0:
+                return [[] for _ in queries]
+            mask = self._filter_mask(filter)
+            use_ivf = self._ivf is not None and self.size >= self.ivf_min_rows
+            if use_ivf and self._ivf.centroids is None:
+                self._train_ivf()
+
+            results = []
+            for query in queries:
+                query_mask = mask & self._ivf.probe_mask(query, size) if use_ivf else mask
+                results.append(self._top_k(query, query_mask, limit))
+            return results
+
+    def _top_k(self, query: np.ndarray, mask: np.ndarray, limit: int) -> List[VectorRecord]:
+        best_rows: List[np.ndarray] = []
+        best_scores: List[np.ndarray] = []
+        for start in range(0, len(mask), SEARCH_BLOCK_ROWS):
+            block_mask = mask[start:start + SEARCH_BLOCK_ROWS]
+            if not block_mask.any():
+                continue
+            rows = np.flatnonzero(block_mask) + start
+            block = self._gather(rows, dense=len(rows) > len(block_mask) // 2, start=start, stop=start + len(block_mask))
+            scores = block @ query
+            if len(scores) > limit:
+                top = np.argpartition(-scores, limit - 1)[:limit]
+                rows, scores = rows[top], scores[top]
+            best_rows.append(rows)
+            best_scores.append(scores)
+        if not best_rows:
+            return []
+        rows = np.concatenate(best_rows)
+        scores = np.concatenate(best_scores)
+        order = np.argsort(-scores, kind="stable")[:limit]
+        return [self._record(int(rows[i]), float(scores[i])) for i in order]
+
+    def _gather(self, rows: np.ndarray, dense: bool, start: int, stop: int) -> np.ndarray:
+        """float32 vectors of `rows`, all within [start, stop) and within one block."""
+        parts = []
+        for number in range(start // self.segment_size, (stop - 1) // self.segment_size + 1):
+            seg_start = number * self.segment_size
+            seg_rows = rows[(rows >= seg_start) & (rows < seg_start + self.segment_size)] - seg_start
+            if not len(seg_rows):
+                continue
+            segment = self._segments[number]
+            if dense:
+                lo, hi = int(seg_rows[0]), int(seg_rows[-1]) + 1
+                parts.append(np.asarray(segment[lo:hi], dtype=np.float32)[seg_rows - lo])
+            else:
+                parts.append(np.asarray(segment[seg_rows], dtype=np.float32))
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+    def _train_ivf(self) -> None:
+        size = len(self._ids)
+        live = np.flatnonzero(self._alive[:size])
+        sample_size = min(len(live), max(self._ivf.nlist or int(math.sqrt(len(live))), 1) * IVF_TRAIN_SAMPLE_PER_LIST)
+        sample_rows = np.sort(np.random.default_rng(0).choice(live, sample_size, replace=False))
+        self._ivf.train(self._gather(sample_rows, dense=False, start=0, stop=size), self.size)
+        for start in range(0, size, SEARCH_BLOCK_ROWS):
+            rows = np.arange(start, min(start + SEARCH_BLOCK_ROWS, size))
+            self._ivf.set_assignments(start, self._ivf.assign(self._gather(rows, dense=True, start=start,
+                                                                             stop=rows[-1] + 1)))
+        logger.debug(f"Trained IVF index with {len(self._ivf.centroids)} lists over {self.size} vectors")
+
+    def _index_options(self) -> Dict[str, Any]:
+        options = {"index": self.index, "ivf_min_rows": self.ivf_min_rows}
+        if self._ivf is not None:
+            options.update(nlist=self._ivf.nlist, nprobe=self._ivf.nprobe)
+        return options
+
+    def compact(self) -> None:
+        """Rewrite the collection without its tombstoned rows."""
+        with self._lock:
+            live = np.flatnonzero(self._alive[:len(self._ids)])
+            vectors = self._gather(live, dense=False, start=0, stop=len(self._ids)) if len(live) else []
+            records = [self._record(int(row)) for row in live]
+            target = None if self.path is None else _compaction_path(self.path)
+            if target is not None and target.exists():
+                shutil.rmtree(target)
+            fresh = LocalVectorCollection(target, dtype=self.dtype.name, segment_size=self.segment_size,
+                                          **self._index_options())
+            fresh.dim = self.dim
+            if target is not None:
+                fresh._write_manifest()
+            fresh.upsert([r[0] for r in records], vectors, [r[1] for r in records], [r[2] for r in records])
+            if target is not None:
+                fresh._segments = []
+                self._segments = []
+                # Move the live directory aside before swapping so that a crash
+                # always leaves one complete copy; `_recover_compaction` finishes
+                # or rolls back an interrupted swap.
+                retired = _retired_path(self.path)
+                if retired.exists():
+                    shutil.rmtree(retired)
+                os.replace(self.path, retired)
+                os.replace(target, self.path)
+                shutil.rmtree(retired)
+                fresh = LocalVectorCollection(self.path, **self._index_options())
+            self.__dict__.update({k: v for k, v in fresh.__dict__.items() if k != "_lock"})
+
+
+def _compaction_path(path: Path) -> Path:
+    return path.with_name(path.name + ".compact")
+
+
+def _retired_path(path: Path) -> Path:
+    return path.with_name(path.name + ".old")
+
+
+def _recover_compaction(path: Path) -> None:
+    """Finish or roll back a `compact()` interrupted by a crash."""
+    target, retired = _compaction_path(path), _retired_path(path)
+    if retired.exists():
+        if not path.exists():
+            # Crashed between the two renames: `.compact` was complete before
+            # the live directory was moved aside.
+            os.replace(target if target.exists() else retired, path)
+        if retired.exists():
+            shutil.rmtree(retired)
+    if target.exists():
+        # Crashed while writing `.compact`; the live directory is untouched.
+        shutil.rmtree(target)
+
+
+class LocalVectorStore:
+    """
+    Named collections of `LocalVectorCollection` under one directory (or in memory
+    when `path` is None). Collection options are shared by every collection.
+    """
+
+    def __init__(self, path: Optional[str] = None, **collection_options: Any):
+        self.path = Path(path).expanduser() if path else None
+        self.collection_options = collection_options
+        self._collections: Dict[str, LocalVectorCollection] = {}
+        self._lock = threading.Lock()
+
+    def _collection_path(self, name: str) -> Optional[Path]:
+        if self.path is None:
+            return None
+        if not name or "/" in name or "\\" in name or name.startswith("."):
+            raise ValueError(f"Invalid collection name: {name!r}")
+        return self.path / name
+
+    def has_collection(self, name: str) -> bool:
+        with self._lock:
+            if name in self._collections:
+                return True
+            path = self._collection_path(name)
+            if path is None:
+                return False
+            _recover_compaction(path)
+            return (path / "manifest.json").exists()
+
+    def collection(self, name: str, create: bool = True) -> Optional[LocalVectorCollection]:
+        with self._lock:
+            collection = self._collections.get(name)
+            if collection is None:
+                path = self._collection_path(name)
+                exists = path is not None and (path / "manifest.json").exists()
+                if not exists and not create:
+                    return None
+                collection = self._collections[name] = LocalVectorCollection(path, **self.collection_options)
+            return collection
+
+    def delete_collection(self, name: str) -> None:
+        with self._lock:
+            self._collections.pop(name, None)
+            path = self._collection_path(name)
+            if path is not None and path.exists():
+                shutil.rmtree(path)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._collections.clear()
+            if self.path is not None and self.path.exists():
+                for child in self.path.iterdir():
+                    if child.is_dir() and (child / "manifest.json").exists():
+                        shutil.rmtree(child)
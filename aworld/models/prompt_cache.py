@@ -1,11 +1,15 @@
 # coding: utf-8
+from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict
 
-from aworld.core.context.amni.prompt.assembly import PromptAssemblyPlan
 from aworld.utils.serialized_util import to_serializable
 
+if TYPE_CHECKING:
+    # Importing the context package here would make `aworld.models` import it at module load.
+    from aworld.core.context.amni.prompt.assembly import PromptAssemblyPlan
+
 PROMPT_CACHE_CAPABLE_PROVIDERS = {"openai", "anthropic"}
 
 
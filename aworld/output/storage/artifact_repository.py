@@ -1,7 +1,11 @@
+import hashlib
 import json
 import os
+import tempfile
+import threading
 import time
 import uuid
+import zlib
 from enum import Enum
 from pathlib import Path
 from typing import Dict, Any, Optional, List
@@ -25,6 +29,19 @@ class ArtifactRepository:
     def save_index(self, index_data: Dict[str, Any]) -> None:
         """Save index to file"""
 
+    def append_index_journal(self, entries: List[Dict[str, Any]]) -> bool:
+        """
+        Append index deltas to the index journal
+
+        Returns:
+            False when the repository keeps no journal; callers then save the full index instead
+        """
+        return False
+
+    def load_index_journal(self) -> List[Dict[str, Any]]:
+        """Load index deltas appended since the index was last saved"""
+        return []
+
     def store_artifact(self,
                        artifact: Artifact
                        ) -> str:
@@ -98,19 +115,40 @@ class EnumDecoder(json.JSONDecoder):
 
 
 class LocalArtifactRepository(ArtifactRepository):
-    """Artifact storage layer: manages versioned artifacts through content-addressable storage"""
-
-    def __init__(self, storage_path: str):
+    """Artifact storage layer: manages versioned artifacts through content-addressable storage
+
+    Serialized artifacts are split into fixed-size chunks stored once under
+    `objects/<aa>/<sha256>` (zlib-compressed). Each artifact keeps a small ref
+    file at `artifact/<artifact_id>/index.json` with its version chain; every
+    version lists the chunk hashes it is made of, so versions share unchanged
+    chunks and re-saving identical content writes nothing. Objects no longer
+    referenced by any version are reclaimed by `collect_garbage()`, which skips
+    objects written within its grace period so chunks stored by a concurrent
+    writer before its ref is saved are kept.
+    """
+
+    REF_FORMAT = "cas-v1"
+    OBJECTS_DIR = "objects"
+
+    def __init__(self, storage_path: str, chunk_size: int = 256 * 1024, max_versions: Optional[int] = 20):
         """
         Initialize the artifact repository
         
         Args:
             storage_path: Directory path for storing data
+            chunk_size: Size in bytes of the content-addressed chunks
+            max_versions: Versions kept per artifact; older ones are dropped from the chain, None keeps all
         """
         super().__init__()
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
         self.index_path = self.storage_path / "index.json"
+        self.journal_path = self.storage_path / "index.journal.jsonl"
+        self.objects_path = self.storage_path / self.OBJECTS_DIR
+        self.chunk_size = chunk_size
+        self.max_versions = max_versions
+        # Serializes stores, deletes and garbage collection of this repository
+        self._lock = threading.RLock()
         self.index = self.load_index()
 
     def load_index(self) -> Dict[str, Any]:
@@ -127,12 +165,35 @@ class LocalArtifactRepository(ArtifactRepository):
             return index
 
     def save_index(self, workspace_data) -> None:
+        """Save the full index; the journal is folded into it and truncated"""
         self._save_index(workspace_data)
+        self.journal_path.unlink(missing_ok=True)
 
     def _save_index(self, index: Dict[str, Any]) -> None:
         """Save index to file"""
-        with open(self.index_path, 'w') as f:
-            json.dump(index, f, indent=2, ensure_ascii=False, cls=CommonEncoder)
+        self._write_file(self.index_path, json.dumps(index, indent=2, ensure_ascii=False,
+                                                     cls=CommonEncoder).encode('utf-8'))
+
+    def append_index_journal(self, entries: List[Dict[str, Any]]) -> bool:
+        lines = "".join(json.dumps(entry, ensure_ascii=False, separators=(',', ':'), cls=CommonEncoder) + "\n"
+                        for entry in entries)
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            f.write(lines)
+            f.flush()
+        return True
+
+    def load_index_journal(self) -> List[Dict[str, Any]]:
+        if not self.journal_path.exists():
+            return []
+        entries = []
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # Torn trailing line from an interrupted append
+                    break
+        return entries
 
     def store_artifact(self,
                        artifact: Artifact
@@ -144,52 +205,90 @@ class LocalArtifactRepository(ArtifactRepository):
             artifact: Artifact to be stored
             
         Returns:
-            Version identifier
+            Version identifier (SHA-256 of the serialized artifact)
         """
-        # Create version record
-        version = {
-            "hash": artifact.artifact_id,
-            "timestamp": time.time(),
-            "metadata": artifact.metadata or {}
-        }
-
-        # Update index
-
         data = artifact.to_dict()
-        # Store content
+        encoded = json.dumps(data, ensure_ascii=False, separators=(',', ':'), cls=CommonEncoder).encode('utf-8')
+        version_id = hashlib.sha256(encoded).hexdigest()
+        with self._lock:
+            return self._store_encoded(artifact, encoded, version_id)
+
+    def _store_encoded(self, artifact: Artifact, encoded: bytes, version_id: str) -> str:
         content_path = Path(self.artifact_path(artifact.artifact_id))
-        content_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(content_path, 'w') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, cls=CommonEncoder)
+        ref = self._load_ref(artifact.artifact_id)
+        versions = ref["versions"] if ref else []
+
+        # Identical to the head version: nothing to write
+        if not versions or versions[-1]["id"] != version_id:
+            chunks = []
+            for offset in range(0, len(encoded), self.chunk_size):
+                chunks.append(self._put_object(encoded[offset:offset + self.chunk_size]))
+            versions.append({
+                "id": version_id,
+                "parent": versions[-1]["id"] if versions else None,
+                "timestamp": time.time(),
+                "size": len(encoded),
+                "chunks": chunks,
+                "metadata": artifact.metadata or {}
+            })
+            if self.max_versions and len(versions) > self.max_versions:
+                versions = versions[-self.max_versions:]
+                versions[0]["parent"] = None
+            self._write_file(content_path, json.dumps(
+                {"format": self.REF_FORMAT, "artifact_id": artifact.artifact_id, "versions": versions},
+                ensure_ascii=False, separators=(',', ':'), cls=CommonEncoder).encode('utf-8'))
 
         if artifact.attachments and artifact.need_save_attachment():
             for attachment in artifact.attachments:
                 attachment_path = content_path.parent / attachment.filename
-                attachment_path.parent.mkdir(parents=True, exist_ok=True)
-
                 if attachment.content and isinstance(attachment.content, str):
-                    with open(attachment_path, 'w') as f:
-                        f.write(attachment.content)
+                    payload = attachment.content.encode('utf-8')
+                    if attachment_path.exists() and attachment_path.stat().st_size == len(payload) \
+                            and attachment_path.read_bytes() == payload:
+                        continue
+                    self._write_file(attachment_path, payload)
 
-        return "success"
+        return version_id
 
     def retrieve_latest_artifact(self, artifact_id: str) -> Optional[Dict[str, Any]]:
         """
-        Retrieve artifact based on version ID
+        Retrieve the head version of an artifact
 
         Args:
-            version_id: Version identifier
+            artifact_id: Artifact identifier
 
         Returns:
             Stored data, or None if it doesn't exist
         """
-        artifact_path = self.artifact_path(artifact_id)
-
-        if not Path(artifact_path).exists():
+        artifact_path = Path(self.artifact_path(artifact_id))
+        if not artifact_path.exists():
             return None
 
         with open(artifact_path, 'r') as f:
-            return json.load(f)
+            data = json.load(f)
+        if data.get("format") != self.REF_FORMAT:
+            # Written before content addressing: the file is the artifact itself
+            return data
+        if not data["versions"]:
+            return None
+        return self._load_version(data["versions"][-1])
+
+    def retrieve_artifact_version(self, artifact_id: str, version_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve a specific version of an artifact
+
+        Args:
+            artifact_id: Artifact identifier
+            version_id: Version identifier returned by `store_artifact`
+
+        Returns:
+            Stored data, or None if the version is unknown
+        """
+        ref = self._load_ref(artifact_id)
+        for version in (ref["versions"] if ref else []):
+            if version["id"] == version_id:
+                return self._load_version(version)
+        return None
 
     def get_artifact_versions(self, artifact_id: str) -> List[Dict[str, Any]]:
         """
@@ -199,27 +298,29 @@ class LocalArtifactRepository(ArtifactRepository):
             artifact_id: Artifact identifier
             
         Returns:
-            List of version information
+            List of version information, oldest first
         """
-        if artifact_id not in self.index["artifacts"]:
+        ref = self._load_ref(artifact_id)
+        if not ref:
             return []
-
-        versions = []
-        for version_id in self.index["artifacts"][artifact_id]:
-            version_info = self.index["versions"][version_id].copy()
-            version_info["id"] = version_id
-            versions.append(version_info)
-
-        return versions
+        return [{key: value for key, value in version.items() if key != "chunks"} for version in ref["versions"]]
     
     def delete_artifact(self, artifact_id: str) -> bool:
         """
         Delete the specified artifact and its attachments from storage
+
+        Chunks are shared between artifacts; the ones left unreferenced are
+        removed by `collect_garbage()`.
+
         Args:
             artifact_id: Artifact identifier
         Returns:
             Whether deletion was successful
         """
+        with self._lock:
+            return self._delete_artifact(artifact_id)
+
+    def _delete_artifact(self, artifact_id: str) -> bool:
         content_path = Path(self.artifact_path(artifact_id))
         if not Path(content_path).exists():
             return False
@@ -240,6 +341,83 @@ class LocalArtifactRepository(ArtifactRepository):
         
         return True
 
+    def collect_garbage(self, grace_period: float = 60.0) -> int:
+        """
+        Remove objects not referenced by any stored version
+
+        Args:
+            grace_period: Objects written or reused within this many seconds are kept, since
+                another process may have stored them without having saved its ref yet
+
+        Returns:
+            Number of objects removed
+        """
+        with self._lock:
+            referenced = set()
+            artifact_root = self.storage_path / "artifact"
+            if artifact_root.exists():
+                for ref_path in artifact_root.glob("*/index.json"):
+                    ref = self._load_ref(ref_path.parent.name)
+                    for version in (ref["versions"] if ref else []):
+                        referenced.update(version["chunks"])
+
+            removed = 0
+            cutoff = time.time() - grace_period
+            if self.objects_path.exists():
+                for object_path in self.objects_path.glob("*/*"):
+                    # In-flight writes of `_write_file`
+                    if object_path.name.startswith(".tmp-") or object_path.name in referenced:
+                        continue
+                    try:
+                        if object_path.stat().st_mtime > cutoff:
+                            continue
+                    except FileNotFoundError:
+                        continue
+                    object_path.unlink(missing_ok=True)
+                    removed += 1
+            return removed
+
+    def _load_ref(self, artifact_id: str) -> Optional[Dict[str, Any]]:
+        artifact_path = Path(self.artifact_path(artifact_id))
+        if not artifact_path.exists():
+            return None
+        try:
+            with open(artifact_path, 'r') as f:
+                data = json.load(f)
+        except json.JSONDecodeError:
+            return None
+        return data if data.get("format") == self.REF_FORMAT else None
+
+    def _load_version(self, version: Dict[str, Any]) -> Dict[str, Any]:
+        encoded = b"".join(zlib.decompress((self._object_path(digest)).read_bytes()) for digest in version["chunks"])
+        return json.loads(encoded.decode('utf-8'))
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_path / digest[:2] / digest
+
+    def _put_object(self, chunk: bytes) -> str:
+        digest = hashlib.sha256(chunk).hexdigest()
+        object_path = self._object_path(digest)
+        try:
+            # Reused chunks count as fresh for the grace period of `collect_garbage`
+            os.utime(object_path)
+        except FileNotFoundError:
+            self._write_file(object_path, zlib.compress(chunk))
+        return digest
+
+    @staticmethod
+    def _write_file(path: Path, payload: bytes) -> None:
+        """Atomically replace `path` so readers never see a partial file"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
     def super_path(self):
         return str(self.storage_path)
 
@@ -265,6 +443,8 @@ class LocalArtifactRepository(ArtifactRepository):
             }
             if os.path.isdir(path):
                 for entry in sorted(os.listdir(path)):
+                    if depth == 1 and entry == self.OBJECTS_DIR:
+                        continue
                     full_path = os.path.join(path, entry)
                     node["children"].append(build_tree(full_path, node["id"], depth + 1))
             return node
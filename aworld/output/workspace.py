@@ -3,9 +3,9 @@ import time
 import traceback
 import uuid
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Set, Union
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr
 
 from aworld.logs.util import logger
 from aworld.output.artifact import ArtifactType, Artifact
@@ -20,6 +20,12 @@ class WorkSpace(BaseModel):
     Artifact workspace, managing a group of related artifacts
     
     Provides collaborative editing features, supporting version management, update notifications, etc. for multiple Artifacts
+
+    With `lazy_load=True` only the index is read when the workspace opens and
+    artifact content is loaded on first access through `get_artifact`. Index
+    changes are then appended to the repository's index journal instead of
+    rewriting the whole index on every save, and the journal is compacted into
+    the index once it holds `journal_compact_threshold` entries.
     """
 
     workspace_id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="unique identifier for the workspace")
@@ -32,6 +38,12 @@ class WorkSpace(BaseModel):
     artifact_id_index: Dict[str, int] = Field(default={}, description="artifact id index", exclude=True)
     observers: Optional[List[WorkspaceObserver]] = Field(default=[], description="list of observers", exclude=True)
     repository: Optional[ArtifactRepository] = Field(default=None, description="local artifact repository", exclude=True)
+    lazy_load: bool = Field(default=False, description="load artifact content on access and journal index updates", exclude=True)
+    journal_compact_threshold: int = Field(default=256, description="journal entries that trigger index compaction", exclude=True)
+
+    _materialized: Set[str] = PrivateAttr(default_factory=set)
+    _pending_index_ops: Dict[str, Dict[str, Any]] = PrivateAttr(default_factory=dict)
+    _journal_size: int = PrivateAttr(default=0)
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
     
@@ -45,9 +57,13 @@ class WorkSpace(BaseModel):
             clear_existing: bool = False,
             repository: Optional[ArtifactRepository] = None,
             load_artifact_content: bool = True,
+            lazy_load: bool = False,
+            journal_compact_threshold: int = 256,
             **kwargs
     ):
         super().__init__(**kwargs)
+        self.lazy_load = lazy_load
+        self.journal_compact_threshold = journal_compact_threshold
         self.workspace_id = workspace_id or str(uuid.uuid4())
         self.name = name or f"Workspace-{self.workspace_id[:8]}"
         self.created_at = datetime.now().isoformat()
@@ -64,6 +80,8 @@ class WorkSpace(BaseModel):
         if clear_existing:
             self.artifacts = []
             self.metadata = {}
+            # A journal left by the previous contents must not be replayed: start with a full save
+            self._journal_size = self.journal_compact_threshold
         else:
             # Try to load existing workspace data
             self._load_workspace_data(load_artifact_content=False)
@@ -97,12 +115,27 @@ class WorkSpace(BaseModel):
             if not workspace_data:
                 return None
 
+            # First load the artifacts list from workspace data
+            index_entries = {}
+            for artifact_data in workspace_data.get("artifacts", []):
+                if artifact_data.get("artifact_id"):
+                    index_entries[artifact_data["artifact_id"]] = artifact_data
+
+            # Then replay index deltas journaled since the index was last saved
+            journal = self.repository.load_index_journal()
+            for entry in journal:
+                if entry.get("op") == "upsert":
+                    index_entries[entry["artifact"]["artifact_id"]] = entry["artifact"]
+                elif entry.get("op") == "delete":
+                    index_entries.pop(entry.get("artifact_id"), None)
+                elif entry.get("op") == "workspace":
+                    workspace_data["metadata"] = entry.get("metadata", workspace_data.get("metadata", {}))
+                    workspace_data["updated_at"] = entry.get("updated_at", workspace_data.get("updated_at"))
+            self._journal_size = len(journal)
+
             # Load artifacts
             artifacts = []
-            # First load the artifacts list from workspace data
-            workspace_artifacts = workspace_data.get("artifacts", [])
-            for artifact_data in workspace_artifacts:
-                artifact_id = artifact_data.get("artifact_id")
+            for artifact_id, artifact_data in index_entries.items():
                 if artifact_id:
                     if load_artifact_content:
                         artifact_data = self.repository.retrieve_latest_artifact(artifact_id)
@@ -296,16 +329,22 @@ class WorkSpace(BaseModel):
         if artifact:
             artifact.mark_complete()
             self.repository.store_artifact(artifact)
+            self._record_index_op(artifact)
             logger.info(f"[📂WORKSPACE]🎉 Marking artifact as completed: {artifact_id}")
             await self._notify_observers("complete", artifact)
         self.save()
 
     def get_artifact(self, artifact_id: str) -> Optional[Artifact]:
         """Get artifact with the specified ID"""
-        for artifact in self.artifacts:
-            if artifact.artifact_id == artifact_id:
-                return artifact
-        return None
+        position = self.artifact_id_index.get(artifact_id, -1)
+        if position < 0:
+            return None
+        if self.lazy_load and artifact_id not in self._materialized:
+            artifact_data = self.repository.retrieve_latest_artifact(artifact_id)
+            if artifact_data:
+                self.artifacts[position] = Artifact.from_dict(artifact_data)
+            self._materialized.add(artifact_id)
+        return self.artifacts[position]
 
     def get_artifact_data(self, artifact_id: str) -> Optional[Dict]:
         """Get artifact data with the specified ID"""
@@ -366,22 +405,23 @@ class WorkSpace(BaseModel):
         existed = self._check_artifact_exists(artifact_id)
         if not existed:
             return True
-        for i, artifact in enumerate(self.artifacts):
-            if artifact.artifact_id == artifact_id:
-                # Remove from list
-                self.artifacts.pop(i)
+        # Remove from list
+        artifact = self.artifacts.pop(self.artifact_id_index[artifact_id])
+        self._rebuild_artifact_id_index()
+        self._materialized.discard(artifact_id)
+        if self.lazy_load:
+            self._pending_index_ops[artifact_id] = {"op": "delete", "artifact_id": artifact_id}
 
-                # Update workspace time
-                self.updated_at = datetime.now().isoformat()
+        # Update workspace time
+        self.updated_at = datetime.now().isoformat()
 
-                self.repository.delete_artifact(artifact_id)
-                # Save workspace state to create new version
-                self.save()
+        self.repository.delete_artifact(artifact_id)
+        # Save workspace state to create new version
+        self.save()
 
-                # Notify observers
-                await self._notify_observers("delete", artifact)
-                return True
-        return False
+        # Notify observers
+        await self._notify_observers("delete", artifact)
+        return True
 
     def list_artifacts(self, filter_type: Optional[ArtifactType] = None) -> List[Artifact]:
         """
@@ -449,15 +489,24 @@ class WorkSpace(BaseModel):
 
     def _append_artifact(self, artifact: Artifact) -> None:
         self.artifacts.append(artifact)
+        self.artifact_id_index[artifact.artifact_id] = len(self.artifacts) - 1
+        self._materialized.add(artifact.artifact_id)
+        self._record_index_op(artifact)
         logger.debug(f"[📂WORKSPACE]🆕 Appending artifact in repository: {artifact.artifact_id}")
 
 
     def _update_artifact(self, artifact: Artifact) -> None:
-        for i, a in enumerate(self.artifacts):
-            if a.artifact_id == artifact.artifact_id:
-                self.artifacts[i] = artifact
-                logger.info(f"[📂WORKSPACE]🔄 Updating artifact in repository: {artifact.artifact_id}")
-                break
+        self.artifacts[self.artifact_id_index[artifact.artifact_id]] = artifact
+        self._materialized.add(artifact.artifact_id)
+        self._record_index_op(artifact)
+        logger.info(f"[📂WORKSPACE]🔄 Updating artifact in repository: {artifact.artifact_id}")
+
+    def _record_index_op(self, artifact: Artifact) -> None:
+        # Only journaled saves of lazy workspaces replay the pending ops
+        if not self.lazy_load:
+            return
+        self._pending_index_ops[artifact.artifact_id] = {"op": "upsert",
+                                                         "artifact": artifact.to_dict(exclude_content=True)}
 
     
     async def _store_artifact(self, artifact: Artifact) -> None:
@@ -486,6 +535,14 @@ class WorkSpace(BaseModel):
         Returns:
             Workspace storage ID
         """
+        if self.lazy_load and self._journal_size + len(self._pending_index_ops) < self.journal_compact_threshold:
+            entries = [{"op": "workspace", "updated_at": self.updated_at, "metadata": self.metadata}]
+            entries.extend(self._pending_index_ops.values())
+            if self.repository.append_index_journal(entries):
+                self._journal_size += len(entries)
+                self._pending_index_ops.clear()
+                return
+
         workspace_data = {
             "workspace_id": self.workspace_id,
             "name": self.name,
@@ -500,6 +557,8 @@ class WorkSpace(BaseModel):
 
         # Store workspace information with workspace_id in metadata
         self.repository.save_index(workspace_data)
+        self._pending_index_ops.clear()
+        self._journal_size = 0
         self._rebuild_artifact_id_index()
 
     def get_file_content_by_artifact_id(self, artifact_id: str) -> str:
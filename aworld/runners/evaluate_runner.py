@@ -1,5 +1,7 @@
 # coding: utf-8
 # Copyright (c) 2025 inclusionAI.
+import hashlib
+import json
 import os
 import uuid
 import importlib
@@ -12,6 +14,7 @@ from aworld.evaluations.base import (
 from aworld.evaluations.types import MetricNames
 from aworld.evaluations.recoder.base import EvalRecorder
 from aworld.evaluations.recoder.eval_recorder import EvalResultRecorder, EvalDatasetRecorder, EvalTaskRecorder
+from aworld.evaluations.run_store import create_eval_run_store
 from aworld.dataset.dataset import Dataset
 from aworld.logs.util import logger
 from aworld.evaluations.scorers import scorer_factory
@@ -55,6 +58,11 @@ class EvaluateRunner(Runner):
                 parallel_num=eval_config.parallel_num,
                 skip_passed_cases=eval_config.skip_passed_cases,
                 skip_passed_on_metrics=eval_config.skip_passed_on_metrics,
+                run_store=create_eval_run_store(eval_config.eval_run_store_path),
+                run_id=eval_config.eval_run_id or eval_task.task_id,
+                resume=eval_config.eval_resume,
+                parallel_scorers=eval_config.parallel_scorers,
+                scorer_concurrency=eval_config.scorer_concurrency,
             )
             result = await evaluator.evaluate(eval_dataset, eval_target)
             await self.result_recorder.record(eval_input=result)
@@ -142,7 +150,12 @@ class EvaluateRunner(Runner):
                                                   seed=eval_config.eval_dataset_load_config.seed,
                                                   sampler=eval_config.eval_dataset_load_config.sampler):
                 if data_row:
-                    eval_cases.append(EvalDataCase(eval_dataset_id=eval_dataset_id, case_data=data_row[0]))
+                    eval_case = EvalDataCase(eval_dataset_id=eval_dataset_id, case_data=data_row[0])
+                    if eval_config.eval_run_store_path:
+                        # resumed runs match ledgered cases by id, so derive it from the row content
+                        eval_case.eval_case_id = hashlib.sha256(
+                            json.dumps(data_row[0], sort_keys=True, default=str).encode("utf-8")).hexdigest()[:32]
+                    eval_cases.append(eval_case)
 
             return EvalDataset(eval_dataset_id=eval_dataset_id, eval_cases=eval_cases)
         else:
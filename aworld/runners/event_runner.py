@@ -18,6 +18,7 @@ from aworld.core.common import TaskItem, ActionModel, Observation
 from aworld.core.context.amni import AmniContext, ApplicationContext
 from aworld.core.context.base import Context
 from aworld.dataset.trajectory_storage import get_storage_instance
+from aworld.dataset.trajectory_sink import get_sink_instance
 from aworld.core.event.base import Message, Constants, TopicType, ToolMessage, AgentMessage
 from aworld.core.exceptions import AWorldRuntimeException
 from aworld.core.task import Task, TaskResponse, TaskStatusValue
@@ -273,6 +274,9 @@ class TaskEventRunner(TaskRunner):
                 # 重新抛出原始异常
                 raise
             finally:
+                # Steps of a task that failed before _save_trajectories are still buffered in the sink
+                if self.context.trajectory_dataset is not None:
+                    await self.context.trajectory_dataset.flush_task_trajectory(self.task.id)
                 # the last step mark output finished
                 if not self.task.is_sub_task:
                     logger.info(f'main task {self.task.id} will mark outputs finished')
@@ -354,7 +358,8 @@ class TaskEventRunner(TaskRunner):
                 storage=storage_instance,
                 enable_storage=False,
                 data=[],
-                strategy=self.conf.get('trajectory_strategy', None)
+                strategy=self.conf.get('trajectory_strategy', None),
+                sink=get_sink_instance(self.conf.get('trajectory_sink', None))
             )
             self.context.trajectory_dataset = traj_dataset
         if not self.context.task_graph and not self.task.is_sub_task:
@@ -478,7 +483,7 @@ class TaskEventRunner(TaskRunner):
         event_bus = self.event_mng.event_bus
 
         key = message.category
-        logger.info(f"Task {self.task.id} consume message: {message}")
+        logger.info(f"Task {self.task.id} consume message {message.id}, category: {key}, topic: {message.topic}")
         if key == Constants.TOOL_CALLBACK:
             logger.info(f"Task {self.task.id} Tool callback message {message.id}")
         transformer = self.event_mng.get_transform_handler(key)
@@ -845,6 +850,8 @@ class TaskEventRunner(TaskRunner):
                     "yes",
                 ):
                     trajectory_logger.info(f"{res}")
+            if self.context.trajectory_dataset is not None:
+                await self.context.trajectory_dataset.flush_task_trajectory(self.task.id)
         except Exception as e:
             logger.error(f"Failed to get trajectories: {str(e)}.{traceback.format_exc()}")
 
@@ -116,6 +116,8 @@ from aworld.self_evolve.replay import (
     build_replay_request,
     replay_dataset_fingerprint,
 )
+from aworld.self_evolve.replay_workers import ReplayWorkerPool
+from aworld.self_evolve.result_cache import SelfEvolveResultCache, result_cache_key
 from aworld.self_evolve.replay_adaptation import (
     REPLAY_ADAPTATION_SCHEMA_VERSION,
     REPLAY_ARTIFACT_PLACEHOLDER,
@@ -198,6 +200,8 @@ __all__ = [
     "AWorldTrajectoryEvaluatorBackend",
     "AWorldCliCandidateReplayBackend",
     "AWorldCliReplayExecutor",
+    "ReplayWorkerPool",
+    "SelfEvolveResultCache",
     "BudgetGate",
     "CandidateGenerationAgent",
     "CandidateGenerationInfrastructureError",
@@ -327,6 +331,7 @@ __all__ = [
     "build_replay_request",
     "build_self_evolve_task",
     "replay_dataset_fingerprint",
+    "result_cache_key",
     "cleanup_self_evolve_overlays",
     "compile_and_freeze_capability",
     "cleanup_self_evolve_artifacts",
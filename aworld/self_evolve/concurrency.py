@@ -42,6 +42,13 @@ class SelfEvolveConcurrencyPolicy(BaseModel):
     replay_concurrency: PositiveInt = 2
     judge_concurrency: PositiveInt = 2
     candidate_screening_concurrency: PositiveInt = 1
+    # Keep `replay_concurrency` warm replay CLI runtimes instead of starting a
+    # fresh interpreter per replay variant.
+    warm_replay_workers: bool = False
+    # Reuse replay and judge results recorded under the same fingerprints by
+    # earlier or interrupted runs (see `SelfEvolveResultCache`). Replays and
+    # judging are nondeterministic, so this is opt-in.
+    reuse_cached_results: bool = False
 
     def effective_limit(self, stage: SelfEvolveStage, *, item_count: int) -> int:
         if isinstance(item_count, bool) or item_count < 0:
@@ -62,6 +69,7 @@ class SelfEvolveExecutionTelemetry:
 
     def __init__(self) -> None:
         self._records: dict[str, list[dict[str, Any]]] = {}
+        self._cache_counts: dict[str, dict[str, int]] = {}
 
     def record(self, stage: SelfEvolveStage, observability: Mapping[str, Any]) -> None:
         allowed = {
@@ -102,6 +110,13 @@ class SelfEvolveExecutionTelemetry:
                 record[key] = _bounded_token_usage(usage)
         self._records.setdefault(stage, []).append(record)
 
+    def record_cache(self, stage: SelfEvolveStage, *, hit: bool) -> None:
+        counts = self._cache_counts.setdefault(
+            stage,
+            {"cache_hit_count": 0, "cache_miss_count": 0},
+        )
+        counts["cache_hit_count" if hit else "cache_miss_count"] += 1
+
     def to_report(self) -> dict[str, Mapping[str, Any]]:
         report: dict[str, Mapping[str, Any]] = {}
         for stage, records in self._records.items():
@@ -151,6 +166,10 @@ class SelfEvolveExecutionTelemetry:
                 if usage:
                     stage_report[key] = usage
             report[stage] = stage_report
+        for stage, counts in self._cache_counts.items():
+            stage_report = dict(report.get(stage, {}))
+            stage_report.update(counts)
+            report[stage] = stage_report
         return report
 
 
@@ -27,6 +27,7 @@ from aworld.runners.batch import (
 from aworld.runners.evaluate_runner import EvaluateRunner
 from aworld.self_evolve.concurrency import SelfEvolveExecutionTelemetry
 from aworld.self_evolve.datasets import SelfEvolveDataset
+from aworld.self_evolve.result_cache import SelfEvolveResultCache, result_cache_key
 from aworld.self_evolve.types import CandidateVariant, EvaluationSummary
 
 
@@ -253,6 +254,8 @@ class AWorldTrajectoryEvaluatorBackend:
         judge_repetitions: int = 1,
         judge_failure_retries: int = 2,
         judge_timeout_seconds: float | None = 300.0,
+        result_cache: SelfEvolveResultCache | None = None,
+        reuse_cached_results: bool = False,
     ) -> None:
         selector_count = sum(
             bool(value)
@@ -276,6 +279,8 @@ class AWorldTrajectoryEvaluatorBackend:
         self.judge_repetitions = judge_repetitions
         self.judge_failure_retries = judge_failure_retries
         self.judge_timeout_seconds = judge_timeout_seconds
+        self.result_cache = result_cache
+        self.reuse_cached_results = reuse_cached_results
 
     @property
     def task_local_runtime(self) -> bool:
@@ -362,6 +367,32 @@ class AWorldTrajectoryEvaluatorBackend:
         failures: list[Mapping[str, Any]] = []
         max_attempts = self.judge_repetitions + self.judge_failure_retries
         fallback_model_profile: str | None = None
+        cache_key = (
+            self._judge_result_cache_key(
+                request,
+                trajectory_log=log_path.read_bytes(),
+                task_id=task_id,
+            )
+            if self.result_cache is not None and self.reuse_cached_results
+            else None
+        )
+        cache_hit = False
+        if cache_key is not None:
+            cached = self.result_cache.get(
+                "evaluation",
+                cache_key,
+                validate=lambda value: (
+                    isinstance(value.get("reports"), list)
+                    and len(value["reports"]) >= self.judge_repetitions
+                ),
+            )
+            if cached is not None:
+                reports.extend(cached["reports"][: self.judge_repetitions])
+                cache_hit = True
+                logger.info(
+                    "self_evolve.evaluator.cache.hit "
+                    f"variant_id={request.variant_id} split={request.dataset_split}"
+                )
         logger.info(
             "self_evolve.evaluator.start "
             f"variant_id={request.variant_id} split={request.dataset_split} "
@@ -370,6 +401,8 @@ class AWorldTrajectoryEvaluatorBackend:
             f"max_attempts={max_attempts} namespace={request.artifact_namespace or '-'}"
         )
         for attempt_index in range(1, max_attempts + 1):
+            if len(reports) >= self.judge_repetitions:
+                break
             logger.info(
                 "self_evolve.evaluator.attempt.start "
                 f"variant_id={request.variant_id} split={request.dataset_split} "
@@ -453,6 +486,13 @@ class AWorldTrajectoryEvaluatorBackend:
             )
             if len(reports) >= self.judge_repetitions:
                 break
+        if (
+            cache_key is not None
+            and not cache_hit
+            and len(reports) >= self.judge_repetitions
+            and fallback_model_profile is None
+        ):
+            self.result_cache.put("evaluation", cache_key, {"reports": reports})
         if reports:
             metrics = _aggregate_aworld_evaluator_metrics(
                 reports,
@@ -473,6 +513,8 @@ class AWorldTrajectoryEvaluatorBackend:
                 metrics["judge_failures"] = failures
             if fallback_model_profile is not None:
                 metrics["judge_model_profile_fallback"] = fallback_model_profile
+            if cache_hit:
+                metrics["judge_cache_hit"] = True
         else:
             metrics = _failed_aworld_evaluator_metrics(
                 failures=failures,
@@ -500,6 +542,36 @@ class AWorldTrajectoryEvaluatorBackend:
             metrics=metrics,
         )
 
+    def _judge_result_cache_key(
+        self,
+        request: EvaluationRequest,
+        *,
+        trajectory_log: bytes,
+        task_id: str | None,
+    ) -> str:
+        judge_agent_fingerprint: str | None = None
+        if self.judge_agent:
+            judge_agent_path = Path(self.judge_agent)
+            if judge_agent_path.is_file():
+                judge_agent_fingerprint = (
+                    "sha256:" + hashlib.sha256(judge_agent_path.read_bytes()).hexdigest()
+                )
+        return result_cache_key(
+            kind="trajectory_judge",
+            judge_agent=self.judge_agent,
+            judge_agent_fingerprint=judge_agent_fingerprint,
+            judge_agent_name=self.judge_agent_name,
+            judge_backend_ref=self.judge_backend_ref,
+            judge_model_profile=self.judge_model_profile,
+            agent=self.agent,
+            judge_repetitions=self.judge_repetitions,
+            dataset_split=request.dataset_split,
+            case_id=task_id,
+            trajectory_fingerprint=(
+                "sha256:" + hashlib.sha256(trajectory_log).hexdigest()
+            ),
+        )
+
     async def _run_evaluator_source_with_timeout(
         self,
         runner: Callable[..., Any],
@@ -58,6 +58,8 @@ from aworld.self_evolve.replay_capability import (
     replay_process_resource_limiter,
     verify_frozen_replay_capability,
 )
+from aworld.self_evolve.replay_workers import ReplayWorkerPool, ReplayWorkerUnavailable
+from aworld.self_evolve.result_cache import SelfEvolveResultCache, result_cache_key
 from aworld.self_evolve.sanitization import sanitize_text
 from aworld.self_evolve.types import CandidateVariant, DatasetRecipe, SelfEvolveTargetRef, to_json_dict
 
@@ -1151,12 +1153,14 @@ class AWorldCliCandidateReplayBackend:
         executor: ReplayExecutor | None = None,
         concurrency_policy: SelfEvolveConcurrencyPolicy | None = None,
         task_batch_executor: DeterministicTaskBatchExecutor | None = None,
+        result_cache: SelfEvolveResultCache | None = None,
     ) -> None:
         self.executor = executor or AWorldCliReplayExecutor()
         self.concurrency_policy = concurrency_policy or SelfEvolveConcurrencyPolicy()
         self.task_batch_executor = (
             task_batch_executor or DeterministicTaskBatchExecutor()
         )
+        self.result_cache = result_cache
         self.last_replay_batch_observability: Mapping[str, Any] = {}
         self.replay_batch_observability: list[Mapping[str, Any]] = []
 
@@ -1269,12 +1273,15 @@ class AWorldCliCandidateReplayBackend:
                         candidate.candidate_id
                     )
                 else:
-                    candidate_result = await self._run_repetitions(
+                    candidate_result = await self._run_or_reuse_repetitions(
                         member_request,
                         base_variant_id=candidate.candidate_id,
                         skill_root=member_request.overlay_skill_root,
                         artifact_dir=member_dir / _safe_path(candidate.candidate_id),
                         repetitions=member_request.candidate_repetitions,
+                        config_fingerprint=(
+                            member_request.verified_candidate_package_fingerprint
+                        ),
                     )
                 member_items.append(
                     CandidateReplayMemberResult(
@@ -1343,12 +1350,13 @@ class AWorldCliCandidateReplayBackend:
                 candidate.candidate_id
             )
         else:
-            candidate_result = await self._run_repetitions(
+            candidate_result = await self._run_or_reuse_repetitions(
                 request,
                 base_variant_id=candidate.candidate_id,
                 skill_root=request.overlay_skill_root,
                 artifact_dir=replay_dir / _safe_path(candidate.candidate_id),
                 repetitions=request.candidate_repetitions,
+                config_fingerprint=request.verified_candidate_package_fingerprint,
             )
         return CandidateReplayMemberResult(
             case_id=request.task_id,
@@ -1383,14 +1391,97 @@ class AWorldCliCandidateReplayBackend:
                     f"candidate_id={candidate.candidate_id} "
                     "reason=missing_or_mismatched_replay_provenance"
                 )
-            baseline = await self._run_repetitions(
+            baseline = await self._run_or_reuse_repetitions(
                 request,
                 base_variant_id="baseline",
                 skill_root=request.baseline_skill_root or _infer_baseline_skill_root(request),
                 artifact_dir=replay_dir / "baseline",
                 repetitions=request.baseline_repetitions,
+                config_fingerprint=request.baseline_skill_fingerprint,
             )
         return baseline
+
+    async def _run_or_reuse_repetitions(
+        self,
+        request: CandidateReplayRequest,
+        *,
+        base_variant_id: str,
+        skill_root: str | None,
+        artifact_dir: Path,
+        repetitions: int,
+        config_fingerprint: str | None,
+    ) -> ReplayVariantResult:
+        """Run replay repetitions unless an identical replay already succeeded.
+
+        Cached entries point at the stored variant directory of an earlier run;
+        on a hit that directory is copied into `artifact_dir` so every run keeps
+        self-contained artifacts, and the run it came from is recorded in
+        `cache_source.json`.
+        """
+        cache_key = (
+            _replay_result_cache_key(
+                request,
+                config_fingerprint=config_fingerprint,
+                repetitions=repetitions,
+            )
+            if self.result_cache is not None
+            and self.concurrency_policy.reuse_cached_results
+            else None
+        )
+        if cache_key is not None:
+            cached = self.result_cache.get(
+                "replay",
+                cache_key,
+                validate=lambda value: _cached_replay_variant_is_reusable(
+                    value,
+                    repetitions=repetitions,
+                ),
+            )
+            if cached is not None:
+                source_dir = Path(str(cached["variant_dir"]))
+                if source_dir.resolve() != artifact_dir.resolve():
+                    shutil.rmtree(artifact_dir, ignore_errors=True)
+                    shutil.copytree(source_dir, artifact_dir)
+                    _write_json(
+                        artifact_dir / "cache_source.json",
+                        {
+                            "cache_key": cache_key,
+                            "source_run_id": cached.get("source_run_id"),
+                            "source_variant_dir": str(source_dir),
+                        },
+                    )
+                logger.info(
+                    "self_evolve.replay.cache.hit "
+                    f"run_id={request.run_id} task_id={request.task_id} "
+                    f"variant_id={base_variant_id} source_run_id={cached.get('source_run_id')} "
+                    f"source={source_dir}"
+                )
+                return _load_variant_result_from_dir(
+                    artifact_dir,
+                    base_variant_id=base_variant_id,
+                )
+        result = await self._run_repetitions(
+            request,
+            base_variant_id=base_variant_id,
+            skill_root=skill_root,
+            artifact_dir=artifact_dir,
+            repetitions=repetitions,
+        )
+        if (
+            cache_key is not None
+            and result.succeeded
+            and _successful_repetition_count(result) == repetitions
+        ):
+            self.result_cache.put(
+                "replay",
+                cache_key,
+                {
+                    "variant_dir": str(artifact_dir.resolve()),
+                    "source_run_id": request.run_id,
+                },
+            )
+        return result
+
     async def _run_repetitions(
         self,
         request: CandidateReplayRequest,
@@ -1813,6 +1904,71 @@ class AWorldCliCandidateReplayBackend:
         )
 
 
+def _replay_result_cache_key(
+    request: CandidateReplayRequest,
+    *,
+    config_fingerprint: str | None,
+    repetitions: int,
+) -> str | None:
+    """Cache key for one replay variant; None when provenance is incomplete."""
+
+    if config_fingerprint is None or request.dataset_fingerprint is None:
+        return None
+    return result_cache_key(
+        kind="replay_variant",
+        config_fingerprint=config_fingerprint,
+        dataset_fingerprint=request.dataset_fingerprint,
+        case_id=request.task_id,
+        adaptation_fingerprint=request.adaptation_fingerprint,
+        workspace_seed_fingerprint=request.workspace_seed_fingerprint,
+        task_input_fingerprint=request.task_input_fingerprint,
+        target_type=request.target.target_type,
+        target_id=request.target.target_id,
+        agent=request.agent,
+        max_steps=request.max_steps,
+        max_tokens=request.max_tokens,
+        max_cost_usd=request.max_cost_usd,
+        repetitions=repetitions,
+        model_fingerprint=_replay_model_fingerprint(request.environment),
+    )
+
+
+def _replay_model_fingerprint(environment: Mapping[str, str]) -> str:
+    """Fingerprint the model settings a replay runs with (name, provider, base URL, sampling).
+
+    Mirrors the replay process environment, where `environment` overrides the
+    host's; API keys are left out so that rotating them keeps cached results.
+    """
+
+    effective = {**os.environ, **dict(environment)}
+    return result_cache_key(
+        kind="replay_model",
+        **{
+            name: str(value)
+            for name, value in effective.items()
+            if name.startswith("LLM_") and "API_KEY" not in name
+        },
+    )
+
+
+def _cached_replay_variant_is_reusable(
+    value: Mapping[str, Any],
+    *,
+    repetitions: int,
+) -> bool:
+    variant_dir = value.get("variant_dir")
+    if not isinstance(variant_dir, str) or not Path(variant_dir).is_dir():
+        return False
+    try:
+        result = _load_variant_result_from_dir(
+            Path(variant_dir),
+            base_variant_id="cached",
+        )
+    except (FileNotFoundError, ValueError, json.JSONDecodeError, OSError):
+        return False
+    return result.succeeded and _successful_repetition_count(result) == repetitions
+
+
 def _stored_baseline_matches_request(request: CandidateReplayRequest) -> bool:
     if request.baseline_replay_dir is None:
         return False
@@ -1917,11 +2073,42 @@ def _run_replay_cli(
     artifact_dir: Path,
     execution_started_at: float,
     replay_environment: Mapping[str, str],
+    worker_pool: ReplayWorkerPool | None = None,
 ) -> subprocess.CompletedProcess[str]:
-    """Run a replay CLI process while supervising terminal task diagnostics."""
+    """Run a replay CLI process while supervising terminal task diagnostics.
+
+    When a warm `worker_pool` accepts the command the replay runs in a fork of
+    one of its workers; otherwise, or when the pool cannot take the job, a
+    fresh process is started.
+    """
 
     if not capture_output:
         raise ValueError("replay CLI supervision requires captured output")
+
+    def terminal_check(partial_stdout: str, partial_stderr: str) -> bool:
+        return _replay_cli_terminal_failure(
+            partial_stdout,
+            partial_stderr,
+            artifact_dir=artifact_dir,
+            execution_started_at=execution_started_at,
+            replay_environment=replay_environment,
+        )
+
+    if worker_pool is not None and worker_pool.accepts(command):
+        try:
+            return worker_pool.run(
+                command,
+                cwd=cwd,
+                env=env,
+                timeout=timeout,
+                start_new_session=start_new_session,
+                terminal_check=terminal_check,
+            )
+        except ReplayWorkerUnavailable as exc:
+            worker_pool.count("fallbacks")
+            logger.warning(
+                f"self_evolve.replay.worker_unavailable falling back to a cold process: {exc}"
+            )
     process = subprocess.Popen(
         list(command),
         cwd=cwd,
@@ -1954,41 +2141,7 @@ def _run_replay_cli(
                 stderr=stderr,
             )
         except subprocess.TimeoutExpired as exc:
-            artifact_diagnostics = _terminal_replay_artifact_diagnostics(
-                artifact_dir=artifact_dir,
-                since=execution_started_at,
-            )
-            partial_details: dict[str, object] = {}
-            partial_stdout = _text_output(exc.output)
-            partial_stderr = _text_output(exc.stderr)
-            if partial_stdout.strip():
-                partial_details["stdout_tail"] = sanitize_text(
-                    partial_stdout[-4_000:],
-                    max_chars=2_000,
-                )
-            if partial_stderr.strip():
-                partial_details["stderr_tail"] = sanitize_text(
-                    partial_stderr[-2_000:],
-                    max_chars=1_000,
-                )
-            partial_diagnostics = (
-                {"diagnostics": partial_details}
-                if partial_details
-                else {}
-            )
-            artifact_failure = _diagnostics_indicate_replay_dependency_failure(
-                artifact_diagnostics,
-                environment=replay_environment,
-                live=True,
-            )
-            partial_failure = _partial_process_diagnostics_indicate_replay_failure(
-                partial_diagnostics,
-                environment=replay_environment,
-            )
-            if (
-                not artifact_failure
-                and not partial_failure
-            ):
+            if not terminal_check(_text_output(exc.output), _text_output(exc.stderr)):
                 continue
             stdout, stderr = _stop_replay_cli_process(
                 process,
@@ -2004,6 +2157,48 @@ def _run_replay_cli(
             raise failure
 
 
+def _replay_cli_terminal_failure(
+    partial_stdout: str,
+    partial_stderr: str,
+    *,
+    artifact_dir: Path,
+    execution_started_at: float,
+    replay_environment: Mapping[str, str],
+) -> bool:
+    """Whether a running replay already shows a terminal dependency failure."""
+
+    artifact_diagnostics = _terminal_replay_artifact_diagnostics(
+        artifact_dir=artifact_dir,
+        since=execution_started_at,
+    )
+    partial_details: dict[str, object] = {}
+    if partial_stdout.strip():
+        partial_details["stdout_tail"] = sanitize_text(
+            partial_stdout[-4_000:],
+            max_chars=2_000,
+        )
+    if partial_stderr.strip():
+        partial_details["stderr_tail"] = sanitize_text(
+            partial_stderr[-2_000:],
+            max_chars=1_000,
+        )
+    partial_diagnostics = (
+        {"diagnostics": partial_details}
+        if partial_details
+        else {}
+    )
+    artifact_failure = _diagnostics_indicate_replay_dependency_failure(
+        artifact_diagnostics,
+        environment=replay_environment,
+        live=True,
+    )
+    partial_failure = _partial_process_diagnostics_indicate_replay_failure(
+        partial_diagnostics,
+        environment=replay_environment,
+    )
+    return bool(artifact_failure or partial_failure)
+
+
 def _stop_replay_cli_process(
     process: subprocess.Popen[str],
     *,
@@ -2091,6 +2286,9 @@ class AWorldCliReplayExecutor:
     _DEFAULT_TOOL_CALL_LIMIT = 24
     _DEFAULT_RESERVED_OUTPUT_TOKENS = 4096
 
+    def __init__(self, *, worker_pool: ReplayWorkerPool | None = None) -> None:
+        self.worker_pool = worker_pool
+
     async def __call__(self, request: ReplayExecutionRequest) -> ReplayExecutionResult:
         artifact_dir = Path(request.artifact_dir)
         evidence_manifest = artifact_dir / "evidence_manifest.jsonl"
@@ -2156,6 +2354,9 @@ class AWorldCliReplayExecutor:
             }
         )
         execution_started_at = time.time()
+        run_options: dict[str, Any] = {}
+        if self.worker_pool is not None:
+            run_options["worker_pool"] = self.worker_pool
         try:
             completed = await asyncio.to_thread(
                 _run_replay_cli,
@@ -2169,6 +2370,7 @@ class AWorldCliReplayExecutor:
                 artifact_dir=artifact_dir,
                 execution_started_at=execution_started_at,
                 replay_environment=request.environment,
+                **run_options,
             )
         except subprocess.TimeoutExpired as exc:
             stdout = _text_output(exc.stdout)
@@ -0,0 +1,98 @@
+"""Warm replay worker process used by `aworld.self_evolve.replay_workers`.
+
+Run by file path, not as part of the `aworld` package: importing `aworld`
+loads `.env` from the working directory and reads `AWORLD_*` variables,
+which are per-job here. Only the standard library and the preload modules
+passed on the command line are imported before forking a job.
+"""
+
+import os
+import sys
+
+# Running by path puts this package directory first on sys.path, where
+# modules such as `types.py` would shadow the standard library. Only `os`
+# and `sys` (already loaded by interpreter startup) may be imported before
+# it is removed; `json` and `typing` pull in `types` through `re`/`enum`.
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:] = [entry for entry in sys.path if os.path.abspath(entry or ".") != _SCRIPT_DIR]
+
+import atexit  # noqa: E402
+import importlib  # noqa: E402
+import json  # noqa: E402
+from typing import Any, Mapping, Sequence  # noqa: E402
+
+
+def _emit(payload: Mapping[str, Any]) -> None:
+    os.write(1, json.dumps(dict(payload)).encode("utf-8") + b"\n")
+
+
+def _run_forked_job(job: Mapping[str, Any]) -> None:
+    """Body of the forked child; never returns."""
+    code = 1
+    try:
+        if job.get("new_session"):
+            os.setsid()
+        os.chdir(job["cwd"])
+        os.environ.clear()
+        os.environ.update(job["env"])
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(devnull, 0)
+        for fd, target in ((1, job["stdout"]), (2, job["stderr"])):
+            out = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            os.dup2(out, fd)
+        sys.stdin = open(0, "r", closefd=False)
+        sys.stdout = open(1, "w", buffering=1, closefd=False)
+        sys.stderr = open(2, "w", buffering=1, closefd=False)
+        sys.argv = [job["module"], *job["args"]]
+        sys.path.insert(0, job["cwd"])
+        import runpy
+
+        try:
+            runpy.run_module(job["module"], run_name="__main__", alter_sys=True)
+            code = 0
+        except SystemExit as exc:
+            if exc.code is None:
+                code = 0
+            elif isinstance(exc.code, int):
+                code = exc.code
+            else:
+                print(exc.code, file=sys.stderr)
+                code = 1
+        atexit._run_exitfuncs()
+    except BaseException:
+        import traceback
+
+        traceback.print_exc()
+    finally:
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except Exception:
+                pass
+        os._exit(code)
+
+
+def _serve(preload_modules: Sequence[str]) -> None:
+    """Zygote loop: read one JSON job per line, fork it, report its exit."""
+    for name in preload_modules:
+        try:
+            importlib.import_module(name)
+        except Exception as exc:
+            print(f"replay worker preload skipped {name}: {exc}", file=sys.stderr)
+    # Jobs talk over fds 0/1; keep stray prints in the zygote off the event pipe.
+    sys.stdout = sys.stderr
+    _emit({"event": "ready", "pid": os.getpid()})
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+        job = json.loads(line.decode("utf-8"))
+        pid = os.fork()
+        if pid == 0:
+            _run_forked_job(job)
+        _emit({"event": "started", "pid": pid})
+        _, status = os.waitpid(pid, 0)
+        _emit({"event": "exited", "pid": pid, "returncode": os.waitstatus_to_exitcode(status)})
+
+
+if __name__ == "__main__":
+    _serve(sys.argv[1:])
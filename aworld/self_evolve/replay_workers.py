@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import select
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Callable, Mapping
+
+# Third-party packages that dominate replay CLI import time and read no
+# per-run environment at import. AWorld itself is deliberately not preloaded:
+# `import aworld` loads `.env` from the working directory and logging reads
+# `AWORLD_*` variables, both of which are per-variant in replay.
+DEFAULT_REPLAY_WORKER_PRELOAD_MODULES = (
+    "pydantic",
+    "yaml",
+    "httpx",
+    "openai",
+    "mcp",
+    "rich.console",
+    "loguru",
+    "opentelemetry.sdk.trace",
+)
+# Launched by path so that the zygote does not import the `aworld` package.
+_ZYGOTE_SCRIPT = Path(__file__).with_name("replay_worker_zygote.py")
+_EVENT_READ_CHUNK = 65536
+_STOP_GRACE_SECONDS = 2.0
+_OUTPUT_TAIL_BYTES = 8_000
+
+TerminalCheck = Callable[[str, str], bool]
+
+
+class ReplayWorkerUnavailable(RuntimeError):
+    """Raised when a warm worker cannot accept a job; callers fall back to a cold process."""
+
+
+def _module_command(command: Sequence[str]) -> tuple[str, list[str]] | None:
+    """Return (module, args) for `python -m module ...` commands, else None."""
+    if len(command) < 3 or command[1] != "-m":
+        return None
+    if Path(command[0]).name != Path(sys.executable).name and command[0] != sys.executable:
+        return None
+    return command[2], list(command[3:])
+
+
+class _ReplayWorker:
+    """Parent-side handle of one warm zygote process.
+
+    The zygote has already paid interpreter startup and the preload imports.
+    Every job is run in a fresh fork of it, so no agent, skill or environment
+    state leaks between candidates; the zygote itself never runs a job.
+    """
+
+    def __init__(self, preload_modules: Sequence[str]) -> None:
+        self._buffer = b""
+        self.process = subprocess.Popen(
+            [sys.executable, str(_ZYGOTE_SCRIPT), *preload_modules],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        ready = self._read_event(timeout=60.0)
+        if ready is None or ready.get("event") != "ready":
+            self.close()
+            raise ReplayWorkerUnavailable("replay worker failed to start")
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def _send(self, payload: Mapping[str, Any]) -> None:
+        assert self.process.stdin is not None
+        try:
+            self.process.stdin.write(json.dumps(dict(payload)).encode("utf-8") + b"\n")
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError) as exc:
+            raise ReplayWorkerUnavailable("replay worker pipe closed") from exc
+
+    def _read_event(self, timeout: float) -> dict[str, Any] | None:
+        """Block until the next event line or `timeout`; None on timeout."""
+        assert self.process.stdout is not None
+        fd = self.process.stdout.fileno()
+        deadline = time.monotonic() + max(timeout, 0.0)
+        while b"\n" not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            readable, _, _ = select.select([fd], [], [], remaining)
+            if not readable:
+                return None
+            chunk = os.read(fd, _EVENT_READ_CHUNK)
+            if not chunk:
+                raise ReplayWorkerUnavailable("replay worker exited")
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return json.loads(line.decode("utf-8"))
+
+    def run(
+        self,
+        module: str,
+        args: Sequence[str],
+        *,
+        command: Sequence[str],
+        cwd: str,
+        env: Mapping[str, str],
+        timeout: float,
+        start_new_session: bool,
+        terminal_check: TerminalCheck | None,
+        poll_interval: float,
+    ) -> subprocess.CompletedProcess[str]:
+        output_dir = Path(tempfile.mkdtemp(prefix="aworld-replay-worker-"))
+        stdout_path = output_dir / "stdout"
+        stderr_path = output_dir / "stderr"
+        try:
+            self._send(
+                {
+                    "module": module,
+                    "args": list(args),
+                    "cwd": cwd,
+                    "env": dict(env),
+                    "stdout": str(stdout_path),
+                    "stderr": str(stderr_path),
+                    "new_session": start_new_session,
+                }
+            )
+            started = self._read_event(timeout=30.0)
+            if started is None or started.get("event") != "started":
+                raise ReplayWorkerUnavailable(f"replay worker did not start job: {started}")
+            pid = int(started["pid"])
+            deadline = time.monotonic() + max(float(timeout), 0.0)
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stop_job(pid, start_new_session=start_new_session)
+                    raise subprocess.TimeoutExpired(
+                        cmd=list(command),
+                        timeout=timeout,
+                        output=_read_text(stdout_path),
+                        stderr=_read_text(stderr_path),
+                    )
+                # Completion is pushed by the zygote; the interval only paces
+                # the terminal-diagnostic checks while the job is running.
+                event = self._read_event(timeout=min(poll_interval, remaining))
+                if event is not None and event.get("event") == "exited":
+                    return subprocess.CompletedProcess(
+                        list(command),
+                        int(event["returncode"]),
+                        stdout=_read_text(stdout_path),
+                        stderr=_read_text(stderr_path),
+                    )
+                if terminal_check is None or not terminal_check(
+                    _read_text(stdout_path, tail=_OUTPUT_TAIL_BYTES),
+                    _read_text(stderr_path, tail=_OUTPUT_TAIL_BYTES),
+                ):
+                    continue
+                self._stop_job(pid, start_new_session=start_new_session)
+                failure = subprocess.TimeoutExpired(
+                    cmd=list(command),
+                    timeout=timeout,
+                    output=_read_text(stdout_path),
+                    stderr=_read_text(stderr_path),
+                )
+                failure.terminal_diagnostic = True
+                raise failure
+        finally:
+            shutil.rmtree(output_dir, ignore_errors=True)
+
+    def _stop_job(self, pid: int, *, start_new_session: bool) -> None:
+        for sig, grace in ((signal.SIGTERM, _STOP_GRACE_SECONDS), (signal.SIGKILL, 30.0)):
+            try:
+                if start_new_session:
+                    os.killpg(pid, sig)
+                else:
+                    os.kill(pid, sig)
+            except (OSError, ProcessLookupError):
+                # The child may not have called setsid() yet.
+                try:
+                    os.kill(pid, sig)
+                except (OSError, ProcessLookupError):
+                    pass
+            event = self._read_event(timeout=grace)
+            if event is not None and event.get("event") == "exited":
+                return
+        raise ReplayWorkerUnavailable("replay worker job did not exit after SIGKILL")
+
+    def close(self) -> None:
+        if self.process.poll() is None:
+            try:
+                os.killpg(self.process.pid, signal.SIGTERM)
+            except (OSError, ProcessLookupError):
+                pass
+            try:
+                self.process.wait(timeout=_STOP_GRACE_SECONDS)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        for stream in (self.process.stdin, self.process.stdout):
+            if stream is not None:
+                stream.close()
+
+
+class ReplayWorkerPool:
+    """Bounded pool of warm replay CLI runtimes.
+
+    Accepts `python -m <module> ...` replay commands and runs each one in a
+    fresh fork of an idle zygote that already has the heavy third-party
+    imports loaded. Completion is streamed back over the zygote's pipe, so a
+    finished replay is observed immediately rather than on the next poll.
+    Workers are spawned on first use, replaced when they die, and closed with
+    `close()` or at interpreter exit. Only available on POSIX.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        *,
+        preload_modules: Sequence[str] = DEFAULT_REPLAY_WORKER_PRELOAD_MODULES,
+        poll_interval: float = 0.5,
+    ) -> None:
+        if size < 1:
+            raise ValueError("replay worker pool size must be positive")
+        self.size = size
+        self.preload_modules = tuple(preload_modules)
+        self.poll_interval = poll_interval
+        # Idle workers (used LIFO) and the spawn count share one condition so
+        # that a waiter is woken whenever a worker is returned, a spawn slot
+        # frees up, or the pool closes.
+        self._idle: list[_ReplayWorker] = []
+        self._spawned = 0
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._closed = False
+        self.stats = {"jobs": 0, "spawned": 0, "replaced": 0, "fallbacks": 0}
+        atexit.register(self.close)
+
+    @staticmethod
+    def supported() -> bool:
+        return os.name == "posix" and hasattr(os, "fork")
+
+    def count(self, stat: str) -> None:
+        """Increment a `stats` counter; jobs run on several threads."""
+        with self._lock:
+            self.stats[stat] += 1
+
+    def accepts(self, command: Sequence[str]) -> bool:
+        return not self._closed and self.supported() and _module_command(command) is not None
+
+    def _acquire(self) -> _ReplayWorker:
+        with self._available:
+            while True:
+                if self._closed:
+                    raise ReplayWorkerUnavailable("replay worker pool is closed")
+                if self._idle:
+                    return self._idle.pop()
+                if self._spawned < self.size:
+                    self._spawned += 1
+                    break
+                self._available.wait()
+        try:
+            worker = _ReplayWorker(self.preload_modules)
+        except Exception:
+            with self._available:
+                self._spawned -= 1
+                self._available.notify()
+            raise
+        self.count("spawned")
+        return worker
+
+    def _release(self, worker: _ReplayWorker, *, reusable: bool = True) -> None:
+        with self._available:
+            if reusable and worker.alive and not self._closed:
+                self._idle.append(worker)
+                self._available.notify()
+                return
+        worker.close()
+        with self._available:
+            self._spawned -= 1
+            self.stats["replaced"] += 1
+            self._available.notify()
+
+    def run(
+        self,
+        command: Sequence[str],
+        *,
+        cwd: str,
+        env: Mapping[str, str],
+        timeout: float,
+        start_new_session: bool = True,
+        terminal_check: TerminalCheck | None = None,
+    ) -> subprocess.CompletedProcess[str]:
+        """Run `command` on a warm worker; mirrors `subprocess.run` results.
+
+        Raises `subprocess.TimeoutExpired` on timeout, or with
+        `terminal_diagnostic=True` when `terminal_check(stdout_tail,
+        stderr_tail)` asks to stop the job early.
+        """
+        parsed = _module_command(command)
+        if parsed is None:
+            raise ReplayWorkerUnavailable("replay worker pool only runs `python -m` commands")
+        worker = self._acquire()
+        reusable = True
+        try:
+            self.count("jobs")
+            return worker.run(
+                parsed[0],
+                parsed[1],
+                command=command,
+                cwd=cwd,
+                env=env,
+                timeout=timeout,
+                start_new_session=start_new_session,
+                terminal_check=terminal_check,
+                poll_interval=self.poll_interval,
+            )
+        except ReplayWorkerUnavailable:
+            reusable = False
+            raise
+        finally:
+            self._release(worker, reusable=reusable)
+
+    def close(self) -> None:
+        with self._available:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._available.notify_all()
+        for worker in idle:
+            worker.close()
+
+
+def _read_text(path: Path, *, tail: int | None = None) -> str:
+    try:
+        with open(path, "rb") as handle:
+            if tail is not None:
+                handle.seek(0, os.SEEK_END)
+                handle.seek(max(0, handle.tell() - tail))
+            data = handle.read()
+    except OSError:
+        return ""
+    return data.decode("utf-8", errors="replace")
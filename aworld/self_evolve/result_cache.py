@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Mapping
+
+from aworld.self_evolve.types import to_json_dict
+
+if TYPE_CHECKING:
+    from aworld.self_evolve.concurrency import SelfEvolveExecutionTelemetry, SelfEvolveStage
+
+
+RESULT_CACHE_SCHEMA_VERSION = 1
+
+
+def result_cache_key(**parts: Any) -> str:
+    """Content address for a cached result: sha256 over the canonical JSON of `parts`."""
+
+    encoded = json.dumps(
+        to_json_dict({"schema_version": RESULT_CACHE_SCHEMA_VERSION, **parts}),
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    ).encode("utf-8")
+    return "sha256:" + hashlib.sha256(encoded).hexdigest()
+
+
+class SelfEvolveResultCache:
+    """Content-addressed cache of replay and judge results shared across runs.
+
+    Entries live under `<root>/<stage>/<aa>/<digest>.json` and are keyed by
+    `result_cache_key(...)` over everything that determines the result
+    (candidate configuration, dataset fingerprint, case id, judge config).
+    Writes are atomic renames, so concurrent runs and interrupted writes never
+    expose partial entries. Hits and misses are counted per stage and, when
+    `telemetry` is bound, reported through `SelfEvolveExecutionTelemetry`.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self.telemetry: SelfEvolveExecutionTelemetry | None = None
+        self.stats: dict[str, dict[str, int]] = {}
+
+    def _path(self, stage: str, key: str) -> Path:
+        digest = key.split(":", 1)[-1]
+        if not digest or not all(character in "0123456789abcdef" for character in digest):
+            raise ValueError(f"invalid result cache key: {key!r}")
+        return self.root / stage / digest[:2] / f"{digest}.json"
+
+    def get(
+        self,
+        stage: SelfEvolveStage,
+        key: str,
+        *,
+        validate: Callable[[Mapping[str, Any]], bool] | None = None,
+    ) -> Mapping[str, Any] | None:
+        """Return the cached value for `key`, or None on a miss.
+
+        `validate` lets callers reject entries whose referenced artifacts are
+        gone or stale; rejected entries count as misses.
+        """
+
+        path = self._path(stage, key)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            payload = None
+        value = payload.get("value") if isinstance(payload, Mapping) else None
+        if (
+            not isinstance(payload, Mapping)
+            or payload.get("key") != key
+            or not isinstance(value, Mapping)
+            or (validate is not None and not validate(value))
+        ):
+            self._record(stage, hit=False)
+            return None
+        self._record(stage, hit=True)
+        return value
+
+    def put(self, stage: SelfEvolveStage, key: str, value: Mapping[str, Any]) -> Path:
+        path = self._path(stage, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        encoded = json.dumps(
+            to_json_dict({"key": key, "stage": stage, "value": value}),
+            ensure_ascii=False,
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(encoded)
+            os.replace(temp_name, path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        return path
+
+    def invalidate(self, stage: SelfEvolveStage, key: str) -> None:
+        self._path(stage, key).unlink(missing_ok=True)
+
+    def _record(self, stage: SelfEvolveStage, *, hit: bool) -> None:
+        counts = self.stats.setdefault(stage, {"hit_count": 0, "miss_count": 0})
+        counts["hit_count" if hit else "miss_count"] += 1
+        if self.telemetry is not None:
+            self.telemetry.record_cache(stage, hit=hit)
@@ -86,6 +86,7 @@ from aworld.self_evolve.overlay import create_candidate_skill_overlay
 from aworld.self_evolve.provenance import TargetProvenance
 from aworld.self_evolve.replay import (
     AWorldCliCandidateReplayBackend,
+    AWorldCliReplayExecutor,
     CandidateReplayBackend,
     CandidateReplayRequest,
     CandidateReplayResult,
@@ -111,6 +112,8 @@ from aworld.self_evolve.repair_conformance import (
     evaluate_candidate_source_conformance,
     evaluate_compiled_probe_conformance,
 )
+from aworld.self_evolve.replay_workers import ReplayWorkerPool
+from aworld.self_evolve.result_cache import SelfEvolveResultCache
 from aworld.self_evolve.replay_adaptation import (
     ReplayAdaptationBundle,
     ReplayAdaptationCompiler,
@@ -582,6 +585,10 @@ class SelfEvolveRunner:
         target_provenance: TargetProvenance | None = None,
     ) -> SelfEvolveRunnerResult:
         self.execution_telemetry = SelfEvolveExecutionTelemetry()
+        for backend in (self.candidate_replay_backend, self.evaluation_backend):
+            result_cache = getattr(backend, "result_cache", None)
+            if isinstance(result_cache, SelfEvolveResultCache):
+                result_cache.telemetry = self.execution_telemetry
         if apply_policy not in {"proposal", "auto_verified"}:
             raise ValueError(f"unsupported apply policy: {apply_policy}")
         _emit_progress(
@@ -3114,14 +3121,35 @@ def optimize_from_cli_request(
             judge_repetitions=judge_repetitions,
             judge_timeout_seconds=judge_timeout_seconds,
         )
+        if effective_concurrency_policy.reuse_cached_results and hasattr(
+            evaluation_backend, "result_cache"
+        ):
+            evaluation_backend.result_cache = store.result_cache()
+            evaluation_backend.reuse_cached_results = True
     if apply_policy == "auto_verified" and post_apply_evaluator is None:
         post_apply_evaluator = _default_post_apply_evaluator(target_adapter)
+    replay_worker_pool: ReplayWorkerPool | None = None
     if replay_enabled and candidate_replay_backend is None:
-        candidate_replay_backend = AWorldCliCandidateReplayBackend()
+        if (
+            effective_concurrency_policy.warm_replay_workers
+            and ReplayWorkerPool.supported()
+        ):
+            replay_worker_pool = ReplayWorkerPool(
+                size=effective_concurrency_policy.replay_concurrency
+            )
+            candidate_replay_backend = AWorldCliCandidateReplayBackend(
+                executor=AWorldCliReplayExecutor(worker_pool=replay_worker_pool)
+            )
+        else:
+            candidate_replay_backend = AWorldCliCandidateReplayBackend()
         if hasattr(candidate_replay_backend, "concurrency_policy"):
             candidate_replay_backend.concurrency_policy = (
                 effective_concurrency_policy
             )
+        if effective_concurrency_policy.reuse_cached_results and hasattr(
+            candidate_replay_backend, "result_cache"
+        ):
+            candidate_replay_backend.result_cache = store.result_cache()
 
     self_evolve_runner = SelfEvolveRunner(
         store=store,
@@ -3177,7 +3205,11 @@ def optimize_from_cli_request(
         ),
         task_id=f"{run_id}-self-evolve",
     )
-    outer_responses = Runners.sync_run_task(outer_task)
+    try:
+        outer_responses = Runners.sync_run_task(outer_task)
+    finally:
+        if replay_worker_pool is not None:
+            replay_worker_pool.close()
     outer_response = outer_responses.get(outer_task.id)
     if outer_response is None or not outer_response.success:
         raise RuntimeError("self-evolve outer Task did not complete successfully")
@@ -18,6 +18,7 @@ from aworld.self_evolve.candidate_package import (
 )
 from aworld.self_evolve.replay_adaptation import ReplayPreflightReport
 from aworld.self_evolve.judge import JudgeRecord
+from aworld.self_evolve.result_cache import SelfEvolveResultCache
 from aworld.self_evolve.credit_assignment import TargetSelectionReport
 from aworld.self_evolve.types import (
     CandidateVariant,
@@ -40,6 +41,13 @@ class FilesystemSelfEvolveStore:
             if artifact_root is not None
             else self.workspace_root / ".aworld" / "self_evolve"
         )
+        self._result_cache: SelfEvolveResultCache | None = None
+
+    def result_cache(self) -> SelfEvolveResultCache:
+        """Replay and judge results shared by every run under `artifact_root/cache/`."""
+        if self._result_cache is None:
+            self._result_cache = SelfEvolveResultCache(self.artifact_root / "cache")
+        return self._result_cache
 
     def run_path(self, run_id: str) -> Path:
         self._validate_id(run_id, "run_id")
@@ -47,6 +47,10 @@ class CompatSkillRegistry:
             logger.debug(f"ℹ️ Source already registered: {source_key}")
             return len(self._source_to_skills.get(source_key, []))
 
+        if force_reload:
+            from aworld.utils.skill_loader import clear_requirements_cache
+
+            clear_requirements_cache()
         loaded_skills = self._load_skills_from_source(source)
         previous_skills = list(self._source_to_skills.get(source_key, []))
 
@@ -2,24 +2,23 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import Any
 
-from aworld.skills.execution_assets import build_execution_assets_config
+from aworld.skills.index import SkillIndex
 from aworld.skills.models import SkillContent, SkillDescriptor
-from aworld.skills.providers import SkillProvider, read_front_matter_lines
+from aworld.skills.providers import SkillProvider
 from aworld.skills.release import extract_self_evolve_metadata, is_self_evolve_draft_path
 from aworld.utils.skill_loader import (
     evaluate_skill_requirements,
-    extract_front_matter,
     resolve_aworld_metadata,
 )
 
 
 class FilesystemSkillProvider(SkillProvider):
-    def __init__(self, provider_id: str, root: Path) -> None:
+    def __init__(self, provider_id: str, root: Path, index: SkillIndex | None = None) -> None:
         self._provider_id = provider_id
         self._root = Path(root)
         self._skill_files: dict[str, Path] = {}
+        self._index = index if index is not None else SkillIndex.for_root(self._root)
 
     def provider_id(self) -> str:
         return self._provider_id
@@ -42,21 +41,13 @@ class FilesystemSkillProvider(SkillProvider):
                 seen.add(resolved)
                 yield resolved
 
-    def _read_front_matter(self, skill_file: Path) -> dict[str, Any]:
-        content_lines = read_front_matter_lines(skill_file)
-        front_matter, _ = extract_front_matter(content_lines)
-        return front_matter
-
-    def _load_full_skill(self, skill_file: Path) -> tuple[dict[str, Any], str]:
-        content = skill_file.read_text(encoding="utf-8").splitlines()
-        front_matter, body_start = extract_front_matter(content)
-        usage = "\n".join(content[body_start:]).strip()
-        return front_matter, usage
-
     def list_descriptors(self) -> list[SkillDescriptor]:
         descriptors: list[SkillDescriptor] = []
+        seen_files: set[str] = set()
         for skill_file in self._iter_skill_files():
-            front_matter = self._read_front_matter(skill_file)
+            seen_files.add(str(skill_file))
+            entry = self._index.get(skill_file)
+            front_matter = entry.front_matter
             tool_list = front_matter.get("tool_list", {})
             if isinstance(tool_list, str):
                 tool_list = {}
@@ -97,16 +88,12 @@ class FilesystemSkillProvider(SkillProvider):
                         "tool_list": dict(tool_list),
                         "self_evolve": extract_self_evolve_metadata(front_matter),
                     },
-                    execution_assets=build_execution_assets_config(
-                        skill_file.parent,
-                        declared_assets=front_matter.get("execution_assets"),
-                        skill_name=skill_name,
-                        entrypoint=front_matter.get("entrypoint"),
-                        metadata=front_matter.get("metadata"),
-                    ),
+                    execution_assets=entry.descriptor_assets,
                     requirements=requirements,
                 )
             )
+        self._index.prune(seen_files)
+        self._index.save()
         return descriptors
 
     def load_content(self, skill_id: str) -> SkillContent:
@@ -119,7 +106,8 @@ class FilesystemSkillProvider(SkillProvider):
         if skill_file is None:
             raise KeyError(skill_id)
 
-        front_matter, usage = self._load_full_skill(skill_file)
+        entry = self._index.get(skill_file)
+        front_matter, usage = entry.front_matter, entry.usage
         tool_list = front_matter.get("tool_list", {})
         if isinstance(tool_list, str):
             tool_list = {}
@@ -128,14 +116,7 @@ class FilesystemSkillProvider(SkillProvider):
             usage=usage,
             tool_list=tool_list,
             raw_frontmatter=front_matter,
-            execution_assets=build_execution_assets_config(
-                skill_file.parent,
-                declared_assets=front_matter.get("execution_assets"),
-                usage_text=usage,
-                skill_name=skill_file.parent.name,
-                entrypoint=front_matter.get("entrypoint"),
-                metadata=front_matter.get("metadata"),
-            ),
+            execution_assets=entry.content_assets,
         )
 
     def resolve_asset_path(self, skill_id: str, relative_path: str) -> Path:
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from aworld.logs.util import logger
+from aworld.skills.execution_assets import build_execution_assets_config
+
+SKILL_INDEX_VERSION = 1
+SKILL_INDEX_DIR_ENV = "AWORLD_SKILL_INDEX_DIR"
+
+
+def default_index_dir() -> Path | None:
+    """Directory of persisted skill indexes; `AWORLD_SKILL_INDEX_DIR=""` keeps them in memory only."""
+    configured = os.environ.get(SKILL_INDEX_DIR_ENV)
+    if configured is not None:
+        return Path(configured).expanduser() if configured.strip() else None
+    from aworld.utils.skill_loader import DEFAULT_CACHE_DIR
+
+    return DEFAULT_CACHE_DIR.parent / "skill_index"
+
+
+@dataclass
+class SkillIndexEntry:
+    skill_stat: tuple[int, int]
+    assets_stamp: str
+    content_hash: str
+    front_matter: dict[str, Any]
+    usage: str
+    descriptor_assets: dict[str, Any] = field(default_factory=dict)
+    content_assets: dict[str, Any] = field(default_factory=dict)
+
+
+class SkillIndex:
+    """Parsed `SKILL.md` files of one skill root, revalidated by file stats.
+
+    An entry is reused while the skill file's (mtime, size) and the stat
+    stamp of every other file in its directory are unchanged. When only the
+    skill file's timestamps moved (a checkout or `touch`), its content hash
+    decides. Anything else re-reads and re-parses that one skill, so a
+    rescan costs a stat walk plus the work for the skills that changed.
+    Indexes are shared per root within the process and persisted as one
+    pickle per root under `cache_dir`.
+    """
+
+    _instances: dict[tuple[str, str], "SkillIndex"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, root: Path, cache_dir: Path | None = None) -> None:
+        self.root = Path(root)
+        self.cache_dir = cache_dir
+        self._entries: dict[str, SkillIndexEntry] = {}
+        self._dirty = False
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    @classmethod
+    def for_root(cls, root: Path, cache_dir: Path | None = None) -> "SkillIndex":
+        cache_dir = default_index_dir() if cache_dir is None else cache_dir
+        key = (str(Path(root).resolve()), str(cache_dir))
+        with cls._instances_lock:
+            index = cls._instances.get(key)
+            if index is None:
+                index = cls._instances[key] = cls(Path(root), cache_dir)
+            return index
+
+    @property
+    def index_path(self) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.sha256(str(self.root.resolve()).encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.pkl"
+
+    def get(self, skill_file: Path) -> SkillIndexEntry:
+        """Return the (copied) entry of `skill_file`, re-parsing it if it changed."""
+        key = str(skill_file)
+        skill_stat_result = os.stat(skill_file)
+        skill_stat = (skill_stat_result.st_mtime_ns, skill_stat_result.st_size)
+        assets_stamp = self._assets_stamp(skill_file)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.assets_stamp == assets_stamp:
+                if entry.skill_stat == skill_stat:
+                    self.hits += 1
+                    return copy.deepcopy(entry)
+                data = skill_file.read_bytes()
+                if hashlib.sha256(data).hexdigest() == entry.content_hash:
+                    entry.skill_stat = skill_stat
+                    self._dirty = True
+                    self.hits += 1
+                    return copy.deepcopy(entry)
+            self.misses += 1
+            entry = self._parse(skill_file, skill_stat, assets_stamp)
+            self._entries[key] = entry
+            self._dirty = True
+            return copy.deepcopy(entry)
+
+    def prune(self, keep: set[str]) -> None:
+        """Drop entries for skill files that no longer exist under the root."""
+        with self._lock:
+            for key in [key for key in self._entries if key not in keep]:
+                del self._entries[key]
+                self._dirty = True
+
+    def save(self) -> None:
+        path = self.index_path
+        with self._lock:
+            if not self._dirty or path is None:
+                return
+            payload = {"version": SKILL_INDEX_VERSION, "root": str(self.root), "entries": self._entries}
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+                with os.fdopen(fd, "wb") as handle:
+                    pickle.dump(payload, handle, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_name, path)
+                self._dirty = False
+            except Exception as exc:
+                logger.debug(f"Failed to write skill index {path}: {exc}")
+
+    def _load(self) -> None:
+        path = self.index_path
+        if path is None:
+            return
+        try:
+            with open(path, "rb") as handle:
+                payload = pickle.load(handle)
+        except FileNotFoundError:
+            return
+        except Exception as exc:
+            logger.debug(f"Ignoring unreadable skill index {path}: {exc}")
+            return
+        if isinstance(payload, dict) and payload.get("version") == SKILL_INDEX_VERSION:
+            self._entries = dict(payload.get("entries") or {})
+
+    @staticmethod
+    def _assets_stamp(skill_file: Path) -> str:
+        """Digest of (path, mtime, size, mode) of every file next to and below `skill_file`."""
+        skill_dir = skill_file.parent
+        rows = []
+        for current_root, _, filenames in os.walk(skill_dir):
+            for filename in filenames:
+                path = os.path.join(current_root, filename)
+                if path == str(skill_file):
+                    continue
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                rows.append(f"{os.path.relpath(path, skill_dir)}\0{stat.st_mtime_ns}\0{stat.st_size}\0{stat.st_mode}")
+        rows.sort()
+        return hashlib.sha256("\n".join(rows).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _parse(skill_file: Path, skill_stat: tuple[int, int], assets_stamp: str) -> SkillIndexEntry:
+        from aworld.utils.skill_loader import extract_front_matter
+
+        data = skill_file.read_bytes()
+        content = data.decode("utf-8", errors="replace").splitlines()
+        front_matter, body_start = extract_front_matter(content)
+        usage = "\n".join(content[body_start:]).strip()
+        skill_name = skill_file.parent.name
+        return SkillIndexEntry(
+            skill_stat=skill_stat,
+            assets_stamp=assets_stamp,
+            content_hash=hashlib.sha256(data).hexdigest(),
+            front_matter=front_matter,
+            usage=usage,
+            descriptor_assets=build_execution_assets_config(
+                skill_file.parent,
+                declared_assets=front_matter.get("execution_assets"),
+                skill_name=skill_name,
+                entrypoint=front_matter.get("entrypoint"),
+                metadata=front_matter.get("metadata"),
+            ),
+            content_assets=build_execution_assets_config(
+                skill_file.parent,
+                declared_assets=front_matter.get("execution_assets"),
+                usage_text=usage,
+                skill_name=skill_name,
+                entrypoint=front_matter.get("entrypoint"),
+                metadata=front_matter.get("metadata"),
+            ),
+        )
@@ -0,0 +1,47 @@
+# coding: utf-8
+# Copyright (c) 2025 inclusionAI.
+"""PEP 562 helpers for deferring heavy imports until a name is first used.
+
+Usage in a module::
+
+    __getattr__, _lazy_attr = lazy_attrs(__name__, {"Runners": ("aworld.runner", "Runners")})
+
+`module.Runners` (including `from module import Runners` and monkeypatching)
+imports `aworld.runner` on first access and caches the value in the module
+globals. Code inside the module calls `_lazy_attr("Runners")`, which returns
+the cached (or monkeypatched) global when present and imports it otherwise.
+Relative module names are resolved against the module's package.
+"""
+import importlib
+import sys
+from typing import Any, Callable, Dict, Tuple
+
+
+def lazy_attrs(module_name: str,
+               lazy_imports: Dict[str, Tuple[str, str]]) -> Tuple[Callable[[str], Any], Callable[[str], Any]]:
+    """Build the module-level `__getattr__` and an in-module resolver for `lazy_imports`.
+
+    Args:
+        module_name: `__name__` of the module the names belong to.
+        lazy_imports: Attribute name -> (module to import, attribute of that module).
+    """
+
+    def _globals() -> Dict[str, Any]:
+        return sys.modules[module_name].__dict__
+
+    def __getattr__(name: str) -> Any:
+        if name not in lazy_imports:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        target_module, attr_name = lazy_imports[name]
+        package = _globals().get("__package__") or module_name.rpartition(".")[0]
+        value = getattr(importlib.import_module(target_module, package), attr_name)
+        _globals()[name] = value
+        return value
+
+    def resolve(name: str) -> Any:
+        namespace = _globals()
+        if name in namespace:
+            return namespace[name]
+        return __getattr__(name)
+
+    return __getattr__, resolve
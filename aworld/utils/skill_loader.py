@@ -10,6 +10,7 @@ import os
 import re
 import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
@@ -334,8 +335,19 @@ def resolve_aworld_metadata(front_matter: Dict[str, Any]) -> Optional[Dict[str,
     }
 
 
+@lru_cache(maxsize=1024)
+def _which(bin_name: str, search_path: Optional[str]) -> bool:
+    return shutil.which(bin_name, path=search_path) is not None
+
+
 def _has_bin(bin_name: str) -> bool:
-    return shutil.which(bin_name) is not None
+    # Memoized per PATH value: skill listings probe the same binaries for every skill and reload.
+    return _which(bin_name, os.environ.get("PATH"))
+
+
+def clear_requirements_cache() -> None:
+    """Forget memoized binary lookups, e.g. after installing a skill's requirements."""
+    _which.cache_clear()
 
 
 def evaluate_skill_requirements(aworld_meta: Dict[str, Any]) -> Tuple[bool, Dict[str, List[str]]]:
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from inspect import isawaitable
+from typing import Any
+
+from aworld_gateway.logging import get_gateway_logger
+
+
+logger = get_gateway_logger("agent_pool")
+
+
+@dataclass
+class PooledAgent:
+    swarm: Any
+    executor: Any
+    created_at: float = field(default_factory=time.monotonic)
+    last_used_at: float = field(default_factory=time.monotonic)
+    uses: int = 0
+
+
+class WarmAgentPool:
+    """Per-agent pool of built swarms and executors for the gateway backend.
+
+    Building a swarm (and, for some agents, a temporary ApplicationContext) is
+    the expensive part of serving a chat message; instances are returned here
+    after each run and handed to the next message for the same agent. At most
+    `max_idle_per_agent` idle instances are kept per agent, idle instances
+    older than `idle_ttl_seconds` are evicted, and instances are retired after
+    `max_uses` runs or after a failed run. `reset` is called on every instance
+    that goes back to the pool, so no swarm, agent or executor state of one
+    session is seen by the next.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_idle_per_agent: int,
+        idle_ttl_seconds: float = 300.0,
+        max_uses: int = 200,
+        reset: Callable[[PooledAgent], Any] | None = None,
+    ) -> None:
+        self.max_idle_per_agent = max_idle_per_agent
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.max_uses = max_uses
+        self._reset = reset
+        self._idle: dict[str, deque[PooledAgent]] = {}
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    async def acquire(
+        self,
+        agent_id: str,
+        build: Callable[[], Awaitable[PooledAgent]],
+    ) -> PooledAgent:
+        now = time.monotonic()
+        self._evict_expired(now)
+        idle = self._idle.get(agent_id)
+        if idle:
+            entry = idle.pop()
+            self.stats["hits"] += 1
+            entry.uses += 1
+            return entry
+        self.stats["misses"] += 1
+        entry = await build()
+        entry.uses = 1
+        return entry
+
+    async def release(self, agent_id: str, entry: PooledAgent, *, healthy: bool = True) -> None:
+        entry.last_used_at = time.monotonic()
+        if not healthy or entry.uses >= self.max_uses:
+            self._discard(entry, reason="retired")
+            return
+        idle = self._idle.setdefault(agent_id, deque())
+        if len(idle) >= self.max_idle_per_agent:
+            self._discard(entry, reason="pool full")
+            return
+        if self._reset is not None:
+            try:
+                result = self._reset(entry)
+                if isawaitable(result):
+                    await result
+            except Exception as exc:
+                logger.warning(f"Gateway agent pool failed to reset instance error={exc}")
+                self._discard(entry, reason="reset failed")
+                return
+        idle.append(entry)
+
+    async def close(self) -> None:
+        for idle in self._idle.values():
+            while idle:
+                self._discard(idle.pop(), reason="closed")
+        self._idle.clear()
+
+    def idle_count(self, agent_id: str) -> int:
+        return len(self._idle.get(agent_id, ()))
+
+    def _evict_expired(self, now: float) -> None:
+        for idle in self._idle.values():
+            # Oldest entries sit on the left; reuse pops the warmest from the right.
+            while idle and now - idle[0].last_used_at > self.idle_ttl_seconds:
+                self._discard(idle.popleft(), reason="idle")
+
+    def _discard(self, entry: PooledAgent, *, reason: str) -> None:
+        # Executors free their background tasks after every run, a dropped
+        # instance holds nothing else that needs closing.
+        self.stats["evictions"] += 1
+        logger.debug(f"Gateway agent pool discarding instance reason={reason} uses={entry.uses}")
@@ -7,9 +7,15 @@ from inspect import isawaitable
 from pathlib import Path
 from typing import Any
 
-from aworld.runner import Runners
+from aworld.utils.lazy_import import lazy_attrs
 
 from aworld_gateway.channels.dingding.types import DingdingBridgeResult
+from aworld_gateway.context_bootstrap import (
+    CONTEXT_BOOTSTRAP_IMPORTS,
+    RUNNER_IMPORTS,
+    context_bootstrap_classes,
+)
+from aworld_gateway.session_state import SessionRuntimeCache, StripedSessionLocks
 from aworld_cli.core.tool_filter import temporary_tool_filter
 from aworld_cli.steering import STEERING_CAPTURED_ACK, SessionSteeringRuntime
 from aworld_cli.steering.observability import (
@@ -17,15 +23,20 @@ from aworld_cli.steering.observability import (
     log_queued_steering_event,
 )
 
-try:
-    from aworld.core.context.amni import ApplicationContext, TaskInput
-except ImportError:  # pragma: no cover
-    ApplicationContext = None
-    TaskInput = None
+__getattr__, _lazy_attr = lazy_attrs(__name__, {**RUNNER_IMPORTS, **CONTEXT_BOOTSTRAP_IMPORTS})
 
 
 class AworldDingdingBridge:
-    def __init__(self, registry_cls: Any = None, executor_cls: Any = None) -> None:
+    def __init__(
+        self,
+        registry_cls: Any = None,
+        executor_cls: Any = None,
+        *,
+        session_cache_size: int = 1024,
+        session_idle_seconds: float | None = 3600.0,
+        session_lock_stripes: int = 64,
+        on_session_evicted: Callable[[str, SessionSteeringRuntime], Any] | None = None,
+    ) -> None:
         if registry_cls is None:
             from aworld_cli.core.agent_registry import LocalAgentRegistry
 
@@ -37,9 +48,17 @@ class AworldDingdingBridge:
 
         self._registry_cls = registry_cls
         self._executor_cls = executor_cls
-        self._session_runtime_by_id: dict[str, SessionSteeringRuntime] = {}
         self._active_run_by_session: dict[str, asyncio.Task[Any]] = {}
-        self._session_state_lock = asyncio.Lock()
+        # Sessions on different lock stripes never wait on each other; idle runtimes are evicted.
+        self._session_locks = StripedSessionLocks(session_lock_stripes)
+        self._session_runtime_by_id: SessionRuntimeCache[SessionSteeringRuntime] = SessionRuntimeCache(
+            lambda _session_id: SessionSteeringRuntime(workspace_path=str(Path.cwd())),
+            max_entries=session_cache_size,
+            ttl_seconds=session_idle_seconds,
+            is_pinned=self._active_run_by_session.__contains__,
+        )
+        if on_session_evicted is not None:
+            self._session_runtime_by_id.add_eviction_hook(on_session_evicted)
 
     async def run(
         self,
@@ -52,9 +71,10 @@ class AworldDingdingBridge:
         on_output: Callable[[Any], Any] | None = None,
         allowed_tools: list[str] | None = None,
     ) -> DingdingBridgeResult:
-        runtime = self._runtime_for_session(session_id)
         current_task = asyncio.current_task()
-        async with self._session_state_lock:
+        async with self._session_locks.hold(session_id):
+            # Resolved under the lock so the runtime is pinned before it can be evicted.
+            runtime = self._runtime_for_session(session_id)
             active_task = self._active_run_by_session.get(session_id)
             if active_task is not None and active_task.done():
                 self._active_run_by_session.pop(session_id, None)
@@ -106,18 +126,22 @@ class AworldDingdingBridge:
                     await cleanup_result
 
     def _runtime_for_session(self, session_id: str) -> SessionSteeringRuntime:
-        runtime = self._session_runtime_by_id.get(session_id)
-        if runtime is None:
-            runtime = SessionSteeringRuntime(workspace_path=str(Path.cwd()))
-            self._session_runtime_by_id[session_id] = runtime
-        return runtime
+        return self._session_runtime_by_id.get(session_id)
+
+    def session_state_metrics(self) -> dict[str, Any]:
+        """Lock wait and session runtime cache counters for status reporting."""
+        return {
+            "lock_wait": self._session_locks.stats.snapshot(),
+            "runtime_cache": {**self._session_runtime_by_id.stats, "size": len(self._session_runtime_by_id)},
+            "active_runs": len(self._active_run_by_session),
+        }
 
     async def _release_active_session(
         self,
         session_id: str,
         task: asyncio.Task[Any] | None,
     ) -> None:
-        async with self._session_state_lock:
+        async with self._session_locks.hold(session_id):
             active_task = self._active_run_by_session.get(session_id)
             if active_task is task:
                 self._active_run_by_session.pop(session_id, None)
@@ -205,7 +229,7 @@ class AworldDingdingBridge:
         steering = getattr(runtime, "_steering", None) if runtime is not None else None
         if steering is not None and session_id:
             steering.begin_task(session_id, task_id)
-        outputs = Runners.streamed_run_task(task=task)
+        outputs = _lazy_attr("Runners").streamed_run_task(task=task)
 
         async for output in outputs.stream_events():
             if on_output is not None:
@@ -266,7 +290,7 @@ class AworldDingdingBridge:
         session_id: str,
     ) -> AsyncIterator[Any]:
         task = await executor._build_task(text, session_id=session_id)
-        outputs = Runners.streamed_run_task(task=task)
+        outputs = _lazy_attr("Runners").streamed_run_task(task=task)
 
         async for output in outputs.stream_events():
             yield output
@@ -310,16 +334,17 @@ class AworldDingdingBridge:
                         raise
             return await agent.get_swarm(None)
         except (TypeError, AttributeError):
-            if TaskInput is None or ApplicationContext is None:
+            task_input_cls, context_cls = context_bootstrap_classes(_lazy_attr)
+            if task_input_cls is None or context_cls is None:
                 raise
-            temp_task_input = TaskInput(
+            temp_task_input = task_input_cls(
                 user_id="gateway_user",
                 session_id=f"temp_session_{datetime.now().strftime('%Y%m%d%H%M%S')}",
                 task_id=f"temp_task_{datetime.now().strftime('%Y%m%d%H%M%S')}",
                 task_content="",
                 origin_user_input="",
             )
-            temp_context = await ApplicationContext.from_input(
+            temp_context = await context_cls.from_input(
                 temp_task_input,
                 context_config=context_config,
             )
@@ -39,23 +39,21 @@ from aworld_gateway.channels.wechat.media import (
     sanitize_filename,
 )
 from aworld_gateway.config import WechatChannelConfig
+from aworld_gateway.context_bootstrap import CONTEXT_BOOTSTRAP_IMPORTS, context_bootstrap_classes
 from aworld_gateway.cron_push import CronPushBindingStore, CronPushBridge
 from aworld_gateway.logging import get_gateway_logger
 from aworld_gateway.router import SESSION_BINDING_CONVERSATION_ID_METADATA_KEY
 from aworld_gateway.types import InboundEnvelope
 from aworld_cli.steering import STEERING_CAPTURED_ACK
 from aworld_cli.core.command_bridge import CommandBridge
+from aworld.utils.lazy_import import lazy_attrs
 
 try:
     import aiohttp
 except ImportError:  # pragma: no cover - optional dependency boundary
     aiohttp = None  # type: ignore[assignment]
 
-try:
-    from aworld.core.context.amni import ApplicationContext, TaskInput
-except ImportError:  # pragma: no cover
-    ApplicationContext = None
-    TaskInput = None
+__getattr__, _lazy_attr = lazy_attrs(__name__, CONTEXT_BOOTSTRAP_IMPORTS)
 
 DEFAULT_BASE_URL = "https://ilinkai.weixin.qq.com"
 CHANNEL_VERSION = "2.2.0"
@@ -573,16 +571,17 @@ class WechatConnector:
                         raise
             return await agent.get_swarm(None)
         except (TypeError, AttributeError):
-            if TaskInput is None or ApplicationContext is None:
+            task_input_cls, context_cls = context_bootstrap_classes(_lazy_attr)
+            if task_input_cls is None or context_cls is None:
                 raise
-            temp_task_input = TaskInput(
+            temp_task_input = task_input_cls(
                 user_id="gateway_user",
                 session_id=f"temp_session_{datetime.now().strftime('%Y%m%d%H%M%S')}",
                 task_id=f"temp_task_{datetime.now().strftime('%Y%m%d%H%M%S')}",
                 task_content="",
                 origin_user_input="",
             )
-            temp_context = await ApplicationContext.from_input(
+            temp_context = await context_cls.from_input(
                 temp_task_input,
                 context_config=context_config,
             )
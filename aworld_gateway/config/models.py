@@ -13,6 +13,13 @@ class GatewayServerConfig(StrictConfigModel):
     host: str = "127.0.0.1"
     port: int = 18888
     public_base_url: str | None = None
+    # Warm swarm/executor instances kept per agent; 0 builds a fresh agent for every message.
+    agent_pool_size: int = 0
+    agent_pool_idle_seconds: float = 300.0
+    # Per-session steering runtimes kept in memory; idle or least recently used ones are evicted.
+    session_cache_size: int = 1024
+    session_idle_seconds: float | None = 3600.0
+    session_lock_stripes: int = 64
 
 
 class BaseChannelConfig(StrictConfigModel):
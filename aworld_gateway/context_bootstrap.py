@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+# The runner and the context package pull in the whole agent stack; gateway
+# start-up should not pay for them. Modules that run agents spread these into
+# their `lazy_attrs` table, so tests can still patch the names per module.
+RUNNER_IMPORTS = {
+    "Runners": ("aworld.runner", "Runners"),
+}
+CONTEXT_BOOTSTRAP_IMPORTS = {
+    "ApplicationContext": ("aworld.core.context.amni", "ApplicationContext"),
+    "TaskInput": ("aworld.core.context.amni", "TaskInput"),
+}
+
+
+def context_bootstrap_classes(resolve: Callable[[str], Any]) -> tuple[Any, Any]:
+    """TaskInput and ApplicationContext as seen by the calling module, (None, None) when unavailable."""
+    try:
+        return resolve("TaskInput"), resolve("ApplicationContext")
+    except ImportError:  # pragma: no cover
+        return None, None
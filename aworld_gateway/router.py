@@ -7,11 +7,18 @@ from inspect import isawaitable
 from pathlib import Path
 from typing import Any, Protocol
 
-from aworld.runner import Runners
+from aworld.utils.lazy_import import lazy_attrs
 
+from aworld_gateway.agent_pool import PooledAgent, WarmAgentPool
 from aworld_gateway.agent_resolver import AgentResolver
+from aworld_gateway.context_bootstrap import (
+    CONTEXT_BOOTSTRAP_IMPORTS,
+    RUNNER_IMPORTS,
+    context_bootstrap_classes,
+)
 from aworld_gateway.logging import get_gateway_logger
 from aworld_gateway.session_binding import SessionBinding
+from aworld_gateway.session_state import SessionRuntimeCache, StripedSessionLocks
 from aworld_gateway.types import InboundEnvelope, OutboundEnvelope
 from aworld_cli.core.command_bridge import CommandBridge
 from aworld_cli.core.tool_filter import temporary_tool_filter
@@ -21,12 +28,7 @@ from aworld_cli.steering.observability import (
     log_queued_steering_event,
 )
 
-try:
-    from aworld.core.context.amni import ApplicationContext, TaskInput
-except ImportError:  # pragma: no cover
-    ApplicationContext = None
-    TaskInput = None
-
+__getattr__, _lazy_attr = lazy_attrs(__name__, {**RUNNER_IMPORTS, **CONTEXT_BOOTSTRAP_IMPORTS})
 
 logger = get_gateway_logger("router")
 SESSION_BINDING_CONVERSATION_ID_METADATA_KEY = "session_binding_conversation_id"
@@ -45,7 +47,18 @@ class AgentBackend(Protocol):
 
 
 class LocalCliAgentBackend:
-    def __init__(self, registry_cls: Any = None, executor_cls: Any = None) -> None:
+    def __init__(
+        self,
+        registry_cls: Any = None,
+        executor_cls: Any = None,
+        *,
+        pool_size: int = 0,
+        pool_idle_seconds: float = 300.0,
+        session_cache_size: int = 1024,
+        session_idle_seconds: float | None = 3600.0,
+        session_lock_stripes: int = 64,
+        on_session_evicted: Callable[[str, SessionSteeringRuntime], Any] | None = None,
+    ) -> None:
         if registry_cls is None:
             from aworld_cli.core.agent_registry import LocalAgentRegistry
 
@@ -57,9 +70,27 @@ class LocalCliAgentBackend:
 
         self._registry_cls = registry_cls
         self._executor_cls = executor_cls
-        self._session_runtime_by_id: dict[str, SessionSteeringRuntime] = {}
         self._active_run_by_session: dict[str, asyncio.Task[Any]] = {}
-        self._session_state_lock = asyncio.Lock()
+        # Sessions on different lock stripes never wait on each other; idle runtimes are evicted.
+        self._session_locks = StripedSessionLocks(session_lock_stripes)
+        self._session_runtime_by_id: SessionRuntimeCache[SessionSteeringRuntime] = SessionRuntimeCache(
+            lambda _session_id: SessionSteeringRuntime(workspace_path=str(Path.cwd())),
+            max_entries=session_cache_size,
+            ttl_seconds=session_idle_seconds,
+            is_pinned=self._active_run_by_session.__contains__,
+        )
+        if on_session_evicted is not None:
+            self._session_runtime_by_id.add_eviction_hook(on_session_evicted)
+        # Warm swarms/executors per agent; pool_size=0 builds and tears down one per message.
+        self._agent_pool = (
+            WarmAgentPool(
+                max_idle_per_agent=pool_size,
+                idle_ttl_seconds=pool_idle_seconds,
+                reset=self._reset_pooled_agent,
+            )
+            if pool_size > 0
+            else None
+        )
 
     async def run(
         self,
@@ -70,9 +101,10 @@ class LocalCliAgentBackend:
         on_output: Callable[[Any], Any] | None = None,
         allowed_tools: list[str] | None = None,
     ) -> str:
-        runtime = self._runtime_for_session(session_id)
         current_task = asyncio.current_task()
-        async with self._session_state_lock:
+        async with self._session_locks.hold(session_id):
+            # Resolved under the lock so the runtime is pinned before it can be evicted.
+            runtime = self._runtime_for_session(session_id)
             active_task = self._active_run_by_session.get(session_id)
             if active_task is not None and active_task.done():
                 self._active_run_by_session.pop(session_id, None)
@@ -86,46 +118,35 @@ class LocalCliAgentBackend:
             if active_task is None:
                 self._active_run_by_session[session_id] = current_task
         executor = None
+        pooled: PooledAgent | None = None
+        succeeded = False
         try:
             agent = self._registry_cls.get_agent(agent_id)
             if agent is None:
                 raise ValueError(f"Agent not found: {agent_id}")
 
-            context_config = getattr(agent, "context_config", None)
-            try:
-                swarm = await agent.get_swarm(None)
-            except (TypeError, AttributeError):
-                if TaskInput is None or ApplicationContext is None:
-                    raise
-                temp_task_input = TaskInput(
-                    user_id="gateway_user",
-                    session_id=f"temp_session_{datetime.now().strftime('%Y%m%d%H%M%S')}",
-                    task_id=f"temp_task_{datetime.now().strftime('%Y%m%d%H%M%S')}",
-                    task_content="",
-                    origin_user_input="",
-                )
-                temp_context = await ApplicationContext.from_input(
-                    temp_task_input,
-                    context_config=context_config,
+            if self._agent_pool is not None:
+                pooled = await self._agent_pool.acquire(
+                    agent_id,
+                    lambda: self._build_pooled_agent(agent, session_id),
                 )
-                swarm = await agent.get_swarm(temp_context)
-
-            executor = self._executor_cls(
-                swarm=swarm,
-                context_config=context_config,
-                session_id=session_id,
-                hooks=getattr(agent, "hooks", None),
-            )
+                swarm, executor = pooled.swarm, pooled.executor
+                self._bind_executor_session(executor, session_id)
+            else:
+                swarm = await self._build_swarm(agent)
+                executor = self._build_executor(agent, swarm, session_id)
             executor._base_runtime = runtime
             executor._allow_session_steering_checkpoints = True
             runtime._steering.begin_task(session_id, f"gateway-{session_id}")
             with temporary_tool_filter(swarm, allowed_tools):
-                return await self._run_with_session_steering(
+                result = await self._run_with_session_steering(
                     executor=executor,
                     text=text,
                     session_id=session_id,
                     on_output=on_output,
                 )
+            succeeded = True
+            return result
         finally:
             runtime._steering.end_task(session_id, clear_pending=True)
             await self._release_active_session(session_id, current_task)
@@ -133,20 +154,96 @@ class LocalCliAgentBackend:
                 cleanup_result = executor.cleanup_resources()
                 if isawaitable(cleanup_result):
                     await cleanup_result
+            if pooled is not None:
+                await self._agent_pool.release(agent_id, pooled, healthy=succeeded)
+
+    async def _build_swarm(self, agent: Any) -> Any:
+        context_config = getattr(agent, "context_config", None)
+        try:
+            return await agent.get_swarm(None)
+        except (TypeError, AttributeError):
+            task_input_cls, context_cls = context_bootstrap_classes(_lazy_attr)
+            if task_input_cls is None or context_cls is None:
+                raise
+            temp_task_input = task_input_cls(
+                user_id="gateway_user",
+                session_id=f"temp_session_{datetime.now().strftime('%Y%m%d%H%M%S')}",
+                task_id=f"temp_task_{datetime.now().strftime('%Y%m%d%H%M%S')}",
+                task_content="",
+                origin_user_input="",
+            )
+            temp_context = await context_cls.from_input(
+                temp_task_input,
+                context_config=context_config,
+            )
+            return await agent.get_swarm(temp_context)
+
+    def _build_executor(self, agent: Any, swarm: Any, session_id: str) -> Any:
+        return self._executor_cls(
+            swarm=swarm,
+            context_config=getattr(agent, "context_config", None),
+            session_id=session_id,
+            hooks=getattr(agent, "hooks", None),
+        )
+
+    async def _build_pooled_agent(self, agent: Any, session_id: str) -> PooledAgent:
+        swarm = await self._build_swarm(agent)
+        return PooledAgent(swarm=swarm, executor=self._build_executor(agent, swarm, session_id))
+
+    @staticmethod
+    def _bind_executor_session(executor: Any, session_id: str) -> None:
+        executor.session_id = session_id
+        background_tasks = getattr(executor, "background_task_manager", None)
+        if background_tasks is not None and hasattr(background_tasks, "session_id"):
+            background_tasks.session_id = session_id
+
+    @staticmethod
+    def _reset_pooled_agent(pooled: PooledAgent) -> None:
+        """Clear the per-session state of a pooled instance before it serves another session."""
+        executor = pooled.executor
+        executor.context = None
+        executor._base_runtime = None
+        for attr, empty in (
+            ("last_task_response", None),
+            ("_active_steering_commit_buffer", None),
+            ("_aworld_cli_restored_messages", []),
+        ):
+            if hasattr(executor, attr):
+                setattr(executor, attr, empty)
+
+        swarm = pooled.swarm
+        if not getattr(swarm, "initialized", False):
+            return
+        # The next task re-initializes the swarm, handing its agents the new task.
+        for agent in swarm.agent_graph.agents.values():
+            agent.task = None
+            agent.reset()
+        swarm.task = None
+        swarm.cur_step = 1
+        swarm.initialized = False
+
+    async def close(self) -> None:
+        """Release pooled agent instances."""
+        if self._agent_pool is not None:
+            await self._agent_pool.close()
 
     def _runtime_for_session(self, session_id: str) -> SessionSteeringRuntime:
-        runtime = self._session_runtime_by_id.get(session_id)
-        if runtime is None:
-            runtime = SessionSteeringRuntime(workspace_path=str(Path.cwd()))
-            self._session_runtime_by_id[session_id] = runtime
-        return runtime
+        return self._session_runtime_by_id.get(session_id)
+
+    def session_state_metrics(self) -> dict[str, Any]:
+        """Lock wait and session runtime cache counters for status reporting."""
+        return {
+            "lock_wait": self._session_locks.stats.snapshot(),
+            "runtime_cache": {**self._session_runtime_by_id.stats, "size": len(self._session_runtime_by_id)},
+            "active_runs": len(self._active_run_by_session),
+        }
 
     async def _release_active_session(
         self,
         session_id: str,
         task: asyncio.Task[Any] | None,
     ) -> None:
-        async with self._session_state_lock:
+        async with self._session_locks.hold(session_id):
             active_task = self._active_run_by_session.get(session_id)
             if active_task is task:
                 self._active_run_by_session.pop(session_id, None)
@@ -224,7 +321,7 @@ class LocalCliAgentBackend:
         steering = getattr(runtime, "_steering", None) if runtime is not None else None
         if steering is not None and session_id:
             steering.begin_task(session_id, task_id)
-        outputs = Runners.streamed_run_task(task=task)
+        outputs = _lazy_attr("Runners").streamed_run_task(task=task)
 
         async for output in outputs.stream_events():
             callback_result = on_output(output)
@@ -283,7 +380,7 @@ class LocalCliAgentBackend:
         session_id: str,
     ) -> AsyncIterator[Any]:
         task = await executor._build_task(text, session_id=session_id)
-        outputs = Runners.streamed_run_task(task=task)
+        outputs = _lazy_attr("Runners").streamed_run_task(task=task)
 
         async for output in outputs.stream_events():
             yield output
@@ -419,6 +516,14 @@ class GatewayRouter:
         self._agent_backend = agent_backend
         self._command_bridge = command_bridge or CommandBridge()
 
+    async def close(self) -> None:
+        """Release what the agent backend holds between messages."""
+        close = getattr(self._agent_backend, "close", None)
+        if callable(close):
+            result = close()
+            if isawaitable(result):
+                await result
+
     async def handle_inbound(
         self,
         inbound: InboundEnvelope,
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from inspect import isawaitable
+from typing import Any, Generic, TypeVar
+
+from aworld_gateway.logging import get_gateway_logger
+
+
+logger = get_gateway_logger("session_state")
+
+T = TypeVar("T")
+
+
+@dataclass
+class LockWaitStats:
+    acquisitions: int = 0
+    contended: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    def record(self, waited: float) -> None:
+        self.acquisitions += 1
+        self.total_wait_seconds += waited
+        if waited > self.max_wait_seconds:
+            self.max_wait_seconds = waited
+
+    def snapshot(self) -> dict[str, float | int]:
+        mean = self.total_wait_seconds / self.acquisitions if self.acquisitions else 0.0
+        return {
+            "acquisitions": self.acquisitions,
+            "contended": self.contended,
+            "total_wait_seconds": self.total_wait_seconds,
+            "mean_wait_seconds": mean,
+            "max_wait_seconds": self.max_wait_seconds,
+        }
+
+
+class StripedSessionLocks:
+    """Fixed set of asyncio locks shared out to sessions by a stable hash.
+
+    Sessions on different stripes never wait on each other, and memory stays
+    bounded by `stripes` regardless of how many sessions the gateway has seen.
+    Every acquisition records how long it waited in `stats`.
+    """
+
+    def __init__(self, stripes: int = 64) -> None:
+        if stripes < 1:
+            raise ValueError("stripes must be >= 1")
+        self._locks = [asyncio.Lock() for _ in range(stripes)]
+        self.stats = LockWaitStats()
+
+    def lock_for(self, session_id: str) -> asyncio.Lock:
+        return self._locks[zlib.crc32(session_id.encode("utf-8")) % len(self._locks)]
+
+    @asynccontextmanager
+    async def hold(self, session_id: str) -> AsyncIterator[None]:
+        lock = self.lock_for(session_id)
+        if lock.locked():
+            self.stats.contended += 1
+        started = time.perf_counter()
+        async with lock:
+            self.stats.record(time.perf_counter() - started)
+            yield
+
+
+@dataclass
+class _CacheEntry(Generic[T]):
+    value: T
+    last_used_at: float
+
+
+class SessionRuntimeCache(Generic[T]):
+    """LRU and idle-TTL bounded map of per-session runtimes.
+
+    Entries beyond `max_entries` or idle for longer than `ttl_seconds` are
+    evicted, least recently used first, and handed to every registered
+    eviction hook so their state can be persisted. Sessions for which
+    `is_pinned(session_id)` is true (e.g. a run is in flight) are never
+    evicted; the cache may briefly exceed `max_entries` while they are.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[str], T],
+        *,
+        max_entries: int = 1024,
+        ttl_seconds: float | None = 3600.0,
+        is_pinned: Callable[[str], bool] | None = None,
+    ) -> None:
+        self._factory = factory
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._is_pinned = is_pinned or (lambda _session_id: False)
+        self._entries: OrderedDict[str, _CacheEntry[T]] = OrderedDict()
+        self._evict_hooks: list[Callable[[str, T], Any]] = []
+        self._pending_hooks: set[asyncio.Task[Any]] = set()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._entries
+
+    def add_eviction_hook(self, hook: Callable[[str, T], Any]) -> None:
+        """Register `hook(session_id, runtime)`; it may be sync or async."""
+        self._evict_hooks.append(hook)
+
+    def get(self, session_id: str) -> T:
+        now = time.monotonic()
+        entry = self._entries.get(session_id)
+        if entry is None:
+            self.stats["misses"] += 1
+            entry = _CacheEntry(value=self._factory(session_id), last_used_at=now)
+            self._entries[session_id] = entry
+        else:
+            self.stats["hits"] += 1
+            entry.last_used_at = now
+            self._entries.move_to_end(session_id)
+        self.evict(now=now, keep=session_id)
+        return entry.value
+
+    def evict(self, *, now: float | None = None, keep: str | None = None) -> list[str]:
+        """Drop expired and over-capacity entries; returns the evicted session ids."""
+        now = time.monotonic() if now is None else now
+        evicted: list[str] = []
+        overflow = len(self._entries) - self.max_entries
+        for session_id in list(self._entries):
+            entry = self._entries[session_id]
+            expired = self.ttl_seconds is not None and now - entry.last_used_at > self.ttl_seconds
+            if not expired and overflow <= 0:
+                # Entries are ordered by last use, so nothing further along is expired either.
+                break
+            if session_id == keep or self._is_pinned(session_id):
+                continue
+            del self._entries[session_id]
+            overflow -= 1
+            evicted.append(session_id)
+            self._on_evicted(session_id, entry.value)
+        return evicted
+
+    async def drain(self) -> None:
+        """Wait for asynchronous eviction hooks that are still running."""
+        if self._pending_hooks:
+            await asyncio.gather(*self._pending_hooks, return_exceptions=True)
+
+    def _on_evicted(self, session_id: str, value: T) -> None:
+        self.stats["evictions"] += 1
+        logger.debug(f"Gateway session runtime evicted session={session_id}")
+        for hook in self._evict_hooks:
+            try:
+                result = hook(session_id, value)
+            except Exception as exc:
+                logger.warning(f"Gateway session eviction hook failed session={session_id} error={exc}")
+                continue
+            if isawaitable(result):
+                task = asyncio.ensure_future(self._await_hook(session_id, result))
+                self._pending_hooks.add(task)
+                task.add_done_callback(self._pending_hooks.discard)
+
+    @staticmethod
+    async def _await_hook(session_id: str, result: Any) -> None:
+        try:
+            await result
+        except Exception as exc:
+            logger.warning(f"Gateway session eviction hook failed session={session_id} error={exc}")
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCENARIOS = {
+    "import-aworld": "import aworld",
+    "cli-help": (
+        "import sys; sys.argv = ['aworld-cli', '--help']\n"
+        "from aworld_cli.main import main\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit:\n"
+        "    pass"
+    ),
+    "gateway-cli": "import aworld_cli.gateway_cli",
+    "gateway-router": "import aworld_gateway.router",
+}
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(.*)$")
+
+
+def _env() -> dict[str, str]:
+    env = dict(os.environ)
+    paths = [str(REPO_ROOT / "aworld-cli" / "src"), str(REPO_ROOT)]
+    if env.get("PYTHONPATH"):
+        paths.append(env["PYTHONPATH"])
+    env["PYTHONPATH"] = os.pathsep.join(paths)
+    return env
+
+
+def time_scenario(code: str, runs: int) -> list[float]:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=str(REPO_ROOT),
+            env=_env(),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def top_imports(code: str, limit: int) -> list[tuple[str, float]]:
+    """Modules with the largest cumulative import time, from `python -X importtime`."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=str(REPO_ROOT),
+        env=_env(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            rows.append((match.group(3).strip(), int(match.group(2)) / 1_000_000))
+    rows.sort(key=lambda row: row[1], reverse=True)
+    return rows[:limit]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure cold start-up time of aworld, aworld-cli and the gateway.")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="Scenario to measure; repeat to select several (default: all).")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreter runs per scenario.")
+    parser.add_argument("--top", type=int, default=0,
+                        help="Also list the N slowest imports of each scenario (python -X importtime).")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    results = {}
+    for name in args.scenario or list(SCENARIOS):
+        timings = time_scenario(SCENARIOS[name], args.runs)
+        results[name] = {
+            "median_seconds": statistics.median(timings),
+            "min_seconds": min(timings),
+            "max_seconds": max(timings),
+        }
+        if args.top:
+            results[name]["top_imports"] = top_imports(SCENARIOS[name], args.top)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    for name, result in results.items():
+        print(f"{name:16} median={result['median_seconds']:.3f}s "
+              f"min={result['min_seconds']:.3f}s max={result['max_seconds']:.3f}s")
+        for module, seconds in result.get("top_imports", []):
+            print(f"    {seconds:7.3f}s  {module}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
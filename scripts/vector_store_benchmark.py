@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from aworld.core.memory import VectorDBConfig  # noqa: E402
+from aworld.memory.embeddings.base import EmbeddingsMetadata, EmbeddingsResult  # noqa: E402
+from aworld.memory.vector.factory import VectorDBFactory  # noqa: E402
+
+COLLECTION = "benchmark"
+
+
+def backend_configs(data_dir: Path, dim: int) -> dict[str, VectorDBConfig]:
+    return {
+        "local-flat": VectorDBConfig(provider="local", config={"local_data_path": str(data_dir / "flat")}),
+        "local-flat-f16": VectorDBConfig(provider="local", config={
+            "local_data_path": str(data_dir / "flat16"), "local_dtype": "float16"}),
+        "local-ivf": VectorDBConfig(provider="local", config={
+            "local_data_path": str(data_dir / "ivf"), "local_index": "ivf", "local_nprobe": 8}),
+        "chroma": VectorDBConfig(provider="chroma", config={"chroma_data_path": str(data_dir / "chroma")}),
+        "qdrant": VectorDBConfig(provider="qdrant", config={
+            "qdrant_path": str(data_dir / "qdrant"), "qdrant_vector_size": dim}),
+    }
+
+
+def make_items(vectors: np.ndarray) -> list[EmbeddingsResult]:
+    return [
+        EmbeddingsResult(
+            id=f"item-{i}",
+            embedding=vector.tolist(),
+            content=f"document {i}",
+            metadata=EmbeddingsMetadata(memory_id=f"item-{i}", memory_type="message", embedding_model="bench",
+                                        user_id=f"user-{i % 10}"),
+        )
+        for i, vector in enumerate(vectors)
+    ]
+
+
+def exact_neighbours(vectors: np.ndarray, queries: np.ndarray, k: int) -> list[set[str]]:
+    normed = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = queries @ normed.T
+    return [{f"item-{i}" for i in np.argsort(-row)[:k]} for row in scores]
+
+
+def run_backend(name: str, config: VectorDBConfig, items: list[EmbeddingsResult], queries: np.ndarray,
+                truth: list[set[str]], k: int, batch: int) -> dict:
+    try:
+        db = VectorDBFactory.get_vector_db(config)
+    except ImportError as e:
+        return {"skipped": f"{type(e).__name__}: {e}"}
+
+    started = time.perf_counter()
+    for i in range(0, len(items), batch):
+        db.insert(COLLECTION, items[i:i + batch])
+    insert_seconds = time.perf_counter() - started
+
+    latencies, recalls = [], []
+    for query, expected in zip(queries, truth):
+        started = time.perf_counter()
+        results = db.search(COLLECTION, [query.tolist()], {"memory_type": "message"}, 0.0, k)
+        latencies.append(time.perf_counter() - started)
+        found = {doc.id for doc in (results.docs if results else [])}
+        recalls.append(len(found & expected) / k)
+
+    started = time.perf_counter()
+    db.search(COLLECTION, [queries[0].tolist()], {"memory_type": "message", "user_id": "user-3"}, 0.0, k)
+    filtered_seconds = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "insert_seconds": insert_seconds,
+        "search_p50_ms": statistics.median(latencies) * 1000,
+        "search_p95_ms": latencies[int(0.95 * (len(latencies) - 1))] * 1000,
+        "filtered_search_ms": filtered_seconds * 1000,
+        f"recall@{k}": float(np.mean(recalls)),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare the embedded local vector store with the chroma and qdrant backends.")
+    parser.add_argument("--rows", type=int, default=20000, help="Vectors to insert.")
+    parser.add_argument("--dim", type=int, default=384, help="Vector dimension.")
+    parser.add_argument("--queries", type=int, default=100, help="Search queries to time.")
+    parser.add_argument("--k", type=int, default=10, help="Results per query.")
+    parser.add_argument("--batch", type=int, default=500, help="Items per insert call.")
+    parser.add_argument("--backend", action="append", help="Backend to run; repeat to select several (default: all).")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    rng = np.random.default_rng(0)
+    # Clustered data so approximate indexes see realistic structure
+    centers = rng.normal(size=(max(1, args.rows // 200), args.dim))
+    vectors = (centers[rng.integers(0, len(centers), args.rows)]
+               + 0.5 * rng.normal(size=(args.rows, args.dim))).astype(np.float32)
+    queries = vectors[rng.choice(args.rows, args.queries, replace=False)] + 0.1 * rng.normal(
+        size=(args.queries, args.dim)).astype(np.float32)
+    queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+    truth = exact_neighbours(vectors, queries, args.k)
+    items = make_items(vectors)
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="aworld-vector-bench-") as tmp:
+        configs = backend_configs(Path(tmp), args.dim)
+        for name in args.backend or list(configs):
+            results[name] = run_backend(name, configs[name], items, queries, truth, args.k, args.batch)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    for name, result in results.items():
+        if "skipped" in result:
+            print(f"{name:15} skipped ({result['skipped']})")
+            continue
+        print(f"{name:15} insert={result['insert_seconds']:.2f}s "
+              f"p50={result['search_p50_ms']:.2f}ms p95={result['search_p95_ms']:.2f}ms "
+              f"filtered={result['filtered_search_ms']:.2f}ms recall@{args.k}={result[f'recall@{args.k}']:.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,121 @@
+# coding: utf-8
+# Copyright (c) 2025 inclusionAI.
+import asyncio
+import json
+
+import pytest
+
+from aworld.experimental.a2a.http_pool import A2AConnectionPool, AgentCardCache
+
+AGENT_CARD = {"name": "stub", "description": "stub agent", "url": "http://127.0.0.1/"}
+
+
+class StubA2AServer:
+    """Keep-alive HTTP/1.1 server answering every request with the agent card after `delay` seconds."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.connections = 0
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._server = None
+
+    async def __aenter__(self) -> "StubA2AServer":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                self.requests += 1
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                await asyncio.sleep(self.delay)
+                self.in_flight -= 1
+                body = json.dumps(AGENT_CARD).encode()
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                             b"Content-Length: %d\r\n\r\n%s" % (len(body), body))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_connections_per_remote() -> None:
+    pool = A2AConnectionPool(timeout=5)
+    async with StubA2AServer() as server:
+        try:
+            for _ in range(20):
+                response = await pool.get_client(server.url).get(f"{server.url}/.well-known/agent-card.json")
+                assert response.json()["name"] == "stub"
+            assert pool.get_client(server.url + "/rpc") is pool.get_client(server.url)
+        finally:
+            await pool.aclose()
+    assert (server.requests, server.connections) == (20, 1)
+
+
+@pytest.mark.asyncio
+async def test_pool_limits_concurrency_per_remote() -> None:
+    pool = A2AConnectionPool(timeout=5, max_concurrency_per_remote=3)
+
+    async def call(url: str) -> None:
+        async with pool.limit(url):
+            await pool.get_client(url).get(url)
+
+    async with StubA2AServer(delay=0.02) as server:
+        try:
+            await asyncio.gather(*(call(server.url) for _ in range(12)))
+        finally:
+            await pool.aclose()
+    assert server.requests == 12
+    assert server.max_in_flight == 3
+    assert server.connections <= 3
+
+
+@pytest.mark.asyncio
+async def test_agent_card_cache_shares_one_fetch_until_expiry() -> None:
+    cache = AgentCardCache(ttl=60)
+    fetches = []
+
+    async def fetch():
+        fetches.append(1)
+        await asyncio.sleep(0.01)
+        return dict(AGENT_CARD)
+
+    cards = await asyncio.gather(*(cache.get_or_fetch("http://remote", fetch) for _ in range(10)))
+    assert len(fetches) == 1 and all(card == AGENT_CARD for card in cards)
+
+    await cache.get_or_fetch("http://remote", fetch, ttl=0)
+    assert len(fetches) == 1
+    cache.put("http://remote", AGENT_CARD, ttl=-1)
+    await cache.get_or_fetch("http://remote", fetch)
+    assert len(fetches) == 2
+
+
+@pytest.mark.asyncio
+async def test_agent_card_cache_does_not_cache_failures() -> None:
+    cache = AgentCardCache()
+
+    async def fail():
+        raise ConnectionError("remote down")
+
+    with pytest.raises(ConnectionError):
+        await cache.get_or_fetch("http://remote", fail)
+
+    async def fetch():
+        return AGENT_CARD
+
+    assert await cache.get_or_fetch("http://remote", fetch) == AGENT_CARD
@@ -0,0 +1,87 @@
+import pytest
+
+from aworld.checkpoint import CheckpointMetadata, create_checkpoint
+from aworld.checkpoint.sqlite import SqliteCheckpointRepository
+
+
+def _checkpoint(session_id, version, values, task_id=None, ts=None):
+    checkpoint = create_checkpoint(values=values, metadata=CheckpointMetadata(session_id=session_id, task_id=task_id),
+                                   version=version)
+    if ts:
+        checkpoint.ts = ts
+    return checkpoint
+
+
+def test_checkpoints_survive_reopen_and_restore_through_deltas(tmp_path):
+    db_path = str(tmp_path / "checkpoints.db")
+    repo = SqliteCheckpointRepository(db_path, keyframe_interval=3)
+    history = []
+    values = {"messages": [], "meta": {"owner": "agent"}}
+    for step in range(7):
+        values = dict(values, messages=values["messages"] + [f"msg-{step}"], step=step)
+        if step == 4:
+            values.pop("meta")
+        checkpoint = _checkpoint("s1", step + 1, values, task_id="t1")
+        repo.put(checkpoint)
+        history.append(checkpoint)
+    repo.close()
+
+    reopened = SqliteCheckpointRepository(db_path, keyframe_interval=3)
+
+    assert reopened.get_by_session("s1").values == history[-1].values
+    for checkpoint in history:
+        assert reopened.get(checkpoint.id).values == checkpoint.values
+    assert [cp.id for cp in reopened.list({"task_id": "t1"})] == [cp.id for cp in history]
+    assert [cp.values for cp in reopened.list({"session_id": "s1"})] == [cp.values for cp in history]
+    # Continues the chain after a restart, with no cached predecessor
+    reopened.put(_checkpoint("s1", 8, {"step": 7}))
+    assert reopened.get_by_session("s1").values == {"step": 7}
+
+
+def test_point_in_time_lookup_and_version_check(tmp_path):
+    repo = SqliteCheckpointRepository(str(tmp_path / "checkpoints.db"))
+    repo.put(_checkpoint("s1", 1, {"step": 1}, ts="2026-01-01T00:00:00+00:00"))
+    repo.put(_checkpoint("s1", 2, {"step": 2}, ts="2026-01-02T00:00:00+00:00"))
+    repo.put(_checkpoint("s2", 1, {"other": True}, ts="2026-01-03T00:00:00+00:00"))
+
+    assert repo.get_at("s1", "2026-01-01T12:00:00+00:00").values == {"step": 1}
+    assert repo.get_at("s1", "2026-01-05T00:00:00+00:00").values == {"step": 2}
+    assert repo.get_at("s1", "2025-12-31T00:00:00+00:00") is None
+    with pytest.raises(ValueError):
+        repo.put(_checkpoint("s1", 1, {"step": 0}))
+
+    repo.delete_by_session("s1")
+    assert repo.get_by_session("s1") is None
+    assert repo.get_by_session("s2").values == {"other": True}
+
+
+def test_reputting_checkpoints_keeps_the_delta_chain(tmp_path):
+    repo = SqliteCheckpointRepository(str(tmp_path / "checkpoints.db"), keyframe_interval=4)
+    first = _checkpoint("s1", 1, {"x": 1, "y": 2})
+    second = _checkpoint("s1", 1, {"x": 1, "y": 3})
+    repo.put(first)
+    repo.put(second)
+
+    # Only the latest checkpoint can be replaced; later deltas build on earlier ones
+    with pytest.raises(ValueError):
+        repo.put(first)
+    assert repo.get(second.id).values == {"x": 1, "y": 3}
+
+    second.values = {"x": 2, "y": 3}
+    repo.put(second)
+    third = _checkpoint("s1", 1, {"x": 2, "y": 4})
+    repo.put(third)
+
+    assert repo.get(first.id).values == {"x": 1, "y": 2}
+    assert repo.get(second.id).values == {"x": 2, "y": 3}
+    assert repo.get(third.id).values == {"x": 2, "y": 4}
+    assert [cp.id for cp in repo.list({"session_id": "s1"})] == [first.id, second.id, third.id]
+
+    # A replaced keyframe stays the base of the deltas after it
+    other = _checkpoint("s2", 1, {"a": 1})
+    repo.put(other)
+    other.values = {"a": 2, "b": 1}
+    repo.put(other)
+    repo.put(_checkpoint("s2", 1, {"a": 2, "b": 2}))
+    assert repo.get_by_session("s2").values == {"a": 2, "b": 2}
+    assert repo.get(other.id).values == {"a": 2, "b": 1}
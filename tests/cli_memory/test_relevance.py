@@ -369,3 +369,17 @@ def test_relevant_memory_context_source_files_match_only_returned_texts(tmp_path
         durable_memory_file(workspace),
         sessions_dir / "session-1.jsonl",
     )
+
+
+def test_memory_revision_changes_when_session_logs_change(tmp_path) -> None:
+    workspace = tmp_path / "workspace"
+    provider = CliDurableMemoryProvider()
+    assert provider.memory_revision(str(workspace)) == ()
+
+    session_log = workspace / ".aworld" / "memory" / "sessions" / "session-1.jsonl"
+    _write_session_log(session_log, [{"session_id": "session-1", "final_answer": "first"}])
+    first = provider.memory_revision(str(workspace))
+    assert first == provider.memory_revision(str(workspace))
+
+    _write_session_log(session_log, [{"session_id": "session-1", "final_answer": "first, then more"}])
+    assert provider.memory_revision(str(workspace)) != first
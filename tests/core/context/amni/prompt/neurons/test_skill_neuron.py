@@ -43,3 +43,18 @@ async def test_skills_neuron_includes_forced_skill_contract() -> None:
     assert '<skill id="writing-plans" active_status="True">' in rendered
     assert "<skill_usage>Use the planning workflow</skill_usage>" in rendered
 
+
+
+@pytest.mark.asyncio
+async def test_skills_neuron_state_version_tracks_active_skills() -> None:
+    neuron = SkillsNeuron()
+    context = _FakeContext()
+
+    first = await neuron.state_version(context, namespace="Aworld")
+    assert await neuron.state_version(context, namespace="Aworld") == first
+
+    async def no_active_skills(namespace=None):
+        return []
+
+    context.get_active_skills = no_active_skills
+    assert await neuron.state_version(context, namespace="Aworld") != first
@@ -0,0 +1,72 @@
+import pytest
+
+from aworld.core.context.amni.retrieval.chunker.base import Chunk, ChunkMetadata
+from aworld.core.context.amni.retrieval.chunker.storage import InMemoryChunkStore, SQLiteChunkStore
+
+
+def _chunk(chunk_id: str, artifact_id: str, chunk_index: int, workspace_id: str = "w1", **extra) -> Chunk:
+    return Chunk(
+        chunk_id=chunk_id,
+        content=f"{artifact_id}#{chunk_index}",
+        chunk_metadata=ChunkMetadata(artifact_id=artifact_id, chunk_index=chunk_index, workspace_id=workspace_id,
+                                     **extra),
+    )
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        yield InMemoryChunkStore()
+        return
+    sqlite_store = SQLiteChunkStore({"db_path": str(tmp_path / "chunks.db")})
+    yield sqlite_store
+    sqlite_store.close()
+
+
+@pytest.mark.asyncio
+async def test_chunk_store_lookups_follow_upserts_and_deletes(store) -> None:
+    await store.upsert_chunks_batch(
+        [_chunk(f"a-{i}", "a", i) for i in range(10)] + [_chunk("b-0", "b", 0, workspace_id="w2", tag="x")])
+
+    found = await store.search_chunks({"artifact_id": "a", "chunk_index": 3, "workspace_id": "w1"})
+    assert [c.chunk_id for c in found] == ["a-3"]
+    assert [c.chunk_id for c in await store.search_chunks({"tag": "x"})] == ["b-0"]
+    assert await store.search_chunks({"artifact_id": "a", "chunk_index": 3, "workspace_id": "w2"}) == []
+
+    # Moving a chunk to another position must update the position index
+    await store.upsert_chunk(_chunk("a-3", "b", 1, workspace_id="w2"))
+    assert await store.search_chunks({"artifact_id": "a", "chunk_index": 3}) == []
+    assert [c.content for c in await store.search_chunks({"artifact_id": "b", "chunk_index": 1})] == ["b#1"]
+
+    assert await store.delete_chunk("a-5") is True
+    assert await store.delete_chunk("a-5") is False
+    assert await store.get_chunk("a-5") is None
+    assert await store.check_chunk_exists("a-4") is True
+    assert await store.get_chunk_count() == 10
+
+    in_range = await store.get_artifact_chunks_by_range("a", 2, 7)
+    assert [c.chunk_metadata.chunk_index for c in in_range] == [2, 4, 6]
+    assert await store.get_artifact_chunk_counts({"workspace_id": "w2"}) == {"b": 2}
+    assert await store.get_artifact_chunk_counts({"chunk_index": 0}) == {"a": 1, "b": 1}
+
+    await store.clear()
+    assert await store.search_chunks({"artifact_id": "a"}) == []
+    assert await store.get_chunk_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_sqlite_chunk_store_persists_batched_upserts(tmp_path) -> None:
+    path = str(tmp_path / "chunks.db")
+    store = SQLiteChunkStore({"db_path": path})
+    await store.upsert_chunks_batch([_chunk(f"a-{i}", "a", i) for i in range(25)], batch_size=10)
+    await store.upsert_chunks_batch([_chunk("a-0", "a", 0, chunk_desc="updated")])
+    store.close()
+
+    reopened = SQLiteChunkStore({"db_path": path})
+    try:
+        assert await reopened.get_chunk_count() == 25
+        assert (await reopened.get_chunk("a-0")).chunk_metadata.chunk_desc == "updated"
+        journal_mode = reopened._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert journal_mode == "wal"
+    finally:
+        reopened.close()
@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+from aworld.core.context.amni.retrieval.chunker import ChunkConfig, ChunkerFactory
+from aworld.core.context.amni.retrieval.chunker.storage import InMemoryChunkStore
+from aworld.core.context.amni.retrieval.index.base import RetrievalIndexPlugin
+from aworld.core.context.amni.retrieval.pipeline import IngestionPipeline, _get_process_pool, shutdown_chunk_pool
+from aworld.output import Artifact
+from aworld.output.artifact import ArtifactType
+
+CHUNK_CONFIG = ChunkConfig(provider="smart", chunk_size=200, chunk_overlap=0)
+
+
+class RecordingIndexPlugin(RetrievalIndexPlugin):
+    def __init__(self, delay: float = 0.0):
+        super().__init__({})
+        self.delay = delay
+        self.batches = []
+
+    async def build_index_batch(self, collection, documents, **kwargs):
+        await asyncio.sleep(self.delay)
+        self.batches.append((collection, [doc["doc_id"] for doc in documents]))
+
+
+def _artifact(i: int, paragraphs: int = 5) -> Artifact:
+    content = "\n\n".join(f"Paragraph {p} of document {i}. " + "word " * 30 for p in range(paragraphs))
+    return Artifact(artifact_id=f"doc-{i}", artifact_type=ArtifactType.TEXT, content=content)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_stores_and_indexes_every_chunk_in_batches() -> None:
+    store = InMemoryChunkStore()
+    plugin = RecordingIndexPlugin()
+    pipeline = IngestionPipeline(ChunkerFactory.get_chunker(CHUNK_CONFIG), store, [plugin],
+                                 chunk_config=CHUNK_CONFIG, chunk_workers=0, batch_size=7)
+    artifacts = [_artifact(i) for i in range(10)]
+
+    stats = await pipeline.run("w1", artifacts)
+
+    expected = await ChunkerFactory.get_chunker(CHUNK_CONFIG).chunk(_artifact(3))
+    stored = await store.search_chunks({"artifact_id": "doc-3", "workspace_id": "w1"})
+    assert [c.content for c in sorted(stored, key=lambda c: c.chunk_metadata.chunk_index)] == \
+           [c.content for c in expected]
+    assert stats.artifacts == 10 and stats.failed_artifacts == 0
+    assert stats.chunks == sum(a.metadata["chunks"] for a in artifacts) == len(await store.search_chunks({}))
+    assert all(len(ids) == 7 for _, ids in plugin.batches[:-1])
+    assert sum(len(ids) for _, ids in plugin.batches) == stats.chunks
+    assert {collection for collection, _ in plugin.batches} == {"w1"}
+    assert stats.stages["index"].items == stats.stages["store"].items == stats.chunks
+
+
+@pytest.mark.asyncio
+async def test_pipeline_applies_backpressure_to_the_source() -> None:
+    plugin = RecordingIndexPlugin(delay=0.01)
+    pipeline = IngestionPipeline(ChunkerFactory.get_chunker(CHUNK_CONFIG), InMemoryChunkStore(), [plugin],
+                                 chunk_workers=0, batch_size=1, queue_size=1, index_concurrency=1)
+    lead = []
+
+    async def source():
+        for i in range(30):
+            lead.append(i - sum(len(ids) for _, ids in plugin.batches))
+            yield _artifact(i, paragraphs=1)
+
+    stats = await pipeline.run("w1", source())
+
+    assert stats.chunks == 30
+    # One artifact in each queue and stage at most, never the whole stream
+    assert max(lead) <= 6
+    assert stats.stages["store"].blocked_seconds > 0
+
+
+@pytest.mark.asyncio
+async def test_pipeline_chunks_in_worker_processes() -> None:
+    store = InMemoryChunkStore()
+    pipeline = IngestionPipeline(ChunkerFactory.get_chunker(CHUNK_CONFIG), store, [],
+                                 chunk_config=CHUNK_CONFIG, chunk_workers=1)
+    assert pipeline.uses_process_pool
+    try:
+        stats = await pipeline.run("w1", (_artifact(i) for i in range(4)), index=False)
+    finally:
+        shutdown_chunk_pool()
+
+    expected = await ChunkerFactory.get_chunker(CHUNK_CONFIG).chunk(_artifact(2))
+    stored = await store.search_chunks({"artifact_id": "doc-2"})
+    assert stats.failed_artifacts == 0
+    assert sorted(c.content for c in stored) == sorted(c.content for c in expected)
+    assert stats.stages["index"].items == 0
+
+
+
+def test_larger_pool_does_not_shut_down_a_pool_in_use() -> None:
+    try:
+        small = _get_process_pool(1)
+        large = _get_process_pool(2)
+        assert small is not large and _get_process_pool(1) is small
+        assert small.submit(sum, [1, 2]).result(timeout=60) == 3
+    finally:
+        shutdown_chunk_pool()
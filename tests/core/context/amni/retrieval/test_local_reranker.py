@@ -0,0 +1,72 @@
+import pytest
+
+from aworld.core.context.amni.retrieval.reranker.factory import RerankConfig, RerankerFactory
+from aworld.core.context.amni.retrieval.reranker.local import LocalReranker, RerankScoreCache
+
+
+DOCUMENTS = [
+    "Install the package with pip and run the CLI.",
+    "The retriever chunks artifacts and reranks search results by relevance.",
+    "Weather today is sunny with a light breeze.",
+    "检索结果的重排序在本地完成",
+]
+
+
+@pytest.mark.asyncio
+async def test_local_reranker_orders_by_lexical_relevance() -> None:
+    reranker = LocalReranker(cache=RerankScoreCache())
+
+    results = await reranker.run("rerank search results", DOCUMENTS, top_k=2)
+
+    assert results[0].doc == DOCUMENTS[1]
+    assert 0.0 < results[0].score < 1.0
+    assert len(results) == 2
+
+
+@pytest.mark.asyncio
+async def test_local_reranker_scores_cjk_and_handles_empty_input() -> None:
+    reranker = LocalReranker(cache=RerankScoreCache())
+
+    results = await reranker.run("重排序", DOCUMENTS, top_k=None)
+
+    assert results[0].idx == 3
+    assert len(results) == len(DOCUMENTS)
+    assert await reranker.run("query", []) is None
+
+
+def test_local_reranker_caches_document_statistics() -> None:
+    cache = RerankScoreCache()
+    reranker = LocalReranker(cache=cache)
+
+    reranker.rerank("pip install", DOCUMENTS)
+    reranker.rerank("sunny weather", DOCUMENTS)
+
+    assert (cache.hits, cache.misses) == (len(DOCUMENTS), len(DOCUMENTS))
+
+
+def test_model_scores_are_cached_per_query_and_document() -> None:
+    class FakeEncoder:
+        def __init__(self):
+            self.calls = []
+
+        def score(self, query, documents):
+            self.calls.append(list(documents))
+            return [0.5] * len(documents)
+
+    encoder = FakeEncoder()
+    reranker = LocalReranker(RerankConfig(provider="local", config={"model_path": "fake", "batch_size": 2}),
+                             cache=RerankScoreCache())
+    reranker._cross_encoder = lambda: encoder
+
+    reranker.rerank("retriever", DOCUMENTS)
+    reranker.rerank("retriever", DOCUMENTS + ["A new document about the retriever."])
+
+    assert [len(batch) for batch in encoder.calls] == [2, 2, 1]
+
+
+def test_default_reranker_is_local_without_service(monkeypatch) -> None:
+    monkeypatch.delenv("RERANKER_PROVIDER", raising=False)
+    monkeypatch.delenv("RERANKER_BASE_URL", raising=False)
+
+    assert isinstance(RerankerFactory.get_default_reranker(), LocalReranker)
+    assert isinstance(RerankerFactory.get_reranker(RerankConfig(provider="local")), LocalReranker)
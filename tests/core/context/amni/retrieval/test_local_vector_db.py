@@ -0,0 +1,21 @@
+from aworld.core.context.amni.retrieval.embeddings import EmbeddingsMetadata, EmbeddingsResult
+from aworld.core.context.amni.retrieval.vector import VectorDBConfig, VectorDBFactory
+
+
+def test_local_vector_db_searches_chunks_by_artifact() -> None:
+    db = VectorDBFactory.get_vector_db(VectorDBConfig(provider="local"))
+    db.upsert("workspace", [
+        EmbeddingsResult(id="a-0", embedding=[1.0, 0.0, 0.0], content="alpha",
+                         metadata=EmbeddingsMetadata(artifact_id="a", chunk_index=0)),
+        EmbeddingsResult(id="a-1", embedding=[0.9, 0.1, 0.0], content="alpha 2",
+                         metadata=EmbeddingsMetadata(artifact_id="a", chunk_index=1)),
+        EmbeddingsResult(id="b-0", embedding=[1.0, 0.0, 0.1], content="beta",
+                         metadata=EmbeddingsMetadata(artifact_id="b", chunk_index=0)),
+    ])
+
+    results = db.search("workspace", [[1.0, 0.0, 0.0]], {"artifact_id": "a"}, threshold=0.5, limit=5)
+
+    assert [doc.id for doc in results.docs] == ["a-0", "a-1"]
+    assert results.docs[0].score == 1.0
+    assert [doc.id for doc in db.query("workspace", {"chunk_index": 0}).docs] == ["a-0", "b-0"]
+    assert db.search("missing", [[1.0, 0.0, 0.0]], {}, threshold=0.0, limit=5) is None
@@ -2,7 +2,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from aworld.core.context.amni.services.knowledge_service import KnowledgeService
+from aworld.core.context.amni.services.knowledge_service import IKnowledgeService, KnowledgeService
 from aworld.output import Artifact, ArtifactType
 
 
@@ -110,3 +110,85 @@ async def test_get_actions_info_guides_agents_to_supported_knowledge_tools():
     assert "grep_knowledge(knowledge_id, pattern)" in actions_info
     assert "get_knowledge_by_lines(knowledge_id, start_line, end_line)" in actions_info
     assert "get_knowledge(knowledge_id_xxx)" not in actions_info
+
+
+class _VersionedWorkspace:
+    def __init__(self, content: str) -> None:
+        self.workspace_id = "workspace-lines"
+        self.content = content
+        self.version = "v1"
+        self.loads = 0
+        self.repository = self
+
+    def get_artifact_versions(self, artifact_id):
+        return [{"id": self.version}]
+
+    def get_latest_artifact(self, artifact_id):
+        self.loads += 1
+        return Artifact(artifact_id=artifact_id, artifact_type=ArtifactType.TEXT, content=self.content)
+
+
+def _service_for(workspace) -> KnowledgeService:
+    context = _FakeContext()
+
+    async def _ensure_workspace():
+        return workspace
+
+    context._ensure_workspace = _ensure_workspace
+    return KnowledgeService(context)
+
+
+@pytest.mark.asyncio
+async def test_get_knowledge_by_lines_reuses_line_index_until_version_changes():
+    from aworld.core.context.amni.services.knowledge_index import knowledge_line_indexes
+
+    knowledge_line_indexes.clear()
+    workspace = _VersionedWorkspace("\n".join(f"line {i}" for i in range(1, 101)))
+    service = _service_for(workspace)
+
+    first = await service.get_knowledge_by_lines("doc-1", 10, 12)
+    second = await service.get_knowledge_by_lines("doc-1", 99, 150)
+
+    assert first == "Lines 10-12 of 100 (knowledge_id: doc-1):\n\nline 10\nline 11\nline 12"
+    assert second.endswith("line 99\nline 100")
+    assert workspace.loads == 1
+
+    workspace.content, workspace.version = "changed\ncontent", "v2"
+    third = await service.get_knowledge_by_lines("doc-1", 1, 2)
+
+    assert third == "Lines 1-2 of 2 (knowledge_id: doc-1):\n\nchanged\ncontent"
+    assert workspace.loads == 2
+
+
+@pytest.mark.asyncio
+async def test_grep_knowledge_stops_at_max_results_with_context():
+    from aworld.core.context.amni.services.knowledge_index import knowledge_line_indexes
+
+    knowledge_line_indexes.clear()
+    workspace = _VersionedWorkspace("alpha\nmatch one\nbeta\nmatch two\ngamma\nmatch three\n")
+    service = _service_for(workspace)
+
+    result = await service.grep_knowledge("doc-2", "match", context_before=1, max_results=2)
+
+    assert result.startswith("Found 2 match(es) for pattern 'match' in knowledge#doc-2 (7 total lines)")
+    assert "1- alpha\n2: **match** one\n3- beta\n4: **match** two" in result
+    assert "three" not in result.split("\n\n⚠️")[0]
+
+
+def test_line_index_matches_str_split():
+    from aworld.core.context.amni.services.knowledge_index import LineIndex
+
+    for text in ["", "one", "one\n", "\n\nthree\n", "a\nbb\n\nccc"]:
+        lines = text.split("\n")
+        index = LineIndex(text)
+        assert index.line_count == len(lines)
+        assert [line for _, line in index.iter_lines()] == lines
+        assert index.lines(1, len(lines)) == text
+        if len(lines) >= 2:
+            assert index.lines(2, 2) == lines[1]
+
+
+def test_knowledge_service_interface_keeps_grep_abstract():
+    assert "grep_knowledge" in IKnowledgeService.__abstractmethods__
+    assert not hasattr(IKnowledgeService, "_get_line_index")
+    assert not hasattr(IKnowledgeService, "_head_version")
@@ -133,3 +133,103 @@ async def test_system_prompt_augment_op_uses_injected_prompt_assembly_provider()
         {"role": "system", "content": "memory chunk"},
     ]
     assert command.item.content == "assembled rules\n\nassembled memory"
+
+
+@pytest.mark.asyncio
+async def test_system_prompt_augment_op_serves_unchanged_neurons_from_render_cache() -> None:
+    from aworld.core.context.amni.prompt.neurons import Neuron
+    from aworld.core.context.amni.prompt.neurons.render_cache import NeuronRenderCache
+
+    class CountingNeuron(Neuron):
+        name = "counting"
+
+        def __init__(self) -> None:
+            self.version = 1
+            self.renders = 0
+
+        async def state_version(self, context, namespace=None, **kwargs):
+            return self.version
+
+        async def format_items(self, context, namespace=None, **kwargs):
+            self.renders += 1
+            return [f"item-v{self.version}"]
+
+        async def format(self, context, items=None, namespace=None, **kwargs):
+            return "\n".join(items)
+
+    class UnversionedNeuron(CountingNeuron):
+        name = "unversioned"
+
+        async def state_version(self, context, namespace=None, **kwargs):
+            return None
+
+    op = SystemPromptAugmentOp()
+    op._render_cache = NeuronRenderCache()
+    context = SimpleNamespace(task_input="hello")
+    neuron, unversioned = CountingNeuron(), UnversionedNeuron()
+
+    assert await op._render_neuron(neuron, context, namespace="agent") == "item-v1"
+    assert await op._render_neuron(neuron, context, namespace="agent") == "item-v1"
+    assert neuron.renders == 1
+
+    neuron.version = 2
+    assert await op._render_neuron(neuron, context, namespace="agent") == "item-v2"
+    assert neuron.renders == 2
+
+    await op._render_neuron(unversioned, context, namespace="agent")
+    await op._render_neuron(unversioned, context, namespace="agent")
+    assert unversioned.renders == 2
+    assert (op._render_cache.hits, op._render_cache.misses) == (1, 2)
+
+
+def test_neuron_render_cache_binds_reranked_renderings_to_their_query() -> None:
+    from aworld.core.context.amni.prompt.neurons.render_cache import NeuronRenderCache
+
+    cache = NeuronRenderCache(max_entries=2)
+    cache.put("history", None, ("m1",), "reranked", query="first question")
+    cache.put("skills", None, ("s1",), "skills prompt")
+
+    assert cache.get("history", None, ("m1",), "first question") == "reranked"
+    assert cache.get("history", None, ("m1",), "second question") is None
+    assert cache.get("skills", None, ("s1",), "any question") == "skills prompt"
+
+    cache.put("workspace", None, ("w1",), "workspace prompt")
+    assert cache.get("history", None, ("m1",), "first question") is None
+
+
+@pytest.mark.asyncio
+async def test_system_prompt_augment_op_does_not_cache_a_failed_rerank(monkeypatch: pytest.MonkeyPatch) -> None:
+    from aworld.core.context.amni.prompt.neurons import Neuron
+    from aworld.core.context.amni.prompt.neurons.render_cache import NeuronRenderCache
+
+    class LongNeuron(Neuron):
+        name = "long_history"
+
+        async def state_version(self, context, namespace=None, **kwargs):
+            return 1
+
+        async def format_items(self, context, namespace=None, **kwargs):
+            return ["x" * 30000, "y" * 30000]
+
+        async def format(self, context, items=None, namespace=None, **kwargs):
+            return "|".join(item[0] for item in items)
+
+    reranker_results = [None, [SimpleNamespace(idx=1, score=0.9)]]
+
+    class FlakyReranker:
+        async def run(self, query, documents):
+            return reranker_results.pop(0)
+
+    monkeypatch.setattr(
+        "aworld.core.context.amni.processor.op.system_prompt_augment_op.RerankerFactory.get_default_reranker",
+        lambda: FlakyReranker(),
+    )
+    op = SystemPromptAugmentOp()
+    op._render_cache = NeuronRenderCache()
+    context = SimpleNamespace(task_input="hello")
+    neuron = LongNeuron()
+
+    assert await op._render_neuron(neuron, context, namespace="agent") == ""
+    assert await op._render_neuron(neuron, context, namespace="agent") == "y"
+    assert await op._render_neuron(neuron, context, namespace="agent") == "y"
+    assert op._render_cache.hits == 1
@@ -0,0 +1,129 @@
+import json
+import pickle
+
+import pytest
+
+from aworld.dataset.dataloader import DataLoader
+from aworld.dataset.dataset import Dataset, create_dataset
+from aworld.dataset.lazy_records import ConcatRecords, CsvRecords, JsonlRecords
+
+
+def _write_jsonl(path, rows):
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows) + "\n", encoding="utf-8")
+
+
+def test_lazy_jsonl_matches_eager_load(tmp_path):
+    source = tmp_path / "rows.jsonl"
+    _write_jsonl(source, [{"id": i, "text": f"row-{i}"} for i in range(50)])
+
+    eager = Dataset(name="eager", data=[])
+    eager.load_from(str(source))
+    lazy = Dataset(name="lazy", data=[])
+    lazy.load_from(str(source), lazy=True)
+
+    assert isinstance(lazy.data, JsonlRecords)
+    assert lazy.metadata["lazy"] is True
+    assert len(lazy) == len(eager) == 50
+    assert [lazy[i] for i in range(50)] == eager.data
+    assert lazy[-1] == {"id": 49, "text": "row-49"}
+    with pytest.raises(IndexError):
+        lazy[50]
+
+
+def test_lazy_csv_handles_quoted_newlines(tmp_path):
+    source = tmp_path / "rows.csv"
+    source.write_text('name,note\nalpha,"line one\nline two"\nbeta,"say ""hi"""\n', encoding="utf-8")
+
+    eager = Dataset(name="eager", data=[])
+    eager.load_from(str(source))
+    lazy = Dataset(name="lazy", data=[])
+    lazy.load_from(str(source), lazy=True)
+
+    assert isinstance(lazy.data, CsvRecords)
+    assert list(lazy.data) == eager.data
+    assert lazy[0]["note"] == "line one\nline two"
+    assert lazy.data.fieldnames == ["name", "note"]
+
+
+def test_lazy_multiple_sources_apply_limit_and_preload_transform(tmp_path):
+    first = tmp_path / "a.jsonl"
+    second = tmp_path / "b.txt"
+    _write_jsonl(first, [{"v": 1}, {"v": 2}])
+    second.write_text("x\ny\nz\n", encoding="utf-8")
+
+    ds = Dataset(name="multi", data=[])
+    ds.load_from([str(first), str(second)], lazy=True, limit=4, preload_transform=lambda item: {"item": item})
+
+    assert isinstance(ds.data, ConcatRecords)
+    assert len(ds) == 4
+    assert [ds[i] for i in range(4)] == [{"item": {"v": 1}}, {"item": {"v": 2}}, {"item": "x"}, {"item": "y"}]
+    assert ds.metadata["format"] == "multiple"
+
+
+def test_lazy_rejects_unsupported_format(tmp_path):
+    source = tmp_path / "rows.json"
+    source.write_text("[1, 2]", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Lazy loading does not support"):
+        Dataset(name="bad", data=[]).load_from(str(source), lazy=True)
+
+
+def test_lazy_records_survive_pickling(tmp_path):
+    source = tmp_path / "rows.jsonl"
+    _write_jsonl(source, [{"id": i} for i in range(3)])
+    records = JsonlRecords(source)
+    assert records[1] == {"id": 1}
+
+    restored = pickle.loads(pickle.dumps(records))
+
+    assert list(restored) == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+
+def test_lazy_parquet_reads_row_groups(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    source = tmp_path / "rows.parquet"
+    table = pa.table({"id": list(range(10)), "text": [f"t{i}" for i in range(10)]})
+    pq.write_table(table, source, row_group_size=3)
+
+    ds = Dataset(name="parquet", data=[])
+    ds.load_from(str(source), lazy=True, parquet_columns=["id"])
+
+    assert len(ds) == 10
+    assert ds[7] == {"id": 7}
+    assert [row["id"] for row in ds.data] == list(range(10))
+
+
+def test_shuffle_buffer_yields_every_item_once_and_is_deterministic():
+    ds = Dataset(name="numbers", data=list(range(100)))
+
+    def run(seed):
+        loader = DataLoader(ds, batch_size=8, shuffle=True, shuffle_buffer_size=10, seed=seed)
+        return [item for batch in loader for item in batch]
+
+    order = run(3)
+    assert sorted(order) == list(range(100))
+    assert order != list(range(100))
+    assert order == run(3)
+
+
+def test_shuffle_buffer_rejects_non_positive_size():
+    with pytest.raises(ValueError, match="shuffle_buffer_size"):
+        DataLoader([1, 2, 3], batch_size=1, shuffle=True, shuffle_buffer_size=0)
+
+
+def test_create_dataset_passes_lazy_and_shuffle_buffer(tmp_path):
+    source = tmp_path / "rows.jsonl"
+    _write_jsonl(source, [{"id": i} for i in range(6)])
+
+    ds, loader = create_dataset({
+        "name": "cfg",
+        "source": str(source),
+        "lazy": True,
+        "dataloader_config": {"batch_size": 4, "shuffle": True, "shuffle_buffer_size": 2, "seed": 1},
+    })
+
+    assert isinstance(ds.data, JsonlRecords)
+    batches = list(loader)
+    assert [len(batch) for batch in batches] == [4, 2]
+    assert sorted(row["id"] for batch in batches for row in batch) == list(range(6))
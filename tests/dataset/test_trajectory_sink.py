@@ -0,0 +1,118 @@
+import asyncio
+import gzip
+import json
+import threading
+
+import pytest
+
+from aworld.dataset.trajectory_dataset import TrajectoryDataset
+from aworld.dataset.trajectory_sink import TrajectorySink, get_sink_instance
+from aworld.dataset.types import ExpMeta, TrajectoryAction, TrajectoryItem, TrajectoryReward, TrajectoryState
+from aworld.runners.state_manager import EventRuntimeStateManager
+
+
+def _item(task_id: str, step: int) -> TrajectoryItem:
+    return TrajectoryItem(
+        id=f"{task_id}-{step}",
+        meta=ExpMeta(session_id="s1", task_id=task_id, agent_id="agent", step=step),
+        state=TrajectoryState(input=f"q{step}", messages=[{"role": "user", "content": f"q{step}"}]),
+        action=TrajectoryAction(content=f"a{step}", tool_calls=[{"id": "t", "name": "search"}]),
+        reward=TrajectoryReward(status="ok", score=step / 10),
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fmt", ["jsonl", "parquet"])
+async def test_sink_buffers_until_threshold_and_reads_tasks_back(tmp_path, fmt) -> None:
+    sink = TrajectorySink(tmp_path, format=fmt, max_buffer_items=4, flush_interval=3600)
+
+    for step in range(3):
+        await sink.append("t1", [_item("t1", step)])
+    assert sink.segment_paths() == [] and sink.buffered == 3
+
+    await sink.append("t2", [_item("t2", 0)])
+    assert len(sink.segment_paths()) == 1 and sink.buffered == 0
+
+    await sink.append("t1", [_item("t1", 3)])
+    assert [step.id for step in await sink.read_task("t1")] == ["t1-0", "t1-1", "t1-2", "t1-3"]
+    await sink.flush("t1")
+
+    reopened = TrajectorySink(tmp_path, format=fmt)
+    steps = await reopened.read_task("t1")
+    assert steps == [_item("t1", step) for step in range(4)]
+    assert [step.id for step in await reopened.read_task("t2")] == ["t2-0"]
+    assert sorted(reopened.task_ids()) == ["t1", "t2"]
+
+
+@pytest.mark.asyncio
+async def test_jsonl_segments_are_plain_gzip_with_task_index(tmp_path) -> None:
+    sink = TrajectorySink(tmp_path, max_buffer_items=100)
+    await sink.append("t1", [_item("t1", 0), _item("t1", 1)])
+    await sink.append("t2", [_item("t2", 0)])
+    await sink.flush()
+
+    with gzip.open(sink.segment_paths()[0], "rt", encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f]
+    assert [(row["task_id"], row["id"]) for row in rows] == [("t1", "t1-0"), ("t1", "t1-1"), ("t2", "t2-0")]
+    index = [json.loads(line) for line in (tmp_path / "index.jsonl").read_text().splitlines()]
+    assert [(entry["task_id"], entry["rows"]) for entry in index] == [("t1", 2), ("t2", 1)]
+    assert [row["id"] for row in sink.iter_records("t2")] == ["t2-0"]
+
+
+@pytest.mark.asyncio
+async def test_dataset_routes_steps_through_sink(tmp_path) -> None:
+    sink = TrajectorySink(tmp_path, max_buffer_items=100)
+    dataset = TrajectoryDataset(name="d", data=[], state_manager=EventRuntimeStateManager.instance(), sink=sink)
+
+    await dataset.save_task_trajectory("t1", [_item("t1", 0)])
+    await dataset.save_task_trajectory("t1", [_item("t1", 1).to_dict()])
+    assert sink.segment_paths() == []
+    assert [step.id for step in await dataset.get_task_trajectory("t1")] == ["t1-0", "t1-1"]
+
+    await dataset.flush_task_trajectory("t1")
+    assert sink.buffered == 0 and len(sink.segment_paths()) == 1
+    assert [step.id for step in await dataset.get_task_trajectory("t1")] == ["t1-0", "t1-1"]
+
+
+@pytest.mark.asyncio
+async def test_sink_flushes_after_interval_without_further_appends(tmp_path) -> None:
+    sink = TrajectorySink(tmp_path, max_buffer_items=100, flush_interval=0.05)
+
+    await sink.append("t1", [_item("t1", 0)])
+    assert sink.buffered == 1
+    await asyncio.sleep(0.3)
+
+    assert sink.buffered == 0 and len(sink.segment_paths()) == 1
+
+
+@pytest.mark.asyncio
+async def test_sinks_are_shared_per_directory_and_load_the_index_lazily(tmp_path) -> None:
+    writer = TrajectorySink(tmp_path / "traj")
+    await writer.append("t1", [_item("t1", 0)])
+    await writer.flush()
+
+    sink = get_sink_instance(str(tmp_path / "traj"))
+    assert get_sink_instance(tmp_path / "traj" / ".." / "traj") is sink
+    assert sink._index_entries is None
+    assert [step.id for step in await sink.read_task("t1")] == ["t1-0"]
+
+
+
+def test_shared_sink_keeps_every_step_when_loops_in_threads_flush_concurrently(tmp_path) -> None:
+    sink = TrajectorySink(tmp_path, max_buffer_items=5, flush_interval=3600)
+
+    async def write(task_id: str) -> None:
+        for step in range(400):
+            await sink.append(task_id, [{"id": f"{task_id}-{step}", "step": step}])
+
+    threads = [threading.Thread(target=asyncio.run, args=(write(f"t{i}"),)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    asyncio.run(sink.flush())
+
+    assert sink.buffered == 0
+    for i in range(4):
+        records = list(sink.iter_records(f"t{i}"))
+        assert sorted(record["step"] for record in records) == list(range(400))
@@ -0,0 +1,148 @@
+import asyncio
+import time
+
+import pytest
+
+from aworld.evaluations.base import (
+    EvalCriteria,
+    EvalDataCase,
+    EvalDataset,
+    EvalStatus,
+    EvalTarget,
+    Evaluator,
+    Scorer,
+    ScorerResult,
+)
+from aworld.evaluations.run_store import InMemoryEvalRunStore, JsonlEvalRunStore
+
+
+class EchoTarget(EvalTarget):
+    def __init__(self, fail_on=None):
+        super().__init__()
+        self.fail_on = fail_on
+        self.calls = []
+
+    async def predict(self, index, input):
+        self.calls.append(input.eval_case_id)
+        if input.eval_case_id == self.fail_on:
+            raise RuntimeError("target crashed")
+        return {"answer": input.case_data["value"]}
+
+
+class ValueScorer(Scorer):
+    def __init__(self, name="ValueScorer", delay=0.0):
+        super().__init__(name=name)
+        self.add_eval_criteria(EvalCriteria(metric_name=f"{name}_value", threshold=2))
+        self.delay = delay
+        self.running = 0
+        self.max_running = 0
+
+    async def score(self, index, input, output):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+        return ScorerResult(scorer_name=self.name,
+                            metric_results={f"{self.name}_value": {"value": output["answer"]}})
+
+
+def _dataset():
+    cases = [EvalDataCase(eval_case_id=f"case-{i}", eval_dataset_id="ds", case_data={"value": i})
+             for i in range(4)]
+    return EvalDataset(eval_dataset_id="ds", run_id="run-1", eval_cases=cases)
+
+
+@pytest.mark.asyncio
+async def test_evaluator_resumes_from_jsonl_ledger(tmp_path):
+    store = JsonlEvalRunStore(str(tmp_path / "ledger"))
+    crashing = EchoTarget(fail_on="case-2")
+
+    with pytest.raises(RuntimeError, match="target crashed"):
+        await Evaluator(scorers=[ValueScorer()], run_store=store).evaluate(_dataset(), crashing)
+
+    assert set(store.load("run-1")) == {0, 1}
+
+    target = EchoTarget()
+    result = await Evaluator(scorers=[ValueScorer()], run_store=store).evaluate(_dataset(), target)
+
+    assert target.calls == ["case-2", "case-3"]
+    assert [row.eval_case_id for row in result.eval_case_results] == ["case-0", "case-1", "case-2", "case-3"]
+    assert result.eval_case_results[0].input.case_data == {"value": 0}
+    restored = result.eval_case_results[1].score_rows["ValueScorer"].metric_results["ValueScorer_value"]
+    assert restored["eval_status"] == EvalStatus.FAILED
+    assert result.summary["ValueScorer"]["ValueScorer_value"]["mean"] == 1.5
+    assert set(store.load("run-1")) == {0, 1, 2, 3}
+
+
+@pytest.mark.asyncio
+async def test_evaluator_resume_disabled_reruns_every_case():
+    store = InMemoryEvalRunStore()
+    await Evaluator(scorers=[ValueScorer()], run_store=store).evaluate(_dataset(), EchoTarget())
+
+    target = EchoTarget()
+    await Evaluator(scorers=[ValueScorer()], run_store=store, resume=False).evaluate(_dataset(), target)
+
+    assert len(target.calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_parallel_scorers_bound_case_latency_by_slowest_scorer():
+    scorers = [ValueScorer(name="A", delay=0.2), ValueScorer(name="B", delay=0.2)]
+    dataset = EvalDataset(eval_dataset_id="ds", eval_cases=_dataset().eval_cases[:1])
+
+    started = time.monotonic()
+    result = await Evaluator(scorers=scorers, parallel_scorers=True).evaluate(dataset, EchoTarget())
+
+    assert time.monotonic() - started < 0.35
+    assert list(result.eval_case_results[0].score_rows) == ["A", "B"]
+
+
+@pytest.mark.asyncio
+async def test_scorer_concurrency_limits_calls_across_cases():
+    scorer = ValueScorer(name="Judge", delay=0.05)
+    evaluator = Evaluator(scorers=[scorer], parallel_num=4, scorer_concurrency={"Judge": 1})
+
+    rows = [row async for row in evaluator.evaluate_stream(_dataset(), EchoTarget())]
+
+    assert len(rows) == 4
+    assert scorer.max_running == 1
+
+
+@pytest.mark.asyncio
+async def test_evaluate_runner_resumes_by_configured_run_id(tmp_path):
+    from aworld.config.conf import EvaluationConfig
+    from aworld.runners.evaluate_runner import EvaluateRunner
+
+    dataset_path = tmp_path / "cases.jsonl"
+    dataset_path.write_text("".join(f'{{"value": {i}}}\n' for i in range(4)), encoding="utf-8")
+
+    class Runner(EvaluateRunner):
+        def get_scorers(self, eval_config):
+            return [ValueScorer()]
+
+    def config(target):
+        return EvaluationConfig(eval_target=target,
+                                eval_dataset_id_or_file_path=str(dataset_path),
+                                eval_run_store_path=str(tmp_path / "ledger"),
+                                eval_run_id="nightly")
+
+    crashing = EchoTarget()
+    crashing.predict_calls = 0
+
+    async def crash_after_two(index, input):
+        crashing.predict_calls += 1
+        if crashing.predict_calls > 2:
+            raise RuntimeError("target crashed")
+        return {"answer": input.case_data["value"]}
+
+    crashing.predict = crash_after_two
+    with pytest.raises(RuntimeError, match="target crashed"):
+        await Runner(config=config(crashing)).do_run()
+
+    target = EchoTarget()
+    result = await Runner(config=config(target)).do_run()
+
+    assert len(target.calls) == 2
+    assert sorted(row.input.case_data["value"] for row in result.eval_case_results) == [0, 1, 2, 3]
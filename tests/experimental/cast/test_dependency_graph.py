@@ -0,0 +1,68 @@
+import random
+from pathlib import Path
+
+import networkx as nx
+import pytest
+
+pytest.importorskip("tree_sitter_python")
+
+from aworld.experimental.cast import PythonParser
+from aworld.experimental.cast.ast_analyzer import DefaultASTAnalyzer
+from aworld.experimental.cast.models import CodeNode
+
+
+def _write(root: Path, rel: str, content: str) -> Path:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def test_dependency_graph_resolves_modules_and_symbols(tmp_path):
+    init = _write(tmp_path, "pkg/__init__.py", "")
+    models = _write(tmp_path, "pkg/models.py", "class Record:\n    pass\n")
+    service = _write(tmp_path, "pkg/service.py", "from pkg.models import Record\n\n\ndef run():\n    return Record()\n")
+    cli = _write(tmp_path, "cli.py", "import pkg.service\n\n\ndef main():\n    run()\n")
+    analyzer = DefaultASTAnalyzer({"python": PythonParser()}, max_workers=1)
+    code_nodes = analyzer.analyze_files([init, models, service, cli])
+
+    graph = analyzer.build_dependency_graph(code_nodes)
+
+    assert graph[service] == {models}
+    assert graph[cli] == {service}
+    assert code_nodes[models].dependents == {service}
+    assert analyzer._find_symbol_definition("run", code_nodes) == [service]
+
+
+def test_sparse_pagerank_matches_networkx():
+    rng = random.Random(7)
+    paths = [Path(f"/repo/m{i}.py") for i in range(200)]
+    code_nodes = {path: CodeNode(file_path=path) for path in paths}
+    graph = {}
+    for path in paths[:150]:
+        graph[path] = set(rng.sample(paths, 3)) - {path}
+
+    scores = DefaultASTAnalyzer({}).calculate_importance(code_nodes, graph)
+
+    g = nx.DiGraph()
+    g.add_nodes_from(str(path) for path in paths)
+    g.add_edges_from((str(s), str(t)) for s, targets in graph.items() for t in targets)
+    expected = nx.pagerank(g, alpha=0.85, max_iter=100)
+    for path in paths:
+        assert scores[path] == pytest.approx(expected[str(path)], abs=1e-6)
+
+
+def test_module_index_only_holds_repo_relative_module_paths(tmp_path):
+    files = [
+        _write(tmp_path, "src/app/__init__.py", ""),
+        _write(tmp_path, "src/app/agent.py", ""),
+        _write(tmp_path, "tools/agent.py", ""),
+        _write(tmp_path, "main.py", ""),
+    ]
+    analyzer = DefaultASTAnalyzer({})
+
+    index = analyzer._build_module_index({path: CodeNode(file_path=path) for path in files}, tmp_path)
+
+    assert set(index) == {"src.app", "app", "src.app.agent", "app.agent", "tools.agent", "main"}
+    assert analyzer._resolve_import("agent", index) == []
+    assert analyzer._resolve_import("app.agent.Agent", index) == [files[1]]
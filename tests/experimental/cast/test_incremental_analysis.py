@@ -0,0 +1,81 @@
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("tree_sitter_python")
+
+from aworld.experimental.cast import PythonParser
+from aworld.experimental.cast.ast_analyzer import DefaultASTAnalyzer
+from aworld.experimental.cast.incremental import IgnoreMatcher
+
+
+def _write_repo(root: Path, count: int = 3) -> None:
+    for i in range(count):
+        (root / f"mod_{i}.py").write_text(f"def func_{i}():\n    return {i}\n", encoding="utf-8")
+    (root / "__pycache__").mkdir()
+    (root / "__pycache__" / "mod_0.py").write_text("x = 1\n", encoding="utf-8")
+    (root / "pkg").mkdir()
+    (root / "pkg" / "util.py").write_text("def util():\n    pass\n", encoding="utf-8")
+
+
+def test_ignore_matcher_uses_gitignore_semantics():
+    matcher = IgnoreMatcher(["__pycache__", "*.pyc", "/build", "docs/_build/", "!keep.pyc"])
+
+    assert matcher.match("__pycache__", is_dir=True)
+    assert matcher.match("pkg/__pycache__/mod.py")
+    assert matcher.match("pkg/mod.pyc")
+    assert not matcher.match("pkg/keep.pyc")
+    assert matcher.match("build/out.py")
+    assert not matcher.match("src/build/out.py")
+    assert matcher.match("docs/_build", is_dir=True)
+    assert not matcher.match("docs/_build")
+    # Substring matching used to drop these.
+    assert not matcher.match("pkg/my__pycache__helpers.py")
+
+
+def test_scan_files_prunes_ignored_directories(tmp_path):
+    _write_repo(tmp_path)
+    analyzer = DefaultASTAnalyzer({"python": PythonParser()})
+
+    files = analyzer._scan_files(tmp_path, ["__pycache__"], [])
+
+    assert sorted(p.relative_to(tmp_path).as_posix() for p in files) == [
+        "mod_0.py", "mod_1.py", "mod_2.py", "pkg/util.py",
+    ]
+
+
+def test_parse_cache_only_reparses_changed_files(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _write_repo(repo)
+    files = sorted(repo.glob("*.py"))
+    parser = PythonParser()
+    analyzer = DefaultASTAnalyzer({"python": parser}, cache_dir=tmp_path / "cache", max_workers=1)
+
+    first = analyzer.analyze_files(files)
+    assert analyzer.parse_cache.misses == 3
+
+    files[1].write_text("def changed():\n    return 42\n", encoding="utf-8")
+    parsed = []
+    original = parser.parse_file
+    parser.parse_file = lambda path: parsed.append(path) or original(path)
+
+    second = DefaultASTAnalyzer({"python": parser}, cache_dir=tmp_path / "cache", max_workers=1).analyze_files(files)
+
+    assert parsed == [files[1]]
+    assert list(second) == files
+    assert [s.name for s in second[files[0]].symbols] == [s.name for s in first[files[0]].symbols]
+    assert "changed" in [s.name for s in second[files[1]].symbols]
+
+
+def test_parallel_parsing_matches_serial_results(tmp_path):
+    _write_repo(tmp_path, count=6)
+    files = sorted(tmp_path.glob("*.py"))
+
+    serial = DefaultASTAnalyzer({"python": PythonParser()}, max_workers=1).analyze_files(files)
+    parallel = DefaultASTAnalyzer({"python": PythonParser()}, max_workers=2,
+                                  parallel_threshold=2).analyze_files(files)
+
+    assert list(parallel) == list(serial)
+    for path in files:
+        assert [s.name for s in parallel[path].symbols] == [s.name for s in serial[path].symbols]
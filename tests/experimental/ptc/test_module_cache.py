@@ -0,0 +1,62 @@
+import asyncio
+
+from aworld.experimental.ptc.module_cache import PtcModuleCache, instantiate_tool_module
+
+
+def _tool(name: str, description: str = "[allow_code_execution] Read a file") -> dict:
+    return {
+        "type": "function",
+        "function": {
+            "name": f"fs__{name}",
+            "description": description,
+            "parameters": {
+                "type": "object",
+                "properties": {"path": {"type": "string", "description": "File path"}},
+                "required": ["path"],
+            },
+        },
+    }
+
+
+class FakeMcpServers:
+    def __init__(self, tag: str):
+        self.tag = tag
+        self.calls = []
+
+    async def call_tool(self, actions, context=None):
+        self.calls.append((actions[0]["action_name"], actions[0]["params"], context))
+        return [{"content": f'{{"from": "{self.tag}"}}'}]
+
+
+class FakeSandbox:
+    def __init__(self, tag: str):
+        self.mcpservers = FakeMcpServers(tag)
+
+
+def test_module_is_compiled_once_per_schema() -> None:
+    cache = PtcModuleCache()
+    tools = [_tool("read_file")]
+
+    code = cache.get_code("fs", tools)
+    assert cache.get_code("fs", [dict(t) for t in tools]) is code
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    changed = cache.get_code("fs", [_tool("read_file", "[allow_code_execution] Read a text file")])
+    assert changed is not code
+    # Other servers keep their modules when one server's schema changes
+    other = cache.get_code("web", [_tool("read_file")])
+    assert cache.get_code("fs", tools) is code and cache.get_code("web", [_tool("read_file")]) is other
+
+
+def test_cached_module_binds_sandbox_and_context_per_instance() -> None:
+    code = PtcModuleCache().get_code("fs", [_tool("read_file")])
+    first, second = FakeSandbox("first"), FakeSandbox("second")
+    first_module = instantiate_tool_module(code, first, context="ctx-1")
+    second_module = instantiate_tool_module(code, second, context="ctx-2")
+
+    async def call_both():
+        return await asyncio.gather(first_module["read_file"](path="a.txt"), second_module["read_file"](path="b.txt"))
+
+    assert asyncio.run(call_both()) == [{"from": "first"}, {"from": "second"}]
+    assert first.mcpservers.calls == [("read_file", {"path": "a.txt"}, "ctx-1")]
+    assert second.mcpservers.calls == [("read_file", {"path": "b.txt"}, "ctx-2")]
@@ -0,0 +1,101 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from aworld.experimental.ptc.module_cache import PtcModuleCache
+from aworld.experimental.ptc.worker_pool import PtcWorkerPool
+
+
+def _tool(name: str) -> dict:
+    return {
+        "type": "function",
+        "function": {
+            "name": f"fs__{name}",
+            "description": "[allow_code_execution] Read a file",
+            "parameters": {
+                "type": "object",
+                "properties": {"path": {"type": "string", "description": "File path"}},
+                "required": ["path"],
+            },
+        },
+    }
+
+
+class SlowMcpServers:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = []
+
+    async def call_tool(self, actions, context=None):
+        self.calls.append((actions[0]["params"]["path"], context))
+        await asyncio.sleep(self.delay)
+        return [{"content": f'{{"path": "{actions[0]["params"]["path"]}", "pid": {os.getpid()}}}'}]
+
+
+class FakeSandbox:
+    def __init__(self, delay: float = 0.0):
+        self.mcpservers = SlowMcpServers(delay)
+
+
+MODULES = {"fs": PtcModuleCache().get_module("fs", [_tool("read_file")])}
+
+
+@pytest.mark.asyncio
+async def test_script_tool_calls_run_concurrently_through_parent() -> None:
+    pool = PtcWorkerPool(size=1, timeout=30)
+    sandbox = FakeSandbox(delay=0.3)
+    code = (
+        "import asyncio, os\n"
+        "files = await asyncio.gather(*(read_file(path=f'{i}.txt') for i in range(5)))\n"
+        "print('worker', os.getpid())\n"
+        "result = {'paths': [f['path'] for f in files], 'tool_pid': files[0]['pid'], 'pid': os.getpid()}\n"
+    )
+    try:
+        start = time.monotonic()
+        result, output = await pool.execute(code, sandbox, "ctx", MODULES)
+        elapsed = time.monotonic() - start
+    finally:
+        await pool.aclose()
+
+    assert result["paths"] == [f"{i}.txt" for i in range(5)]
+    # Tools ran in this process, the script in the worker
+    assert result["tool_pid"] == os.getpid() and result["pid"] != os.getpid()
+    assert f"worker {result['pid']}" in output
+    assert sorted(sandbox.mcpservers.calls) == [(f"{i}.txt", "ctx") for i in range(5)]
+    assert elapsed < 1.2
+
+
+@pytest.mark.asyncio
+async def test_worker_is_reused_and_replaced_after_timeout() -> None:
+    pool = PtcWorkerPool(size=1, timeout=1)
+    try:
+        first, _ = await pool.execute("import os\nresult = os.getpid()", FakeSandbox(), None, MODULES)
+        second, _ = await pool.execute("import os\nresult = os.getpid()", FakeSandbox(), None, MODULES)
+        assert first == second and pool.started == 1
+
+        result, error = await pool.execute("while True:\n    pass", FakeSandbox(), None, MODULES)
+        assert result is None and "timed out" in error
+
+        third, _ = await pool.execute("import os\nresult = os.getpid()", FakeSandbox(), None, MODULES)
+        assert third != first and pool.started == 2
+    finally:
+        await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_script_errors_and_cpu_limit_are_reported() -> None:
+    pool = PtcWorkerPool(size=1, timeout=30, cpu_seconds=1)
+    try:
+        result, error = await pool.execute("raise ValueError('boom')", FakeSandbox(), None, MODULES)
+        assert result is None and "Execution error: boom" in error
+        assert pool.started == 1
+
+        result, error = await pool.execute("while True:\n    pass", FakeSandbox(), None, MODULES)
+        assert result is None and "CPU time limit" in error
+
+        result, _ = await pool.execute("result = 'ok'", FakeSandbox(), None, MODULES)
+        assert result == "ok" and pool.started == 2
+    finally:
+        await pool.aclose()
@@ -291,8 +291,9 @@ def test_serve_gateway_bootstraps_runtime_http_app_and_uvicorn(
             calls["agent_resolver_default_agent_id"] = default_agent_id
 
     class FakeAgentBackend:
-        def __init__(self) -> None:
+        def __init__(self, **kwargs) -> None:
             calls["agent_backend_created"] = True
+            calls["agent_backend_kwargs"] = kwargs
 
     class FakeRouter:
         def __init__(self, *, session_binding, agent_resolver, agent_backend):
@@ -302,6 +303,9 @@ def test_serve_gateway_bootstraps_runtime_http_app_and_uvicorn(
                 "agent_backend": agent_backend,
             }
 
+        async def close(self) -> None:
+            calls["router_closed"] = True
+
     class FakeRegistry:
         def __init__(self) -> None:
             calls["registry_created"] = calls.get("registry_created", 0) + 1
@@ -390,6 +394,13 @@ def test_serve_gateway_bootstraps_runtime_http_app_and_uvicorn(
     }
     assert calls["loader_base_dir"] == tmp_path
     assert calls["agent_resolver_default_agent_id"] == "aworld"
+    assert calls["agent_backend_kwargs"] == {
+        "pool_size": 0,
+        "pool_idle_seconds": 300.0,
+        "session_cache_size": 1024,
+        "session_idle_seconds": 3600.0,
+        "session_lock_stripes": 64,
+    }
     assert calls["runtime_started"] is True
     expected_workspace_path = (
         tmp_path / ".aworld" / "gateway" / "dingding"
@@ -413,6 +424,7 @@ def test_serve_gateway_bootstraps_runtime_http_app_and_uvicorn(
     assert calls["uvicorn_config"]["port"] == 18999
     assert calls["uvicorn_serve_called"] is True
     assert calls["runtime_stopped"] is True
+    assert calls["router_closed"] is True
 
 
 def test_serve_gateway_skips_artifact_service_when_dingding_disabled_and_workspace_is_invalid(
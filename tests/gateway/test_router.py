@@ -12,6 +12,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
 from aworld_gateway.agent_resolver import AgentResolver
 from aworld_gateway import router as router_module
+from aworld_gateway.agent_pool import PooledAgent, WarmAgentPool
 from aworld_gateway.router import GatewayRouter, LocalCliAgentBackend
 from aworld_gateway.session_binding import SessionBinding
 from aworld_gateway.types import InboundEnvelope
@@ -458,6 +459,163 @@ def test_local_cli_backend_cleans_up_executor_when_chat_raises():
     assert _FailingExecutor.instances[0].cleanup_called is True
 
 
+def test_local_cli_backend_pool_reuses_swarm_and_executor_across_sessions():
+    class CountingAgent(_SimpleAgent):
+        swarm_calls = 0
+
+        async def get_swarm(self, context):
+            type(self).swarm_calls += 1
+            return "swarm"
+
+    class CountingRegistry:
+        agent = CountingAgent()
+
+        @classmethod
+        def get_agent(cls, agent_id: str):
+            return cls.agent
+
+    class SessionExecutor(_SuccessExecutor):
+        instances = []
+
+        def __init__(self, **kwargs) -> None:
+            super().__init__(**kwargs)
+            self.session_id = kwargs["session_id"]
+            self.seen_sessions = []
+
+        async def chat(self, text: str) -> str:
+            self.seen_sessions.append(self.session_id)
+            return f"ok:{text}"
+
+    backend = LocalCliAgentBackend(
+        registry_cls=CountingRegistry,
+        executor_cls=SessionExecutor,
+        pool_size=2,
+    )
+
+    async def scenario():
+        first = await backend.run(agent_id="aworld", session_id="s1", text="a")
+        second = await backend.run(agent_id="aworld", session_id="s2", text="b")
+        return first, second
+
+    assert asyncio.run(scenario()) == ("ok:a", "ok:b")
+    assert CountingAgent.swarm_calls == 1
+    assert len(SessionExecutor.instances) == 1
+    assert SessionExecutor.instances[0].seen_sessions == ["s1", "s2"]
+    assert SessionExecutor.instances[0].cleanup_called is True
+    assert backend._agent_pool.stats["hits"] == 1
+
+
+def test_local_cli_backend_pool_discards_executor_after_failed_run():
+    _FailingExecutor.instances = []
+    backend = LocalCliAgentBackend(
+        registry_cls=_SimpleRegistry,
+        executor_cls=_FailingExecutor,
+        pool_size=2,
+    )
+
+    async def scenario():
+        for session_id in ("s1", "s2"):
+            with pytest.raises(RuntimeError, match="chat failed"):
+                await backend.run(agent_id="aworld", session_id=session_id, text="boom")
+
+    asyncio.run(scenario())
+
+    assert len(_FailingExecutor.instances) == 2
+    assert backend._agent_pool.idle_count("aworld") == 0
+
+
+def test_warm_agent_pool_evicts_idle_instances():
+    pool = WarmAgentPool(max_idle_per_agent=1, idle_ttl_seconds=0.0)
+
+    async def build():
+        return PooledAgent(swarm="swarm", executor=object())
+
+    async def scenario():
+        entry = await pool.acquire("aworld", build)
+        await pool.release("aworld", entry)
+        assert pool.idle_count("aworld") == 1
+        await asyncio.sleep(0.01)
+        return entry, await pool.acquire("aworld", build)
+
+    first, second = asyncio.run(scenario())
+
+    assert first is not second
+    assert pool.stats == {"hits": 0, "misses": 2, "evictions": 1}
+
+
+def test_local_cli_backend_pool_resets_swarm_and_agents_between_sessions():
+    class FakeAgent:
+        def __init__(self) -> None:
+            self.task = "task of s1"
+            self.trajectory = ["s1 step"]
+
+        def reset(self) -> None:
+            self.trajectory = []
+
+    class FakeSwarm:
+        def __init__(self) -> None:
+            self.agent = FakeAgent()
+            self.agent_graph = SimpleNamespace(agents={"a": self.agent})
+            self.initialized = True
+            self.task = "task of s1"
+            self.cur_step = 3
+
+    swarm = FakeSwarm()
+
+    class SwarmAgent(_SimpleAgent):
+        async def get_swarm(self, context):
+            return swarm
+
+    class SwarmRegistry:
+        @classmethod
+        def get_agent(cls, agent_id: str):
+            return SwarmAgent()
+
+    class StatefulExecutor(_SuccessExecutor):
+        instances = []
+
+        async def chat(self, text: str) -> str:
+            self.context = f"context of {text}"
+            self.last_task_response = f"response to {text}"
+            return f"ok:{text}"
+
+    backend = LocalCliAgentBackend(
+        registry_cls=SwarmRegistry,
+        executor_cls=StatefulExecutor,
+        pool_size=1,
+    )
+
+    async def scenario():
+        result = await backend.run(agent_id="aworld", session_id="s1", text="a")
+        await backend.close()
+        return result
+
+    assert asyncio.run(scenario()) == "ok:a"
+    executor = StatefulExecutor.instances[0]
+    assert executor.context is None and executor.last_task_response is None
+    assert swarm.initialized is False and swarm.task is None and swarm.cur_step == 1
+    assert swarm.agent.task is None and swarm.agent.trajectory == []
+    assert backend._agent_pool.idle_count("aworld") == 0
+
+
+def test_gateway_router_close_closes_agent_backend():
+    closed = []
+
+    class ClosableBackend:
+        async def close(self) -> None:
+            closed.append(True)
+
+    router = GatewayRouter(
+        session_binding=SessionBinding(),
+        agent_resolver=AgentResolver(default_agent_id="aworld"),
+        agent_backend=ClosableBackend(),
+    )
+
+    asyncio.run(router.close())
+
+    assert closed == [True]
+
+
 def test_local_cli_backend_queues_same_session_input_as_steering():
     first_started = asyncio.Event()
     release_first = asyncio.Event()
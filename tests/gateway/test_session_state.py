@@ -0,0 +1,112 @@
+import asyncio
+
+from aworld_gateway.router import LocalCliAgentBackend
+from aworld_gateway.session_state import SessionRuntimeCache, StripedSessionLocks
+
+
+def test_runtime_cache_evicts_least_recently_used_and_calls_hooks():
+    evicted = []
+    cache = SessionRuntimeCache(lambda session_id: {"session": session_id}, max_entries=2, ttl_seconds=None)
+    cache.add_eviction_hook(lambda session_id, runtime: evicted.append((session_id, runtime)))
+
+    cache.get("a")
+    cache.get("b")
+    cache.get("a")
+    cache.get("c")
+
+    assert "b" not in cache
+    assert len(cache) == 2
+    assert evicted == [("b", {"session": "b"})]
+    assert cache.stats == {"hits": 1, "misses": 3, "evictions": 1}
+
+
+def test_runtime_cache_expires_idle_entries_but_keeps_pinned_sessions():
+    pinned = {"busy"}
+    cache = SessionRuntimeCache(lambda session_id: object(), max_entries=10, ttl_seconds=0.0, is_pinned=pinned.__contains__)
+
+    cache.get("busy")
+    cache.get("idle")
+    cache.evict(now=10**9)
+
+    assert "busy" in cache
+    assert "idle" not in cache
+
+
+def test_runtime_cache_awaits_async_eviction_hooks():
+    persisted = []
+
+    async def persist(session_id, runtime):
+        await asyncio.sleep(0)
+        persisted.append(session_id)
+
+    async def scenario():
+        cache = SessionRuntimeCache(lambda session_id: object(), max_entries=1, ttl_seconds=None)
+        cache.add_eviction_hook(persist)
+        cache.get("a")
+        cache.get("b")
+        await cache.drain()
+
+    asyncio.run(scenario())
+
+    assert persisted == ["a"]
+
+
+def test_striped_locks_do_not_serialize_sessions_on_other_stripes():
+    locks = StripedSessionLocks(stripes=64)
+    first = "session-0"
+    other = next(f"session-{i}" for i in range(1, 1000) if locks.lock_for(f"session-{i}") is not locks.lock_for(first))
+
+    async def scenario():
+        async with locks.hold(first):
+            await asyncio.wait_for(_enter(locks, other), timeout=0.5)
+
+    asyncio.run(scenario())
+
+    assert locks.stats.acquisitions == 2
+    assert locks.stats.contended == 0
+
+
+async def _enter(locks, session_id):
+    async with locks.hold(session_id):
+        return None
+
+
+def test_local_cli_backend_bounds_session_runtimes():
+    class Agent:
+        context_config = None
+        hooks = None
+
+        async def get_swarm(self, context):
+            return "swarm"
+
+    class Registry:
+        @staticmethod
+        def get_agent(agent_id):
+            return Agent()
+
+    class Executor:
+        def __init__(self, **kwargs):
+            pass
+
+        async def chat(self, text):
+            return text
+
+    evicted = []
+    backend = LocalCliAgentBackend(
+        registry_cls=Registry,
+        executor_cls=Executor,
+        session_cache_size=2,
+        on_session_evicted=lambda session_id, runtime: evicted.append(session_id),
+    )
+
+    async def scenario():
+        for session_id in ("s1", "s2", "s3"):
+            await backend.run(agent_id="aworld", session_id=session_id, text="hi")
+
+    asyncio.run(scenario())
+
+    metrics = backend.session_state_metrics()
+    assert evicted == ["s1"]
+    assert metrics["runtime_cache"]["size"] == 2
+    assert metrics["lock_wait"]["acquisitions"] == 6
+    assert metrics["active_runs"] == 0
@@ -57,3 +57,109 @@ def test_log_llm_record_includes_request_linked_cache_observability(monkeypatch)
     assert "provider_request_id=req_provider_123" in fake_logger.bound["meta"]
     assert "cache_hit_tokens=80" in fake_logger.bound["meta"]
     assert "cache_write_tokens=20" in fake_logger.bound["meta"]
+
+
+def test_log_llm_record_samples_by_request_and_caps_payload(monkeypatch):
+    from aworld.logs import util
+
+    fake_logger = _FakeLogger()
+
+    class _Recorder:
+        def __init__(self, logger):
+            self._logger = logger
+
+    monkeypatch.setattr("aworld.logs.util.llm_logger", _Recorder(fake_logger))
+    monkeypatch.setattr(util.llm_log_settings, "sample_rates", {"CHUNK": 0.0, "INPUT": 0.5})
+    monkeypatch.setattr(util.llm_log_settings, "max_payload_chars", 40)
+
+    log_llm_record("CHUNK", "gpt-4.1", {"content": "x"}, {"request_id": "r1"}, trace_id="t")
+    assert fake_logger.bound == {}
+
+    kept = [rid for rid in (f"req-{i}" for i in range(200))
+            if util.llm_log_settings.sampled("INPUT", rid)]
+    assert 50 < len(kept) < 150
+    assert all(util.llm_log_settings.sampled("INPUT", rid) for rid in kept)
+
+    log_llm_record("INPUT", "gpt-4.1", [{"role": "user", "content": "y" * 500}],
+                   {"request_id": kept[0]}, trace_id="t")
+    assert fake_logger.bound["truncated"] is True
+
+
+def test_sampling_keeps_or_drops_all_directions_of_a_request_together(monkeypatch):
+    from aworld.logs import util
+
+    monkeypatch.setattr(util.llm_log_settings, "sample_rates", {"INPUT": 0.5, "OUTPUT": 0.5, "CHUNK": 0.2})
+
+    request_ids = [f"req-{i}" for i in range(200)]
+    for rid in request_ids:
+        assert util.llm_log_settings.sampled("INPUT", rid) == util.llm_log_settings.sampled("OUTPUT", rid)
+    chunk_kept = {rid for rid in request_ids if util.llm_log_settings.sampled("CHUNK", rid)}
+    assert chunk_kept
+    assert all(util.llm_log_settings.sampled("INPUT", rid) for rid in chunk_kept)
+
+
+def test_async_writer_writes_lazy_messages_off_the_caller_thread():
+    import threading
+
+    from aworld.logs.util import AsyncLogWriter, LazyMessage
+
+    writer = AsyncLogWriter()
+    written = []
+
+    def sink(message):
+        written.append((message, threading.current_thread().name))
+
+    writer.submit(sink, LazyMessage(lambda: "built later"))
+    writer.flush()
+
+    assert written == [("built later", "aworld-log-writer")]
+
+
+def test_lazy_messages_are_rendered_with_and_without_monkey_patching(monkeypatch):
+    from aworld.logs.util import AWorldLogger, LazyMessage, logger
+
+    written = []
+
+    class _RecordingLogger:
+        def patch(self, patch):
+            return self
+
+        def info(self, message):
+            written.append(message)
+
+        def log(self, level, message):
+            written.append(message)
+
+    monkeypatch.setattr(logger, "_logger", _RecordingLogger())
+    # Monkey-patched loggers (AWORLD_LOG_ENDABLE_MONKEY=true) and the plain AWorldLogger methods
+    logger.info(LazyMessage(lambda: "monkey"))
+    AWorldLogger.__getattr__(logger, "info")(LazyMessage(lambda: "plain"))
+
+    assert all(isinstance(message, str) for message in written)
+    assert written[-1] == "plain"
+    assert "monkey" in written[0]
+
+
+def test_monkey_patched_logger_defers_lazy_messages_and_formats_callables_eagerly(monkeypatch):
+    from aworld.logs import util
+    from aworld.logs.util import LazyMessage, logger
+
+    submitted = []
+
+    class _Writer:
+        def submit(self, fn, *args, **kwargs):
+            submitted.extend(args)
+
+    monkeypatch.setattr(util, "_async_writer", _Writer())
+    builds = []
+    logger.info(LazyMessage(lambda: builds.append(1) or "deferred"))
+
+    def not_a_message():
+        raise AssertionError("plain callables must not be called")
+
+    logger.info(not_a_message)
+
+    assert builds == []
+    assert isinstance(submitted[0], LazyMessage)
+    assert "deferred" in str(submitted[0])
+    assert isinstance(submitted[1], str) and "not_a_message" in submitted[1]
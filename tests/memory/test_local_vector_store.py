@@ -0,0 +1,167 @@
+import os
+
+import numpy as np
+import pytest
+
+from aworld.core.memory import VectorDBConfig
+from aworld.memory.embeddings.base import EmbeddingsMetadata, EmbeddingsResult
+from aworld.memory.vector.factory import VectorDBFactory
+from aworld.memory.vector.local_store import LocalVectorCollection
+
+
+def _vectors(count: int, dim: int = 16, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).normal(size=(count, dim)).astype(np.float32)
+
+
+def _fill(collection: LocalVectorCollection, vectors: np.ndarray) -> None:
+    collection.upsert(
+        ids=[f"id-{i}" for i in range(len(vectors))],
+        vectors=vectors,
+        contents=[f"doc {i}" for i in range(len(vectors))],
+        metadatas=[{"parity": "even" if i % 2 == 0 else "odd", "bucket": i % 3} for i in range(len(vectors))],
+    )
+
+
+def test_exact_search_filters_and_survives_reopen(tmp_path) -> None:
+    vectors = _vectors(50)
+    collection = LocalVectorCollection(tmp_path / "c", segment_size=8)
+    _fill(collection, vectors)
+
+    hits = collection.search([vectors[7]], limit=3)[0]
+    assert hits[0][0] == "id-7"
+    assert abs(hits[0][3] - 1.0) < 1e-5
+
+    filtered = collection.search([vectors[7]], limit=50, filter={"parity": "even", "bucket": 1})[0]
+    assert {hit[0] for hit in filtered} == {f"id-{i}" for i in range(50) if i % 2 == 0 and i % 3 == 1}
+
+    reopened = LocalVectorCollection(tmp_path / "c")
+    assert reopened.size == 50
+    assert reopened.search([vectors[7]], limit=1)[0][0][:3] == ("id-7", "doc 7", {"parity": "odd", "bucket": 1})
+
+
+def test_upsert_and_delete_use_tombstones_then_compact(tmp_path) -> None:
+    vectors = _vectors(40)
+    collection = LocalVectorCollection(tmp_path / "c", segment_size=8)
+    _fill(collection, vectors)
+
+    collection.upsert(["id-0"], [vectors[1]], ["replaced"], [{"parity": "odd"}])
+    assert collection.size == 40
+    assert [hit[0] for hit in collection.search([vectors[1]], limit=2)[0]] in (["id-1", "id-0"], ["id-0", "id-1"])
+
+    assert collection.delete(filter={"parity": "even"}) == 19
+    assert collection.delete(ids=["id-1", "missing"]) == 1
+    assert collection.size == 20
+    assert all(hit[0] != "id-1" for hit in collection.search([vectors[1]], limit=40)[0])
+
+    reopened = LocalVectorCollection(tmp_path / "c")
+    assert reopened.size == 20
+    reopened.compact()
+    assert len(reopened._ids) == 20
+    assert sorted(r[0] for r in LocalVectorCollection(tmp_path / "c").query()) == sorted(r[0] for r in reopened.query())
+
+
+def test_torn_log_tail_is_dropped(tmp_path) -> None:
+    collection = LocalVectorCollection(tmp_path / "c", segment_size=8)
+    _fill(collection, _vectors(5))
+    with open(tmp_path / "c" / "rows.jsonl", "a", encoding="utf-8") as handle:
+        handle.write('{"op": "add", "id": "torn"')
+
+    reopened = LocalVectorCollection(tmp_path / "c")
+    reopened.upsert(["after"], _vectors(1, seed=1), ["after"], [{}])
+
+    assert sorted(r[0] for r in LocalVectorCollection(tmp_path / "c").query()) == sorted(
+        [f"id-{i}" for i in range(5)] + ["after"])
+
+
+def test_interrupted_compaction_is_recovered_on_open(tmp_path, monkeypatch) -> None:
+    collection = LocalVectorCollection(tmp_path / "c", segment_size=8)
+    _fill(collection, _vectors(10))
+    collection.delete(ids=["id-0"])
+    real_replace = os.replace
+
+    def crash_after_retiring(src, dst):
+        real_replace(src, dst)
+        if str(dst).endswith(".old"):
+            raise OSError("crash between renames")
+
+    monkeypatch.setattr(os, "replace", crash_after_retiring)
+    with pytest.raises(OSError):
+        collection.compact()
+    monkeypatch.undo()
+    assert not (tmp_path / "c").exists()
+
+    reopened = LocalVectorCollection(tmp_path / "c")
+    assert sorted(r[0] for r in reopened.query()) == [f"id-{i}" for i in range(1, 10)]
+    assert len(reopened._ids) == 9
+    assert not (tmp_path / "c.old").exists() and not (tmp_path / "c.compact").exists()
+
+
+def test_ivf_search_matches_exact_neighbours() -> None:
+    centers = _vectors(20, dim=32, seed=1) * 10
+    rng = np.random.default_rng(2)
+    vectors = np.concatenate([center + rng.normal(size=(50, 32)) for center in centers]).astype(np.float32)
+    exact = LocalVectorCollection(None)
+    ivf = LocalVectorCollection(None, dtype="float16", index="ivf", nlist=20, nprobe=3, ivf_min_rows=100)
+    _fill(exact, vectors)
+    _fill(ivf, vectors)
+
+    queries = vectors[::97]
+    recall = np.mean([
+        len({h[0] for h in a} & {h[0] for h in b}) / 10
+        for a, b in zip(exact.search(queries, limit=10), ivf.search(queries, limit=10))
+    ])
+
+    assert ivf._ivf.centroids is not None
+    assert recall >= 0.9
+
+
+def test_factory_builds_local_memory_vector_db(tmp_path) -> None:
+    db = VectorDBFactory.get_vector_db(
+        VectorDBConfig(provider="local", config={"local_data_path": str(tmp_path)}))
+    vectors = _vectors(3)
+    db.insert("memories", [
+        EmbeddingsResult(id=f"m{i}", embedding=vectors[i].tolist(), content=f"memory {i}",
+                         metadata=EmbeddingsMetadata(memory_id=f"m{i}", memory_type="message",
+                                                     embedding_model="test", user_id="u1" if i else None))
+        for i in range(3)
+    ])
+
+    results = db.search("memories", [vectors[2].tolist()], {"memory_type": "message", "user_id": "u1"}, 0.0, 5)
+
+    assert [doc.metadata.memory_id for doc in results.docs][0] == "m2"
+    assert {doc.id for doc in results.docs} == {"m1", "m2"}
+    assert db.has_collection("memories")
+    db.delete("memories")
+    assert not db.has_collection("memories")
+
+
+def test_memory_vector_db_ignores_empty_filter_values_and_missing_collections() -> None:
+    db = VectorDBFactory.get_vector_db(VectorDBConfig(provider="local", config={}))
+    vectors = _vectors(4)
+    db.insert("memories", [
+        EmbeddingsResult(id=f"m{i}", embedding=vectors[i].tolist(), content=f"memory {i}",
+                         metadata=EmbeddingsMetadata(memory_id=f"m{i}", memory_type="message",
+                                                     embedding_model="test", user_id=f"u{i % 2}"))
+        for i in range(4)
+    ])
+
+    assert db.search("missing", [vectors[0].tolist()], {}, 0.0, 5) is None
+    db.delete("memories", filter={"user_id": None})
+    assert len(db.get("memories").docs) == 4
+    db.delete("memories", filter={"user_id": "u1", "agent_id": ""})
+    assert {doc.id for doc in db.get("memories").docs} == {"m0", "m2"}
+
+
+def test_bulk_upsert_indexes_metadata_values_per_row() -> None:
+    collection = LocalVectorCollection(None, segment_size=4096)
+    count = 20000
+    collection.upsert(
+        ids=[f"id-{i}" for i in range(count)],
+        vectors=np.ones((count, 4), dtype=np.float32),
+        contents=[""] * count,
+        metadatas=[{"bucket": i % 7, "unique": f"u{i}"} for i in range(count)],
+    )
+
+    assert [record[0] for record in collection.query({"unique": "u12345"})] == ["id-12345"]
+    assert len(collection.query({"bucket": 3})) == len(range(3, count, 7))
+
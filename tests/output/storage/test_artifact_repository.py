@@ -0,0 +1,81 @@
+from aworld.output import Artifact, ArtifactType
+from aworld.output.storage.artifact_repository import LocalArtifactRepository
+
+
+def _objects(repo):
+    return sorted(p.name for p in repo.objects_path.glob("*/*"))
+
+
+def test_storing_unchanged_artifact_writes_nothing(tmp_path):
+    repo = LocalArtifactRepository(str(tmp_path))
+    artifact = Artifact(artifact_id="a1", artifact_type=ArtifactType.TEXT, content="hello" * 1000)
+
+    first = repo.store_artifact(artifact)
+    ref_mtime = (tmp_path / "artifact" / "a1" / "index.json").stat().st_mtime_ns
+    second = repo.store_artifact(artifact)
+
+    assert first == second
+    assert (tmp_path / "artifact" / "a1" / "index.json").stat().st_mtime_ns == ref_mtime
+    assert len(repo.get_artifact_versions("a1")) == 1
+    assert repo.retrieve_latest_artifact("a1")["content"] == "hello" * 1000
+
+
+def test_versions_share_chunks_and_can_be_retrieved(tmp_path):
+    repo = LocalArtifactRepository(str(tmp_path), chunk_size=64)
+    artifact = Artifact(artifact_id="a1", artifact_type=ArtifactType.TEXT, content="x" * 1000)
+    first = repo.store_artifact(artifact)
+    objects_after_first = _objects(repo)
+
+    artifact.content = "x" * 1000 + "tail"
+    second = repo.store_artifact(artifact)
+
+    versions = repo.get_artifact_versions("a1")
+    assert [v["id"] for v in versions] == [first, second]
+    assert versions[1]["parent"] == first
+    # Only the chunks that differ are new
+    assert len(_objects(repo)) - len(objects_after_first) < len(objects_after_first)
+    assert repo.retrieve_artifact_version("a1", first)["content"] == "x" * 1000
+    assert repo.retrieve_latest_artifact("a1")["content"] == "x" * 1000 + "tail"
+
+
+def test_collect_garbage_removes_unreferenced_objects(tmp_path):
+    repo = LocalArtifactRepository(str(tmp_path), max_versions=1)
+    artifact = Artifact(artifact_id="a1", artifact_type=ArtifactType.TEXT, content="old")
+    repo.store_artifact(artifact)
+    artifact.content = "new"
+    repo.store_artifact(artifact)
+    other = Artifact(artifact_id="b1", artifact_type=ArtifactType.TEXT, content="other")
+    repo.store_artifact(other)
+
+    assert repo.collect_garbage(grace_period=0) == 1
+    assert repo.retrieve_latest_artifact("a1")["content"] == "new"
+
+    repo.delete_artifact("b1")
+    assert repo.collect_garbage(grace_period=0) == 1
+    assert repo.retrieve_latest_artifact("b1") is None
+
+
+def test_reads_artifacts_written_before_content_addressing(tmp_path):
+    legacy = tmp_path / "artifact" / "old" / "index.json"
+    legacy.parent.mkdir(parents=True)
+    legacy.write_text('{"artifact_id": "old", "artifact_type": "TEXT", "content": "legacy", "status": "COMPLETE"}')
+
+    repo = LocalArtifactRepository(str(tmp_path))
+
+    assert repo.retrieve_latest_artifact("old")["content"] == "legacy"
+
+
+def test_collect_garbage_keeps_temp_files_and_recent_objects(tmp_path):
+    repo = LocalArtifactRepository(str(tmp_path), max_versions=1)
+    artifact = Artifact(artifact_id="a1", artifact_type=ArtifactType.TEXT, content="old")
+    repo.store_artifact(artifact)
+    artifact.content = "new"
+    repo.store_artifact(artifact)
+    in_flight = next(repo.objects_path.glob("*")) / ".tmp-chunk"
+    in_flight.write_bytes(b"partial")
+
+    # The dropped version's chunk was just written, so a concurrent writer may still reference it
+    assert repo.collect_garbage() == 0
+    assert repo.collect_garbage(grace_period=0) == 1
+    assert in_flight.exists()
+    assert repo.retrieve_latest_artifact("a1")["content"] == "new"
@@ -0,0 +1,60 @@
+import pytest
+
+from aworld.output import ArtifactType, WorkSpace
+
+
+def _open(path, **kwargs):
+    return WorkSpace(workspace_id="ws", storage_path=str(path), use_default_observer=False, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_lazy_workspace_journals_index_updates_and_materializes_on_access(tmp_path):
+    workspace = _open(tmp_path, lazy_load=True)
+    for i in range(3):
+        await workspace.create_artifact(ArtifactType.TEXT, f"a{i}", content=f"content {i}")
+    await workspace.delete_artifact("a1")
+
+    journal = tmp_path / "index.journal.jsonl"
+    assert journal.exists()
+    assert '"artifacts": []' in (tmp_path / "index.json").read_text()
+
+    reopened = _open(tmp_path, lazy_load=True)
+
+    assert [a.artifact_id for a in reopened.list_artifacts()] == ["a0", "a2"]
+    assert reopened.artifacts[1].content is None
+    assert reopened.get_artifact("a2").content == "content 2"
+    assert reopened.get_artifact("a1") is None
+
+
+@pytest.mark.asyncio
+async def test_lazy_workspace_compacts_journal_into_index(tmp_path):
+    workspace = _open(tmp_path, lazy_load=True, journal_compact_threshold=4)
+    for i in range(3):
+        await workspace.create_artifact(ArtifactType.TEXT, f"a{i}", content=f"content {i}")
+
+    assert not (tmp_path / "index.journal.jsonl").exists()
+    reopened = _open(tmp_path)
+    assert [a.artifact_id for a in reopened.list_artifacts()] == ["a0", "a1", "a2"]
+
+
+@pytest.mark.asyncio
+async def test_update_artifact_uses_id_index(tmp_path):
+    workspace = _open(tmp_path)
+    await workspace.create_artifact(ArtifactType.TEXT, "a0", content="v1")
+    await workspace.create_artifact(ArtifactType.TEXT, "a1", content="v1")
+
+    await workspace.update_artifact("a1", content="v2")
+
+    assert workspace.artifact_id_index == {"a0": 0, "a1": 1}
+    assert workspace.get_artifact("a1").content == "v2"
+    assert workspace.get_latest_artifact("a1").content == "v2"
+
+
+@pytest.mark.asyncio
+async def test_eager_workspace_does_not_record_index_ops(tmp_path):
+    workspace = _open(tmp_path)
+    await workspace.create_artifact(ArtifactType.TEXT, "a0", content="content")
+
+    workspace._record_index_op(workspace.get_artifact("a0"))
+
+    assert workspace._pending_index_ops == {}
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from aworld.self_evolve.replay import _run_replay_cli
+from aworld.self_evolve.replay_workers import _ZYGOTE_SCRIPT, ReplayWorkerPool, ReplayWorkerUnavailable
+
+pytestmark = pytest.mark.skipif(
+    not ReplayWorkerPool.supported(),
+    reason="warm replay workers require fork()",
+)
+
+
+@pytest.fixture
+def pool():
+    worker_pool = ReplayWorkerPool(size=1, preload_modules=("json",), poll_interval=0.1)
+    yield worker_pool
+    worker_pool.close()
+
+
+def _write_module(root: Path, name: str, source: str) -> None:
+    (root / f"{name}.py").write_text(source, encoding="utf-8")
+
+
+def test_worker_pool_runs_module_with_job_env_cwd_and_exit_code(tmp_path: Path, pool) -> None:
+    _write_module(
+        tmp_path,
+        "replay_job",
+        "import os, sys\n"
+        "print(os.environ['REPLAY_MARKER'], os.getcwd(), sys.argv[1:])\n"
+        "print('warn', file=sys.stderr)\n"
+        "sys.exit(3)\n",
+    )
+
+    completed = pool.run(
+        [sys.executable, "-m", "replay_job", "a", "b"],
+        cwd=str(tmp_path),
+        env={"REPLAY_MARKER": "first"},
+        timeout=30,
+    )
+
+    assert completed.returncode == 3
+    assert completed.stdout.split() == ["first", str(tmp_path), "['a',", "'b']"]
+    assert completed.stderr.strip() == "warn"
+
+
+def test_worker_pool_resets_state_between_jobs(tmp_path: Path, pool) -> None:
+    _write_module(
+        tmp_path,
+        "stateful_job",
+        "import json, os\n"
+        "print(getattr(json, 'leaked', None), os.environ.get('ONLY_FIRST'))\n"
+        "json.leaked = 'yes'\n",
+    )
+    command = [sys.executable, "-m", "stateful_job"]
+
+    first = pool.run(command, cwd=str(tmp_path), env={"ONLY_FIRST": "1"}, timeout=30)
+    second = pool.run(command, cwd=str(tmp_path), env={}, timeout=30)
+
+    assert first.stdout.split() == ["None", "1"]
+    assert second.stdout.split() == ["None", "None"]
+    assert pool.stats["spawned"] == 1
+    assert pool.stats["jobs"] == 2
+
+
+def test_worker_pool_times_out_and_stops_job(tmp_path: Path, pool) -> None:
+    _write_module(tmp_path, "slow_job", "import time\nprint('begin', flush=True)\ntime.sleep(30)\n")
+    started = time.monotonic()
+
+    with pytest.raises(subprocess.TimeoutExpired) as exc_info:
+        pool.run([sys.executable, "-m", "slow_job"], cwd=str(tmp_path), env={}, timeout=1)
+
+    assert time.monotonic() - started < 10
+    assert "begin" in exc_info.value.output
+    # The worker stays usable after a stopped job.
+    _write_module(tmp_path, "quick_job", "print('ok')\n")
+    assert pool.run([sys.executable, "-m", "quick_job"], cwd=str(tmp_path), env={}, timeout=30).stdout == "ok\n"
+
+
+def test_worker_pool_stops_on_terminal_check(tmp_path: Path, pool) -> None:
+    _write_module(tmp_path, "failing_job", "import time\nprint('FATAL', flush=True)\ntime.sleep(30)\n")
+
+    with pytest.raises(subprocess.TimeoutExpired) as exc_info:
+        pool.run(
+            [sys.executable, "-m", "failing_job"],
+            cwd=str(tmp_path),
+            env={},
+            timeout=30,
+            terminal_check=lambda stdout, stderr: "FATAL" in stdout,
+        )
+
+    assert getattr(exc_info.value, "terminal_diagnostic", False) is True
+
+
+def test_run_replay_cli_uses_worker_pool_and_falls_back_for_other_commands(tmp_path: Path, pool) -> None:
+    _write_module(tmp_path, "pooled_job", "print('pooled')\n")
+    options = dict(
+        cwd=str(tmp_path),
+        text=True,
+        capture_output=True,
+        timeout=30,
+        start_new_session=True,
+        env={},
+        artifact_dir=tmp_path / "artifacts",
+        execution_started_at=time.time(),
+        replay_environment={},
+        worker_pool=pool,
+    )
+
+    pooled = _run_replay_cli([sys.executable, "-m", "pooled_job"], **options)
+    cold = _run_replay_cli([sys.executable, "-c", "print('cold')"], **options)
+
+    assert pooled.stdout == "pooled\n"
+    assert cold.stdout == "cold\n"
+    assert pool.stats["jobs"] == 1
+
+
+def test_worker_pool_closes_unavailable_worker_once_and_replaces_it(tmp_path: Path, pool, monkeypatch) -> None:
+    _write_module(tmp_path, "quick_job", "print('ok')\n")
+    command = [sys.executable, "-m", "quick_job"]
+    pool.run(command, cwd=str(tmp_path), env={}, timeout=30)
+    worker = pool._idle[-1]
+    closes = []
+    original_close = worker.close
+    monkeypatch.setattr(worker, "close", lambda: (closes.append(1), original_close()))
+    monkeypatch.setattr(worker, "run", lambda *args, **kwargs: (_ for _ in ()).throw(ReplayWorkerUnavailable("gone")))
+
+    with pytest.raises(ReplayWorkerUnavailable):
+        pool.run(command, cwd=str(tmp_path), env={}, timeout=30)
+
+    assert closes == [1]
+    assert pool.stats["replaced"] == 1
+    assert pool.run(command, cwd=str(tmp_path), env={}, timeout=30).stdout == "ok\n"
+    assert pool.stats["spawned"] == 2
+
+
+def test_zygote_starts_under_clean_interpreter_despite_package_types_module(tmp_path: Path) -> None:
+    # Run by path, the zygote's directory (which holds `types.py`) is first on
+    # sys.path; it must not shadow the standard library during start-up.
+    process = subprocess.Popen(
+        [sys.executable, str(_ZYGOTE_SCRIPT), "json"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=str(tmp_path),
+        env={"PATH": "/usr/bin:/bin"},
+    )
+    try:
+        ready = process.stdout.readline()
+    finally:
+        process.stdin.close()
+        process.wait(timeout=30)
+        process.stdout.close()
+        stderr = process.stderr.read().decode("utf-8", errors="replace")
+        process.stderr.close()
+
+    assert b'"ready"' in ready, stderr
+
+
+def test_worker_pool_wakes_waiter_when_busy_worker_dies(tmp_path: Path, pool, monkeypatch) -> None:
+    _write_module(tmp_path, "quick_job", "print('ok')\n")
+    command = [sys.executable, "-m", "quick_job"]
+    pool.run(command, cwd=str(tmp_path), env={}, timeout=30)
+    worker = pool._idle[-1]
+    holding = threading.Event()
+    let_die = threading.Event()
+
+    def dying_run(*args, **kwargs):
+        holding.set()
+        let_die.wait(timeout=30)
+        raise ReplayWorkerUnavailable("gone")
+
+    monkeypatch.setattr(worker, "run", dying_run)
+    outcomes: dict[str, object] = {}
+
+    def run_first() -> None:
+        try:
+            pool.run(command, cwd=str(tmp_path), env={}, timeout=30)
+        except ReplayWorkerUnavailable as exc:
+            outcomes["first"] = exc
+
+    def run_second() -> None:
+        outcomes["second"] = pool.run(command, cwd=str(tmp_path), env={}, timeout=30).stdout
+
+    first = threading.Thread(target=run_first)
+    first.start()
+    assert holding.wait(timeout=30)
+    second = threading.Thread(target=run_second)
+    second.start()
+    time.sleep(0.2)
+    let_die.set()
+    first.join(timeout=30)
+    second.join(timeout=60)
+
+    assert not second.is_alive()
+    assert isinstance(outcomes["first"], ReplayWorkerUnavailable)
+    assert outcomes["second"] == "ok\n"
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from aworld.self_evolve.concurrency import (
+    SelfEvolveConcurrencyPolicy,
+    SelfEvolveExecutionTelemetry,
+)
+from aworld.self_evolve.datasets import EvalCase, SelfEvolveDataset
+from aworld.self_evolve.evaluation import (
+    AWorldTrajectoryEvaluatorBackend,
+    EvaluationRequest,
+)
+from aworld.self_evolve.replay import (
+    AWorldCliCandidateReplayBackend,
+    ReplayExecutionRequest,
+    ReplayExecutionResult,
+    _replay_model_fingerprint,
+    build_replay_request,
+)
+from aworld.self_evolve.result_cache import SelfEvolveResultCache, result_cache_key
+from aworld.self_evolve.store import FilesystemSelfEvolveStore
+from aworld.self_evolve.types import (
+    CandidateVariant,
+    DatasetRecipe,
+    SelfEvolveTargetRef,
+)
+
+
+def _dataset(cases: tuple[EvalCase, ...]) -> SelfEvolveDataset:
+    return SelfEvolveDataset(
+        cases=cases,
+        recipe=DatasetRecipe(
+            source={"kind": "test", "case_count": len(cases)},
+            split_seed="seed",
+            splits={"train": [case.case_id for case in cases], "validation": [], "held_out": []},
+        ),
+    )
+
+
+def _candidate(candidate_id: str = "cand-1") -> CandidateVariant:
+    return CandidateVariant(
+        candidate_id=candidate_id,
+        target=SelfEvolveTargetRef(target_type="skill", target_id="demo"),
+        content="---\nname: demo\n---\n# Demo\n",
+        rationale="test candidate",
+        target_fingerprint="sha256:old",
+    )
+
+
+def test_result_cache_key_is_order_independent_and_content_sensitive() -> None:
+    assert result_cache_key(a=1, b="x") == result_cache_key(b="x", a=1)
+    assert result_cache_key(a=1, b="x") != result_cache_key(a=2, b="x")
+    assert result_cache_key(a=1).startswith("sha256:")
+
+
+def test_replay_model_fingerprint_tracks_model_settings_but_not_api_keys(monkeypatch) -> None:
+    monkeypatch.setenv("LLM_MODEL_NAME", "model-a")
+    monkeypatch.setenv("LLM_API_KEY", "key-1")
+    base = _replay_model_fingerprint({})
+
+    assert _replay_model_fingerprint({"LLM_MODEL_NAME": "model-b"}) != base
+    assert _replay_model_fingerprint({"LLM_BASE_URL": "http://other"}) != base
+    assert _replay_model_fingerprint({"LLM_TEMPERATURE": "0.7"}) != base
+    assert _replay_model_fingerprint({"LLM_API_KEY": "key-2"}) == base
+    monkeypatch.setenv("LLM_MODEL_NAME", "model-b")
+    assert _replay_model_fingerprint({}) == _replay_model_fingerprint({"LLM_MODEL_NAME": "model-b"})
+
+
+def test_result_cache_round_trips_and_reports_hits_and_misses(tmp_path: Path) -> None:
+    store = FilesystemSelfEvolveStore(tmp_path)
+    cache = store.result_cache()
+    telemetry = SelfEvolveExecutionTelemetry()
+    cache.telemetry = telemetry
+    key = result_cache_key(case_id="task-a")
+
+    assert store.result_cache() is cache
+    assert cache.get("replay", key) is None
+    path = cache.put("replay", key, {"variant_dir": "somewhere"})
+
+    assert path.parent.parent.parent == tmp_path / ".aworld" / "self_evolve" / "cache"
+    assert cache.get("replay", key) == {"variant_dir": "somewhere"}
+    assert cache.get("replay", key, validate=lambda value: False) is None
+    cache.invalidate("replay", key)
+    assert cache.get("replay", key) is None
+    assert cache.stats["replay"] == {"hit_count": 1, "miss_count": 3}
+    assert telemetry.to_report()["replay"] == {
+        "cache_hit_count": 1,
+        "cache_miss_count": 3,
+    }
+
+
+@pytest.mark.asyncio
+async def test_replay_backend_reuses_cached_variants_across_runs(tmp_path: Path) -> None:
+    calls: list[ReplayExecutionRequest] = []
+
+    async def fake_executor(request: ReplayExecutionRequest) -> ReplayExecutionResult:
+        calls.append(request)
+        return ReplayExecutionResult(
+            status="succeeded",
+            trajectory=[{"action": {"content": request.variant_id}}],
+        )
+
+    dataset = _dataset((EvalCase(case_id="task-a", input="Replay task A"),))
+    candidate = _candidate()
+    cache = SelfEvolveResultCache(tmp_path / "cache")
+    backend = AWorldCliCandidateReplayBackend(
+        executor=fake_executor,
+        result_cache=cache,
+        concurrency_policy=SelfEvolveConcurrencyPolicy(reuse_cached_results=True),
+    )
+
+    def request_for(run_id: str):
+        return replace(
+            build_replay_request(
+                run_id=run_id,
+                workspace_root=tmp_path,
+                target=candidate.target,
+                candidate=candidate,
+                overlay_skill_root=tmp_path / "overlay",
+                dataset=dataset,
+            ),
+            verified_candidate_package_fingerprint="sha256:candidate",
+        )
+
+    first = await backend.replay_candidate(request_for("run-1"), candidate=candidate, dataset=dataset)
+    assert first.succeeded is True
+    assert [call.variant_id for call in calls] == ["baseline", "cand-1"]
+    calls.clear()
+
+    second = await backend.replay_candidate(request_for("run-2"), candidate=candidate, dataset=dataset)
+
+    assert second.succeeded is True
+    assert calls == []
+    assert second.candidate.trajectory == first.candidate.trajectory
+    run_2_replay = tmp_path / ".aworld" / "self_evolve" / "run-2" / "replay" / "cand-1"
+    assert (run_2_replay / "baseline").is_dir()
+    cache_source = json.loads((run_2_replay / "cand-1" / "cache_source.json").read_text(encoding="utf-8"))
+    assert cache_source["source_run_id"] == "run-1"
+    assert cache.stats["replay"] == {"hit_count": 2, "miss_count": 2}
+
+    disabled = AWorldCliCandidateReplayBackend(
+        executor=fake_executor,
+        result_cache=cache,
+        concurrency_policy=SelfEvolveConcurrencyPolicy(reuse_cached_results=False),
+    )
+    await disabled.replay_candidate(request_for("run-3"), candidate=candidate, dataset=dataset)
+    assert [call.variant_id for call in calls] == ["baseline", "cand-1"]
+
+
+@pytest.mark.asyncio
+async def test_trajectory_evaluator_reuses_cached_judge_reports(tmp_path: Path) -> None:
+    dataset = _dataset(
+        (
+            EvalCase(
+                case_id="task-eval",
+                input={"content": "Recover the workflow."},
+                metadata={"baseline_trajectory": [{"action": {"content": "Recovered."}}]},
+            ),
+        )
+    )
+    judge_agent = tmp_path / "agent.md"
+    judge_agent.write_text("---\nname: judge\n---\nJudge.\n", encoding="utf-8")
+    calls = []
+
+    def fake_run_evaluator_source(**kwargs):
+        calls.append(kwargs)
+        return {
+            "suite_id": "trajectory-source-evaluator",
+            "summary": {"trajectory-source-evaluator": {"score": {"mean": 75.0}}},
+            "gate": {"status": "pass", "metric_name": "score", "value": 75.0},
+        }
+
+    cache = SelfEvolveResultCache(tmp_path / "cache")
+    backend = AWorldTrajectoryEvaluatorBackend(
+        workspace_root=tmp_path,
+        judge_agent=str(judge_agent),
+        run_evaluator_source=fake_run_evaluator_source,
+        result_cache=cache,
+        reuse_cached_results=True,
+    )
+    request = EvaluationRequest(variant_id="baseline", candidate=None, dataset=dataset)
+
+    first = await backend.evaluate_variant(request)
+    second = await backend.evaluate_variant(request)
+
+    assert len(calls) == 1
+    assert second.metrics["score"] == first.metrics["score"] == 75.0
+    assert second.metrics["judge_cache_hit"] is True
+    assert "judge_cache_hit" not in first.metrics
+
+    judge_agent.write_text("---\nname: judge\n---\nJudge strictly.\n", encoding="utf-8")
+    await backend.evaluate_variant(request)
+    assert len(calls) == 2
+
+    # Reuse is opt-in: a backend with a cache but without the flag judges again
+    not_reusing = AWorldTrajectoryEvaluatorBackend(
+        workspace_root=tmp_path,
+        judge_agent=str(judge_agent),
+        run_evaluator_source=fake_run_evaluator_source,
+        result_cache=cache,
+    )
+    await not_reusing.evaluate_variant(request)
+    assert len(calls) == 3
+    assert SelfEvolveConcurrencyPolicy().reuse_cached_results is False
@@ -0,0 +1,94 @@
+import os
+from pathlib import Path
+
+import aworld.utils.skill_loader as skill_loader_module
+from aworld.skills.filesystem_provider import FilesystemSkillProvider
+from aworld.skills.index import SkillIndex
+
+
+def _write_skill(root: Path, name: str, description: str) -> Path:
+    skill_dir = root / name
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    skill_file = skill_dir / "SKILL.md"
+    skill_file.write_text(
+        f"---\ndescription: {description}\n---\n\n# Usage\nUse {name}.\n",
+        encoding="utf-8",
+    )
+    return skill_file
+
+
+def test_skill_index_reparses_only_changed_skills(tmp_path: Path) -> None:
+    root = tmp_path / "skills"
+    _write_skill(root, "alpha", "First")
+    beta_file = _write_skill(root, "beta", "Second")
+    index = SkillIndex(root)
+
+    FilesystemSkillProvider(provider_id="local", root=root, index=index).list_descriptors()
+    assert (index.hits, index.misses) == (0, 2)
+
+    beta_file.write_text("---\ndescription: Second, edited\n---\n\nNew usage.\n", encoding="utf-8")
+    descriptors = FilesystemSkillProvider(provider_id="local", root=root, index=index).list_descriptors()
+
+    assert (index.hits, index.misses) == (1, 3)
+    assert {d.skill_name: d.description for d in descriptors} == {"alpha": "First", "beta": "Second, edited"}
+
+
+def test_skill_index_uses_content_hash_when_only_mtime_changes(tmp_path: Path) -> None:
+    root = tmp_path / "skills"
+    skill_file = _write_skill(root, "alpha", "First")
+    index = SkillIndex(root)
+    index.get(skill_file.resolve())
+
+    stat = skill_file.stat()
+    os.utime(skill_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+    entry = index.get(skill_file.resolve())
+
+    assert (index.hits, index.misses) == (1, 1)
+    assert entry.front_matter == {"description": "First"}
+
+
+def test_skill_index_invalidates_when_skill_assets_change(tmp_path: Path) -> None:
+    root = tmp_path / "skills"
+    skill_file = _write_skill(root, "alpha", "First")
+    index = SkillIndex(root)
+    assert index.get(skill_file.resolve()).descriptor_assets["enabled"] is False
+
+    (skill_file.parent / "run.sh").write_text("echo alpha\n", encoding="utf-8")
+    entry = index.get(skill_file.resolve())
+
+    assert index.misses == 2
+    assert entry.descriptor_assets["relative_paths"] == ["run.sh"]
+
+
+def test_skill_index_persists_between_instances(tmp_path: Path) -> None:
+    root = tmp_path / "skills"
+    _write_skill(root, "alpha", "First")
+    cache_dir = tmp_path / "index"
+    FilesystemSkillProvider(
+        provider_id="local", root=root, index=SkillIndex(root, cache_dir)
+    ).list_descriptors()
+
+    reloaded = SkillIndex(root, cache_dir)
+    descriptors = FilesystemSkillProvider(provider_id="local", root=root, index=reloaded).list_descriptors()
+
+    assert (reloaded.hits, reloaded.misses) == (1, 0)
+    assert descriptors[0].description == "First"
+
+
+def test_requirement_bin_probe_is_memoized(monkeypatch) -> None:
+    calls = []
+
+    def fake_which(name, path=None):
+        calls.append(name)
+        return None
+
+    skill_loader_module.clear_requirements_cache()
+    monkeypatch.setattr(skill_loader_module.shutil, "which", fake_which)
+    meta = {"always": False, "requires": {"bins": ["definitely-missing-bin"]}}
+
+    try:
+        assert skill_loader_module.evaluate_skill_requirements(meta)[0] is False
+        assert skill_loader_module.evaluate_skill_requirements(meta)[0] is False
+        assert calls == ["definitely-missing-bin"]
+    finally:
+        skill_loader_module.clear_requirements_cache()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+# Generous wall-clock ceiling for a cold `aworld-cli --help`; the module checks below are the real gate.
+HELP_BUDGET_SECONDS = float(os.environ.get("AWORLD_CLI_HELP_BUDGET_SECONDS", "5.0"))
+HEAVY_MODULES = (
+    "aworld.runner",
+    "aworld.core.context.amni",
+    "aworld_cli.console",
+    "aworld_cli.core.agent_registry",
+    "openai",
+    "anthropic",
+)
+
+
+def _cli_env() -> dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(REPO_ROOT / "aworld-cli" / "src") + ":" + str(REPO_ROOT)
+    return env
+
+
+def _loaded_heavy_modules(code: str) -> list[str]:
+    probe = (
+        f"{code}\n"
+        "import json, sys\n"
+        f"print(json.dumps([name for name in {HEAVY_MODULES!r} if name in sys.modules]))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=str(REPO_ROOT),
+        env=_cli_env(),
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert proc.returncode == 0, proc.stderr
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def test_cli_help_does_not_import_runtime() -> None:
+    loaded = _loaded_heavy_modules(
+        "import contextlib, io, sys\n"
+        "sys.argv = ['aworld-cli', '--help']\n"
+        "from aworld_cli.main import main\n"
+        "with contextlib.redirect_stdout(io.StringIO()):\n"
+        "    try:\n"
+        "        main()\n"
+        "    except SystemExit:\n"
+        "        pass"
+    )
+
+    assert loaded == []
+
+
+def test_gateway_router_import_does_not_import_runtime() -> None:
+    loaded = _loaded_heavy_modules("import aworld_gateway.router")
+
+    assert loaded == []
+
+
+def test_cli_help_within_budget() -> None:
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-m", "aworld_cli.main", "--help"],
+        cwd=str(REPO_ROOT),
+        env=_cli_env(),
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    elapsed = time.perf_counter() - started
+
+    assert proc.returncode == 0
+    assert elapsed < HELP_BUDGET_SECONDS
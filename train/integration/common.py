@@ -77,7 +77,6 @@ async def encode_messages(tokenizer: AutoTokenizer,
     loop = asyncio.get_running_loop()
     # system_prompt_prefix_ids = self.tokenizer.apply_chat_template([{}], add_generation_prompt=False, tokenize=True)
     i = 0
-    print(f"tokenizer={tokenizer}")
     try:
         while i < len(messages):
             if messages[i].get("role") == "system":